@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""build_icon_map.py - Compile owm_icon_map.csv into a Python lookup module.
+
+The weather icon mapper used to parse the CSV on first use. This script turns
+it into a generated module of frozen dictionaries keyed by
+(condition ID, icon code), so the server loads the table at import time
+without any file I/O.
+
+Usage (from project root):
+
+    python3 deploy/scripts/build_icon_map.py
+    # or customise:
+    python3 deploy/scripts/build_icon_map.py --csv owm_icon_map.csv \
+        --out src/rpi_weather_display/server/weather_icon_table.py
+
+Run it again whenever owm_icon_map.csv changes; the test suite fails while
+the generated module is out of date.
+
+© 2025 raspberry-pi-weather-display
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+DEFAULT_CSV = ROOT_DIR / "owm_icon_map.csv"
+DEFAULT_OUT = ROOT_DIR / "src" / "rpi_weather_display" / "server" / "weather_icon_table.py"
+
+ID_COLUMN = "API response: id"
+ICON_COLUMN = "API response: icon"
+CLASS_COLUMN = "Weather Icons Class"
+
+HEADER = '''"""Weather icon lookup table generated from owm_icon_map.csv.
+
+Generated by deploy/scripts/build_icon_map.py - do not edit by hand.
+"""
+
+from collections.abc import Mapping
+from types import MappingProxyType
+'''
+
+
+def read_icon_rows(csv_path: Path) -> list[tuple[int, str, str]]:
+    """Read icon mappings from the CSV file.
+
+    Args:
+        csv_path: Path to owm_icon_map.csv.
+
+    Returns:
+        List of (condition ID, icon code, Weather Icons class) in file order.
+    """
+    with csv_path.open(encoding="utf-8", newline="") as f:
+        return [
+            (int(row[ID_COLUMN]), row[ICON_COLUMN].strip(), row[CLASS_COLUMN].strip())
+            for row in csv.DictReader(f)
+        ]
+
+
+def render_module(rows: list[tuple[int, str, str]]) -> str:
+    """Render the generated lookup module.
+
+    Later rows win when a condition ID appears more than once, matching how
+    the CSV was read at runtime before.
+
+    Args:
+        rows: Icon mappings as returned by read_icon_rows.
+
+    Returns:
+        Source code of the generated module.
+    """
+    by_condition: dict[tuple[int, str], str] = {}
+    by_id: dict[int, str] = {}
+    for weather_id, icon_code, icon_class in rows:
+        by_condition[(weather_id, icon_code)] = icon_class
+        by_id[weather_id] = icon_class
+
+    lines = [
+        HEADER,
+        "# (OpenWeatherMap condition ID, icon code) -> Weather Icons class",
+        "ICONS_BY_CONDITION: Mapping[tuple[int, str], str] = MappingProxyType({",
+    ]
+    lines += [f'    ({key[0]}, "{key[1]}"): "{value}",' for key, value in by_condition.items()]
+    lines += [
+        "})",
+        "",
+        "# OpenWeatherMap condition ID -> Weather Icons class, for unlisted icon codes",
+        "ICONS_BY_ID: Mapping[int, str] = MappingProxyType({",
+    ]
+    lines += [f'    {key}: "{value}",' for key, value in by_id.items()]
+    lines.append("})")
+    return "\n".join(lines) + "\n"
+
+
+def build_icon_map(csv_path: Path, out_path: Path) -> None:
+    """Compile the icon CSV into the generated lookup module.
+
+    Args:
+        csv_path: Path to owm_icon_map.csv.
+        out_path: Path to write the generated module.
+    """
+    if not csv_path.is_file():
+        sys.exit(f"[icon-map] ✖ CSV file not found: {csv_path}")
+
+    rows = read_icon_rows(csv_path)
+    if not rows:
+        sys.exit(f"[icon-map] ✖ No icon mappings found in {csv_path}")
+
+    out_path.write_text(render_module(rows), encoding="utf-8")
+    print(f"[icon-map] ✓ wrote {len(rows)} mappings to {out_path}")
+
+
+def main() -> None:
+    """Parse command-line arguments and build the icon lookup module."""
+    parser = argparse.ArgumentParser(description="Compile owm_icon_map.csv into a Python module")
+    parser.add_argument(
+        "--csv",
+        default=str(DEFAULT_CSV),
+        type=str,
+        help="icon mapping CSV file (default: owm_icon_map.csv in the project root)",
+    )
+    parser.add_argument(
+        "--out",
+        default=str(DEFAULT_OUT),
+        type=str,
+        help="generated module path (default: src/rpi_weather_display/server/"
+        "weather_icon_table.py)",
+    )
+    args = parser.parse_args()
+
+    build_icon_map(Path(args.csv), Path(args.out))
+
+
+if __name__ == "__main__":
+    main()
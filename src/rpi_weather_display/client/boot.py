@@ -0,0 +1,227 @@
+"""Fast-path entry point of the weather display client.
+
+The client is cold-started after every PiJuice wakeup, and importing the full
+client with httpx, Pillow, numpy and the pydantic models takes a large part of
+each wake on a slow core. Before deep sleep the full client leaves a small
+state file recording the wakeup it scheduled. This module reads it using only
+the standard library and, when the RTC alarm woke the device well before that
+wakeup, re-arms the alarm and shuts down again without importing the full
+client. Otherwise it hands over to the full client, as it does when the device
+was woken another way, such as by the button, when it's on external power, or
+when the RPI_WEATHER_DISPLAY_FULL_BOOT environment variable is set.
+
+Quiet hours and battery-aware intervals are already folded into the scheduled
+wakeup by the power state controller, so they don't need checking here.
+"""
+
+import json
+import logging
+import os
+import subprocess  # nosec B404 - subprocess usage has been security reviewed
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, TypedDict
+
+from rpi_weather_display.constants import (
+    BOOT_FULL_ENV_VAR,
+    BOOT_STATE_FILENAME,
+    BOOT_WAKE_GRACE_SECONDS,
+    CLIENT_CACHE_DIR_NAME,
+)
+
+if TYPE_CHECKING:
+    from rpi_weather_display.utils.pijuice_adapter import PiJuiceAdapter
+
+logger = logging.getLogger(__name__)
+
+
+class BootState(TypedDict):
+    """State left by the full client for the next boot."""
+
+    next_wakeup: float  # Unix time of the scheduled wakeup
+    written: float  # Unix time the state was written
+    battery_level: int  # Battery level when going into deep sleep
+    config_path: str  # Configuration file the client ran with
+    config_mtime: float  # Modification time of the configuration file
+
+
+def client_state_dir() -> Path:
+    """Get the directory for client state that has to survive power-off.
+
+    The XDG state directory is used rather than the cache directory, which
+    may be on tmpfs.
+
+    Returns:
+        Path to the client state directory
+    """
+    state_home = os.environ.get("XDG_STATE_HOME") or Path.home() / ".local" / "state"
+    return Path(state_home) / CLIENT_CACHE_DIR_NAME
+
+
+def boot_state_path() -> Path:
+    """Get the path of the boot state file.
+
+    Returns:
+        Path to the boot state file in the client state directory
+    """
+    return client_state_dir() / BOOT_STATE_FILENAME
+
+
+def read_boot_state(path: Path) -> BootState | None:
+    """Read the boot state file.
+
+    Args:
+        path: Path to the boot state file
+
+    Returns:
+        Boot state, or None if the file is missing or invalid
+    """
+    try:
+        with open(path, "rb") as f:
+            data = json.load(f)
+        return BootState(
+            next_wakeup=float(data["next_wakeup"]),
+            written=float(data["written"]),
+            battery_level=int(data["battery_level"]),
+            config_path=str(data["config_path"]),
+            config_mtime=float(data["config_mtime"]),
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def write_boot_state(path: Path, state: BootState) -> None:
+    """Write the boot state file, replacing it atomically.
+
+    Args:
+        path: Path to the boot state file
+        state: Boot state to write
+    """
+    content = json.dumps(state)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f".{path.name}.tmp")
+    temp_path.write_text(content)
+    os.replace(temp_path, path)
+
+
+def seconds_until_due(state: BootState | None, now: float) -> float | None:
+    """Get how long the client has nothing to do.
+
+    Args:
+        state: Boot state left by the full client, if any
+        now: Current Unix time
+
+    Returns:
+        Seconds until the scheduled wakeup, or None if the full client should run
+    """
+    if state is None:
+        return None
+
+    # A clock running behind the last boot can't be compared with the wakeup
+    if now < state["written"]:
+        return None
+
+    # A changed configuration may change the schedule
+    try:
+        if os.stat(state["config_path"]).st_mtime != state["config_mtime"]:
+            return None
+    except OSError:
+        return None
+
+    remaining = state["next_wakeup"] - now
+    if remaining <= BOOT_WAKE_GRACE_SECONDS:
+        return None
+    return remaining
+
+
+def full_boot_requested() -> bool:
+    """Check whether the fast path is turned off by the environment.
+
+    Returns:
+        True if BOOT_FULL_ENV_VAR is set to a true value
+    """
+    return os.environ.get(BOOT_FULL_ENV_VAR, "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _connect_pijuice() -> "PiJuiceAdapter | None":
+    """Connect to the PiJuice.
+
+    Returns:
+        Initialized adapter, or None if the PiJuice isn't available
+    """
+    # Imported here so the decision itself needs the standard library only
+    from rpi_weather_display.utils.pijuice_adapter import PiJuiceAdapter  # noqa: PLC0415
+
+    adapter = PiJuiceAdapter()
+    return adapter if adapter.initialize() else None
+
+
+def _woke_on_schedule(adapter: "PiJuiceAdapter") -> bool:
+    """Check the RTC alarm woke the device and it's running on battery.
+
+    Waking any other way, such as by the button or when a charger is
+    connected, means someone wants the display updated.
+
+    Args:
+        adapter: Initialized PiJuice adapter
+
+    Returns:
+        True if it's safe to go back to sleep
+    """
+    if not adapter.get_alarm_flag():
+        logger.info("Not woken by the wakeup alarm, starting the client")
+        return False
+    if adapter.is_on_external_power():
+        logger.info("Running on external power, starting the client")
+        return False
+    return True
+
+
+def _sleep_until(adapter: "PiJuiceAdapter", wakeup: float) -> bool:
+    """Re-arm the wakeup alarm and shut down.
+
+    Args:
+        adapter: Initialized PiJuice adapter
+        wakeup: Unix time to wake up at
+
+    Returns:
+        True if the system is shutting down, False if it couldn't be put to sleep
+    """
+    try:
+        if not adapter.set_alarm(datetime.fromtimestamp(wakeup)):
+            return False
+
+        # Security: Using hardcoded paths and arguments to prevent injection
+        subprocess.run(  # nosec B603 - hardcoded command with no user input
+            ["/usr/bin/sudo", "/sbin/shutdown", "-h", "now"],
+            check=True,
+        )
+    except Exception as e:
+        logger.error(f"Failed to go back to sleep: {e}")
+        return False
+    return True
+
+
+def main() -> None:
+    """Entry point of the client, going back to sleep early when nothing is due."""
+    state = read_boot_state(boot_state_path())
+    remaining = seconds_until_due(state, time.time())
+    if state is not None and remaining is not None and not full_boot_requested():
+        logging.basicConfig(level=logging.INFO, stream=sys.stderr)
+        adapter = _connect_pijuice()
+        if adapter is not None and _woke_on_schedule(adapter):
+            logger.info(f"Nothing due for {remaining / 60:.0f} minutes, going back to sleep")
+            if _sleep_until(adapter, state["next_wakeup"]):
+                return
+            logger.warning("Starting the client after failing to go back to sleep")
+
+    # Imported only when the client runs, so early wakeups skip its heavy imports
+    from rpi_weather_display.client.main import main as client_main  # noqa: PLC0415
+
+    client_main()
+
+
+if __name__ == "__main__":
+    main()
@@ -11,17 +11,23 @@ handling image rendering, partial refreshes, and power management.
 # pyright: reportUnknownMemberType=false
 
 import logging
+import mmap
 from collections.abc import Callable
-from io import BytesIO
 from typing import TYPE_CHECKING, Protocol, TypeVar
 
 from PIL import Image
 
 from rpi_weather_display.client.battery_threshold_manager import BatteryThresholdManager
+from rpi_weather_display.client.boot import client_state_dir
+from rpi_weather_display.client.frame_store import FrameStore
 from rpi_weather_display.client.image_processor import ImageProcessor
 from rpi_weather_display.client.partial_refresh_manager import PartialRefreshManager
 from rpi_weather_display.client.text_renderer import TextRenderer
-from rpi_weather_display.constants import VALID_ROTATION_ANGLES
+from rpi_weather_display.constants import (
+    DISPLAYED_DIGEST_FILENAME,
+    LAST_FRAME_FILENAME,
+    VALID_ROTATION_ANGLES,
+)
 from rpi_weather_display.exceptions import (
     DisplayError,
     DisplayInitializationError,
@@ -30,7 +36,9 @@ from rpi_weather_display.exceptions import (
 )
 from rpi_weather_display.models.config import DisplayConfig
 from rpi_weather_display.models.system import BatteryStatus
-from rpi_weather_display.utils.file_utils import PathLike, read_bytes
+from rpi_weather_display.utils.dirty_regions import Rect
+from rpi_weather_display.utils.file_utils import PathLike, atomic_write, read_text
+from rpi_weather_display.utils.path_utils import path_resolver
 
 # Type checking imports
 if TYPE_CHECKING:
@@ -107,6 +115,8 @@ class EPaperDisplay:
         partial_refresh_manager: Manages partial refresh operations
         text_renderer: Handles text rendering
         _display: The underlying IT8951 display driver instance
+        _digest_path: File keeping the displayed image's digest across reboots
+        _displayed_digest: Digest of the image file being displayed, if known
         _initialized: Whether the display has been successfully initialized
     """
 
@@ -124,13 +134,82 @@ class EPaperDisplay:
         # Initialize component managers
         self.battery_threshold_manager = BatteryThresholdManager(config)
         self.image_processor = ImageProcessor(config)
+        frame_store = self._create_frame_store()
         self.partial_refresh_manager = PartialRefreshManager(
             config, 
             self.image_processor,
-            self.battery_threshold_manager
+            self.battery_threshold_manager,
+            frame_store
         )
         self.text_renderer = TextRenderer(config)
 
+        # The digest is stored beside the frame, so they are kept or lost together
+        self._digest_path = (
+            frame_store.path.with_name(DISPLAYED_DIGEST_FILENAME) if frame_store else None
+        )
+        self._displayed_digest = self._load_displayed_digest()
+
+    def _create_frame_store(self) -> FrameStore | None:
+        """Create the store keeping the displayed frame across reboots.
+        
+        The frame is kept in the client state directory unless another
+        directory is configured, since the cache directory may be on tmpfs.
+        
+        Returns:
+            Frame store, or None if persisting the frame is disabled
+        """
+        if not self.config.persist_last_frame:
+            return None
+        if self.config.last_frame_dir:
+            path = path_resolver.normalize_path(self.config.last_frame_dir) / LAST_FRAME_FILENAME
+        else:
+            path = client_state_dir() / LAST_FRAME_FILENAME
+        return FrameStore(path, self.config.width, self.config.height)
+
+    def _load_displayed_digest(self) -> str | None:
+        """Load the digest stored with the displayed frame.
+        
+        Returns:
+            Digest of the image file being displayed, or None if not stored
+        """
+        if not self._digest_path or not self.partial_refresh_manager.has_last_image:
+            return None
+        try:
+            return read_text(self._digest_path).strip() or None
+        except Exception:
+            return None
+
+    def _set_displayed_digest(self, digest: str | None) -> None:
+        """Record the digest of the image file being displayed.
+        
+        Args:
+            digest: Digest of the displayed image file, or None if unknown
+        """
+        if digest == self._displayed_digest:
+            return
+        self._displayed_digest = digest
+        if not self._digest_path:
+            return
+        try:
+            if digest is None:
+                self._digest_path.unlink(missing_ok=True)
+            else:
+                atomic_write(self._digest_path, digest)
+        except Exception as e:
+            self.logger.warning(f"Failed to store displayed image digest: {e}")
+
+    @property
+    def displayed_digest(self) -> str | None:
+        """Get the digest of the image file being displayed.
+        
+        Returns:
+            Digest passed to display_image() for the image on the panel, or
+            None if the panel's content is unknown
+        """
+        if not self.partial_refresh_manager.has_last_image:
+            return None
+        return self._displayed_digest
+
     def initialize(self) -> None:
         """Initialize the e-paper display hardware.
 
@@ -150,7 +229,9 @@ class EPaperDisplay:
             # Initialize display
             self._display = auto_epd_display(vcom=self.config.vcom)
             if self._display:
-                self._display.clear()
+                # Keep a restored frame on the panel so updates can diff against it
+                if not self.partial_refresh_manager.has_last_image:
+                    self._display.clear()
                 self._set_rotation()
 
             self._initialized = True
@@ -186,31 +267,59 @@ class EPaperDisplay:
                     e
                 ) from None
 
+    def prepare(self) -> None:
+        """Get ready to display the next image, such as while it downloads."""
+        self.partial_refresh_manager.prepare_last_image()
+
     def clear(self) -> None:
         """Clear the display and reset state."""
         if self._initialized and self._display:
             self._display.clear()
         self.partial_refresh_manager.clear_last_image()
+        self._set_displayed_digest(None)
 
-    def display_image(self, image_path: PathLike) -> None:
+    def display_image(
+        self,
+        image_path: PathLike,
+        dirty_regions: list[Rect] | None = None,
+        digest: str | None = None,
+    ) -> None:
         """Display an image from file.
 
+        The file is memory-mapped and decoded in place rather than read into
+        memory first.
+
         Args:
             image_path: Path to the image file
+            dirty_regions: Regions known to differ from the displayed image
+            digest: Digest of the image file, reported by displayed_digest
+                once the image is displayed
         """
-        image_data = read_bytes(image_path)
-        with Image.open(BytesIO(image_data)) as image:
-            self.display_pil_image(image)
+        # Forget the old digest first, in case opening the image fails
+        self._set_displayed_digest(None)
+        with (
+            open(image_path, "rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as image_data,
+            Image.open(image_data) as image,
+        ):
+            self.display_pil_image(image, dirty_regions)
+        self._set_displayed_digest(digest)
 
-    def display_pil_image(self, image: Image.Image) -> None:
+    def display_pil_image(
+        self, image: Image.Image, dirty_regions: list[Rect] | None = None
+    ) -> None:
         """Display a PIL Image on the e-paper display.
 
         Args:
             image: PIL Image object to display
+            dirty_regions: Regions known to differ from the displayed image,
+                in the image's pixels. Ignored if the image must be resized.
             
         Raises:
             DisplayUpdateError: If displaying the image fails
         """
+        # The panel no longer shows the image the digest was recorded for
+        self._set_displayed_digest(None)
         if not self._initialized:
             self._handle_mock_display(image)
             return
@@ -218,11 +327,16 @@ class EPaperDisplay:
         try:
             # Process image
             processed_image = self.image_processor.preprocess_image(image)
+
+            # Regions no longer line up with a resized image
+            if processed_image.size != image.size:
+                dirty_regions = None
             
             # Update display through partial refresh manager
             updated = self.partial_refresh_manager.update_display(
                 processed_image,
-                self._display
+                self._display,
+                dirty_regions
             )
             
             # Clean up if image wasn't used
@@ -309,6 +423,7 @@ class EPaperDisplay:
     def close(self) -> None:
         """Close and clean up display resources."""
         self.sleep()
-        self.partial_refresh_manager.clear_last_image()
+        # The panel keeps showing the frame, so keep it stored for the next boot
+        self.partial_refresh_manager.clear_last_image(keep_stored=True)
         self._initialized = False
         self._display = None
\ No newline at end of file
@@ -0,0 +1,120 @@
+"""Persistence of the last displayed frame across reboots.
+
+The client powers off between updates, and e-paper keeps showing the last
+frame while it does. Storing that frame lets the first update after a cold
+boot diff against what the panel shows instead of doing a full refresh.
+
+The frame is stored as 4-bit grayscale pixels, the 16 levels the panel
+shows, packed two a byte and followed by the tile hashes of the frame as it
+was displayed. Both are in one file replaced atomically so they always
+belong together, at half the size of 8-bit pixels to spare the SD card.
+Loading memory-maps the file and unpacks the pixels from it.
+"""
+
+import logging
+import mmap
+from pathlib import Path
+
+from PIL import Image
+
+from rpi_weather_display.constants import (
+    DIFF_TILE_SIZE,
+    STORED_FRAME_GRAY_LEVELS,
+    TILE_HASH_SIZE,
+)
+from rpi_weather_display.utils.file_utils import atomic_write
+
+# Maps 8-bit gray to the nearest stored level, which unpacking scales back up
+_GRAY_STEP = 255 // (STORED_FRAME_GRAY_LEVELS - 1)
+_QUANTIZE_TABLE = [(value + _GRAY_STEP // 2) // _GRAY_STEP for value in range(256)]
+
+
+class FrameStore:
+    """Stores the last displayed frame and its tile hashes in a file.
+
+    Attributes:
+        path: File holding the frame
+        width: Frame width in pixels
+        height: Frame height in pixels
+    """
+
+    def __init__(self, path: Path, width: int, height: int) -> None:
+        """Initialize the frame store.
+
+        Args:
+            path: File holding the frame
+            width: Frame width in pixels
+            height: Frame height in pixels
+        """
+        self.path = path
+        self.width = width
+        self.height = height
+        self.logger = logging.getLogger(__name__)
+
+    @property
+    def _frame_size(self) -> int:
+        """Get the size of the packed frame in bytes, each row starting on a byte."""
+        return (self.width + 1) // 2 * self.height
+
+    @property
+    def _hashes_size(self) -> int:
+        """Get the size of the frame's tile hashes in bytes."""
+        rows = -(-self.height // DIFF_TILE_SIZE)
+        cols = -(-self.width // DIFF_TILE_SIZE)
+        return rows * cols * TILE_HASH_SIZE
+
+    def load(self) -> tuple[Image.Image, bytes | None] | None:
+        """Load the stored frame.
+
+        Returns:
+            Tuple of (frame, tile hashes or None if they weren't stored), or
+            None if no usable frame is stored
+        """
+        try:
+            with open(self.path, "rb") as f:
+                frame = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            # Missing or empty file
+            self.logger.debug(f"No stored frame to load: {e}")
+            return None
+
+        if len(frame) not in (self._frame_size, self._frame_size + self._hashes_size):
+            self.logger.info("Ignoring stored frame of a different format or display size")
+            frame.close()
+            return None
+
+        with frame:
+            image = Image.frombuffer("L", (self.width, self.height), frame, "raw", "L;4", 0, 1)
+            tile_hashes = frame[self._frame_size:] or None
+        return image, tile_hashes
+
+    def save(self, image: Image.Image, tile_hashes: bytes | None = None) -> None:
+        """Store a frame, replacing the stored one.
+
+        Failures are logged rather than raised, since the display has been
+        updated either way.
+
+        Args:
+            image: Displayed frame, in grayscale at the display size
+            tile_hashes: Tile hashes of the frame, if computed
+        """
+        if image.size != (self.width, self.height) or image.mode != "L":
+            self.logger.debug(f"Not storing {image.mode} frame of size {image.size}")
+            self.clear()
+            return
+        if tile_hashes is not None and len(tile_hashes) != self._hashes_size:
+            tile_hashes = None
+
+        # Pillow packs 4-bit pixels of palette images only
+        levels = Image.frombytes("P", image.size, image.point(_QUANTIZE_TABLE).tobytes())
+        try:
+            atomic_write(self.path, levels.tobytes("raw", "P;4") + (tile_hashes or b""))
+        except Exception as e:
+            self.logger.warning(f"Failed to store displayed frame: {e}")
+
+    def clear(self) -> None:
+        """Remove the stored frame, such as when the panel was cleared."""
+        try:
+            self.path.unlink(missing_ok=True)
+        except Exception as e:
+            self.logger.warning(f"Failed to remove stored frame: {e}")
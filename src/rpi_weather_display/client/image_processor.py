@@ -4,18 +4,100 @@ Handles image preprocessing, format conversion, and difference calculations
 for efficient display updates.
 """
 
+import hashlib
 import logging
+from dataclasses import dataclass
 from types import ModuleType
 from typing import TYPE_CHECKING
 
 from PIL import Image
 
-from rpi_weather_display.constants import DISPLAY_MARGIN
+from rpi_weather_display.constants import (
+    DIFF_MAX_COMPONENTS,
+    DIFF_TILE_SIZE,
+    DISPLAY_MARGIN,
+    MAX_PARTIAL_UPDATES,
+    PARTIAL_UPDATE_COST_PIXELS,
+    TILE_HASH_SIZE,
+)
 from rpi_weather_display.exceptions import ImageRenderingError, chain_exception
+from rpi_weather_display.utils.dirty_regions import Rect, merge_regions
 
 if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
     from rpi_weather_display.models.config import DisplayConfig
 
+    # Row-major indices of image tiles
+    TileIndices = NDArray[np.intp]
+
+
+@dataclass(frozen=True)
+class DiffThresholds:
+    """Thresholds deciding which pixel differences warrant a refresh.
+
+    Attributes:
+        pixel_threshold: Minimum pixel difference to consider changed
+        min_changed_pixels: Minimum total changed pixels for update
+    """
+
+    pixel_threshold: int
+    min_changed_pixels: int
+
+
+class _DiffScratch:
+    """Reusable uint8 buffers for finding the pixels that differ between images.
+
+    |old - new| is computed as max - min, which can't wrap around in uint8,
+    so areas of any size up to the buffer shape are compared without
+    allocating int16 temporaries.
+    """
+
+    def __init__(self, shape: tuple[int, ...], np: ModuleType) -> None:
+        """Allocate the buffers.
+
+        Args:
+            shape: Largest (rows, columns[, channels]) area to compare
+            np: NumPy module
+        """
+        self.np = np
+        self.high = np.empty(shape, dtype=np.uint8)
+        self.low = np.empty(shape, dtype=np.uint8)
+        self.changed = np.empty(shape, dtype=bool)
+
+    def compare(
+        self,
+        old_image: Image.Image,
+        new_image: Image.Image,
+        box: Rect,
+        pixel_threshold: int,
+    ) -> "NDArray[np.bool_]":
+        """Mark the pixels of an area that differ by more than the threshold.
+
+        Args:
+            old_image: Previously displayed image
+            new_image: New image, the same size as old_image
+            box: Area (left, top, right, bottom) no larger than the buffers
+            pixel_threshold: Minimum pixel difference to consider changed
+
+        Returns:
+            Mask of the area's changed pixels, a pixel changing if any of its
+            channels does, valid until the next comparison
+        """
+        np = self.np
+        rows, columns = box[3] - box[1], box[2] - box[0]
+        high = self.high[:rows, :columns]
+        low = self.low[:rows, :columns]
+        changed = self.changed[:rows, :columns]
+        old_area = np.asarray(old_image.crop(box), dtype=np.uint8)
+        new_area = np.asarray(new_image.crop(box), dtype=np.uint8)
+        np.maximum(old_area, new_area, out=high)
+        np.minimum(old_area, new_area, out=low)
+        np.subtract(high, low, out=high)
+        np.greater(high, pixel_threshold, out=changed)
+        return changed if changed.ndim == 2 else changed.any(axis=2)
+
 
 def _import_numpy() -> ModuleType | None:
     """Import numpy or return None if not available.
@@ -96,88 +178,212 @@ class ImageProcessor:
                 e
             ) from None
         
-    def calculate_diff_bbox(
-        self, 
-        old_image: Image.Image, 
+    def compute_tile_hashes(self, image: Image.Image) -> bytes | None:
+        """Hash each DIFF_TILE_SIZE tile of an image.
+
+        Kept alongside a displayed image, the hashes let the next diff find
+        the tiles that changed without comparing the rest of the pixels.
+
+        Args:
+            image: Grayscale image to hash
+
+        Returns:
+            8-byte digests of the tiles in row-major order, or None if numpy
+            is unavailable or an error occurs
+        """
+        try:
+            np = _import_numpy()
+            if not np:
+                return None
+
+            # Convert one band of tiles at a time rather than the whole image
+            size = DIFF_TILE_SIZE
+            width, height = image.size
+            digests: list[bytes] = []
+            for top in range(0, height, size):
+                band = np.asarray(image.crop((0, top, width, min(top + size, height))))
+                digests += (
+                    hashlib.blake2b(
+                        band[:, left:left + size].tobytes(), digest_size=TILE_HASH_SIZE
+                    ).digest()
+                    for left in range(0, width, size)
+                )
+            return b"".join(digests)
+        except Exception as e:
+            self.logger.debug(f"Error hashing image tiles: {e}")
+            return None
+
+    def calculate_diff_regions(
+        self,
+        old_image: Image.Image,
         new_image: Image.Image,
-        pixel_threshold: int,
-        min_changed_pixels: int
-    ) -> tuple[int, int, int, int] | None:
-        """Calculate bounding box of differences between two images.
-        
-        Compares images to determine which areas have changed significantly,
-        enabling partial refresh optimization.
-        
+        thresholds: DiffThresholds,
+        old_hashes: bytes | None = None,
+        new_hashes: bytes | None = None
+    ) -> list[Rect] | None:
+        """Calculate the separate regions that differ between two images.
+
+        Tiles whose hashes match are skipped, and only the pixels of the
+        remaining tiles are compared against the threshold. Changed tiles
+        are grouped into connected areas, so changes far apart, such as the
+        clock at the top and a temperature at the bottom, get regions of
+        their own instead of one bounding box covering most of the display.
+        Regions are then merged where one larger update is cheaper than
+        several small ones.
+
         Args:
             old_image: Previously displayed image
             new_image: New image to be displayed
-            pixel_threshold: Minimum pixel difference to consider changed
-            min_changed_pixels: Minimum total changed pixels for update
-            
+            thresholds: Pixel difference and changed pixel count thresholds
+            old_hashes: Tile hashes of old_image, computed if not given
+            new_hashes: Tile hashes of new_image, computed if not given
+
         Returns:
-            Bounding box (left, top, right, bottom) or None if no significant changes
-            or if an error occurs during calculation
+            Disjoint regions (left, top, right, bottom) ordered top to bottom,
+            an empty list if there are no significant changes, or None if
+            numpy is unavailable or an error occurs during calculation
         """
         try:
             np = _import_numpy()
             if not np:
                 return None
-                
-            # Convert to numpy arrays
-            old_array = np.array(old_image)
-            new_array = np.array(new_image)
-            
-            # Calculate difference
-            diff = np.abs(old_array.astype(np.int16) - new_array.astype(np.int16))
-            
-            # Check if max difference exceeds threshold
-            max_diff = np.max(diff)
-            if max_diff < pixel_threshold:
-                del old_array, new_array, diff
-                return None
-                
-            # Find changed pixels
-            non_zero = np.where(diff > pixel_threshold)
-            
-            # Check if enough pixels changed
-            if len(non_zero[0]) < min_changed_pixels:
-                del old_array, new_array, diff
+
+            if old_hashes is None:
+                old_hashes = self.compute_tile_hashes(old_image)
+            if new_hashes is None:
+                new_hashes = self.compute_tile_hashes(new_image)
+            if old_hashes is None or new_hashes is None:
                 return None
-                
-            # Calculate bounding box
-            bbox = self._calculate_bbox_dimensions(non_zero, diff.shape, np)
-            
-            # Clean up
-            del old_array, new_array, diff
-            
-            return bbox
-            
+
+            old_digests = np.frombuffer(old_hashes, dtype=np.uint8).reshape(-1, TILE_HASH_SIZE)
+            new_digests = np.frombuffer(new_hashes, dtype=np.uint8).reshape(-1, TILE_HASH_SIZE)
+            differing = np.flatnonzero((old_digests != new_digests).any(axis=1))
+            if not differing.size:
+                return []
+
+            tile_bounds = self._compare_tiles(
+                old_image, new_image, differing, thresholds.pixel_threshold, np
+            )
+            changed_count = sum(count for count, _ in tile_bounds.values())
+            if changed_count < thresholds.min_changed_pixels:
+                return []
+
+            components = self._find_changed_components(
+                {tile: bounds for tile, (_, bounds) in tile_bounds.items()}
+            )
+            if len(components) > DIFF_MAX_COMPONENTS:
+                components = [(
+                    min(c[0] for c in components),
+                    min(c[1] for c in components),
+                    max(c[2] for c in components),
+                    max(c[3] for c in components),
+                )]
+
+            width, height = new_image.size
+            regions = [
+                (
+                    max(0, left - DISPLAY_MARGIN),
+                    max(0, top - DISPLAY_MARGIN),
+                    min(width, right + DISPLAY_MARGIN),
+                    min(height, bottom + DISPLAY_MARGIN),
+                )
+                for left, top, right, bottom in components
+            ]
+            return merge_regions(regions, PARTIAL_UPDATE_COST_PIXELS, MAX_PARTIAL_UPDATES)
+
         except Exception as e:
-            self.logger.debug(f"Error calculating diff bbox: {e}")
+            self.logger.debug(f"Error calculating diff regions: {e}")
             return None
-            
-    def _calculate_bbox_dimensions(
-        self, 
-        non_zero: tuple[list[int], list[int]], 
-        diff_shape: tuple[int, int],
+
+    def _compare_tiles(
+        self,
+        old_image: Image.Image,
+        new_image: Image.Image,
+        tiles: "TileIndices",
+        pixel_threshold: int,
         np: ModuleType
-    ) -> tuple[int, int, int, int] | None:
-        """Calculate bounding box dimensions with margin.
-        
+    ) -> dict[tuple[int, int], tuple[int, Rect]]:
+        """Compare the pixels of tiles against the threshold.
+
+        Tiles are compared one at a time in uint8 scratch buffers allocated
+        once per call, so the temporaries stay a few kilobytes however
+        large the display is.
+
         Args:
-            non_zero: Tuple of arrays with non-zero pixel indices (rows, columns)
-            diff_shape: Shape of the difference array (height, width)
+            old_image: Previously displayed image
+            new_image: New image, the same size as old_image
+            tiles: Row-major indices of the tiles to compare
+            pixel_threshold: Minimum pixel difference to consider changed
             np: NumPy module
-            
+
         Returns:
-            Bounding box (left, top, right, bottom) or None if calculation fails
+            Number of changed pixels and their bounding box, keyed by the
+            (row, column) of each tile with changed pixels
         """
-        try:
-            left = max(0, int(np.min(non_zero[1])) - DISPLAY_MARGIN)
-            top = max(0, int(np.min(non_zero[0])) - DISPLAY_MARGIN)
-            right = min(int(diff_shape[1]), int(np.max(non_zero[1])) + DISPLAY_MARGIN)
-            bottom = min(int(diff_shape[0]), int(np.max(non_zero[0])) + DISPLAY_MARGIN)
-            
-            return (left, top, right, bottom)
-        except Exception:
-            return None
\ No newline at end of file
+        size = DIFF_TILE_SIZE
+        width, height = new_image.size
+        cols = -(-width // size)
+        scratch = _DiffScratch(self._scratch_shape(new_image, size, size), np)
+        changed_tiles: dict[tuple[int, int], tuple[int, Rect]] = {}
+        for index in tiles.tolist():
+            row, col = divmod(index, cols)
+            top, left = row * size, col * size
+            box = (left, top, min(left + size, width), min(top + size, height))
+            changed = scratch.compare(old_image, new_image, box, pixel_threshold)
+            count = int(np.count_nonzero(changed))
+            if not count:
+                continue
+            ys = np.flatnonzero(changed.any(axis=1))
+            xs = np.flatnonzero(changed.any(axis=0))
+            changed_tiles[(row, col)] = (count, (
+                left + int(xs[0]),
+                top + int(ys[0]),
+                left + int(xs[-1]) + 1,
+                top + int(ys[-1]) + 1,
+            ))
+        return changed_tiles
+
+    def _scratch_shape(self, image: Image.Image, rows: int, columns: int) -> tuple[int, ...]:
+        """Get the shape of scratch buffers for comparing areas of an image.
+
+        Args:
+            image: Image to be compared
+            rows: Rows in the largest area compared
+            columns: Columns in the largest area compared
+
+        Returns:
+            Buffer shape, with a channel axis unless the image is grayscale
+        """
+        bands = len(image.getbands())
+        return (rows, columns) if bands == 1 else (rows, columns, bands)
+
+    def _find_changed_components(self, tile_bounds: dict[tuple[int, int], Rect]) -> list[Rect]:
+        """Find the bounding boxes of connected areas of changed tiles.
+
+        Changed tiles are joined with their neighbours, diagonals included.
+
+        Args:
+            tile_bounds: Bounding box of the changed pixels, keyed by the
+                (row, column) of each changed tile
+
+        Returns:
+            Bounding boxes (left, top, right, bottom), ordered top to bottom
+        """
+        remaining = set(tile_bounds)
+        components: list[Rect] = []
+        while remaining:
+            stack = [remaining.pop()]
+            left, top, right, bottom = tile_bounds[stack[0]]
+            while stack:
+                row, col = stack.pop()
+                bounds = tile_bounds[(row, col)]
+                left, top = min(left, bounds[0]), min(top, bounds[1])
+                right, bottom = max(right, bounds[2]), max(bottom, bounds[3])
+                for neighbour in (
+                    (row + dr, col + dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1)
+                ):
+                    if neighbour in remaining:
+                        remaining.remove(neighbour)
+                        stack.append(neighbour)
+            components.append((left, top, right, bottom))
+        return sorted(components, key=lambda c: (c[1], c[0]))
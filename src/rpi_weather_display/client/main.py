@@ -8,22 +8,36 @@ reducing overall power consumption.
 
 import argparse
 import asyncio
+import contextlib
+import functools
+import hashlib
+import os
 import sys
 import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
+from typing import ParamSpec, TypeVar
 
 import httpx
 
+from rpi_weather_display.client.boot import BootState, boot_state_path, write_boot_state
 from rpi_weather_display.client.display import EPaperDisplay
 from rpi_weather_display.constants import (
     CLIENT_MEMORY_GROWTH_THRESHOLD_MB,
     CONNECTION_TIMEOUT,
     DEFAULT_CONFIG_PATH,
     DEFAULT_IMAGE_FILENAME,
+    DIRTY_REGIONS_HEADER,
+    ETAG_HEADER,
+    IF_NONE_MATCH_HEADER,
     KEEPALIVE_EXPIRY,
     MAX_CONCURRENT_OPERATIONS,
     MAX_CONNECTIONS,
+    MAX_IMAGE_DOWNLOAD_BYTES,
     MAX_KEEPALIVE_CONNECTIONS,
+    NEXT_UPDATE_HEADER,
     POOL_TIMEOUT,
     SLEEP_BEFORE_SHUTDOWN,
     TEN_MINUTES,
@@ -36,20 +50,25 @@ from rpi_weather_display.exceptions import (
     MissingConfigError,
 )
 from rpi_weather_display.models.config import AppConfig
+from rpi_weather_display.models.system import BatteryStatus
 from rpi_weather_display.utils import PowerStateManager, path_resolver
 from rpi_weather_display.utils.battery_utils import is_charging
+from rpi_weather_display.utils.dirty_regions import Rect, parse_regions
 from rpi_weather_display.utils.early_error_handler import (
     handle_keyboard_interrupt,
     handle_startup_error,
     handle_unexpected_error,
 )
-from rpi_weather_display.utils.file_utils import file_exists, write_bytes
+from rpi_weather_display.utils.file_utils import create_temp_file, file_exists
 from rpi_weather_display.utils.logging import setup_logging
 from rpi_weather_display.utils.memory_profiler import memory_profiler
 from rpi_weather_display.utils.network import AsyncNetworkManager
 from rpi_weather_display.utils.path_utils import validate_config_path
 from rpi_weather_display.utils.power_manager import PowerState
 
+P = ParamSpec("P")
+T = TypeVar("T")
+
 
 class AsyncWeatherDisplayClient:
     """Async-enabled weather display client.
@@ -65,15 +84,27 @@ class AsyncWeatherDisplayClient:
     - Reduced CPU wake time during network waits
 
     Attributes:
+        config_path: Path to the configuration file
         config: Application configuration loaded from YAML
         logger: Configured logger instance
         power_manager: Manager for power state and battery monitoring
         display: E-paper display controller
         cache_dir: Directory for caching weather images
         current_image_path: Path to the most recently downloaded weather image
+        boot_state_path: File telling the next boot when the client is due
+        _image_etag: Server ETag of the image at current_image_path, if known
+        _image_digest: SHA-256 digest of the image at current_image_path, if known
+        _refreshes_skipped: Refreshes skipped because the image was already displayed
+        _cycle_timings: Wake and radio-on time of the last update cycle, sent
+            with the next request's metrics
+        _dirty_regions: Regions where the image at current_image_path differs
+            from the displayed one, or None if unknown
         _running: Flag indicating if the main loop is active
         _http_client: Reusable async HTTP client instance
+        _display_executor: Thread running blocking display operations
         _semaphore: Concurrency limiter for resource protection
+        _loop: Event loop running the client, once started
+        _shutdown_task: Critical shutdown scheduled on the event loop, if any
     """
 
     def __init__(self, config_path: Path) -> None:
@@ -83,6 +114,7 @@ class AsyncWeatherDisplayClient:
             config_path: Path to the YAML configuration file.
         """
         # Load configuration
+        self.config_path = config_path
         self.config = AppConfig.from_yaml(config_path)
 
         # Set up logging
@@ -99,13 +131,26 @@ class AsyncWeatherDisplayClient:
         # Image cache path using the path resolver
         self.cache_dir = path_resolver.cache_dir
         self.current_image_path = path_resolver.get_cache_file(DEFAULT_IMAGE_FILENAME)
+        self.boot_state_path = boot_state_path()
+        self._image_etag: str | None = None
+        self._image_digest: str | None = None
+        self._refreshes_skipped = 0
+        self._cycle_timings: dict[str, float] = {}
+        self._dirty_regions: list[Rect] | None = None
 
         # Async HTTP client with connection pooling
         self._http_client: httpx.AsyncClient | None = None
 
+        # Single thread for display operations, created on first use
+        self._display_executor: ThreadPoolExecutor | None = None
+
         # Semaphore for limiting concurrent operations
         self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_OPERATIONS)
 
+        # Event loop running the client, and a critical shutdown scheduled on it
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._shutdown_task: asyncio.Task[None] | None = None
+
         self.logger.info("Async Weather Display Client initialized")
         self._running = False
 
@@ -114,6 +159,7 @@ class AsyncWeatherDisplayClient:
 
         Uses a single persistent client with connection pooling for efficiency.
         The client is configured with appropriate timeouts and retry behavior.
+        Creating it loads TLS certificates, so it's created on a worker thread.
 
         Returns:
             Configured async HTTP client instance.
@@ -128,7 +174,8 @@ class AsyncWeatherDisplayClient:
             )
 
             # Create client with retry-friendly settings
-            self._http_client = httpx.AsyncClient(
+            client = await asyncio.to_thread(
+                httpx.AsyncClient,
                 timeout=timeout,
                 limits=httpx.Limits(
                     max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
@@ -138,9 +185,40 @@ class AsyncWeatherDisplayClient:
                 # HTTP/2 is optional - will use HTTP/1.1 if not available
                 http2=False,
             )
+            if self._http_client is None:
+                self._http_client = client
+            else:
+                # Another update created one meanwhile
+                await client.aclose()
 
         return self._http_client
 
+    async def _run_on_display_thread(
+        self, func: Callable[P, T], *args: P.args, **kwargs: P.kwargs
+    ) -> T:
+        """Run a blocking display operation without blocking the event loop.
+
+        Operations run one at a time on a dedicated thread, so the display
+        driver is never used concurrently, and the event loop carries on
+        with network operations meanwhile.
+
+        Args:
+            func: Display operation to run
+            *args: Positional arguments of the operation
+            **kwargs: Keyword arguments of the operation
+
+        Returns:
+            Result of the operation
+        """
+        if self._display_executor is None:
+            self._display_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="display"
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._display_executor, functools.partial(func, *args, **kwargs)
+        )
+
     def initialize(self) -> None:
         """Initialize hardware and subsystems.
 
@@ -172,49 +250,76 @@ class AsyncWeatherDisplayClient:
 
         Manages transitions between power states, with special handling for the
         CRITICAL state which initiates an emergency shutdown to protect the battery.
+        The shutdown is scheduled as a task on the client's event loop, without
+        waiting for it, so a worker thread calling this never blocks on the loop.
 
         Args:
             old_state: Previous power state
             new_state: New power state
         """
         # If transitioning to CRITICAL state, initiate safe shutdown
-        if new_state == PowerState.CRITICAL:
-            self.logger.warning("CRITICAL BATTERY STATE DETECTED - Initiating safe shutdown")
+        if new_state != PowerState.CRITICAL:
+            return
+        self.logger.warning("CRITICAL BATTERY STATE DETECTED - Initiating safe shutdown")
 
-            try:
-                # Display a warning message if possible
-                self.display.display_text("CRITICAL BATTERY", "Shutting down to preserve battery")
+        # Halt the main loop
+        self._running = False
 
-                # Give a brief pause to allow warning to be displayed
-                time.sleep(SLEEP_BEFORE_SHUTDOWN)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is not None:
+            # Called on the event loop's thread, which mustn't block
+            self._start_critical_shutdown()
+        elif self._loop is not None and self._loop.is_running():
+            # Called on a worker thread, so hand the shutdown to the event loop
+            self._loop.call_soon_threadsafe(self._start_critical_shutdown)
+        else:
+            asyncio.run(self._critical_shutdown())
+
+    def _start_critical_shutdown(self) -> None:
+        """Schedule the critical shutdown on the running event loop."""
+        if self._shutdown_task is None:
+            self._shutdown_task = asyncio.get_running_loop().create_task(
+                self._critical_shutdown()
+            )
 
-                # Halt the main loop
-                self._running = False
+    async def _critical_shutdown(self) -> None:
+        """Show a critical battery warning, schedule a wakeup and power off.
 
-                # Schedule a dynamic wakeup based on battery level
-                # Using 12 hours as base duration, but it will be adjusted dynamically
-                self.power_manager.schedule_wakeup(TWELVE_HOURS_IN_MINUTES, dynamic=True)
+        Raises:
+            RuntimeError: If the system could not be shut down
+        """
+        try:
+            # Display a warning message if possible
+            await self._run_on_display_thread(
+                self.display.display_text,
+                "CRITICAL BATTERY",
+                "Shutting down to preserve battery",
+            )
+            self._dirty_regions = None  # The weather image is no longer shown
 
-                # Initiate shutdown - run async method in sync context
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    loop.run_until_complete(self.shutdown())
-                finally:
-                    loop.close()
+            # Give a brief pause to allow warning to be displayed
+            await asyncio.sleep(SLEEP_BEFORE_SHUTDOWN)
 
-                self.power_manager.shutdown_system()
+            # Schedule a dynamic wakeup based on battery level
+            # Using 12 hours as base duration, but it will be adjusted dynamically
+            self.power_manager.schedule_wakeup(TWELVE_HOURS_IN_MINUTES, dynamic=True)
 
-            except Exception as e:
-                self.logger.error(f"Error during critical shutdown: {e}")
-                # Still try to shut down even if there was an error
-                try:
-                    self.power_manager.shutdown_system()
-                except Exception as shutdown_error:
-                    self.logger.error(f"Final shutdown attempt failed: {shutdown_error}")
-                    raise RuntimeError("Failed to perform critical shutdown") from shutdown_error
+            await self.shutdown()
+            self.power_manager.shutdown_system()
 
-    async def update_weather(self) -> bool:
+        except Exception as e:
+            self.logger.error(f"Error during critical shutdown: {e}")
+            # Still try to shut down even if there was an error
+            try:
+                self.power_manager.shutdown_system()
+            except Exception as shutdown_error:
+                self.logger.error(f"Final shutdown attempt failed: {shutdown_error}")
+                raise RuntimeError("Failed to perform critical shutdown") from shutdown_error
+
+    async def update_weather(self, refresh: bool = False) -> bool:
         """Update weather data from server using async operations.
 
         Requests a new weather image from the server, sending battery status
@@ -227,6 +332,10 @@ class AsyncWeatherDisplayClient:
         - Allows CPU to sleep during network wait
         - Automatic WiFi power management
 
+        Args:
+            refresh: Whether to refresh the display once updated. The refresh
+                starts before WiFi is disabled, so they overlap.
+
         Returns:
             True if update was successful, False otherwise.
         """
@@ -237,85 +346,244 @@ class AsyncWeatherDisplayClient:
             # Record memory before update
             memory_profiler.record_snapshot()
 
-            # Get battery status and update network manager
-            battery = self.power_manager.get_battery_status()
-            self.network_manager.update_battery_status(battery)
+            cycle_start = time.monotonic()
+
+            # Do the local work while WiFi connects below, which starts first
+            local_state = asyncio.create_task(self._collect_local_state())
 
             # Use network manager to ensure WiFi connectivity
             # WiFi will be automatically disabled when we exit this context
-            async with self.network_manager.ensure_connectivity() as connected:
-                if not connected:
-                    self.logger.error("Failed to establish network connection")
-                    return False
-
-                try:
-                    # Get system metrics
-                    metrics = self.power_manager.get_system_metrics()
-
-                    # Create request payload
-                    payload = {
-                        "battery": {
-                            "level": battery.level,
-                            "state": battery.state,
-                            "voltage": battery.voltage,
-                            "current": battery.current,
-                            "temperature": battery.temperature,
-                        },
-                        "metrics": metrics,
-                    }
-
-                    # Construct server URL
-                    server_url = f"{self.config.server.url}:{self.config.server.port}/render"
-
-                    # Get the HTTP client
-                    client = await self._get_http_client()
-
-                    # Send async request to server
-                    response = await client.post(server_url, json=payload)
-
-                    if response.status_code != 200:
-                        self.logger.error(
-                            f"Server returned error: {response.status_code} - {response.text}"
-                        )
+            refresh_task: asyncio.Task[None] | None = None
+            try:
+                async with self.network_manager.ensure_connectivity() as connected:
+                    if not connected:
+                        self.logger.error("Failed to establish network connection")
+                        return False
+
+                    try:
+                        # Get battery status and system metrics
+                        battery, metrics = await local_state
+                        if not await self._request_image(battery, metrics):
+                            return False
+                        self._record_weather_update()
+
+                        if refresh and file_exists(self.current_image_path):
+                            # Decode and display the image while the radio is turned off
+                            refresh_task = asyncio.create_task(self.refresh_display())
+                        return True
+
+                    except httpx.TimeoutException as e:
+                        self.logger.error(f"Request timeout: {e}")
+                        return False
+                    except httpx.NetworkError as e:
+                        self.logger.error(f"Network error: {e}")
+                        return False
+                    except httpx.HTTPError as e:
+                        self.logger.error(f"HTTP error: {e}")
                         return False
+                    except Exception as e:
+                        self.logger.error(f"Error updating weather data: {e}")
+                        return False
+                # WiFi is automatically disabled here when we exit the context manager
+            finally:
+                # After a failed connection, the local work finishes with the radio off.
+                # Its errors were handled above otherwise.
+                with contextlib.suppress(Exception):
+                    await local_state
+                if refresh_task is not None:
+                    await refresh_task
+                self._record_cycle_timings(time.monotonic() - cycle_start)
+
+    async def _request_image(self, battery: BatteryStatus, metrics: dict[str, float]) -> bool:
+        """Request a weather image from the server, saving it if it changed.
+
+        Args:
+            battery: Current battery status
+            metrics: System metrics to report to the server
+
+        Returns:
+            True if the cached image is current, False if the server returned an error.
+        """
+        metrics["refreshes_skipped"] = self._refreshes_skipped
+        metrics.update(self._cycle_timings)
+
+        # Create request payload
+        payload = {
+            "battery": {
+                "level": battery.level,
+                "state": battery.state,
+                "voltage": battery.voltage,
+                "current": battery.current,
+                "temperature": battery.temperature,
+            },
+            "metrics": metrics,
+            "device_id": self.config.server.device_id,
+        }
+
+        # Construct server URL
+        server_url = f"{self.config.server.url}:{self.config.server.port}/render"
+
+        # Get the HTTP client
+        client = await self._get_http_client()
+
+        # Let the server skip sending an image we already show
+        headers: dict[str, str] = {}
+        if self._image_etag is not None and file_exists(self.current_image_path):
+            headers[IF_NONE_MATCH_HEADER] = self._image_etag
+
+        # Send async request to server, streaming the image as it arrives
+        async with client.stream("POST", server_url, json=payload, headers=headers) as response:
+            if response.status_code == 304:
+                self.logger.info("Displayed content unchanged on server")
+            elif response.status_code != 200:
+                await response.aread()
+                self.logger.error(
+                    f"Server returned error: {response.status_code} - {response.text}"
+                )
+                return False
+            else:
+                await self._receive_image(response)
+
+        # Align future wake-ups with the server's next content change
+        next_update = self._parse_next_update(response)
+        if next_update is not None:
+            self.power_manager.set_server_next_update(next_update)
+        return True
+
+    def _record_weather_update(self) -> None:
+        """Record a successful weather update and check memory growth."""
+        # Record that we updated the weather data
+        self.power_manager.record_weather_update()
+
+        # Record memory after update
+        memory_profiler.record_snapshot()
+
+        # Check for memory growth
+        if memory_profiler.check_memory_growth(threshold_mb=CLIENT_MEMORY_GROWTH_THRESHOLD_MB):
+            self.logger.warning("Memory growth detected during weather update")
+            # Log memory report
+            report = memory_profiler.get_report()
+            self.logger.info(f"Memory report: {report}")
 
-                    # Save the image to cache using file_utils
-                    # Note: For a production system, we might want to make this async too
-                    write_bytes(self.current_image_path, response.content)
-
-                    # Record that we updated the weather data
-                    self.power_manager.record_weather_update()
-
-                    # Record memory after update
-                    memory_profiler.record_snapshot()
-
-                    # Check for memory growth
-                    if memory_profiler.check_memory_growth(
-                        threshold_mb=CLIENT_MEMORY_GROWTH_THRESHOLD_MB
-                    ):
-                        self.logger.warning("Memory growth detected during weather update")
-                        # Log memory report
-                        report = memory_profiler.get_report()
-                        self.logger.info(f"Memory report: {report}")
-
-                    self.logger.info("Weather data updated successfully (async)")
-                    return True
-
-                except httpx.TimeoutException as e:
-                    self.logger.error(f"Request timeout: {e}")
-                    return False
-                except httpx.NetworkError as e:
-                    self.logger.error(f"Network error: {e}")
-                    return False
-                except httpx.HTTPError as e:
-                    self.logger.error(f"HTTP error: {e}")
-                    return False
-                except Exception as e:
-                    self.logger.error(f"Error updating weather data: {e}")
-                    return False
-            # WiFi is automatically disabled here when we exit the context manager
-
-    def refresh_display(self) -> None:
+        self.logger.info("Weather data updated successfully (async)")
+
+    async def _collect_local_state(self) -> tuple[BatteryStatus, dict[str, float]]:
+        """Read the battery and system metrics, and prepare the HTTP client and display.
+
+        Runs while WiFi connects, so none of this work keeps the radio on.
+        The blocking reads run on worker threads.
+
+        Returns:
+            Tuple of (battery status, system metrics)
+        """
+        battery = await asyncio.to_thread(self.power_manager.get_battery_status)
+        # Lets WiFi power saving account for the battery, if it isn't set up yet
+        self.network_manager.update_battery_status(battery)
+
+        metrics, *_ = await asyncio.gather(
+            asyncio.to_thread(self.power_manager.get_system_metrics),
+            self._get_http_client(),
+            self._run_on_display_thread(self.display.prepare),
+        )
+        return battery, metrics
+
+    def _record_cycle_timings(self, wake_seconds: float) -> None:
+        """Log an update cycle's timings and keep them for the next request.
+
+        Args:
+            wake_seconds: Duration of the update cycle, including an
+                overlapping display refresh
+        """
+        radio_on_seconds = self.network_manager.last_radio_on_seconds
+        if radio_on_seconds is None:
+            return
+        self._cycle_timings = {
+            "last_wake_seconds": round(wake_seconds, 3),
+            "last_radio_on_seconds": round(radio_on_seconds, 3),
+        }
+        self.logger.info(
+            f"Update cycle took {wake_seconds:.2f}s with the radio on for "
+            f"{radio_on_seconds:.2f}s"
+        )
+
+    async def _receive_image(self, response: httpx.Response) -> None:
+        """Save a streamed image to the cache, hashing it as it arrives.
+
+        Chunks are written to a temporary file beside the cached image as they
+        arrive, so the image is never held in memory as a whole. The temporary
+        file replaces the cached image once complete, so a failed download
+        keeps the previous one.
+
+        Args:
+            response: Streamed response carrying a new image.
+
+        Raises:
+            ValueError: If the image is larger than MAX_IMAGE_DOWNLOAD_BYTES.
+        """
+        # Reject oversized images before downloading them where possible
+        length = response.headers.get("Content-Length")
+        if length is not None and length.isdigit() and int(length) > MAX_IMAGE_DOWNLOAD_BYTES:
+            raise ValueError(f"Image of {length} bytes exceeds {MAX_IMAGE_DOWNLOAD_BYTES} bytes")
+
+        digest = hashlib.sha256()
+        size = 0
+        temp_file = create_temp_file(
+            suffix=self.current_image_path.suffix, directory=self.current_image_path.parent
+        )
+        try:
+            with open(temp_file, "wb") as f:
+                async for chunk in response.aiter_bytes():
+                    size += len(chunk)
+                    if size > MAX_IMAGE_DOWNLOAD_BYTES:
+                        raise ValueError(f"Image exceeds {MAX_IMAGE_DOWNLOAD_BYTES} bytes")
+                    digest.update(chunk)
+                    f.write(chunk)
+            os.replace(temp_file, self.current_image_path)
+        except BaseException:
+            temp_file.unlink(missing_ok=True)
+            raise
+
+        self._image_digest = digest.hexdigest()
+        self._image_etag = response.headers.get(ETAG_HEADER)
+        self._track_dirty_regions(response)
+
+    def _parse_next_update(self, response: httpx.Response) -> datetime | None:
+        """Extract the server-advised next content update from a render response.
+
+        Args:
+            response: Response returned by the server's render endpoint.
+
+        Returns:
+            Time of the next content change, or None if the server did not advise one.
+        """
+        header = response.headers.get(NEXT_UPDATE_HEADER)
+        if header is None:
+            return None
+
+        try:
+            return datetime.fromtimestamp(int(header))
+        except (ValueError, OverflowError, OSError):
+            self.logger.warning(f"Ignoring invalid {NEXT_UPDATE_HEADER} header: {header}")
+            return None
+
+    def _track_dirty_regions(self, response: httpx.Response) -> None:
+        """Accumulate the regions changed since the displayed image.
+
+        The server reports the regions differing from the image whose ETag we
+        sent, which may not have been displayed yet, so the regions of every
+        download are merged until the display is next refreshed.
+
+        Args:
+            response: Response carrying a newly downloaded image.
+        """
+        header = response.headers.get(DIRTY_REGIONS_HEADER)
+        regions = parse_regions(header) if header is not None else None
+        if regions is None or self._dirty_regions is None:
+            self._dirty_regions = None
+        else:
+            self._dirty_regions = self._dirty_regions + regions
+
+    async def refresh_display(self) -> None:
         """Refresh the e-paper display with the latest weather data.
 
         Updates the display with the most recently cached weather image.
@@ -323,11 +591,9 @@ class AsyncWeatherDisplayClient:
         from the server first. The display refresh considers battery status
         for power-efficient partial updates.
 
-        Note: Display operations remain synchronous as they are hardware-bound
-        and don't benefit from async patterns.
-
-        Raises:
-            Exception: If there is an error refreshing the display.
+        Decoding the image and driving the panel block, so they run on the
+        display thread while the event loop carries on, such as disabling
+        WiFi after an update.
         """
         self.logger.info("Refreshing display")
 
@@ -336,31 +602,33 @@ class AsyncWeatherDisplayClient:
             battery_status = self.power_manager.get_battery_status()
             self.display.update_battery_status(battery_status)
 
-            # Check if we have a cached image
-            if file_exists(self.current_image_path):
-                # Display the image
-                self.display.display_image(self.current_image_path)
-                # Record that we refreshed the display
+            # Without a cached image, try to update first
+            if not file_exists(self.current_image_path) and not await self.update_weather():
+                self.logger.error("No image available and failed to update")
+                return
+
+            if (
+                self._image_digest is not None
+                and self._image_digest == self.display.displayed_digest
+            ):
+                # Same bytes as the displayed image, so skip decoding and waking the panel
+                self._refreshes_skipped += 1
+                self._dirty_regions = []
                 self.power_manager.record_display_refresh()
-                self.logger.info("Display refreshed successfully")
-            else:
-                # No image available, try to update first
-                # We need to run the async update in a sync context
-                # Create a new event loop for this sync method
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    update_success = loop.run_until_complete(self.update_weather())
-                finally:
-                    loop.close()
-
-                if update_success:
-                    self.display.display_image(self.current_image_path)
-                    # Record that we refreshed the display
-                    self.power_manager.record_display_refresh()
-                    self.logger.info("Display refreshed successfully")
-                else:
-                    self.logger.error("No image available and failed to update")
+                self.logger.info("Display already shows the latest image")
+                return
+
+            # Display the image, refreshing only the changed regions if known
+            await self._run_on_display_thread(
+                self.display.display_image,
+                self.current_image_path,
+                self._dirty_regions,
+                self._image_digest,
+            )
+            self._dirty_regions = []
+            # Record that we refreshed the display
+            self.power_manager.record_display_refresh()
+            self.logger.info("Display refreshed successfully")
         except Exception as e:
             self.logger.error(f"Error refreshing display: {e}")
 
@@ -379,6 +647,7 @@ class AsyncWeatherDisplayClient:
         triggers a shutdown.
         """
         self.logger.info("Starting Async Weather Display Client")
+        self._loop = asyncio.get_running_loop()
         self._running = True
         display_sleeping = False
 
@@ -405,19 +674,22 @@ class AsyncWeatherDisplayClient:
             self.logger.error(f"Error in async client main loop: {e}")
             self._running = False
         finally:
-            # Clean up
-            await self.shutdown()
+            if self._shutdown_task is not None:
+                # The critical shutdown cleans up, so let it finish powering off
+                await self._shutdown_task
+            else:
+                # Clean up
+                await self.shutdown()
     
     async def _initialize_and_update(self) -> None:
         """Initialize hardware and perform initial update."""
         # Initialize hardware
         self.initialize()
         
-        # Initial update (async)
-        await self.update_weather()
-        
-        # Initial display refresh
-        self.refresh_display()
+        # Initial update, refreshing the display as WiFi is disabled
+        if not await self.update_weather(refresh=True):
+            # Display the cached image, if any
+            await self.refresh_display()
     
     async def _handle_display_sleep_state(self, display_sleeping: bool) -> bool:
         """Handle display sleep state based on quiet hours and charging status.
@@ -438,12 +710,12 @@ class AsyncWeatherDisplayClient:
             case (True, False, False):
                 # Quiet hours active, not charging, display awake -> sleep display
                 self.logger.info("Quiet hours active and not charging - display sleeping")
-                self.display.sleep()
+                await self._run_on_display_thread(self.display.sleep)
                 return True
             case (False, _, True) | (_, True, True):
                 # Quiet hours ended OR charging while display sleeping -> wake display
                 self.logger.info("Quiet hours ended or charging - waking display")
-                self.refresh_display()
+                await self.refresh_display()
                 return False
             case _:
                 # No change needed
@@ -455,13 +727,15 @@ class AsyncWeatherDisplayClient:
         Args:
             display_sleeping: Whether display is currently sleeping
         """
-        # Check if we should update weather (async)
-        if self.power_manager.should_update_weather():
-            await self.update_weather()
-
         # Check if we should refresh display (but skip if display is sleeping)
-        if self.power_manager.should_refresh_display() and not display_sleeping:
-            self.refresh_display()
+        refresh = self.power_manager.should_refresh_display() and not display_sleeping
+
+        # Check if we should update weather, refreshing the display as WiFi is disabled
+        if self.power_manager.should_update_weather() and await self.update_weather(refresh):
+            refresh = False
+
+        if refresh:
+            await self.refresh_display()
 
         # Periodic memory status logging
         self._update_memory_logging()
@@ -489,7 +763,7 @@ class AsyncWeatherDisplayClient:
         # If sleep time is long, consider deep sleep
         if sleep_time > TEN_MINUTES:  # More than 10 minutes
             minutes = sleep_time // 60
-            if self._handle_sleep(minutes):
+            if await self._handle_sleep(minutes):
                 return True  # Exit loop if we're doing deep sleep
 
         # Async sleep (allows other coroutines to run)
@@ -497,11 +771,11 @@ class AsyncWeatherDisplayClient:
         await asyncio.sleep(sleep_time)
         return False
 
-    def _handle_sleep(self, minutes: int) -> bool:
+    async def _handle_sleep(self, minutes: int) -> bool:
         """Handle deep sleep request for extended idle periods.
 
-        Identical to synchronous version as hardware operations don't benefit
-        from async patterns.
+        The display is put to sleep on the display thread, like other display
+        operations.
 
         Args:
             minutes: Number of minutes to schedule for deep sleep.
@@ -517,8 +791,10 @@ class AsyncWeatherDisplayClient:
 
             # Schedule dynamic wakeup based on battery level
             if self.power_manager.schedule_wakeup(minutes, dynamic=True):
+                self._save_boot_state()
+
                 # Close the display
-                self.display.sleep()
+                await self._run_on_display_thread(self.display.sleep)
 
                 # Shutdown the system
                 self.power_manager.shutdown_system()
@@ -526,6 +802,24 @@ class AsyncWeatherDisplayClient:
 
         return False
 
+    def _save_boot_state(self) -> None:
+        """Record the scheduled wakeup so early wakeups can go back to sleep quickly."""
+        wakeup = self.power_manager.get_scheduled_wakeup()
+        if wakeup is None:
+            return
+
+        try:
+            state = BootState(
+                next_wakeup=wakeup.timestamp(),
+                written=time.time(),
+                battery_level=self.power_manager.get_battery_status().level,
+                config_path=str(self.config_path.resolve()),
+                config_mtime=self.config_path.stat().st_mtime,
+            )
+            write_boot_state(self.boot_state_path, state)
+        except Exception as e:
+            self.logger.warning(f"Failed to save boot state: {e}")
+
     async def shutdown(self) -> None:
         """Clean up resources and shut down the async client.
 
@@ -542,7 +836,12 @@ class AsyncWeatherDisplayClient:
 
         # Close the display
         if self.display:
-            self.display.close()
+            await self._run_on_display_thread(self.display.close)
+
+        if self._display_executor is not None:
+            # Nothing is queued after closing the display, so don't block the loop
+            self._display_executor.shutdown(wait=False)
+            self._display_executor = None
 
 
 def main() -> None:
@@ -8,14 +8,18 @@ from typing import TYPE_CHECKING, Protocol
 
 from PIL import Image
 
+from rpi_weather_display.client.image_processor import DiffThresholds
+from rpi_weather_display.constants import MAX_PARTIAL_UPDATES, PARTIAL_UPDATE_COST_PIXELS
 from rpi_weather_display.exceptions import (
     DisplayUpdateError,
     PartialRefreshError,
     chain_exception,
 )
+from rpi_weather_display.utils.dirty_regions import Rect, merge_regions
 
 if TYPE_CHECKING:
     from rpi_weather_display.client.battery_threshold_manager import BatteryThresholdManager
+    from rpi_weather_display.client.frame_store import FrameStore
     from rpi_weather_display.client.image_processor import ImageProcessor
     from rpi_weather_display.models.config import DisplayConfig
 
@@ -45,31 +49,66 @@ class PartialRefreshManager:
         config: Display configuration
         image_processor: Image processing utilities
         battery_threshold_manager: Battery-aware threshold management
+        frame_store: Persists the displayed image across reboots, if set
         _last_image: Previously displayed image for comparison
+        _last_tile_hashes: Tile hashes of the previously displayed image, or
+            None until they are needed
     """
     
     def __init__(
         self,
         config: "DisplayConfig",
         image_processor: "ImageProcessor",
-        battery_threshold_manager: "BatteryThresholdManager"
+        battery_threshold_manager: "BatteryThresholdManager",
+        frame_store: "FrameStore | None" = None
     ) -> None:
         """Initialize the partial refresh manager.
         
+        The image stored before the last shutdown, if any, is restored as
+        the displayed image, since e-paper keeps showing it without power.
+        
         Args:
             config: Display configuration
             image_processor: Image processor instance
             battery_threshold_manager: Battery threshold manager instance
+            frame_store: Store persisting the displayed image across reboots
         """
         self.config = config
         self.image_processor = image_processor
         self.battery_threshold_manager = battery_threshold_manager
+        self.frame_store = frame_store
         self._last_image: Image.Image | None = None
+        self._last_tile_hashes: bytes | None = None
+
+        stored = frame_store.load() if frame_store else None
+        if stored:
+            self._last_image, self._last_tile_hashes = stored
+
+    @property
+    def has_last_image(self) -> bool:
+        """Check whether the displayed image is known, such as after a restore."""
+        return self._last_image is not None
+
+    def prepare_last_image(self) -> None:
+        """Hash the displayed image ahead of the next diff.
+
+        Diffs hash the displayed image if its tile hashes aren't known, such
+        as after restoring an image stored without them. Calling this while
+        waiting for the next image, such as while WiFi connects, keeps that
+        work out of the refresh.
+        """
+        if (
+            self.config.partial_refresh
+            and self._last_image is not None
+            and self._last_tile_hashes is None
+        ):
+            self._last_tile_hashes = self.image_processor.compute_tile_hashes(self._last_image)
         
     def update_display(
         self,
         new_image: Image.Image,
-        display: DisplayProtocol | None
+        display: DisplayProtocol | None,
+        dirty_regions: list[Rect] | None = None
     ) -> bool:
         """Update display with appropriate refresh strategy.
         
@@ -79,6 +118,9 @@ class PartialRefreshManager:
         Args:
             new_image: New image to display
             display: Display interface or None for mock mode
+            dirty_regions: Regions known to differ from the last image, such
+                as the server's changed section tiles, or None to compare
+                the images
             
         Returns:
             True if display was updated, False if no update needed
@@ -92,13 +134,19 @@ class PartialRefreshManager:
                 self._update_last_image(new_image)
                 return True
                 
+            tile_hashes = None
             if self.config.partial_refresh and self._last_image is not None:
-                updated = self._handle_partial_refresh(new_image, display)
+                # Hash the new image to diff it, keeping the hashes for the next diff
+                if dirty_regions is None:
+                    tile_hashes = self.image_processor.compute_tile_hashes(new_image)
+                updated = self._handle_partial_refresh(
+                    new_image, display, dirty_regions, tile_hashes
+                )
             else:
                 updated = self._handle_full_refresh(new_image, display)
                 
             if updated:
-                self._update_last_image(new_image)
+                self._update_last_image(new_image, tile_hashes)
                 
             return updated
             
@@ -122,13 +170,22 @@ class PartialRefreshManager:
     def _handle_partial_refresh(
         self,
         new_image: Image.Image,
-        display: DisplayProtocol
+        display: DisplayProtocol,
+        dirty_regions: list[Rect] | None = None,
+        tile_hashes: bytes | None = None
     ) -> bool:
         """Handle partial refresh logic.
         
+        Each changed region is refreshed with its own partial update, in
+        order from top to bottom.
+        
         Args:
             new_image: New image to display
             display: Display interface
+            dirty_regions: Regions known to differ from the last image, or
+                None to compare the images
+            tile_hashes: Tile hashes of the new image, computed if needed
+                and not given
             
         Returns:
             True if display was updated, False if no update needed
@@ -142,27 +199,41 @@ class PartialRefreshManager:
         # Initialize variables for error handling
         pixel_threshold = None
         min_changed_pixels = None
-        bbox = None
+        regions = None
             
         try:
-            # Get thresholds from battery manager
-            pixel_threshold = self.battery_threshold_manager.get_pixel_diff_threshold()
-            min_changed_pixels = self.battery_threshold_manager.get_min_changed_pixels()
-            
-            # Calculate changed region
-            bbox = self.image_processor.calculate_diff_bbox(
-                self._last_image,
-                new_image,
-                pixel_threshold,
-                min_changed_pixels
-            )
-            
-            if bbox:
-                display.display_partial(new_image, bbox)
-                return True
-                
-            # No significant changes
-            return False
+            if dirty_regions is not None:
+                # Known regions are exact, so refresh them without comparing pixels
+                regions = merge_regions(
+                    dirty_regions, PARTIAL_UPDATE_COST_PIXELS, MAX_PARTIAL_UPDATES
+                )
+            else:
+                # Get thresholds from battery manager
+                pixel_threshold = self.battery_threshold_manager.get_pixel_diff_threshold()
+                min_changed_pixels = self.battery_threshold_manager.get_min_changed_pixels()
+
+                # Hash the last image once, so repeated diffs against it only hash the new one
+                if self._last_tile_hashes is None:
+                    self._last_tile_hashes = self.image_processor.compute_tile_hashes(
+                        self._last_image
+                    )
+
+                # Calculate changed regions
+                regions = self.image_processor.calculate_diff_regions(
+                    self._last_image,
+                    new_image,
+                    DiffThresholds(pixel_threshold, min_changed_pixels),
+                    self._last_tile_hashes,
+                    tile_hashes
+                )
+
+            # No regions means no significant changes
+            if not regions:
+                return False
+
+            for region in regions:
+                display.display_partial(new_image, region)
+            return True
             
         except Exception as e:
             raise chain_exception(
@@ -171,7 +242,8 @@ class PartialRefreshManager:
                     {
                         "pixel_threshold": pixel_threshold,
                         "min_changed_pixels": min_changed_pixels,
-                        "bbox": bbox,
+                        "regions": regions,
+                        "dirty_regions": dirty_regions,
                         "error": str(e)
                     }
                 ),
@@ -211,21 +283,42 @@ class PartialRefreshManager:
                 e
             ) from None
         
-    def _update_last_image(self, new_image: Image.Image) -> None:
+    def _update_last_image(
+        self, new_image: Image.Image, tile_hashes: bytes | None = None
+    ) -> None:
         """Update the stored last image reference.
         
         Args:
             new_image: New image to store
+            tile_hashes: Tile hashes of the new image, if already computed
         """
         # Clean up old image
         if self._last_image is not None:
             self._last_image.close()
             
         # Store new image
+        stored_hashes = self._last_tile_hashes
         self._last_image = new_image
+        self._last_tile_hashes = tile_hashes
+
+        # Persist it with its hashes for the first diff after a reboot,
+        # unless the same frame is stored already
+        if self.frame_store:
+            if tile_hashes is None:
+                self._last_tile_hashes = self.image_processor.compute_tile_hashes(new_image)
+            if self._last_tile_hashes is None or self._last_tile_hashes != stored_hashes:
+                self.frame_store.save(new_image, self._last_tile_hashes)
         
-    def clear_last_image(self) -> None:
-        """Clear the stored last image."""
+    def clear_last_image(self, keep_stored: bool = False) -> None:
+        """Clear the stored last image.
+        
+        Args:
+            keep_stored: Keep the persisted image, for when the display
+                still shows it, such as when shutting down
+        """
         if self._last_image is not None:
             self._last_image.close()
-            self._last_image = None
\ No newline at end of file
+            self._last_image = None
+        self._last_tile_hashes = None
+        if self.frame_store and not keep_stored:
+            self.frame_store.clear()
\ No newline at end of file
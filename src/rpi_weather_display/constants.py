@@ -31,11 +31,28 @@ GOOGLE_DNS_PORT = 53  # DNS port for connectivity tests
 BROADCAST_IP = "10.255.255.255"  # Broadcast IP for network discovery
 BROADCAST_PORT = 1  # Port for network discovery
 API_LOCATION_LIMIT = 1  # Limit parameter for geocoding API results
+LOCATION_GRID_DECIMALS = 6  # Decimal places kept when snapping coordinates to a grid
+WEATHER_FETCH_API_CALLS = 2  # API calls per weather fetch (One Call + air pollution)
+GEOCODING_API_CALLS = 1  # API calls per geocoding lookup
+QUOTA_BACKGROUND_RESERVE_FRACTION = 0.2  # Daily budget fraction reserved for interactive calls
+QUOTA_TTL_STRETCH_THRESHOLD = 0.5  # Remaining budget fraction below which cache TTLs stretch
+QUOTA_MAX_TTL_MULTIPLIER = 4.0  # Maximum cache TTL multiplier when the budget is exhausted
+QUOTA_KEY_ID_LENGTH = 12  # Hex digits of the API key hash used to identify quota budgets
+QUOTA_FLUSH_INTERVAL_SECONDS = 60  # Minimum time between API call counter flushes
+WEATHER_PREFETCH_LEAD_SECONDS = 300  # Refresh cached weather in the background this close to expiry
 DEFAULT_SERVER_HOST = "127.0.0.1"  # Default host for server
 # HTTP timeout and connection settings
 CONNECTION_TIMEOUT = 5.0  # HTTP connection timeout in seconds
 WRITE_TIMEOUT = 5.0  # HTTP write timeout in seconds
 POOL_TIMEOUT = 5.0  # HTTP connection pool timeout in seconds
+# Upstream circuit breaker settings
+CIRCUIT_FAILURE_RATE_THRESHOLD = 0.5  # Fraction of failed calls that opens the circuit
+CIRCUIT_SLOW_CALL_SECONDS = 4.0  # Upstream call duration in seconds that counts as slow
+CIRCUIT_SLOW_CALL_RATE_THRESHOLD = 0.5  # Fraction of slow calls that opens the circuit
+CIRCUIT_WINDOW_SIZE = 10  # Number of recent upstream calls evaluated
+CIRCUIT_MIN_CALLS = 3  # Calls needed in the window before the circuit can open
+CIRCUIT_OPEN_SECONDS = 60.0  # Seconds the circuit stays open before probing again
+UPSTREAM_SERVICE_NAME = "OpenWeatherMap"  # Name of the upstream weather provider
 MAX_KEEPALIVE_CONNECTIONS = 2  # Maximum keepalive connections
 MAX_CONNECTIONS = 5  # Maximum total connections
 KEEPALIVE_EXPIRY = 30.0  # Keepalive connection expiry in seconds
@@ -81,12 +98,22 @@ SYSTEM_HALT_DELAY = 5  # Delay before system halt in seconds
 BUTTON_PRESS_DELAY = 180  # Button press configuration delay in seconds
 PIJUICE_YEAR_OFFSET = 2000  # PiJuice expects year as offset from 2000
 PIJUICE_STATUS_OK = "NO_ERROR"  # PiJuice success status
+PIJUICE_CHARGING_STATES = ("CHARGING_FROM_IN", "CHARGING_FROM_5V_IO")  # Battery charging
+PIJUICE_POWER_PRESENT = "PRESENT"  # Power input status with a supply connected
 # Sleep multipliers for different power states
 CONSERVING_SLEEP_MULTIPLIER = 2  # Multiplier for conserving mode sleep
 CRITICAL_SLEEP_MULTIPLIER = 4  # Multiplier for critical mode sleep
 
 # Display constants
 DISPLAY_MARGIN = 5  # Pixel margin for image display
+DIFF_TILE_SIZE = 32  # Edge (pixels) of the grid tiles changed pixels are grouped on
+TILE_HASH_SIZE = 8  # Digest bytes per tile for spotting changed tiles without pixel diffs
+LAST_FRAME_FILENAME = "last_frame.gray"  # Displayed frame kept for diffing after a reboot
+STORED_FRAME_GRAY_LEVELS = 16  # Gray levels of the kept frame, packed two pixels a byte
+DISPLAYED_DIGEST_FILENAME = "last_frame.sha256"  # Digest of the image file being displayed
+DIFF_MAX_COMPONENTS = 64  # More changed areas than this are refreshed as one rectangle
+PARTIAL_UPDATE_COST_PIXELS = 100_000  # Fixed cost of one partial update, in refreshed pixels
+MAX_PARTIAL_UPDATES = 8  # Most partial updates issued for one image
 TITLE_FONT_SIZE_BASE = 36  # Base font size for title text
 TITLE_FONT_SIZE_MAX = 48  # Maximum font size for title text
 MESSAGE_FONT_SIZE_BASE = 24  # Base font size for message text
@@ -116,11 +143,14 @@ KILOBYTES_PER_MEGABYTE = 1024  # Kilobytes in a megabyte
 BYTES_PER_MEGABYTE = 1024 * 1024  # Bytes in a megabyte
 
 # Cache constants
-UVI_CACHE_FILENAME = "uvi_max_cache.json"  # Filename for UV index cache
+DAILY_EXTREMES_FILENAME = "daily_extremes.json"  # Filename for persisted daily extremes
+DAILY_EXTREMES_FLUSH_INTERVAL_SECONDS = 300  # Minimum time between daily extremes flushes
+TIME_FORMAT_CACHE_SIZE = 2048  # Max memoized timestamp formats shared across renders
 # Memory cache defaults
 DEFAULT_MEMORY_CACHE_SIZE_MB = 50.0  # Default memory cache size in MB
 DEFAULT_CACHE_TTL_SECONDS = 900  # Default memory cache TTL (15 minutes)
 WEATHER_API_CACHE_SIZE_MB = 20.0  # Weather API response cache size in MB
+QUOTA_STATE_FILENAME = "api_quota.json"  # Filename for persisted API call counters
 # File cache defaults
 DEFAULT_FILE_CACHE_SIZE_MB = 100.0  # Default file cache size in MB
 DEFAULT_FILE_CACHE_TTL_SECONDS = 3600  # Default file cache TTL (1 hour)
@@ -132,16 +162,48 @@ MEMORY_LEAK_GROWTH_THRESHOLD = 8  # Number of growth samples to trigger leak war
 # Server-specific memory thresholds
 SERVER_IMAGE_CACHE_SIZE_MB = 50.0  # Image cache size for server
 SERVER_IMAGE_CACHE_TTL_SECONDS = 3600  # Image cache TTL for server (1 hour)
+SERVER_IMAGE_CACHE_DIR_NAME = "images"  # Subdirectory of the cache dir for rendered images
 SERVER_MEMORY_GROWTH_THRESHOLD_MB = 100.0  # Memory growth threshold for server rendering
 # Browser management constants
 BROWSER_LAUNCH_DELAY = 0.1  # Delay after browser launch to ensure it's ready (seconds)
 # Client-specific memory thresholds
 CLIENT_MEMORY_GROWTH_THRESHOLD_MB = 20.0  # Memory growth threshold for client operations
+MAX_IMAGE_DOWNLOAD_BYTES = 8 * 1024 * 1024  # Largest image the client accepts from the server
+BOOT_STATE_FILENAME = "boot_state.json"  # Wakeup scheduled before deep sleep, for fast boots
+BOOT_WAKE_GRACE_SECONDS = 120  # Wakeups this close to the scheduled one run the full client
+BOOT_FULL_ENV_VAR = "RPI_WEATHER_DISPLAY_FULL_BOOT"  # Set to 1 to always run the full client
 # File type/extension constants
 DEFAULT_IMAGE_FILENAME = "current.png"  # Default filename for weather image
 IMAGE_FILE_EXTENSION = ".png"  # Image file extension
 IMAGE_MEDIA_TYPE = "image/png"  # MIME type for PNG images
 DOWNLOAD_FILENAME = "weather.png"  # Filename for downloaded weather image
+# Render response schedule headers
+NEXT_UPDATE_HEADER = "X-Next-Update"  # Unix time of the next scheduled content change
+DATA_EXPIRES_HEADER = "X-Data-Expires"  # Unix time the weather data behind an image expires
+SERVER_UPDATE_GRACE_SECONDS = 30  # Seconds to wait past an advised update before waking
+ETAG_HEADER = "ETag"  # Fingerprint of the displayed content of a rendered image
+IF_NONE_MATCH_HEADER = "If-None-Match"  # ETag of the image a client already shows
+DIRTY_REGIONS_HEADER = "X-Dirty-Regions"  # Regions differing from the If-None-Match image
+# Dashboard section tiles
+SECTION_TEMPLATE = "_section.html.j2"  # Template rendering one dashboard section on its own
+TILE_VIEWPORT_HEIGHT = 1  # Viewport height for tiles; full-page screenshots fit the section
+TILE_CACHE_SIZE_MB = 20.0  # Memory for rendered section tiles per renderer
+TILE_CACHE_TTL_SECONDS = 86400  # Tiles are keyed by content; the TTL only frees idle tiles
+FRAME_LAYOUT_HISTORY = 16  # Recent frame layouts kept for computing dirty regions
+
+# Server metrics
+METRICS_NAMESPACE = "rpi_weather_display"  # Prefix of exposed metric names
+METRICS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"  # Prometheus text format
+METRICS_LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0
+)  # Histogram bucket bounds for durations (seconds)
+METRICS_SIZE_BUCKETS = (
+    16_384, 65_536, 131_072, 262_144, 524_288, 1_048_576, 2_097_152, 4_194_304
+)  # Histogram bucket bounds for response sizes (bytes)
+METRICS_DEFAULT_DEVICE = "default"  # Device label for requests without a device ID
+# Request tracing
+SERVER_TIMING_HEADER = "Server-Timing"  # Durations of the stages of a traced request
+OPERATION_ID_HEADER = "X-Operation-ID"  # ID matching a response to its trace log record
 
 # Preview default values
 PREVIEW_BATTERY_LEVEL = 85  # Default battery level percentage for preview mode
@@ -28,9 +28,11 @@ Exception Hierarchy:
     └── APIError
         ├── WeatherAPIError
         ├── APIRateLimitError
+        │   └── APIQuotaExceededError
         ├── APIAuthenticationError
         ├── APITimeoutError
-        └── InvalidAPIResponseError
+        ├── InvalidAPIResponseError
+        └── CircuitOpenError
 """
 
 from typing import Any
@@ -327,6 +329,18 @@ class APIRateLimitError(APIError):
     pass
 
 
+class APIQuotaExceededError(APIRateLimitError):
+    """Raised when a request would exceed the locally tracked API call budget.
+    
+    Example:
+        raise APIQuotaExceededError(
+            "Daily API call budget exhausted",
+            {"key_id": "3f2a9c", "window": "daily", "limit": 1000, "priority": "BACKGROUND"}
+        )
+    """
+    pass
+
+
 class APIAuthenticationError(APIError):
     """Raised when API authentication fails.
     
@@ -366,6 +380,18 @@ class InvalidAPIResponseError(APIError):
     pass
 
 
+class CircuitOpenError(APIError):
+    """Raised when a call is rejected because the circuit for a failing service is open.
+    
+    Example:
+        raise CircuitOpenError(
+            "Circuit open for OpenWeatherMap",
+            {"service": "OpenWeatherMap", "state": "open", "retry_at": "2024-05-25T10:01:00"}
+        )
+    """
+    pass
+
+
 # Utility function for exception chaining
 def chain_exception(new_exception: WeatherDisplayError, cause: Exception) -> WeatherDisplayError:
     """Chain a new exception with its underlying cause.
@@ -9,6 +9,7 @@ from typing import Any
 
 from pydantic import BaseModel, Field, ValidationError, field_validator
 
+from rpi_weather_display.constants import WEATHER_FETCH_API_CALLS
 from rpi_weather_display.exceptions import (
     ConfigFileNotFoundError,
     InvalidConfigError,
@@ -45,6 +46,9 @@ class WeatherConfig(BaseModel):
     update_interval_minutes: int = 30
     forecast_days: int = 5
     hourly_forecast_count: int = 24
+    location_grid_degrees: float = 0.0  # Grid size for sharing fetches; 0 disables snapping
+    api_calls_per_minute: int = 60  # OpenWeatherMap per-minute call limit for the API key
+    api_calls_per_day: int = 1000  # OpenWeatherMap daily call limit for the API key
 
     @field_validator("update_interval_minutes")
     @classmethod
@@ -64,6 +68,57 @@ class WeatherConfig(BaseModel):
             raise ValueError("Update interval must be at least 15 minutes to conserve battery")
         return v
 
+    @field_validator("location_grid_degrees")
+    @classmethod
+    def validate_location_grid_degrees(cls, v: float) -> float:
+        """Validate the location grid size.
+
+        Args:
+            v: The grid size in degrees.
+
+        Returns:
+            The validated grid size.
+
+        Raises:
+            ValueError: If the grid size is negative or larger than one degree.
+        """
+        if v < 0 or v > 1:
+            raise ValueError("Location grid must be between 0 and 1 degree (0 disables it)")
+        return v
+
+    @field_validator("api_calls_per_minute", "api_calls_per_day")
+    @classmethod
+    def validate_api_call_limit(cls, v: int) -> int:
+        """Validate an API call limit.
+
+        Args:
+            v: The call limit.
+
+        Returns:
+            The validated call limit.
+
+        Raises:
+            ValueError: If the limit is below the calls needed for one weather fetch.
+        """
+        if v < WEATHER_FETCH_API_CALLS:
+            raise ValueError(
+                f"API call limits must allow at least {WEATHER_FETCH_API_CALLS} calls"
+            )
+        return v
+
+    @property
+    def location_key(self) -> str:
+        """Get a key identifying the location, units and language of this configuration.
+
+        Returns:
+            Key combining coordinates (or city name if not located), units and language.
+        """
+        lat = self.location.get("lat")
+        lon = self.location.get("lon")
+        located = lat is not None and lon is not None
+        place = f"{lat},{lon}" if located else f"city:{self.city_name}"
+        return f"{place}_{self.units}_{self.language}"
+
     @field_validator("hourly_forecast_count")
     @classmethod
     def validate_hourly_forecast_count(cls, v: int) -> int:
@@ -96,6 +151,9 @@ class DisplayConfig(BaseModel):
     refresh_interval_charging_minutes: int = 15  # Interval when charging
     battery_aware_refresh: bool = True  # Whether to adjust refresh intervals based on battery
     partial_refresh: bool = True
+    tiled_rendering: bool = True  # Render and cache dashboard sections as separate tiles
+    persist_last_frame: bool = True  # Keep the displayed frame for diffing after a reboot
+    last_frame_dir: str = ""  # Empty string means use the client state directory
     pixel_diff_threshold: int = 10  # Threshold for considering a pixel changed
     pixel_diff_threshold_low_battery: int = 20  # Threshold when battery is low
     pixel_diff_threshold_critical_battery: int = 30  # Threshold when battery is critical
@@ -222,6 +280,8 @@ class ServerConfig(BaseModel):
     cache_dir: str = ""  # Empty string means use the default from path_resolver
     log_level: str = "INFO"
     image_format: str = "PNG"
+    device_id: str | None = None  # Identifies this display to a multi-device server
+    request_tracing: bool = True  # Time render stages for Server-Timing headers and logs
 
 
 class LoggingConfig(BaseModel):
@@ -234,6 +294,22 @@ class LoggingConfig(BaseModel):
     backup_count: int = 3
 
 
+class DeviceProfile(BaseModel):
+    """Per-device settings for a display served by a shared server.
+
+    Fields left as None fall back to the server's own weather and display
+    configuration.
+    """
+
+    location: dict[str, float] | None = None
+    city_name: str | None = None
+    units: str | None = None
+    language: str | None = None
+    width: int | None = None
+    height: int | None = None
+    rotate: int | None = None  # 0, 90, 180, 270
+
+
 class AppConfig(BaseModel):
     """Main application configuration."""
 
@@ -242,6 +318,7 @@ class AppConfig(BaseModel):
     power: PowerConfig
     server: ServerConfig
     logging: LoggingConfig = Field(default_factory=LoggingConfig)
+    devices: dict[str, DeviceProfile] = Field(default_factory=dict)
     debug: bool = False
     development_mode: bool = False
 
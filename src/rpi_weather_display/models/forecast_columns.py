@@ -0,0 +1,158 @@
+"""Columnar view of hourly and daily forecasts.
+
+Stores each forecast field as a NumPy array so derived values such as daily
+maximums are computed with vectorized operations instead of Python loops
+over forecast models. NumPy is optional; without it no view is built and
+callers fall back to iterating the models.
+"""
+
+from collections.abc import Callable, Sequence
+from functools import cache
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from numpy.typing import DTypeLike, NDArray
+
+    from rpi_weather_display.models.weather import DailyWeather, HourlyWeather
+
+
+@cache
+def _import_numpy() -> ModuleType | None:
+    """Import numpy or return None if not available.
+
+    Returns:
+        The numpy module if available, or None if the library cannot be imported
+    """
+    try:
+        # Imported on first use, keeping numpy out of startup for callers that never need it
+        import numpy as np  # noqa: PLC0415
+        return np
+    except ImportError:
+        return None
+
+
+def _precipitation_1h(amounts: dict[str, float] | None) -> float:
+    """Get the hourly precipitation amount from an API precipitation dict.
+
+    Args:
+        amounts: Precipitation dict such as {"1h": 0.5}, or None
+
+    Returns:
+        Amount in mm, or 0.0 if not reported
+    """
+    return amounts.get("1h", 0.0) if amounts else 0.0
+
+
+class ForecastColumns:
+    """Hourly and daily forecast fields as NumPy arrays.
+
+    Arrays are aligned with the forecast lists they were built from, so index
+    i of every hourly array describes the i-th hourly forecast. Missing
+    optional values are NaN for wind gusts and 0.0 for precipitation.
+
+    Attributes:
+        hourly_dt: Hourly forecast Unix timestamps
+        hourly_temp: Hourly temperatures
+        hourly_feels_like: Hourly feels-like temperatures
+        hourly_pressure: Hourly pressures in hPa
+        hourly_humidity: Hourly relative humidity percentages
+        hourly_uvi: Hourly UV index values
+        hourly_clouds: Hourly cloud cover percentages
+        hourly_wind_speed: Hourly wind speeds
+        hourly_wind_gust: Hourly wind gusts
+        hourly_pop: Hourly probabilities of precipitation
+        hourly_precipitation: Hourly rain plus snow in mm
+        daily_dt: Daily forecast Unix timestamps
+        daily_temp_min: Daily minimum temperatures
+        daily_temp_max: Daily maximum temperatures
+        daily_uvi: Daily maximum UV index values
+        daily_wind_speed: Daily wind speeds
+        daily_pop: Daily probabilities of precipitation
+        daily_precipitation: Daily rain plus snow in mm
+    """
+
+    def __init__(
+        self,
+        np: ModuleType,
+        hourly: Sequence["HourlyWeather"],
+        daily: Sequence["DailyWeather"],
+    ) -> None:
+        """Build the arrays from forecast models.
+
+        Args:
+            np: The numpy module
+            hourly: Hourly forecasts
+            daily: Daily forecasts
+        """
+        self._np = np
+
+        def column(
+            items: Sequence[Any], value: Callable[[Any], float], dtype: "DTypeLike" = np.float64
+        ) -> "NDArray[Any]":
+            return np.fromiter((value(item) for item in items), dtype=dtype, count=len(items))
+
+        nan = float("nan")
+        self.hourly_dt = column(hourly, lambda h: h.dt, np.int64)
+        self.hourly_temp = column(hourly, lambda h: h.temp)
+        self.hourly_feels_like = column(hourly, lambda h: h.feels_like)
+        self.hourly_pressure = column(hourly, lambda h: h.pressure)
+        self.hourly_humidity = column(hourly, lambda h: h.humidity)
+        self.hourly_uvi = column(hourly, lambda h: h.uvi)
+        self.hourly_clouds = column(hourly, lambda h: h.clouds)
+        self.hourly_wind_speed = column(hourly, lambda h: h.wind_speed)
+        self.hourly_wind_gust = column(
+            hourly, lambda h: nan if h.wind_gust is None else h.wind_gust
+        )
+        self.hourly_pop = column(hourly, lambda h: h.pop)
+        self.hourly_precipitation = column(
+            hourly, lambda h: _precipitation_1h(h.rain) + _precipitation_1h(h.snow)
+        )
+
+        self.daily_dt = column(daily, lambda d: d.dt, np.int64)
+        self.daily_temp_min = column(daily, lambda d: d.temp.min)
+        self.daily_temp_max = column(daily, lambda d: d.temp.max)
+        self.daily_uvi = column(daily, lambda d: d.uvi)
+        self.daily_wind_speed = column(daily, lambda d: d.wind_speed)
+        self.daily_pop = column(daily, lambda d: d.pop)
+        self.daily_precipitation = column(daily, lambda d: (d.rain or 0.0) + (d.snow or 0.0))
+
+    @classmethod
+    def build(
+        cls, hourly: Sequence["HourlyWeather"], daily: Sequence["DailyWeather"]
+    ) -> "ForecastColumns | None":
+        """Build a columnar view if numpy is available.
+
+        Args:
+            hourly: Hourly forecasts
+            daily: Daily forecasts
+
+        Returns:
+            The columnar view, or None if numpy is not installed
+        """
+        np = _import_numpy()
+        if np is None:
+            return None
+        return cls(np, hourly, daily)
+
+    def hourly_max_between(
+        self, values: "NDArray[Any]", start: int, end: int
+    ) -> tuple[float, int] | None:
+        """Find the largest hourly value within a time range.
+
+        Ties resolve to the earliest hour.
+
+        Args:
+            values: Hourly array to search, such as hourly_uvi
+            start: Start of the range as a Unix timestamp (inclusive)
+            end: End of the range as a Unix timestamp (inclusive)
+
+        Returns:
+            Tuple of (value, timestamp), or None if no hour falls in the range
+        """
+        np = self._np
+        indices = np.flatnonzero((self.hourly_dt >= start) & (self.hourly_dt <= end))
+        if indices.size == 0:
+            return None
+        index = indices[np.argmax(values[indices])]
+        return float(values[index]), int(self.hourly_dt[index])
@@ -6,7 +6,9 @@ forecasts, and air quality data from weather service APIs.
 
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
+
+from rpi_weather_display.models.forecast_columns import ForecastColumns
 
 
 class WeatherCondition(BaseModel):
@@ -187,6 +189,17 @@ class AirPollutionData(BaseModel):
     main: dict[str, int] = Field(..., alias="main")
     components: AirPollution
 
+    @model_validator(mode="after")
+    def copy_aqi_to_components(self) -> "AirPollutionData":
+        """Copy the AQI into the components when the API only reports it in main.
+
+        Returns:
+            The validated air pollution data.
+        """
+        if self.components.aqi is None and "aqi" in self.main:
+            self.components.aqi = self.main["aqi"]
+        return self
+
     @property
     def timestamp(self) -> datetime:
         """Convert Unix timestamp to datetime.
@@ -229,3 +242,41 @@ class WeatherData(BaseModel):
     daily: list[DailyWeather]
     air_pollution: AirPollutionData | None = None
     last_updated: datetime = Field(default_factory=datetime.now)
+
+    _columns: ForecastColumns | None = PrivateAttr(default=None)
+
+    @property
+    def columns(self) -> ForecastColumns | None:
+        """Get a columnar NumPy view of the hourly and daily forecasts.
+
+        The view is built on first access and reused afterwards, since weather
+        data is not modified once validated.
+
+        Returns:
+            The columnar view, or None if numpy is not installed.
+        """
+        if self._columns is None:
+            self._columns = ForecastColumns.build(self.hourly, self.daily)
+        return self._columns
+
+
+class OneCallResponse(BaseModel):
+    """One Call API response.
+
+    Validated directly from the raw response bytes, so the forecast models are
+    built in a single pass without an intermediate tree of dictionaries.
+    """
+
+    lat: float
+    lon: float
+    timezone: str
+    timezone_offset: int
+    current: CurrentWeather
+    hourly: list[HourlyWeather]
+    daily: list[DailyWeather]
+
+
+class AirPollutionResponse(BaseModel):
+    """Air pollution API response."""
+
+    entries: list[AirPollutionData] = Field(default_factory=list, alias="list")
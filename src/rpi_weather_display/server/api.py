@@ -10,228 +10,47 @@ from datetime import datetime
 from typing import TypedDict
 
 import httpx
+from pydantic import ValidationError
 
 from rpi_weather_display.constants import (
     API_LOCATION_LIMIT,
+    GEOCODING_API_CALLS,
+    LOCATION_GRID_DECIMALS,
     OWM_AIR_POLLUTION_URL,
     OWM_GEOCODING_URL,
     OWM_ONECALL_URL,
     SECONDS_PER_MINUTE,
-    WEATHER_API_CACHE_SIZE_MB,
+    UPSTREAM_SERVICE_NAME,
+    WEATHER_FETCH_API_CALLS,
+    WEATHER_PREFETCH_LEAD_SECONDS,
 )
 from rpi_weather_display.exceptions import (
     APIAuthenticationError,
     APIRateLimitError,
     APITimeoutError,
+    CircuitOpenError,
     InvalidAPIResponseError,
     MissingConfigError,
     WeatherAPIError,
+    WeatherDisplayError,
     chain_exception,
 )
 from rpi_weather_display.models.config import WeatherConfig
 from rpi_weather_display.models.weather import (
-    AirPollution,
     AirPollutionData,
-    CurrentWeather,
-    DailyWeather,
-    HourlyWeather,
+    AirPollutionResponse,
+    OneCallResponse,
     WeatherData,
 )
-from rpi_weather_display.utils.cache_manager import MemoryAwareCache
+from rpi_weather_display.server.circuit_breaker import CircuitBreaker
+from rpi_weather_display.server.metrics import cache_requests_total, upstream_fetch_seconds
+from rpi_weather_display.server.quota_governor import QuotaGovernor, RequestPriority
+from rpi_weather_display.server.tracing import span
+from rpi_weather_display.server.weather_cache import WeatherCacheIndex
 from rpi_weather_display.utils.error_utils import get_error_location
 
-# Type definitions for API responses
-# These TypedDicts represent the exact JSON structure from OpenWeatherMap API.
-# They use 'Response' suffix to distinguish from Pydantic models while showing
-# the mapping relationship (e.g., WeatherConditionResponse -> WeatherCondition model)
-
-class WeatherConditionResponse(TypedDict):
-    """Weather condition from API response.
-    
-    Maps to WeatherCondition Pydantic model.
-    Represents elements in the 'weather' array.
-    """
-
-    id: int
-    main: str
-    description: str
-    icon: str
-
-
-class CurrentWeatherResponse(TypedDict):
-    """Current weather data from API response.
-    
-    Maps to CurrentWeather Pydantic model.
-    """
-
-    dt: int
-    sunrise: int
-    sunset: int
-    temp: float
-    feels_like: float
-    pressure: int
-    humidity: int
-    dew_point: float
-    uvi: float
-    clouds: int
-    visibility: int
-    wind_speed: float
-    wind_deg: int
-    weather: list[WeatherConditionResponse]
-    wind_gust: float | None  # Optional field
-    rain: dict[str, float] | None  # Optional field, e.g. {"1h": 0.5}
-    snow: dict[str, float] | None  # Optional field, e.g. {"1h": 0.5}
-
-
-class HourlyWeatherResponse(TypedDict, total=False):
-    """Hourly weather forecast from API response.
-    
-    Maps to HourlyWeather Pydantic model.
-    Uses total=False to handle optional fields properly.
-    """
-
-    # Required fields
-    dt: int
-    temp: float
-    feels_like: float
-    pressure: int
-    humidity: int
-    dew_point: float
-    uvi: float
-    clouds: int
-    wind_speed: float
-    wind_deg: int
-    weather: list[WeatherConditionResponse]
-    pop: float  # Probability of precipitation (0-1)
-    
-    # Optional fields
-    visibility: int  # Not always provided in hourly forecasts
-    wind_gust: float | None
-    rain: dict[str, float] | None  # e.g. {"1h": 0.5}
-    snow: dict[str, float] | None  # e.g. {"1h": 0.5}
-
-
-class DailyTempResponse(TypedDict):
-    """Daily temperature data from API response.
-    
-    Maps to DailyTemp Pydantic model.
-    Represents the 'temp' object in daily forecast.
-    """
-
-    day: float
-    min: float
-    max: float
-    night: float
-    eve: float
-    morn: float
-
-
-class DailyFeelsLikeResponse(TypedDict):
-    """Daily feels-like temperature data from API response.
-    
-    Maps to DailyFeelsLike Pydantic model.
-    Represents the 'feels_like' object in daily forecast.
-    """
-
-    day: float
-    night: float
-    eve: float
-    morn: float
-
-
-class DailyWeatherResponse(TypedDict):
-    """Daily weather forecast from API response.
-    
-    Maps to DailyWeather Pydantic model.
-    """
-
-    dt: int
-    sunrise: int
-    sunset: int
-    moonrise: int
-    moonset: int
-    moon_phase: float
-    temp: DailyTempResponse
-    feels_like: DailyFeelsLikeResponse
-    pressure: int
-    humidity: int
-    dew_point: float
-    wind_speed: float
-    wind_deg: int
-    wind_gust: float | None
-    weather: list[WeatherConditionResponse]
-    clouds: int
-    pop: float
-    rain: float | None
-    snow: float | None
-    uvi: float
-
-
-class AirPollutionComponents(TypedDict):
-    """Air pollution components data.
-    
-    Matches the 'components' object in the air pollution API response.
-    All values are in μg/m³.
-    """
-
-    co: float      # Carbon monoxide
-    no: float      # Nitrogen monoxide
-    no2: float     # Nitrogen dioxide
-    o3: float      # Ozone
-    so2: float     # Sulphur dioxide
-    pm2_5: float   # Fine particles matter (note: API uses pm2_5, not pm25)
-    pm10: float    # Coarse particulate matter
-    nh3: float     # Ammonia
-
-
-class AirPollutionMain(TypedDict):
-    """Air quality index data."""
-
-    aqi: int
-
-
-class AirPollutionDataResponse(TypedDict):
-    """Single air pollution data point."""
-
-    dt: int
-    main: AirPollutionMain
-    components: AirPollutionComponents
-
-
-class AirPollutionAPIResponse(TypedDict):
-    """Air pollution API response."""
-
-    coord: dict[str, float]
-    list: list[AirPollutionDataResponse]
-
-
-class WeatherAPIResponse(TypedDict):
-    """Complete weather API response from OpenWeatherMap."""
-
-    lat: float
-    lon: float
-    timezone: str
-    timezone_offset: int
-    current: CurrentWeatherResponse
-    hourly: list[HourlyWeatherResponse]
-    daily: list[DailyWeatherResponse]
-
-
-class CombinedWeatherResponse(TypedDict):
-    """Weather API response combined with air pollution data.
-    
-    This is our internal representation after fetching both
-    weather and air pollution data.
-    """
-
-    lat: float
-    lon: float
-    timezone: str
-    timezone_offset: int
-    current: CurrentWeatherResponse
-    hourly: list[HourlyWeatherResponse]
-    daily: list[DailyWeatherResponse]
-    air_pollution: AirPollutionDataResponse | None
+# Type definition for the geocoding API response, which is decoded into
+# dictionaries. Weather responses are validated straight into Pydantic models.
 
 
 class GeocodingLocationResponse(TypedDict):
@@ -265,20 +84,38 @@ class WeatherAPIClient:
     AIR_POLLUTION_URL = OWM_AIR_POLLUTION_URL
     GEOCODING_URL = OWM_GEOCODING_URL
 
-    def __init__(self, config: WeatherConfig) -> None:
+    def __init__(
+        self,
+        config: WeatherConfig,
+        cache_index: WeatherCacheIndex | None = None,
+        quota_governor: QuotaGovernor | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+    ) -> None:
         """Initialize the API client.
 
         Args:
             config: Weather API configuration including API key, location,
                 units preference, language, and update intervals.
+            cache_index: Optional weather cache shared with other clients. A private
+                cache is created when not provided.
+            quota_governor: Optional API quota governor shared with other clients.
+                An in-memory governor using the configured limits is created when
+                not provided.
+            circuit_breaker: Optional circuit breaker for upstream calls, shared
+                with other clients. A private breaker is created when not provided.
         """
         self.config = config
         self.logger = logging.getLogger(__name__)
-        # Initialize memory-aware cache
-        self._cache = MemoryAwareCache[WeatherData](
-            max_size_mb=WEATHER_API_CACHE_SIZE_MB,
-            ttl_seconds=int(config.update_interval_minutes * SECONDS_PER_MINUTE),
+        # Initialize memory-aware cache, shared with other clients when given
+        self.cache_index = cache_index or WeatherCacheIndex(
+            ttl_seconds=int(config.update_interval_minutes * SECONDS_PER_MINUTE)
         )
+        self._cache = self.cache_index.cache
+        self._last_cache_key: str | None = None
+        self.quota_governor = quota_governor or QuotaGovernor(
+            config.api_calls_per_minute, config.api_calls_per_day
+        )
+        self.circuit_breaker = circuit_breaker or CircuitBreaker(UPSTREAM_SERVICE_NAME)
 
     async def get_coordinates(self) -> tuple[float, float]:
         """Get latitude and longitude from city name if needed.
@@ -313,7 +150,7 @@ class WeatherAPIClient:
         lat = self.config.location.get("lat")
         lon = self.config.location.get("lon")
 
-        if lat and lon:
+        if lat is not None and lon is not None:
             return (lat, lon)
         return None
 
@@ -375,8 +212,10 @@ class WeatherAPIClient:
         Raises:
             WeatherAPIError: If the geocoding API request fails.
             InvalidAPIResponseError: If the city cannot be found.
+            APIQuotaExceededError: If the API call budget is exhausted.
         """
         city_query = self._format_city_query()
+        self.quota_governor.acquire(self.config.api_key, GEOCODING_API_CALLS)
 
         try:
             async with httpx.AsyncClient() as client:
@@ -386,7 +225,8 @@ class WeatherAPIClient:
                     "appid": self.config.api_key,
                 }
 
-                response = await client.get(self.GEOCODING_URL, params=params)
+                with upstream_fetch_seconds.time("geocoding"), span("fetch-geocoding"):
+                    response = await client.get(self.GEOCODING_URL, params=params)
                 response.raise_for_status()
 
                 response_data = response.json()
@@ -455,14 +295,23 @@ class WeatherAPIClient:
                 e,
             ) from e
 
-    async def get_weather_data(self, force_refresh: bool = False) -> WeatherData:
+    async def get_weather_data(
+        self,
+        force_refresh: bool = False,
+        priority: RequestPriority = RequestPriority.INTERACTIVE,
+    ) -> WeatherData:
         """Get weather data from the OpenWeatherMap API.
 
         Fetches current weather conditions, hourly forecast, daily forecast,
-        and air quality data. Implements memory-aware caching to reduce API calls.
+        and air quality data. Implements memory-aware caching to reduce API calls,
+        with cache lifetimes stretched as the API call budget runs low. While the
+        upstream circuit breaker is open, cached data is returned immediately,
+        however old, instead of waiting on a failing API.
 
         Args:
             force_refresh: Force a refresh regardless of cache state.
+            priority: Priority of the request for API quota. Background requests
+                are refused before the budget reserved for interactive ones is used.
 
         Returns:
             WeatherData object with current weather and forecast.
@@ -472,8 +321,10 @@ class WeatherAPIClient:
             MissingConfigError: If required location information is missing.
         """
         # Get location and cache key
-        lat, lon = await self.get_coordinates()
+        lat, lon = self._snap_to_grid(*await self.get_coordinates())
         cache_key = self._generate_cache_key(lat, lon)
+        self._last_cache_key = cache_key
+        self.cache_index.record_request()
 
         # Try to get cached data if not forcing refresh
         if not force_refresh:
@@ -482,11 +333,10 @@ class WeatherAPIClient:
                 return cached_data
 
         try:
-            # Fetch fresh weather data
-            weather = await self._fetch_weather_data(lat, lon)
-
-            # Cache the result
-            self._cache_weather_data(cache_key, weather)
+            # Fetch fresh weather data, sharing any fetch already in flight
+            weather = await self.cache_index.fetch_once(
+                cache_key, lambda: self._fetch_and_cache_weather(cache_key, lat, lon, priority)
+            )
 
             self.logger.info("Weather data updated successfully")
             return weather
@@ -494,6 +344,109 @@ class WeatherAPIClient:
         except (httpx.HTTPError, Exception) as e:
             return self._handle_weather_fetch_error(e, cache_key)
 
+    def get_data_expiry(self) -> datetime | None:
+        """Get the time at which the most recently served weather data expires.
+
+        Once the cached entry expires, the next request fetches fresh data from
+        the API, so this is the earliest time a rendered image can change due
+        to new weather data.
+
+        Returns:
+            Expiry time of the cached data, or None if nothing has been served yet
+        """
+        if self._last_cache_key is None:
+            return None
+
+        expiry = self._cache.get_expiry(self._last_cache_key, self._effective_ttl_seconds())
+        if expiry is None:
+            return None
+        return datetime.fromtimestamp(expiry)
+
+    async def prefetch_weather_data(self) -> None:
+        """Refresh cached weather data in the background shortly before it expires.
+
+        Clients waking at the expiry then get fresh data without waiting on the
+        upstream API. Pre-fetches are background requests for API quota, so they
+        stop once the budget reserved for renders is reached, and errors are
+        logged rather than raised.
+        """
+        if self._last_cache_key is None:
+            return  # Nothing served yet
+
+        lat, lon = self._snap_to_grid(*await self.get_coordinates())
+        cache_key = self._generate_cache_key(lat, lon)
+        expiry = self._cache.get_expiry(cache_key, self._effective_ttl_seconds())
+        now = datetime.now().timestamp()
+        if expiry is None or not now < expiry <= now + WEATHER_PREFETCH_LEAD_SECONDS:
+            return
+
+        try:
+            await self.cache_index.fetch_once(
+                cache_key,
+                lambda: self._fetch_and_cache_weather(
+                    cache_key, lat, lon, RequestPriority.BACKGROUND
+                ),
+            )
+            self.logger.info("Weather data pre-fetched before expiry")
+        except Exception as e:
+            self.logger.info(f"Skipped weather data pre-fetch: {e}")
+
+    async def _fetch_and_cache_weather(
+        self, cache_key: str, lat: float, lon: float, priority: RequestPriority
+    ) -> WeatherData:
+        """Fetch weather data from the API and store it in the cache.
+
+        Args:
+            cache_key: Cache key for the location
+            lat: Latitude
+            lon: Longitude
+            priority: Priority of the request for API quota
+
+        Returns:
+            Freshly fetched WeatherData
+
+        Raises:
+            CircuitOpenError: If upstream calls are suspended after repeated failures
+            APIQuotaExceededError: If the API call budget is exhausted
+        """
+        async with self.circuit_breaker.guard():
+            self.quota_governor.acquire(self.config.api_key, WEATHER_FETCH_API_CALLS, priority)
+            weather = await self._fetch_weather_data(lat, lon)
+        self._cache_weather_data(cache_key, weather)
+        return weather
+
+    def _snap_to_grid(self, lat: float, lon: float) -> tuple[float, float]:
+        """Snap coordinates to the configured location grid.
+
+        Nearby devices whose coordinates fall in the same grid cell share one
+        cache entry and upstream fetch. Snapping is disabled when the grid size
+        is zero.
+
+        Args:
+            lat: Latitude
+            lon: Longitude
+
+        Returns:
+            Tuple of (latitude, longitude) snapped to the grid
+        """
+        grid = self.config.location_grid_degrees
+        if grid <= 0:
+            return lat, lon
+
+        return (
+            round(round(lat / grid) * grid, LOCATION_GRID_DECIMALS),
+            round(round(lon / grid) * grid, LOCATION_GRID_DECIMALS),
+        )
+
+    def _effective_ttl_seconds(self) -> int:
+        """Get the weather cache lifetime, stretched as the API call budget runs low.
+
+        Returns:
+            Cache time-to-live in seconds
+        """
+        multiplier = self.quota_governor.ttl_multiplier(self.config.api_key)
+        return int(self._cache.ttl_seconds * multiplier)
+
     def _generate_cache_key(self, lat: float, lon: float) -> str:
         """Generate cache key for weather data.
 
@@ -515,9 +468,13 @@ class WeatherAPIClient:
         Returns:
             Cached WeatherData or None if not found
         """
-        cached_data = self._cache.get(cache_key)
+        # Expired data is kept as a fallback for when the API is unavailable
+        cached_data = self._cache.get(
+            cache_key, self._effective_ttl_seconds(), evict_expired=False
+        )
         if cached_data is not None:
             self.logger.info("Using cached weather data")
+        cache_requests_total.inc("weather", "miss" if cached_data is None else "hit")
         return cached_data
 
     async def _fetch_weather_data(self, lat: float, lon: float) -> WeatherData:
@@ -535,39 +492,32 @@ class WeatherAPIClient:
         """
         async with httpx.AsyncClient() as client:
             # Fetch both weather and air pollution data
-            weather_data = await self._fetch_weather_forecast(client, lat, lon)
+            forecast = await self._fetch_weather_forecast(client, lat, lon)
             air_data = await self._fetch_air_pollution(client, lat, lon)
 
             # Combine air pollution data with weather data
-            combined_response: CombinedWeatherResponse = {
-                "lat": weather_data["lat"],
-                "lon": weather_data["lon"],
-                "timezone": weather_data["timezone"],
-                "timezone_offset": weather_data["timezone_offset"],
-                "current": weather_data["current"],
-                "hourly": weather_data["hourly"],
-                "daily": weather_data["daily"],
-                "air_pollution": air_data["list"][0] if air_data["list"] else None,
-            }
-
-            # Parse into WeatherData model
-            return self._parse_weather_response(combined_response)
+            air_pollution = air_data.entries[0] if air_data.entries else None
+            return self._build_weather_data(forecast, air_pollution)
 
     async def _fetch_weather_forecast(
         self, client: httpx.AsyncClient, lat: float, lon: float
-    ) -> WeatherAPIResponse:
+    ) -> OneCallResponse:
         """Fetch weather forecast data.
 
+        The response bytes are validated straight into models, without first
+        decoding them into dictionaries.
+
         Args:
             client: HTTP client
             lat: Latitude
             lon: Longitude
 
         Returns:
-            Weather forecast data dictionary
+            Validated One Call API response
 
         Raises:
             WeatherAPIError: If API request fails
+            InvalidAPIResponseError: If the response does not match the expected format
         """
         weather_params = {
             "lat": lat,
@@ -579,10 +529,12 @@ class WeatherAPIClient:
         }
 
         try:
-            response = await client.get(self.BASE_URL, params=weather_params)
+            with upstream_fetch_seconds.time("onecall"), span("fetch-onecall"):
+                response = await client.get(self.BASE_URL, params=weather_params)
             response.raise_for_status()
-            # Cast JSON response to our typed structure
-            return response.json()  # type: ignore[return-value]
+            return OneCallResponse.model_validate_json(response.content)
+        except ValidationError as e:
+            raise self._invalid_response_error(self.BASE_URL, response, e) from e
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 401:
                 raise chain_exception(
@@ -628,7 +580,7 @@ class WeatherAPIClient:
 
     async def _fetch_air_pollution(
         self, client: httpx.AsyncClient, lat: float, lon: float
-    ) -> AirPollutionAPIResponse:
+    ) -> AirPollutionResponse:
         """Fetch air pollution data.
 
         Args:
@@ -637,18 +589,21 @@ class WeatherAPIClient:
             lon: Longitude
 
         Returns:
-            Air pollution data dictionary
+            Validated air pollution API response
 
         Raises:
             WeatherAPIError: If API request fails
+            InvalidAPIResponseError: If the response does not match the expected format
         """
         air_params = {"lat": lat, "lon": lon, "appid": self.config.api_key}
 
         try:
-            response = await client.get(self.AIR_POLLUTION_URL, params=air_params)
+            with upstream_fetch_seconds.time("air_pollution"), span("fetch-air-pollution"):
+                response = await client.get(self.AIR_POLLUTION_URL, params=air_params)
             response.raise_for_status()
-            # Cast JSON response to our typed structure
-            return response.json()  # type: ignore[return-value]
+            return AirPollutionResponse.model_validate_json(response.content)
+        except ValidationError as e:
+            raise self._invalid_response_error(self.AIR_POLLUTION_URL, response, e) from e
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 401:
                 raise chain_exception(
@@ -681,82 +636,66 @@ class WeatherAPIClient:
                 e,
             ) from e
 
-    def _parse_weather_response(self, weather_data: CombinedWeatherResponse) -> WeatherData:
-        """Parse API response into WeatherData model.
+    def _build_weather_data(
+        self, forecast: OneCallResponse, air_pollution: AirPollutionData | None
+    ) -> WeatherData:
+        """Build WeatherData from validated API responses.
 
         Args:
-            weather_data: Raw weather data from API
+            forecast: Validated One Call API response
+            air_pollution: Current air pollution data, if available
 
         Returns:
             WeatherData model instance
         """
         return WeatherData(
-            lat=weather_data["lat"],
-            lon=weather_data["lon"],
-            timezone=weather_data["timezone"],
-            timezone_offset=weather_data["timezone_offset"],
-            current=CurrentWeather(**weather_data["current"]),  # type: ignore[arg-type]
-            hourly=[
-                HourlyWeather(**hour)  # type: ignore[arg-type]
-                for hour in weather_data["hourly"][:24]
-            ],  # 24 hours
-            daily=[
-                DailyWeather(**day)  # type: ignore[arg-type]
-                for day in weather_data["daily"][: self.config.forecast_days]
-            ],
-            air_pollution=self._parse_air_pollution(weather_data["air_pollution"]),
+            lat=forecast.lat,
+            lon=forecast.lon,
+            timezone=forecast.timezone,
+            timezone_offset=forecast.timezone_offset,
+            current=forecast.current,
+            hourly=forecast.hourly[:24],  # 24 hours
+            daily=forecast.daily[: self.config.forecast_days],
+            air_pollution=air_pollution,
             last_updated=datetime.now(),
         )
 
-    def _parse_air_pollution(
-        self, air_data: AirPollutionDataResponse | None
-    ) -> AirPollutionData | None:
-        """Parse air pollution data if available.
+    @staticmethod
+    def _invalid_response_error(
+        endpoint: str, response: httpx.Response, error: ValidationError
+    ) -> WeatherDisplayError:
+        """Create the error raised for a response that fails validation.
 
         Args:
-            air_data: Raw air pollution data or None
+            endpoint: API endpoint that returned the response
+            response: The HTTP response
+            error: Validation error from parsing the response
 
         Returns:
-            AirPollutionData model or None
+            InvalidAPIResponseError chained to the validation error
         """
-        if not air_data:
-            return None
-
-        # Convert components to AirPollution model
-        components_data = air_data["components"]
-        components = AirPollution(
-            aqi=air_data["main"].get("aqi"),
-            co=components_data["co"],
-            no=components_data["no"],
-            no2=components_data["no2"],
-            o3=components_data["o3"],
-            so2=components_data["so2"],
-            pm2_5=components_data["pm2_5"],
-            pm10=components_data["pm10"],
-            nh3=components_data["nh3"],
-        )
-
-        # Create proper dict[str, int] from TypedDict
-        main_dict: dict[str, int] = {"aqi": air_data["main"]["aqi"]}
-
-        return AirPollutionData(
-            dt=air_data["dt"],
-            main=main_dict,
-            components=components,
+        return chain_exception(
+            InvalidAPIResponseError(
+                "Invalid weather API response format",
+                {
+                    "endpoint": endpoint,
+                    "errors": error.error_count(),
+                    "first_error": str(error.errors()[0]["loc"]) if error.errors() else None,
+                },
+                status_code=response.status_code,
+                response_body=response.text[:500],
+            ),
+            error,
         )
 
     def _cache_weather_data(self, cache_key: str, weather: WeatherData) -> None:
-        """Cache weather data with size estimate.
+        """Cache weather data, sized by the cache's in-memory sizer.
 
         Args:
             cache_key: Cache key
             weather: Weather data to cache
         """
-        # Estimate data size for memory-aware caching
-        # Use model_dump_json for proper datetime serialization
-        data_json = weather.model_dump_json()
-        data_size = len(data_json.encode("utf-8"))
-        self._cache.put(cache_key, weather, data_size)
+        self._cache.put(cache_key, weather)
 
     def _handle_weather_fetch_error(self, error: Exception, cache_key: str) -> WeatherData:
         """Handle errors during weather fetch with fallback to cache.
@@ -771,11 +710,14 @@ class WeatherAPIClient:
         Raises:
             The original exception if no cached data available
         """
-        error_location = get_error_location()
-        self.logger.error(f"Error during weather data fetch [{error_location}]: {error}")
+        if isinstance(error, CircuitOpenError):
+            self.logger.warning(f"Skipping weather data fetch: {error}")
+        else:
+            error_location = get_error_location()
+            self.logger.error(f"Error during weather data fetch [{error_location}]: {error}")
 
-        # Try to return cached data as fallback
-        cached_data = self._cache.get(cache_key)
+        # Fall back to cached data, however old, rather than failing the request
+        cached_data = self._cache.get_stale(cache_key)
         if cached_data is not None:
             self.logger.warning("Using cached weather data due to error")
             return cached_data
@@ -8,6 +8,7 @@ import asyncio
 import logging
 from typing import TYPE_CHECKING, Protocol
 
+from rpi_weather_display.server.metrics import browser_restarts_total
 from rpi_weather_display.utils.error_utils import get_error_location
 
 if TYPE_CHECKING:
@@ -25,7 +26,12 @@ class PlaywrightPageProtocol(Protocol):
         """Wait for load state."""
         ...
 
-    async def screenshot(self, path: str | None = None, type: str = "png") -> bytes:  # noqa: A002
+    async def screenshot(
+        self,
+        path: str | None = None,
+        type: str = "png",  # noqa: A002
+        full_page: bool = False,
+    ) -> bytes:
         """Take screenshot."""
         ...
 
@@ -58,6 +64,8 @@ class BrowserManager:
         """
         async with self._lock:
             if self._browser is None or not self._browser.is_connected():
+                if self._browser is not None:
+                    browser_restarts_total.inc()
                 await self._launch_browser()
             return self._browser
 
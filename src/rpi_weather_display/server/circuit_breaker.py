@@ -0,0 +1,250 @@
+"""Circuit breaker for upstream weather provider calls.
+
+Stops sending requests to a weather provider that is failing or responding
+slowly, so requests fall back to cached data immediately instead of each
+waiting through a full HTTP timeout. After a cool-down period a single probe
+request is let through to check whether the provider has recovered.
+"""
+
+import logging
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from enum import Enum
+
+from typing_extensions import TypedDict
+
+from rpi_weather_display.constants import (
+    CIRCUIT_FAILURE_RATE_THRESHOLD,
+    CIRCUIT_MIN_CALLS,
+    CIRCUIT_OPEN_SECONDS,
+    CIRCUIT_SLOW_CALL_RATE_THRESHOLD,
+    CIRCUIT_SLOW_CALL_SECONDS,
+    CIRCUIT_WINDOW_SIZE,
+)
+from rpi_weather_display.exceptions import (
+    APIAuthenticationError,
+    APIRateLimitError,
+    CircuitOpenError,
+)
+
+# Errors caused by the request or our own budget rather than the provider's health
+NON_OUTAGE_ERRORS = (APIAuthenticationError, APIRateLimitError)
+
+
+class CircuitState(Enum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"  # Requests flow normally
+    OPEN = "open"  # Requests are rejected immediately
+    HALF_OPEN = "half_open"  # A probe request is checking for recovery
+
+
+@dataclass(frozen=True)
+class CircuitBreakerPolicy:
+    """Thresholds deciding when a circuit breaker opens and for how long.
+
+    Attributes:
+        failure_rate_threshold: Fraction of failed calls that opens the circuit
+        slow_call_seconds: Duration in seconds above which a call counts as slow
+        slow_call_rate_threshold: Fraction of slow calls that opens the circuit
+        window_size: Number of recent calls to evaluate
+        min_calls: Calls needed in the window before rates are evaluated
+        open_seconds: Seconds the circuit stays open before a probe is allowed
+    """
+
+    failure_rate_threshold: float = CIRCUIT_FAILURE_RATE_THRESHOLD
+    slow_call_seconds: float = CIRCUIT_SLOW_CALL_SECONDS
+    slow_call_rate_threshold: float = CIRCUIT_SLOW_CALL_RATE_THRESHOLD
+    window_size: int = CIRCUIT_WINDOW_SIZE
+    min_calls: int = CIRCUIT_MIN_CALLS
+    open_seconds: float = CIRCUIT_OPEN_SECONDS
+
+
+class CircuitBreakerStatus(TypedDict):
+    """Circuit breaker state and recent call statistics."""
+
+    name: str
+    state: str
+    calls_in_window: int
+    failure_rate: float
+    slow_call_rate: float
+    times_opened: int
+    retry_at: str | None
+
+
+class CircuitBreaker:
+    """Circuit breaker with error-rate and latency thresholds.
+
+    Outcomes of the most recent calls are kept in a sliding window. Once the
+    window holds enough calls, the circuit opens if the share of failed calls
+    or of calls slower than the latency threshold reaches its limit. While open,
+    calls are rejected with CircuitOpenError. After the open period one probe
+    call is allowed (half-open): success closes the circuit, and a failure or
+    slow response opens it again.
+
+    Attributes:
+        name: Name of the protected service, used in logs and errors
+        policy: Thresholds deciding when the circuit opens
+        times_opened: Number of times the circuit has opened
+        logger: Logger instance
+    """
+
+    def __init__(self, name: str, policy: CircuitBreakerPolicy | None = None) -> None:
+        """Initialize the circuit breaker in the closed state.
+
+        Args:
+            name: Name of the protected service.
+            policy: Optional thresholds, defaulting to the configured constants.
+        """
+        self.name = name
+        self.policy = policy or CircuitBreakerPolicy()
+        self.times_opened = 0
+        self.logger = logging.getLogger(__name__)
+        # Each entry is (failed, slow) for one call
+        self._window: deque[tuple[bool, bool]] = deque(maxlen=self.policy.window_size)
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    @property
+    def state(self) -> CircuitState:
+        """Get the current state, moving from open to half-open once the cool-down ends."""
+        if (
+            self._state is CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= self.policy.open_seconds
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self.logger.info(f"Circuit for {self.name} half-open, probing for recovery")
+        return self._state
+
+    @asynccontextmanager
+    async def guard(self) -> AsyncIterator[None]:
+        """Guard a call to the protected service.
+
+        Records the duration and outcome of the wrapped block. Errors caused by
+        authentication or rate limiting, and cancellation, say nothing about the
+        provider's health and are passed through without being recorded.
+
+        Yields:
+            None, once the call is allowed to proceed.
+
+        Raises:
+            CircuitOpenError: If the circuit is open or a probe is already in flight.
+        """
+        self._before_call()
+        start = time.monotonic()
+        try:
+            yield
+        except NON_OUTAGE_ERRORS:
+            self._probe_in_flight = False
+            raise
+        except Exception:
+            self._record(failed=True, duration=time.monotonic() - start)
+            raise
+        except BaseException:
+            # A cancelled call says nothing about the service, but must free the probe slot
+            self._probe_in_flight = False
+            raise
+        self._record(failed=False, duration=time.monotonic() - start)
+
+    def get_status(self) -> CircuitBreakerStatus:
+        """Get the circuit state and recent call statistics.
+
+        Returns:
+            Dictionary with circuit breaker status.
+        """
+        state = self.state
+        retry_at = None
+        if state is CircuitState.OPEN:
+            remaining = self.policy.open_seconds - (time.monotonic() - self._opened_at)
+            retry_at = (datetime.now() + timedelta(seconds=remaining)).isoformat()
+
+        failure_rate, slow_call_rate = self._rates()
+        return {
+            "name": self.name,
+            "state": state.value,
+            "calls_in_window": len(self._window),
+            "failure_rate": round(failure_rate, 3),
+            "slow_call_rate": round(slow_call_rate, 3),
+            "times_opened": self.times_opened,
+            "retry_at": retry_at,
+        }
+
+    def _before_call(self) -> None:
+        """Check that a call may proceed, claiming the probe slot when half-open.
+
+        Raises:
+            CircuitOpenError: If the circuit is open or a probe is already in flight.
+        """
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return
+
+        if state is CircuitState.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return
+
+        raise CircuitOpenError(
+            f"Circuit open for {self.name}",
+            {"service": self.name, "state": state.value, "retry_at": self.get_status()["retry_at"]},
+        )
+
+    def _record(self, failed: bool, duration: float) -> None:
+        """Record the outcome of a call and update the circuit state.
+
+        Args:
+            failed: Whether the call raised an error.
+            duration: Call duration in seconds.
+        """
+        slow = duration >= self.policy.slow_call_seconds
+
+        if self._state is CircuitState.HALF_OPEN:
+            self._probe_in_flight = False
+            if failed or slow:
+                self._open(f"probe {'failed' if failed else 'was slow'}")
+            else:
+                self._window.clear()
+                self._state = CircuitState.CLOSED
+                self.logger.info(f"Circuit for {self.name} closed, service recovered")
+            return
+
+        self._window.append((failed, slow))
+        # Calls that started before the circuit opened don't extend the open period
+        if self._state is CircuitState.OPEN or len(self._window) < self.policy.min_calls:
+            return
+
+        failure_rate, slow_call_rate = self._rates()
+        if failure_rate >= self.policy.failure_rate_threshold:
+            self._open(f"failure rate {failure_rate:.0%}")
+        elif slow_call_rate >= self.policy.slow_call_rate_threshold:
+            self._open(f"slow call rate {slow_call_rate:.0%}")
+
+    def _open(self, reason: str) -> None:
+        """Open the circuit.
+
+        Args:
+            reason: Why the circuit opened, for logging.
+        """
+        self._state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
+        self.times_opened += 1
+        self.logger.warning(
+            f"Circuit for {self.name} opened ({reason}), "
+            f"failing fast for {self.policy.open_seconds:.0f}s"
+        )
+
+    def _rates(self) -> tuple[float, float]:
+        """Get the failure and slow call rates over the window.
+
+        Returns:
+            Tuple of (failure rate, slow call rate).
+        """
+        if not self._window:
+            return 0.0, 0.0
+        failures = sum(1 for failed, _ in self._window if failed)
+        slow_calls = sum(1 for _, slow in self._window if slow)
+        return failures / len(self._window), slow_calls / len(self._window)
@@ -0,0 +1,245 @@
+"""In-memory tracker of daily weather extremes.
+
+Keeps running daily maximums (such as UV index, temperature and wind gusts)
+and daily totals (such as precipitation) in memory, so renders can update
+and read them without touching the disk. State is loaded once at startup
+and flushed to disk periodically and on shutdown, so a restart keeps the
+day's values.
+"""
+
+import json
+import logging
+import threading
+import time
+from datetime import date
+from pathlib import Path
+
+from rpi_weather_display.constants import (
+    DAILY_EXTREMES_FLUSH_INTERVAL_SECONDS,
+    SECONDS_PER_HOUR,
+)
+from rpi_weather_display.utils import file_utils
+
+
+class _LocationDay:
+    """Extremes recorded for one location on one day."""
+
+    def __init__(self, day: date) -> None:
+        """Initialize empty extremes for a day.
+
+        Args:
+            day: Local date the extremes apply to.
+        """
+        self.day = day
+        # Metric name -> (value, timestamp)
+        self.maxima: dict[str, tuple[float, int]] = {}
+        # Metric name -> {hour start timestamp: amount}
+        self.hourly_amounts: dict[str, dict[int, float]] = {}
+
+
+class DailyExtremesTracker:
+    """Daily maximums and totals per location, held in memory.
+
+    Each location's values reset when a new local day begins. Totals are
+    built from hourly amounts keyed by the hour they were observed in, so
+    recording the same observation on several renders doesn't count it twice.
+    Updates are thread-safe, so flushes can run in a worker thread.
+
+    Attributes:
+        state_file: File the extremes are persisted to, or None
+        flush_interval_seconds: Minimum time between periodic flushes
+        logger: Logger instance
+    """
+
+    def __init__(
+        self,
+        state_file: Path | None = None,
+        flush_interval_seconds: float = DAILY_EXTREMES_FLUSH_INTERVAL_SECONDS,
+    ) -> None:
+        """Initialize the tracker, loading any persisted extremes.
+
+        Args:
+            state_file: Optional file used to persist extremes across restarts.
+            flush_interval_seconds: Minimum seconds between periodic flushes.
+        """
+        self.state_file = state_file
+        self.flush_interval_seconds = flush_interval_seconds
+        self.logger = logging.getLogger(__name__)
+        self._locations: dict[str, _LocationDay] = {}
+        self._dirty = False
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        # Keeps concurrent flushes from writing snapshots out of order
+        self._flush_lock = threading.Lock()
+        self._load_state()
+
+    def update_max(
+        self, location: str, metric: str, day: date, value: float, timestamp: int
+    ) -> tuple[float, int]:
+        """Record a value and get the day's maximum.
+
+        Args:
+            location: Key identifying the location.
+            metric: Name of the metric, such as "uvi".
+            day: Local date the value belongs to.
+            value: Observed or forecast value.
+            timestamp: Unix timestamp of the value.
+
+        Returns:
+            Tuple of (maximum value, timestamp of the maximum) for the day.
+        """
+        with self._lock:
+            maxima = self._get_day(location, day).maxima
+            current = maxima.get(metric)
+            if current is None or value > current[0]:
+                maxima[metric] = (value, timestamp)
+                self._dirty = True
+            return maxima[metric]
+
+    def add_hourly_amount(
+        self, location: str, metric: str, day: date, timestamp: int, amount: float
+    ) -> float:
+        """Record the amount for an hour and get the day's total.
+
+        A later amount for the same hour replaces the earlier one.
+
+        Args:
+            location: Key identifying the location.
+            metric: Name of the metric, such as "precipitation".
+            day: Local date the amount belongs to.
+            timestamp: Unix timestamp within the hour the amount covers.
+            amount: Amount for the hour.
+
+        Returns:
+            Total of the hourly amounts recorded for the day.
+        """
+        hour = timestamp - timestamp % SECONDS_PER_HOUR
+        with self._lock:
+            amounts = self._get_day(location, day).hourly_amounts.setdefault(metric, {})
+            if amounts.get(hour) != amount:
+                amounts[hour] = amount
+                self._dirty = True
+            return sum(amounts.values())
+
+    def get_max(self, location: str, metric: str, day: date) -> tuple[float, int] | None:
+        """Get the day's maximum for a metric.
+
+        Args:
+            location: Key identifying the location.
+            metric: Name of the metric.
+            day: Local date.
+
+        Returns:
+            Tuple of (maximum value, timestamp), or None if nothing was recorded.
+        """
+        with self._lock:
+            location_day = self._locations.get(location)
+            if location_day is None or location_day.day != day:
+                return None
+            return location_day.maxima.get(metric)
+
+    def get_total(self, location: str, metric: str, day: date) -> float:
+        """Get the day's total for a metric.
+
+        Args:
+            location: Key identifying the location.
+            metric: Name of the metric.
+            day: Local date.
+
+        Returns:
+            Total of the recorded hourly amounts, or 0.0 if nothing was recorded.
+        """
+        with self._lock:
+            location_day = self._locations.get(location)
+            if location_day is None or location_day.day != day:
+                return 0.0
+            return sum(location_day.hourly_amounts.get(metric, {}).values())
+
+    @property
+    def flush_due(self) -> bool:
+        """Check whether there are unsaved changes and the flush interval has passed."""
+        return (
+            self._dirty
+            and self.state_file is not None
+            and time.monotonic() - self._last_flush >= self.flush_interval_seconds
+        )
+
+    def flush(self) -> None:
+        """Write unsaved extremes to the state file."""
+        if not self._dirty or self.state_file is None:
+            return
+
+        with self._flush_lock:
+            with self._lock:
+                state = self._snapshot()
+                self._dirty = False
+                self._last_flush = time.monotonic()
+            try:
+                file_utils.atomic_write(self.state_file, json.dumps(state))
+            except Exception as e:
+                self._dirty = True
+                self.logger.warning(f"Error writing daily extremes: {e}")
+
+    def _snapshot(self) -> dict[str, dict[str, object]]:
+        """Get the tracked extremes in their persisted form.
+
+        Returns:
+            Dictionary of extremes keyed by location, suitable for JSON.
+        """
+        return {
+            location: {
+                "date": location_day.day.isoformat(),
+                "maxima": {
+                    metric: {"value": value, "timestamp": timestamp}
+                    for metric, (value, timestamp) in location_day.maxima.items()
+                },
+                "hourly_amounts": {
+                    metric: {str(hour): amount for hour, amount in amounts.items()}
+                    for metric, amounts in location_day.hourly_amounts.items()
+                },
+            }
+            for location, location_day in self._locations.items()
+        }
+
+    def _get_day(self, location: str, day: date) -> _LocationDay:
+        """Get a location's extremes for a day, starting afresh on a new day.
+
+        Args:
+            location: Key identifying the location.
+            day: Local date.
+
+        Returns:
+            The location's extremes for the day.
+        """
+        location_day = self._locations.get(location)
+        if location_day is None or location_day.day != day:
+            location_day = _LocationDay(day)
+            self._locations[location] = location_day
+        return location_day
+
+    def _load_state(self) -> None:
+        """Load persisted extremes."""
+        if self.state_file is None or not file_utils.file_exists(self.state_file):
+            return
+
+        try:
+            state = file_utils.read_json(self.state_file)
+            if not isinstance(state, dict):
+                return
+
+            for location, entry in state.items():
+                if not isinstance(entry, dict) or not isinstance(entry.get("date"), str):
+                    continue
+                location_day = _LocationDay(date.fromisoformat(entry["date"]))
+                for metric, extreme in entry.get("maxima", {}).items():
+                    location_day.maxima[metric] = (
+                        float(extreme["value"]),
+                        int(extreme["timestamp"]),
+                    )
+                for metric, amounts in entry.get("hourly_amounts", {}).items():
+                    location_day.hourly_amounts[metric] = {
+                        int(hour): float(amount) for hour, amount in amounts.items()
+                    }
+                self._locations[location] = location_day
+        except Exception as e:
+            self.logger.warning(f"Error reading daily extremes: {e}")
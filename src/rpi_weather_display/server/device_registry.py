@@ -0,0 +1,224 @@
+"""Device registry for serving multiple displays from one server.
+
+Maps device IDs sent by clients to per-device configuration, and shares
+weather API clients and renderers between devices so that upstream API
+calls and memory scale with the number of distinct locations and render
+profiles rather than the number of devices.
+"""
+
+import logging
+from pathlib import Path
+
+from rpi_weather_display.constants import SECONDS_PER_MINUTE, UPSTREAM_SERVICE_NAME
+from rpi_weather_display.exceptions import MissingConfigError
+from rpi_weather_display.models.config import AppConfig, DeviceProfile, WeatherConfig
+from rpi_weather_display.server.api import WeatherAPIClient
+from rpi_weather_display.server.circuit_breaker import CircuitBreaker
+from rpi_weather_display.server.daily_extremes import DailyExtremesTracker
+from rpi_weather_display.server.quota_governor import QuotaGovernor
+from rpi_weather_display.server.renderer import WeatherRenderer
+from rpi_weather_display.server.weather_cache import WeatherCacheIndex
+
+
+class DeviceRegistry:
+    """Registry of device profiles and their shared weather clients and renderers.
+
+    Weather API clients are keyed by location, units and language, and all of
+    them share one weather cache index, so nearby devices whose coordinates snap
+    to the same grid cell also share upstream fetches. Renderers are keyed by the
+    weather and display settings that affect rendering, so devices with identical
+    profiles share one renderer.
+
+    Attributes:
+        config: Server application configuration
+        template_dir: Directory containing Jinja2 templates
+        cache_index: Weather cache shared by all weather API clients
+        quota_governor: API quota governor shared by all weather API clients
+        circuit_breaker: Upstream circuit breaker shared by all weather API clients
+        daily_extremes: Daily extremes tracker shared by all renderers
+        logger: Logger instance
+    """
+
+    def __init__(
+        self,
+        config: AppConfig,
+        template_dir: Path,
+        default_api_client: WeatherAPIClient | None = None,
+        default_renderer: WeatherRenderer | None = None,
+    ) -> None:
+        """Initialize the device registry.
+
+        Args:
+            config: Server application configuration including device profiles.
+            template_dir: Path to the templates directory.
+            default_api_client: Existing API client for the server's own location.
+            default_renderer: Existing renderer for the server's own profile.
+        """
+        self.config = config
+        self.template_dir = template_dir
+        self.cache_index = (
+            default_api_client.cache_index
+            if default_api_client is not None
+            else WeatherCacheIndex(
+                ttl_seconds=int(config.weather.update_interval_minutes * SECONDS_PER_MINUTE)
+            )
+        )
+        self.quota_governor = (
+            default_api_client.quota_governor
+            if default_api_client is not None
+            else QuotaGovernor(
+                config.weather.api_calls_per_minute, config.weather.api_calls_per_day
+            )
+        )
+        self.circuit_breaker = (
+            default_api_client.circuit_breaker
+            if default_api_client is not None
+            else CircuitBreaker(UPSTREAM_SERVICE_NAME)
+        )
+        self.daily_extremes = (
+            default_renderer.weather_calculator.daily_extremes
+            if default_renderer is not None
+            else DailyExtremesTracker()
+        )
+        self.logger = logging.getLogger(__name__)
+        self._device_configs: dict[str, AppConfig] = {}
+        self._api_clients: dict[str, WeatherAPIClient] = {}
+        self._renderers: dict[str, WeatherRenderer] = {}
+
+        if default_api_client is not None:
+            self._api_clients[self._location_key(config.weather)] = default_api_client
+        if default_renderer is not None:
+            self._renderers[self._render_key(config)] = default_renderer
+
+    def get_config(self, device_id: str | None) -> AppConfig:
+        """Get the effective configuration for a device.
+
+        Args:
+            device_id: Device ID from the render request, or None for the default profile.
+
+        Returns:
+            Server configuration with the device's profile applied.
+
+        Raises:
+            MissingConfigError: If the device ID is not registered.
+        """
+        if device_id is None:
+            return self.config
+
+        device_config = self._device_configs.get(device_id)
+        if device_config is None:
+            profile = self.config.devices.get(device_id)
+            if profile is None:
+                raise MissingConfigError(
+                    f"Unknown device: {device_id}",
+                    {"device_id": device_id, "config_section": "devices"},
+                )
+            device_config = self._apply_profile(profile)
+            self._device_configs[device_id] = device_config
+        return device_config
+
+    def get_api_client(self, device_id: str | None) -> WeatherAPIClient:
+        """Get the weather API client serving a device's location.
+
+        Args:
+            device_id: Device ID from the render request, or None for the default profile.
+
+        Returns:
+            Weather API client shared by all devices at the same location.
+
+        Raises:
+            MissingConfigError: If the device ID is not registered.
+        """
+        weather_config = self.get_config(device_id).weather
+        key = self._location_key(weather_config)
+        client = self._api_clients.get(key)
+        if client is None:
+            client = WeatherAPIClient(
+                weather_config, self.cache_index, self.quota_governor, self.circuit_breaker
+            )
+            self._api_clients[key] = client
+            self.logger.info(f"Created weather client for location {key}")
+        return client
+
+    def get_renderer(self, device_id: str | None) -> WeatherRenderer:
+        """Get the renderer for a device's render profile.
+
+        Args:
+            device_id: Device ID from the render request, or None for the default profile.
+
+        Returns:
+            Renderer shared by all devices with the same render profile.
+
+        Raises:
+            MissingConfigError: If the device ID is not registered.
+        """
+        device_config = self.get_config(device_id)
+        key = self._render_key(device_config)
+        renderer = self._renderers.get(key)
+        if renderer is None:
+            renderer = WeatherRenderer(device_config, self.template_dir, self.daily_extremes)
+            self._renderers[key] = renderer
+            self.logger.info(f"Created renderer for device {device_id}")
+        return renderer
+
+    @property
+    def location_count(self) -> int:
+        """Get the number of distinct locations with a weather client."""
+        return len(self._api_clients)
+
+    @property
+    def renderer_count(self) -> int:
+        """Get the number of distinct render profiles with a renderer."""
+        return len(self._renderers)
+
+    def _apply_profile(self, profile: DeviceProfile) -> AppConfig:
+        """Build a device configuration from the server configuration and a profile.
+
+        Args:
+            profile: Device profile overrides.
+
+        Returns:
+            Copy of the server configuration with the profile's overrides applied.
+        """
+        weather_updates = profile.model_dump(
+            include={"location", "city_name", "units", "language"}, exclude_none=True
+        )
+        # A device located by city name alone must be geocoded, not given the
+        # server's own coordinates
+        if profile.city_name is not None and profile.location is None:
+            weather_updates["location"] = {}
+
+        display_updates = profile.model_dump(
+            include={"width", "height", "rotate"}, exclude_none=True
+        )
+
+        return self.config.model_copy(
+            update={
+                "weather": self.config.weather.model_copy(update=weather_updates),
+                "display": self.config.display.model_copy(update=display_updates),
+            }
+        )
+
+    @staticmethod
+    def _location_key(weather: WeatherConfig) -> str:
+        """Generate the key identifying a distinct weather location.
+
+        Args:
+            weather: Weather configuration for a device.
+
+        Returns:
+            Key combining location, units and language.
+        """
+        return weather.location_key
+
+    @staticmethod
+    def _render_key(config: AppConfig) -> str:
+        """Generate the key identifying a distinct render profile.
+
+        Args:
+            config: Effective configuration for a device.
+
+        Returns:
+            Key covering all weather and display settings used when rendering.
+        """
+        return config.model_dump_json(include={"weather", "display"})
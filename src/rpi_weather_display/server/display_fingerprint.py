@@ -0,0 +1,142 @@
+"""Fingerprint of what the weather display would show.
+
+Collects the strings and icon IDs the dashboard templates put on screen,
+formatted with the same Jinja2 filters the templates use, and hashes them.
+Weather updates often change values that round to the same displayed text,
+so two renders with the same fingerprint produce the same image and the
+second one can be skipped. Values are collected per dashboard section, so
+sections can be fingerprinted, rendered and cached on their own too.
+
+The collected values mirror the templates in the templates directory and
+must be kept in step with them: anything a template displays has to be
+collected here, or a change to it won't cause a new render.
+"""
+
+import hashlib
+from collections.abc import Callable, Iterable, Mapping
+from types import MappingProxyType
+from typing import Any
+
+_SEPARATOR = "\x1f"  # Unit separator, never part of displayed text
+
+# Dashboard sections in page order, with the template showing each of them
+SECTION_TEMPLATES: Mapping[str, str] = MappingProxyType({
+    "header": "_header.html.j2",
+    "current": "_current.html.j2",
+    "hourly": "_forecast_hourly.html.j2",
+    "daily": "_forecast_daily.html.j2",
+})
+
+
+def _header_values(context: Mapping[str, Any]) -> list[object]:
+    """Collect the values shown by _header.html.j2."""
+    return [
+        context["date"],
+        context["last_refresh"],
+        context["battery_icon"],
+        context["battery"].level,
+    ]
+
+
+def _current_values(
+    context: Mapping[str, Any], filters: Mapping[str, Callable[..., Any]]
+) -> list[object]:
+    """Collect the values shown by _current.html.j2."""
+    current = context["weather"].current
+    daily = context["weather"].daily
+    current_times = context["current_times"]
+    return [
+        context["city"],
+        filters["weather_icon"](current.weather[0]),
+        filters["int"](filters["round"](current.temp)),
+        context["units_temp"],
+        filters["capitalize"](current.weather[0].description),
+        context["bft"],
+        filters["round"](current.wind_speed),
+        context["units_wind"],
+        filters["get_precipitation_amount"](current),
+        context["units_precip"],
+        current_times["sunrise_local"],
+        current_times["sunset_local"],
+        context["daylight"],
+        context["uvi_max"],
+        context["uvi_time"],
+        context["aqi"],
+        context["pressure"],
+        context["units_pressure"],
+        current.wind_deg + 180,
+        filters["wind_direction_cardinal"](current.wind_deg),
+        context["moon_phase"],
+        filters["moon_phase_label"](daily[0].moon_phase) if daily else None,
+    ]
+
+
+def _hourly_values(
+    context: Mapping[str, Any], filters: Mapping[str, Callable[..., Any]]
+) -> list[object]:
+    """Collect the values shown by _forecast_hourly.html.j2."""
+    values: list[object] = []
+    for hour, times in zip(context["hourly"], context["hourly_times"], strict=False):
+        values += [
+            times["local_time"],
+            filters["weather_icon"](hour.weather[0]),
+            filters["int"](filters["round"](hour.temp)),
+            filters["round"](hour.wind_speed, 0),
+            hour.wind_deg + 180,
+            filters["get_hourly_precipitation"](hour),
+            filters["round"](hour.pop, 0) * 100 if hour.pop > 0 else None,
+        ]
+    return values
+
+
+def _daily_values(
+    context: Mapping[str, Any], filters: Mapping[str, Callable[..., Any]]
+) -> list[object]:
+    """Collect the values shown by _forecast_daily.html.j2."""
+    values: list[object] = []
+    for day, times in zip(context["daily"], context["daily_times"], strict=False):
+        values += [
+            times["weekday_short"],
+            filters["weather_icon"](day.weather[0]),
+            filters["int"](filters["round"](day.temp.min)),
+            filters["int"](filters["round"](day.temp.max)),
+            filters["moon_phase_icon"](day.moon_phase),
+            filters["moon_phase_label"](day.moon_phase),
+            times["sunrise_local"],
+            times["sunset_local"],
+        ]
+    return values
+
+
+def collect_section_values(
+    context: Mapping[str, Any], filters: Mapping[str, Callable[..., Any]]
+) -> dict[str, list[str]]:
+    """Collect the text and icon IDs each dashboard section would display.
+
+    Args:
+        context: Template context built by the renderer
+        filters: Jinja2 filters and globals the templates use
+
+    Returns:
+        Displayed values as strings in template order, keyed by section name
+        in the order of SECTION_TEMPLATES
+    """
+    sections = {
+        "header": _header_values(context),
+        "current": _current_values(context, filters),
+        "hourly": _hourly_values(context, filters),
+        "daily": _daily_values(context, filters),
+    }
+    return {name: [str(value) for value in values] for name, values in sections.items()}
+
+
+def compute_fingerprint(values: Iterable[str]) -> str:
+    """Hash displayed values into a fingerprint.
+
+    Args:
+        values: Displayed values, along with anything else that affects the image
+
+    Returns:
+        Hex digest identifying the values
+    """
+    return hashlib.sha256(_SEPARATOR.join(values).encode()).hexdigest()
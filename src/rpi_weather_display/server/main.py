@@ -11,35 +11,69 @@ application, registers routes, and handles incoming requests.
 import argparse
 from collections.abc import AsyncIterator, Callable
 from contextlib import asynccontextmanager
+from datetime import datetime, time, timedelta, timezone
+from email.utils import formatdate
 from pathlib import Path
+from typing import Annotated
 
-from fastapi import BackgroundTasks, FastAPI, HTTPException
+from fastapi import BackgroundTasks, FastAPI, Header, HTTPException
 from fastapi.responses import FileResponse, Response
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
+from typing_extensions import TypedDict
 
 from rpi_weather_display.constants import (
+    DAILY_EXTREMES_FILENAME,
+    DATA_EXPIRES_HEADER,
     DEFAULT_CONFIG_PATH,
     DEFAULT_SERVER_HOST,
+    DIRTY_REGIONS_HEADER,
     DOWNLOAD_FILENAME,
+    ETAG_HEADER,
     IMAGE_FILE_EXTENSION,
     IMAGE_MEDIA_TYPE,
+    METRICS_CONTENT_TYPE,
+    METRICS_DEFAULT_DEVICE,
+    NEXT_UPDATE_HEADER,
+    OPERATION_ID_HEADER,
     PREVIEW_BATTERY_CURRENT,
     PREVIEW_BATTERY_LEVEL,
     PREVIEW_BATTERY_TEMP,
     PREVIEW_BATTERY_VOLTAGE,
+    QUOTA_STATE_FILENAME,
+    SERVER_IMAGE_CACHE_DIR_NAME,
     SERVER_IMAGE_CACHE_SIZE_MB,
     SERVER_IMAGE_CACHE_TTL_SECONDS,
     SERVER_MEMORY_GROWTH_THRESHOLD_MB,
+    SERVER_TIMING_HEADER,
 )
+from rpi_weather_display.exceptions import MissingConfigError
 from rpi_weather_display.models.config import AppConfig
 from rpi_weather_display.models.system import BatteryState, BatteryStatus
 from rpi_weather_display.models.weather import WeatherData
 from rpi_weather_display.server.api import WeatherAPIClient
 from rpi_weather_display.server.browser_manager import browser_manager
-from rpi_weather_display.server.renderer import WeatherRenderer
+from rpi_weather_display.server.circuit_breaker import CircuitBreakerStatus, CircuitState
+from rpi_weather_display.server.daily_extremes import DailyExtremesTracker
+from rpi_weather_display.server.device_registry import DeviceRegistry
+from rpi_weather_display.server.metrics import (
+    cache_requests_total,
+    device_requests_total,
+    metrics,
+    render_queue_depth,
+    response_size_bytes,
+)
+from rpi_weather_display.server.quota_governor import QuotaGovernor, QuotaStatus
+from rpi_weather_display.server.renderer import (
+    PreparedDisplay,
+    RendererMetrics,
+    WeatherRenderer,
+)
+from rpi_weather_display.server.tracing import span, start_trace
+from rpi_weather_display.server.weather_cache import WeatherCacheStats
 from rpi_weather_display.utils import path_resolver
 from rpi_weather_display.utils.cache_manager import FileCache
+from rpi_weather_display.utils.dirty_regions import format_regions
 from rpi_weather_display.utils.early_error_handler import (
     handle_keyboard_interrupt,
     handle_startup_error,
@@ -75,6 +109,14 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     # Shutdown
     logger.info("Shutting down Weather Display Server")
 
+    # Save daily extremes and API call counters that haven't been flushed yet
+    daily_extremes: DailyExtremesTracker | None = getattr(app.state, "daily_extremes", None)
+    if daily_extremes is not None:
+        daily_extremes.flush()
+    quota_governor: QuotaGovernor | None = getattr(app.state, "quota_governor", None)
+    if quota_governor is not None:
+        quota_governor.flush()
+
     # Log final memory report
     report = memory_profiler.get_report()
     logger.info(f"Final memory report: {report}")
@@ -112,10 +154,24 @@ class RenderRequest(BaseModel):
     Attributes:
         battery: Battery status information
         metrics: Optional dictionary of system metrics (CPU, memory, etc.)
+        device_id: Optional device ID selecting a configured device profile
     """
 
     battery: BatteryInfo
     metrics: dict[str, float] = {}
+    device_id: str | None = None
+
+
+class HealthStatus(TypedDict):
+    """Health check response.
+
+    The status is "degraded" while upstream weather calls are suspended by the
+    circuit breaker, since renders are then served from cached data.
+    """
+
+    status: str
+    service: str
+    upstream: CircuitBreakerStatus
 
 
 class WeatherDisplayServer:
@@ -133,9 +189,12 @@ class WeatherDisplayServer:
         logger: Configured logger instance
         app: FastAPI application instance
         api_client: Client for OpenWeatherMap API
+        quota_governor: Governor of OpenWeatherMap API call budgets
+        daily_extremes: In-memory tracker of daily weather extremes
         template_dir: Directory containing Jinja2 templates
         static_dir: Directory for static assets (CSS, images, etc.)
         renderer: Weather data renderer for HTML and images
+        device_registry: Registry of per-device profiles, weather clients and renderers
         cache_dir: Directory for caching rendered images
     """
 
@@ -166,8 +225,25 @@ class WeatherDisplayServer:
         # Create FastAPI app
         self.app = app_factory()
 
-        # Initialize components
-        self.api_client = WeatherAPIClient(self.config.weather)
+        # Cache directory
+        if self.config.server.cache_dir:
+            self.cache_dir = path_resolver.normalize_path(self.config.server.cache_dir)
+            path_resolver.ensure_dir_exists(self.cache_dir)
+        else:
+            self.cache_dir = path_resolver.cache_dir
+
+        self.logger.info(f"Using cache directory: {self.cache_dir}")
+
+        # Initialize components, with API call consumption persisted across restarts
+        self.quota_governor = QuotaGovernor(
+            self.config.weather.api_calls_per_minute,
+            self.config.weather.api_calls_per_day,
+            state_file=self.cache_dir / QUOTA_STATE_FILENAME,
+        )
+        self.app.state.quota_governor = self.quota_governor
+        self.api_client = WeatherAPIClient(
+            self.config.weather, quota_governor=self.quota_governor
+        )
 
         # Template directory - use path resolver to find templates
         self.template_dir = path_resolver.get_templates_dir()
@@ -177,21 +253,25 @@ class WeatherDisplayServer:
         self.static_dir = path_resolver.get_static_dir()
         self.logger.info(f"Using static directory: {self.static_dir}")
 
-        # Initialize renderer
-        self.renderer = WeatherRenderer(self.config, self.template_dir)
+        # Daily extremes are kept in memory, loaded once here and flushed
+        # periodically after renders and on shutdown
+        self.daily_extremes = DailyExtremesTracker(
+            state_file=self.cache_dir / DAILY_EXTREMES_FILENAME
+        )
+        self.app.state.daily_extremes = self.daily_extremes
 
-        # Cache directory
-        if self.config.server.cache_dir:
-            self.cache_dir = path_resolver.normalize_path(self.config.server.cache_dir)
-            path_resolver.ensure_dir_exists(self.cache_dir)
-        else:
-            self.cache_dir = path_resolver.cache_dir
+        # Initialize renderer
+        self.renderer = WeatherRenderer(self.config, self.template_dir, self.daily_extremes)
 
-        self.logger.info(f"Using cache directory: {self.cache_dir}")
+        # Initialize device registry, sharing the default client and renderer
+        self.device_registry = DeviceRegistry(
+            self.config, self.template_dir, self.api_client, self.renderer
+        )
 
-        # Initialize file cache for images
+        # Rendered images keyed by display fingerprint. They get their own
+        # directory since cleanup removes any file in it.
         self.file_cache = FileCache(
-            cache_dir=self.cache_dir,
+            cache_dir=self.cache_dir / SERVER_IMAGE_CACHE_DIR_NAME,
             max_size_mb=SERVER_IMAGE_CACHE_SIZE_MB,
             ttl_seconds=SERVER_IMAGE_CACHE_TTL_SECONDS,
         )
@@ -211,21 +291,32 @@ class WeatherDisplayServer:
         - GET /: Server health check
         - POST /render: Generate and return a weather image
         - GET /weather: Return raw weather data
+        - GET /cache: Return weather cache and fetch deduplication statistics
+        - GET /quota: Return API call budget usage and projected exhaustion
+        - GET /metrics: Return server metrics in the Prometheus text format
         - GET /preview: Generate HTML preview for browser
         """
 
         @self.app.get("/")
-        async def root() -> dict[str, str]:
+        async def root() -> HealthStatus:
             """Root endpoint for health check.
 
             Returns:
-                Dictionary with status information.
+                Dictionary with status information, including the state of the
+                upstream weather API circuit breaker.
             """
-            return {"status": "ok", "service": "Weather Display Server"}
+            breaker = self.api_client.circuit_breaker
+            return {
+                "status": "ok" if breaker.state is CircuitState.CLOSED else "degraded",
+                "service": "Weather Display Server",
+                "upstream": breaker.get_status(),
+            }
 
         @self.app.post("/render")
         async def render_weather(
-            request: RenderRequest, background_tasks: BackgroundTasks
+            request: RenderRequest,
+            background_tasks: BackgroundTasks,
+            if_none_match: Annotated[str | None, Header()] = None,
         ) -> Response:
             """Render a weather image for e-paper display.
 
@@ -235,14 +326,15 @@ class WeatherDisplayServer:
             Args:
                 request: Client render request with battery status.
                 background_tasks: FastAPI background task queue for cleanup.
+                if_none_match: ETag of the image the client already shows.
 
             Returns:
-                PNG image response.
+                PNG image response, or 304 if the client's image is current.
 
             Raises:
-                HTTPException: If image generation fails.
+                HTTPException: If the device is unknown or image generation fails.
             """
-            return await self._handle_render(request, background_tasks)
+            return await self._handle_render(request, background_tasks, if_none_match)
 
         @self.app.get("/weather")
         async def get_weather() -> WeatherData:
@@ -259,6 +351,42 @@ class WeatherDisplayServer:
             """
             return await self._handle_weather()
 
+        @self.app.get("/cache")
+        async def get_cache_status() -> WeatherCacheStats:
+            """Get weather cache statistics.
+
+            Returns request and upstream fetch counts for the shared weather
+            cache, including the ratio of requests served without a fetch.
+
+            Returns:
+                Dictionary with weather cache statistics.
+            """
+            return self.device_registry.cache_index.get_stats()
+
+        @self.app.get("/quota")
+        async def get_quota_status() -> QuotaStatus:
+            """Get API call budget usage.
+
+            Returns calls made today, remaining budget, cache TTL stretching and
+            the projected time the daily budget runs out for each API key.
+
+            Returns:
+                Dictionary with API quota status.
+            """
+            return self.quota_governor.get_status()
+
+        @self.app.get("/renderer")
+        async def get_renderer_status() -> RendererMetrics:
+            """Get renderer statistics.
+
+            Returns the hit rate of the time formatting cache shared across
+            renders.
+
+            Returns:
+                Dictionary with renderer statistics.
+            """
+            return self.renderer.get_metrics()
+
         @self.app.get("/memory")
         async def get_memory_status() -> MemoryReportDict:
             """Get memory usage statistics.
@@ -271,6 +399,19 @@ class WeatherDisplayServer:
             """
             return memory_profiler.get_report()
 
+        @self.app.get("/metrics")
+        async def get_metrics() -> Response:
+            """Get server metrics in the Prometheus text exposition format.
+
+            Exposes upstream fetch latency, cache hits and misses per tier,
+            template and screenshot times, render queue depth, browser
+            restarts, response sizes and per-device request counts.
+
+            Returns:
+                Plain text response with the metrics.
+            """
+            return Response(content=metrics.expose(), media_type=METRICS_CONTENT_TYPE)
+
         @self.app.get("/preview")
         async def preview_weather() -> Response:
             """Preview the weather dashboard in a browser.
@@ -284,47 +425,76 @@ class WeatherDisplayServer:
             Raises:
                 HTTPException: If preview generation fails.
             """
-            try:
-                # Get default battery status for preview
-                battery_status = BatteryStatus(
-                    level=PREVIEW_BATTERY_LEVEL,
-                    voltage=PREVIEW_BATTERY_VOLTAGE,
-                    current=PREVIEW_BATTERY_CURRENT,
-                    temperature=PREVIEW_BATTERY_TEMP,
-                    state=BatteryState.FULL,
-                )
+            return await self._handle_preview()
 
-                # Get weather data
-                weather_data = await self.api_client.get_weather_data()
+    async def _handle_render(
+        self,
+        request: RenderRequest,
+        background_tasks: BackgroundTasks,
+        if_none_match: str | None = None,
+    ) -> Response:
+        """Handle render request, tracing its stages if request tracing is enabled.
 
-                # Generate HTML
-                html = await self.renderer.generate_html(weather_data, battery_status)
+        The stage durations are sent in a Server-Timing header and logged
+        together with an operation ID, which is also sent with the response.
 
-                # Return HTML content
-                return Response(content=html, media_type="text/html")
-            except Exception as e:
-                error_location = get_error_location()
-                self.logger.error(f"Error generating preview [{error_location}]: {e}")
-                raise HTTPException(status_code=500, detail=str(e)) from e
+        Args:
+            request: Render request data containing battery status and system metrics.
+            background_tasks: FastAPI background task queue for cleanup.
+            if_none_match: ETag of the image the client already shows.
 
-    async def _handle_render(
-        self, request: RenderRequest, background_tasks: BackgroundTasks
+        Returns:
+            FastAPI response with rendered PNG image, or 304 Not Modified.
+
+        Raises:
+            HTTPException: If the device is unknown (404) or rendering fails (500).
+        """
+        if not self.config.server.request_tracing:
+            return await self._render_response(request, background_tasks, if_none_match)
+
+        with start_trace("render") as trace:
+            try:
+                response = await self._render_response(request, background_tasks, if_none_match)
+            finally:
+                self.logger.info("Render trace", extra=trace.to_record())
+            response.headers[SERVER_TIMING_HEADER] = trace.server_timing()
+            response.headers[OPERATION_ID_HEADER] = trace.operation_id
+            return response
+
+    async def _render_response(
+        self,
+        request: RenderRequest,
+        background_tasks: BackgroundTasks,
+        if_none_match: str | None = None,
     ) -> Response:
-        """Handle render request.
+        """Respond to a render request.
+
+        Processes a client render request, fetches the latest weather data for
+        the requesting device, renders an image, and returns it as a PNG response.
 
-        Processes a client render request, fetches the latest weather data,
-        renders an image, and returns it as a PNG response.
+        Before rendering, the displayed content is fingerprinted. If it matches
+        the image the client already shows, a 304 is returned; if an image with
+        the same fingerprint was rendered before, it is served without running
+        Jinja2 or the browser.
 
         Args:
             request: Render request data containing battery status and system metrics.
             background_tasks: FastAPI background task queue for cleanup.
+            if_none_match: ETag of the image the client already shows.
 
         Returns:
-            FastAPI response with rendered PNG image.
+            FastAPI response with rendered PNG image, or 304 Not Modified.
 
         Raises:
-            HTTPException: If rendering fails for any reason.
+            HTTPException: If the device is unknown (404) or rendering fails (500).
         """
+        try:
+            api_client, renderer = self._resolve_device(request.device_id)
+        except MissingConfigError as e:
+            self.logger.warning(f"Render requested for unknown device: {request.device_id}")
+            raise HTTPException(status_code=404, detail=str(e)) from e
+        device_requests_total.inc(request.device_id or METRICS_DEFAULT_DEVICE)
+
         try:
             # Convert battery info to model
             battery_status = BatteryStatus(
@@ -336,7 +506,21 @@ class WeatherDisplayServer:
             )
 
             # Get weather data
-            weather_data = await self.api_client.get_weather_data()
+            with span("weather"):
+                weather_data = await api_client.get_weather_data()
+            headers = self._build_schedule_headers(api_client, weather_data.timezone_offset)
+            background_tasks.add_task(api_client.prefetch_weather_data)
+
+            # Skip rendering when the display would show the same as before
+            with span("fingerprint"):
+                prepared = self._prepare_display(renderer, weather_data, battery_status)
+            self._schedule_flushes(background_tasks)
+            if prepared is not None:
+                unchanged = self._serve_unchanged_image(
+                    headers, renderer, if_none_match, prepared.fingerprint
+                )
+                if unchanged is not None:
+                    return unchanged
 
             # Record memory before rendering
             memory_profiler.record_snapshot()
@@ -345,7 +529,11 @@ class WeatherDisplayServer:
             tmp_path = path_resolver.get_temp_file(suffix=IMAGE_FILE_EXTENSION)
 
             # Render the image
-            await self.renderer.render_weather_image(weather_data, battery_status, tmp_path)
+            with render_queue_depth.track(), span("render"):
+                await renderer.render_weather_image(
+                    weather_data, battery_status, tmp_path, prepared
+                )
+            self._observe_response_size(tmp_path)
 
             # Record memory after rendering
             memory_profiler.record_snapshot()
@@ -354,22 +542,214 @@ class WeatherDisplayServer:
             if memory_profiler.check_memory_growth(threshold_mb=SERVER_MEMORY_GROWTH_THRESHOLD_MB):
                 self.logger.warning("Excessive memory growth detected during rendering")
 
+            # Cache the image before the temporary file is removed
+            if prepared is not None:
+                self._add_dirty_regions(headers, renderer, if_none_match, prepared.fingerprint)
+                background_tasks.add_task(
+                    self._cache_rendered_image, prepared.fingerprint, tmp_path
+                )
             # Return the image with background task to clean up
-            def cleanup_temp_file() -> None:
-                """Clean up temporary file after response is sent."""
-                try:
-                    tmp_path.unlink(missing_ok=True)
-                except Exception as clean_e:
-                    self.logger.warning(f"Failed to clean up temp file {tmp_path}: {clean_e}")
+            background_tasks.add_task(self._cleanup_temp_file, tmp_path)
 
-            background_tasks.add_task(cleanup_temp_file)
-
-            return FileResponse(tmp_path, media_type=IMAGE_MEDIA_TYPE, filename=DOWNLOAD_FILENAME)
+            return FileResponse(
+                tmp_path,
+                media_type=IMAGE_MEDIA_TYPE,
+                filename=DOWNLOAD_FILENAME,
+                headers=headers,
+            )
         except Exception as e:
             error_location = get_error_location()
             self.logger.error(f"Error rendering weather image [{error_location}]: {e}")
             raise HTTPException(status_code=500, detail=str(e)) from e
 
+    def _serve_unchanged_image(
+        self,
+        headers: dict[str, str],
+        renderer: WeatherRenderer,
+        if_none_match: str | None,
+        fingerprint: str,
+    ) -> Response | None:
+        """Respond without rendering if the displayed content was rendered before.
+
+        Adds the fingerprint's ETag to the response headers.
+
+        Args:
+            headers: Response headers.
+            renderer: Renderer for the requesting device.
+            if_none_match: ETag of the image the client already shows.
+            fingerprint: Fingerprint of the content to display.
+
+        Returns:
+            304 if the client already shows the content, the cached image if it
+            was rendered before, or None if the image must be rendered.
+        """
+        etag = f'"{fingerprint}"'
+        headers[ETAG_HEADER] = etag
+        if if_none_match == etag:
+            return Response(status_code=304, headers=headers)
+
+        cached_path = self.file_cache.get_cache_path(fingerprint + IMAGE_FILE_EXTENSION)
+        cached = self.file_cache.is_valid(cached_path)
+        cache_requests_total.inc("image", "hit" if cached else "miss")
+        if not cached:
+            return None
+
+        self.logger.debug("Display unchanged, serving cached image")
+        self._add_dirty_regions(headers, renderer, if_none_match, fingerprint)
+        self._observe_response_size(cached_path)
+        return FileResponse(
+            cached_path,
+            media_type=IMAGE_MEDIA_TYPE,
+            filename=DOWNLOAD_FILENAME,
+            headers=headers,
+        )
+
+    def _cleanup_temp_file(self, tmp_path: Path) -> None:
+        """Clean up a rendered image's temporary file after the response is sent.
+
+        Args:
+            tmp_path: Path of the temporary image file.
+        """
+        try:
+            tmp_path.unlink(missing_ok=True)
+        except Exception as e:
+            self.logger.warning(f"Failed to clean up temp file {tmp_path}: {e}")
+
+    def _schedule_flushes(self, background_tasks: BackgroundTasks) -> None:
+        """Flush daily extremes and API call counters in the background once due.
+
+        Args:
+            background_tasks: FastAPI background task queue to add the flushes to.
+        """
+        if self.daily_extremes.flush_due:
+            background_tasks.add_task(self.daily_extremes.flush)
+        if self.quota_governor.flush_due:
+            background_tasks.add_task(self.quota_governor.flush)
+
+    def _prepare_display(
+        self,
+        renderer: WeatherRenderer,
+        weather_data: WeatherData,
+        battery_status: BatteryStatus,
+    ) -> PreparedDisplay | None:
+        """Build the template context and fingerprint the content it displays.
+
+        Args:
+            renderer: Renderer for the device's render profile.
+            weather_data: Weather data to display.
+            battery_status: Battery status of the device.
+
+        Returns:
+            Prepared display, or None if the content can't be fingerprinted,
+            in which case the image is always rendered.
+        """
+        try:
+            return renderer.prepare_display(weather_data, battery_status)
+        except Exception as e:
+            self.logger.debug(f"Could not fingerprint display content: {e}")
+            return None
+
+    def _add_dirty_regions(
+        self,
+        headers: dict[str, str],
+        renderer: WeatherRenderer,
+        if_none_match: str | None,
+        fingerprint: str,
+    ) -> None:
+        """Advertise the regions differing from the image the client shows.
+
+        Args:
+            headers: Response headers to add the dirty regions to.
+            renderer: Renderer that produced the new image.
+            if_none_match: ETag of the image the client shows, if it sent one.
+            fingerprint: Fingerprint of the new image's displayed content.
+        """
+        if if_none_match is None:
+            return
+        regions = renderer.get_dirty_regions(if_none_match.strip('"'), fingerprint)
+        if regions is not None:
+            headers[DIRTY_REGIONS_HEADER] = format_regions(regions)
+
+    def _observe_response_size(self, image_path: Path) -> None:
+        """Record the size of an image about to be sent to a client.
+
+        Args:
+            image_path: Path to the image.
+        """
+        try:
+            response_size_bytes.observe(image_path.stat().st_size, "render")
+        except Exception as e:
+            self.logger.debug(f"Could not size image response: {e}")
+
+    def _cache_rendered_image(self, fingerprint: str, image_path: Path) -> None:
+        """Store a rendered image under its display fingerprint.
+
+        Args:
+            fingerprint: Fingerprint of the image's displayed content.
+            image_path: Path to the rendered image.
+        """
+        try:
+            self.file_cache.put_file(fingerprint + IMAGE_FILE_EXTENSION, image_path)
+        except Exception as e:
+            self.logger.warning(f"Failed to cache rendered image: {e}")
+
+    def _resolve_device(self, device_id: str | None) -> tuple[WeatherAPIClient, WeatherRenderer]:
+        """Get the weather client and renderer serving a device.
+
+        Args:
+            device_id: Device ID from the render request, or None for the default profile.
+
+        Returns:
+            Tuple of (weather API client, renderer) for the device.
+
+        Raises:
+            MissingConfigError: If the device ID is not registered.
+        """
+        if device_id is None:
+            return self.api_client, self.renderer
+        return (
+            self.device_registry.get_api_client(device_id),
+            self.device_registry.get_renderer(device_id),
+        )
+
+    def _build_schedule_headers(
+        self, api_client: WeatherAPIClient, utc_offset: int
+    ) -> dict[str, str]:
+        """Build response headers advertising when the rendered content changes next.
+
+        The image changes when the cached weather data expires and new data is
+        fetched, or when the displayed date rolls over at midnight where the
+        weather is shown, which need not be the server's midnight. Clients use
+        these headers to align their wake-ups with new content instead of
+        downloading unchanged images.
+
+        Args:
+            api_client: Weather API client that supplied the rendered data.
+            utc_offset: Offset from UTC in seconds of the location being shown,
+                the weather data's timezone_offset.
+
+        Returns:
+            Dictionary of Cache-Control, Expires, and schedule headers.
+        """
+        location_tz = timezone(timedelta(seconds=utc_offset))
+        now = datetime.now(location_tz)
+        data_expiry = api_client.get_data_expiry()
+        if data_expiry is None:
+            data_expiry = now + timedelta(minutes=api_client.config.update_interval_minutes)
+        else:
+            data_expiry = data_expiry.astimezone(location_tz)
+
+        next_midnight = datetime.combine(now.date() + timedelta(days=1), time.min, location_tz)
+        next_update = max(min(data_expiry, next_midnight), now)
+        max_age = int((next_update - now).total_seconds())
+
+        return {
+            "Cache-Control": f"max-age={max_age}",
+            "Expires": formatdate(next_update.timestamp(), usegmt=True),
+            DATA_EXPIRES_HEADER: str(int(data_expiry.timestamp())),
+            NEXT_UPDATE_HEADER: str(int(next_update.timestamp())),
+        }
+
     async def _handle_weather(self) -> WeatherData:
         """Handle weather data request.
 
@@ -393,6 +773,40 @@ class WeatherDisplayServer:
             self.logger.error(f"Error getting weather data [{error_location}]: {e}")
             raise HTTPException(status_code=500, detail=str(e)) from e
 
+    async def _handle_preview(self) -> Response:
+        """Handle preview request.
+
+        Renders the dashboard HTML with mock battery values.
+
+        Returns:
+            HTML response with the rendered dashboard.
+
+        Raises:
+            HTTPException: If preview generation fails.
+        """
+        try:
+            # Get default battery status for preview
+            battery_status = BatteryStatus(
+                level=PREVIEW_BATTERY_LEVEL,
+                voltage=PREVIEW_BATTERY_VOLTAGE,
+                current=PREVIEW_BATTERY_CURRENT,
+                temperature=PREVIEW_BATTERY_TEMP,
+                state=BatteryState.FULL,
+            )
+
+            # Get weather data
+            weather_data = await self.api_client.get_weather_data()
+
+            # Generate HTML
+            html = await self.renderer.generate_html(weather_data, battery_status)
+
+            # Return HTML content
+            return Response(content=html, media_type="text/html")
+        except Exception as e:
+            error_location = get_error_location()
+            self.logger.error(f"Error generating preview [{error_location}]: {e}")
+            raise HTTPException(status_code=500, detail=str(e)) from e
+
     def _setup_static_files(self) -> None:
         """Set up static files handling.
 
@@ -0,0 +1,401 @@
+"""Prometheus-style metrics for the server's hot paths.
+
+Provides counters, gauges and histograms exposed in the Prometheus text
+exposition format by the server's /metrics endpoint.
+
+Metrics are recorded from the event loop thread, where updates to plain
+dictionaries and lists can't interleave, so recording takes no locks and
+costs a dictionary lookup and a few additions. Scrapes copy each metric's
+values before formatting them and never block recording.
+"""
+
+import math
+import time
+from bisect import bisect_left
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+
+from rpi_weather_display.constants import (
+    METRICS_LATENCY_BUCKETS,
+    METRICS_NAMESPACE,
+    METRICS_SIZE_BUCKETS,
+)
+
+LabelValues = tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value for the exposition format.
+
+    Args:
+        value: Sample value
+
+    Returns:
+        Integral values without a fraction, infinity as +Inf
+    """
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the exposition format.
+
+    Args:
+        value: Label value
+
+    Returns:
+        Value with backslashes, quotes and newlines escaped
+    """
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """Format label pairs for a sample line.
+
+    Args:
+        names: Label names
+        values: Label values, in the same order
+
+    Returns:
+        Label set such as {device="kitchen"}, or an empty string without labels
+    """
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)
+    )
+    return "{" + pairs + "}"
+
+
+class _Metric:
+    """Base class for metrics with an optional set of labels."""
+
+    metric_type = ""
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str] = ()) -> None:
+        """Initialize the metric.
+
+        Args:
+            name: Metric name, without the namespace prefix
+            help_text: Description shown in the exposition format
+            label_names: Names of the labels identifying each series
+        """
+        self.name = f"{METRICS_NAMESPACE}_{name}"
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+
+    def _key(self, labels: Sequence[str]) -> LabelValues:
+        """Get the series key for a set of label values.
+
+        Args:
+            labels: Label values, in the order of label_names
+
+        Returns:
+            Tuple of label values
+
+        Raises:
+            ValueError: If the number of label values doesn't match the metric
+        """
+        if len(labels) != len(self.label_names):
+            raise ValueError(
+                f"{self.name} expects labels {self.label_names}, got {tuple(labels)}"
+            )
+        return tuple(labels)
+
+    def _samples(self) -> list[str]:
+        """Format the metric's sample lines.
+
+        Returns:
+            Sample lines of every series
+        """
+        raise NotImplementedError
+
+    def expose(self) -> list[str]:
+        """Format the metric in the exposition format.
+
+        Returns:
+            HELP, TYPE and sample lines
+        """
+        return [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} {self.metric_type}",
+            *self._samples(),
+        ]
+
+
+class Counter(_Metric):
+    """Monotonically increasing count, such as requests served."""
+
+    metric_type = "counter"
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str] = ()) -> None:
+        """Initialize the counter.
+
+        Args:
+            name: Metric name, without the namespace prefix
+            help_text: Description shown in the exposition format
+            label_names: Names of the labels identifying each series
+        """
+        super().__init__(name, help_text, label_names)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        """Increase the count of a series.
+
+        Args:
+            *labels: Label values, in the order of label_names
+            amount: Amount to add
+        """
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def get(self, *labels: str) -> float:
+        """Get the count of a series.
+
+        Args:
+            *labels: Label values, in the order of label_names
+
+        Returns:
+            Current count, 0 for series never incremented
+        """
+        return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> list[str]:
+        """Format the counter's sample lines."""
+        return [
+            f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}"
+            for key, value in list(self._values.items())
+        ]
+
+
+class Gauge(Counter):
+    """Value that goes up and down, such as renders in progress."""
+
+    metric_type = "gauge"
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        """Decrease the value of a series.
+
+        Args:
+            *labels: Label values, in the order of label_names
+            amount: Amount to subtract
+        """
+        self.inc(*labels, amount=-amount)
+
+    @contextmanager
+    def track(self, *labels: str) -> Iterator[None]:
+        """Count the block as in progress while it runs.
+
+        Args:
+            *labels: Label values, in the order of label_names
+
+        Yields:
+            None
+        """
+        self.inc(*labels)
+        try:
+            yield
+        finally:
+            self.dec(*labels)
+
+
+class Histogram(_Metric):
+    """Distribution of observed values, such as latencies, in fixed buckets."""
+
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = METRICS_LATENCY_BUCKETS,
+    ) -> None:
+        """Initialize the histogram.
+
+        Args:
+            name: Metric name, without the namespace prefix
+            help_text: Description shown in the exposition format
+            label_names: Names of the labels identifying each series
+            buckets: Ascending upper bounds of the buckets; an unbounded
+                bucket is added after them
+        """
+        super().__init__(name, help_text, label_names)
+        self.buckets = tuple(sorted(buckets))
+        # Per series: observation counts per bucket (not cumulative), then sum
+        self._series: dict[LabelValues, list[float]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        """Record an observation.
+
+        Args:
+            value: Observed value
+            *labels: Label values, in the order of label_names
+        """
+        key = self._key(labels)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = [0.0] * (len(self.buckets) + 2)
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    @contextmanager
+    def time(self, *labels: str) -> Iterator[None]:
+        """Observe how long the block takes, in seconds.
+
+        Args:
+            *labels: Label values, in the order of label_names
+
+        Yields:
+            None
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, *labels)
+
+    def get_count(self, *labels: str) -> int:
+        """Get the number of observations of a series.
+
+        Args:
+            *labels: Label values, in the order of label_names
+
+        Returns:
+            Number of observations, 0 for series never observed
+        """
+        series = self._series.get(self._key(labels))
+        return int(sum(series[:-1])) if series else 0
+
+    def _samples(self) -> list[str]:
+        """Format the histogram's bucket, sum and count lines."""
+        lines: list[str] = []
+        bounds = [*self.buckets, math.inf]
+        bucket_labels = (*self.label_names, "le")
+        for key, series in list(self._series.items()):
+            counts = list(series)
+            cumulative = 0.0
+            for bound, count in zip(bounds, counts, strict=False):
+                cumulative += count
+                labels = _format_labels(bucket_labels, (*key, _format_value(bound)))
+                lines.append(f"{self.name}_bucket{labels} {_format_value(cumulative)}")
+            labels = _format_labels(self.label_names, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(counts[-1])}")
+            lines.append(f"{self.name}_count{labels} {_format_value(cumulative)}")
+        return lines
+
+
+class MetricsRegistry:
+    """Collection of metrics exposed together."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._metrics: dict[str, _Metric] = {}
+
+    def _register(self, metric: _Metric) -> None:
+        """Add a metric to the registry.
+
+        Args:
+            metric: Metric to add
+
+        Raises:
+            ValueError: If a metric with the same name is already registered
+        """
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric already registered: {metric.name}")
+        self._metrics[metric.name] = metric
+
+    def counter(self, name: str, help_text: str, label_names: Sequence[str] = ()) -> Counter:
+        """Create and register a counter.
+
+        Args:
+            name: Metric name, without the namespace prefix
+            help_text: Description shown in the exposition format
+            label_names: Names of the labels identifying each series
+
+        Returns:
+            The new counter
+        """
+        metric = Counter(name, help_text, label_names)
+        self._register(metric)
+        return metric
+
+    def gauge(self, name: str, help_text: str, label_names: Sequence[str] = ()) -> Gauge:
+        """Create and register a gauge.
+
+        Args:
+            name: Metric name, without the namespace prefix
+            help_text: Description shown in the exposition format
+            label_names: Names of the labels identifying each series
+
+        Returns:
+            The new gauge
+        """
+        metric = Gauge(name, help_text, label_names)
+        self._register(metric)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = METRICS_LATENCY_BUCKETS,
+    ) -> Histogram:
+        """Create and register a histogram.
+
+        Args:
+            name: Metric name, without the namespace prefix
+            help_text: Description shown in the exposition format
+            label_names: Names of the labels identifying each series
+            buckets: Ascending upper bounds of the buckets
+
+        Returns:
+            The new histogram
+        """
+        metric = Histogram(name, help_text, label_names, buckets)
+        self._register(metric)
+        return metric
+
+    def expose(self) -> str:
+        """Format every metric in the Prometheus text exposition format.
+
+        Returns:
+            Exposition text
+        """
+        lines: list[str] = []
+        for metric in list(self._metrics.values()):
+            lines += metric.expose()
+        return "\n".join(lines) + "\n"
+
+
+# Global registry and the server's metrics
+metrics = MetricsRegistry()
+
+upstream_fetch_seconds = metrics.histogram(
+    "upstream_fetch_seconds", "Latency of weather API requests.", ("endpoint",)
+)
+cache_requests_total = metrics.counter(
+    "cache_requests_total", "Cache lookups by cache tier and result.", ("tier", "result")
+)
+template_render_seconds = metrics.histogram(
+    "template_render_seconds", "Time spent rendering Jinja2 templates.", ("template",)
+)
+screenshot_seconds = metrics.histogram(
+    "screenshot_seconds", "Time Chromium takes to load a page and screenshot it."
+)
+render_queue_depth = metrics.gauge(
+    "render_queue_depth", "Image renders in progress or waiting for the browser."
+)
+browser_restarts_total = metrics.counter(
+    "browser_restarts_total", "Browser relaunches after the browser disconnected."
+)
+response_size_bytes = metrics.histogram(
+    "response_size_bytes", "Size of image responses.", ("endpoint",), METRICS_SIZE_BUCKETS
+)
+device_requests_total = metrics.counter(
+    "device_requests_total", "Render requests by device.", ("device",)
+)
@@ -0,0 +1,364 @@
+"""OpenWeatherMap API quota governor.
+
+Tracks API call consumption per API key against per-minute and daily limits,
+so the server can stay within the account's call budget instead of learning
+about overspending from rate limit errors. Requests are prioritized so that
+user-facing renders keep working after background fetches are cut off, and
+cache lifetimes are stretched as the daily budget runs low.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from datetime import UTC, date, datetime, timedelta
+from enum import Enum, auto
+from pathlib import Path
+
+from typing_extensions import TypedDict
+
+from rpi_weather_display.constants import (
+    QUOTA_BACKGROUND_RESERVE_FRACTION,
+    QUOTA_FLUSH_INTERVAL_SECONDS,
+    QUOTA_KEY_ID_LENGTH,
+    QUOTA_MAX_TTL_MULTIPLIER,
+    QUOTA_TTL_STRETCH_THRESHOLD,
+    SECONDS_PER_MINUTE,
+)
+from rpi_weather_display.exceptions import APIQuotaExceededError
+from rpi_weather_display.utils import file_utils
+
+
+class RequestPriority(Enum):
+    """Priority of a request for API quota."""
+
+    INTERACTIVE = auto()  # Needed to answer a user-facing request such as a render
+    BACKGROUND = auto()  # Pre-fetching or cache warming that can be skipped
+
+
+class QuotaKeyStatus(TypedDict):
+    """Quota usage for a single API key."""
+
+    key_id: str
+    calls_today: int
+    daily_limit: int
+    remaining_today: int
+    minute_limit: int
+    minute_tokens: float
+    ttl_multiplier: float
+    resets_at: str
+    projected_exhaustion: str | None
+
+
+class QuotaStatus(TypedDict):
+    """Quota usage for all API keys seen by the governor."""
+
+    keys: list[QuotaKeyStatus]
+
+
+class _KeyBudget:
+    """Call budget state for one API key."""
+
+    def __init__(self, minute_limit: int, day: date, calls_today: int = 0) -> None:
+        """Initialize the budget with a full per-minute bucket.
+
+        Args:
+            minute_limit: Maximum calls per minute (bucket capacity).
+            day: UTC date the daily counter applies to.
+            calls_today: Calls already made on that date.
+        """
+        self.minute_tokens = float(minute_limit)
+        self.last_refill = time.monotonic()
+        self.day = day
+        self.calls_today = calls_today
+
+
+class QuotaGovernor:
+    """Token bucket quota governor keyed by API key.
+
+    Each API key gets a per-minute token bucket that refills continuously and a
+    daily call counter that resets at midnight UTC, when OpenWeatherMap resets
+    its daily limits. The daily counters are persisted so restarts don't reset
+    the budget. They are flushed periodically and on shutdown rather than on
+    every call, and updates are thread-safe, so flushes can run in a worker
+    thread.
+
+    Attributes:
+        calls_per_minute: Per-minute call limit for each API key
+        calls_per_day: Daily call limit for each API key
+        state_file: File the daily counters are persisted to, or None
+        flush_interval_seconds: Minimum time between periodic flushes
+        logger: Logger instance
+    """
+
+    def __init__(
+        self,
+        calls_per_minute: int,
+        calls_per_day: int,
+        state_file: Path | None = None,
+        flush_interval_seconds: float = QUOTA_FLUSH_INTERVAL_SECONDS,
+    ) -> None:
+        """Initialize the quota governor.
+
+        Args:
+            calls_per_minute: Per-minute call limit for each API key.
+            calls_per_day: Daily call limit for each API key.
+            state_file: Optional file used to persist daily consumption.
+            flush_interval_seconds: Minimum seconds between periodic flushes.
+        """
+        self.calls_per_minute = calls_per_minute
+        self.calls_per_day = calls_per_day
+        self.state_file = state_file
+        self.flush_interval_seconds = flush_interval_seconds
+        self.logger = logging.getLogger(__name__)
+        self._budgets: dict[str, _KeyBudget] = {}
+        self._dirty = False
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        # Keeps concurrent flushes from writing snapshots out of order
+        self._flush_lock = threading.Lock()
+        self._load_state()
+
+    def acquire(
+        self, api_key: str, cost: int = 1, priority: RequestPriority = RequestPriority.INTERACTIVE
+    ) -> None:
+        """Reserve quota for one or more API calls.
+
+        Background requests are refused once the remaining daily budget falls to
+        the reserve kept for interactive requests.
+
+        Args:
+            api_key: API key the calls are made with.
+            cost: Number of API calls to reserve.
+            priority: Priority of the request.
+
+        Raises:
+            APIQuotaExceededError: If the calls would exceed the available budget.
+        """
+        key_id = self._key_id(api_key)
+        with self._lock:
+            budget = self._get_budget(key_id)
+            remaining = self.calls_per_day - budget.calls_today
+            if priority is RequestPriority.BACKGROUND:
+                remaining -= int(self.calls_per_day * QUOTA_BACKGROUND_RESERVE_FRACTION)
+
+            if remaining < cost:
+                raise APIQuotaExceededError(
+                    "Daily API call budget exhausted",
+                    {
+                        "key_id": key_id,
+                        "window": "daily",
+                        "limit": self.calls_per_day,
+                        "calls_today": budget.calls_today,
+                        "priority": priority.name,
+                        "retry_after": int(self._seconds_until_reset()),
+                    },
+                )
+
+            if budget.minute_tokens < cost:
+                raise APIQuotaExceededError(
+                    "Per-minute API call budget exhausted",
+                    {
+                        "key_id": key_id,
+                        "window": "minute",
+                        "limit": self.calls_per_minute,
+                        "priority": priority.name,
+                    },
+                )
+
+            budget.minute_tokens -= cost
+            budget.calls_today += cost
+            self._dirty = True
+
+    def ttl_multiplier(self, api_key: str) -> float:
+        """Get the factor to stretch cache lifetimes by for an API key.
+
+        Lifetimes are unchanged while at least the stretch threshold of the daily
+        budget remains, then grow linearly to the maximum multiplier as the
+        budget approaches zero.
+
+        Args:
+            api_key: API key to check.
+
+        Returns:
+            Multiplier of at least 1.0 to apply to cache TTLs.
+        """
+        with self._lock:
+            return self._multiplier_for(self._get_budget(self._key_id(api_key)))
+
+    def get_status(self) -> QuotaStatus:
+        """Get quota usage and projected exhaustion for every known API key.
+
+        Returns:
+            Dictionary with per-key quota status.
+        """
+        now = datetime.now(UTC)
+        resets_at = self._next_reset(now)
+        keys: list[QuotaKeyStatus] = []
+
+        with self._lock:
+            budgets = [(key_id, self._get_budget(key_id)) for key_id in list(self._budgets)]
+
+        for key_id, budget in budgets:
+            remaining = max(0, self.calls_per_day - budget.calls_today)
+            keys.append(
+                {
+                    "key_id": key_id,
+                    "calls_today": budget.calls_today,
+                    "daily_limit": self.calls_per_day,
+                    "remaining_today": remaining,
+                    "minute_limit": self.calls_per_minute,
+                    "minute_tokens": round(budget.minute_tokens, 2),
+                    "ttl_multiplier": round(self._multiplier_for(budget), 2),
+                    "resets_at": resets_at.isoformat(),
+                    "projected_exhaustion": self._project_exhaustion(budget, now, resets_at),
+                }
+            )
+
+        return {"keys": keys}
+
+    @property
+    def flush_due(self) -> bool:
+        """Check whether there are unsaved calls and the flush interval has passed."""
+        return (
+            self._dirty
+            and self.state_file is not None
+            and time.monotonic() - self._last_flush >= self.flush_interval_seconds
+        )
+
+    def flush(self) -> None:
+        """Write unsaved daily consumption counters to the state file."""
+        if not self._dirty or self.state_file is None:
+            return
+
+        with self._flush_lock:
+            with self._lock:
+                state = {
+                    key_id: {"date": budget.day.isoformat(), "calls": budget.calls_today}
+                    for key_id, budget in self._budgets.items()
+                }
+                self._dirty = False
+                self._last_flush = time.monotonic()
+            try:
+                file_utils.atomic_write(self.state_file, json.dumps(state))
+            except Exception as e:
+                self._dirty = True
+                self.logger.warning(f"Error writing API quota state: {e}")
+
+    def _multiplier_for(self, budget: _KeyBudget) -> float:
+        """Get the TTL multiplier for a budget.
+
+        Args:
+            budget: Budget to check.
+
+        Returns:
+            TTL multiplier for the budget.
+        """
+        remaining_fraction = max(0.0, 1 - budget.calls_today / self.calls_per_day)
+        if remaining_fraction >= QUOTA_TTL_STRETCH_THRESHOLD:
+            return 1.0
+        shortfall = 1 - remaining_fraction / QUOTA_TTL_STRETCH_THRESHOLD
+        return 1.0 + (QUOTA_MAX_TTL_MULTIPLIER - 1.0) * shortfall
+
+    def _project_exhaustion(
+        self, budget: _KeyBudget, now: datetime, resets_at: datetime
+    ) -> str | None:
+        """Project when the daily budget runs out at today's average call rate.
+
+        Args:
+            budget: Budget to project.
+            now: Current UTC time.
+            resets_at: Time the daily budget resets.
+
+        Returns:
+            ISO timestamp of projected exhaustion, or None if it lasts until reset.
+        """
+        if budget.calls_today == 0:
+            return None
+
+        day_start = resets_at - timedelta(days=1)
+        elapsed = max((now - day_start).total_seconds(), SECONDS_PER_MINUTE)
+        calls_per_second = budget.calls_today / elapsed
+        remaining = max(0, self.calls_per_day - budget.calls_today)
+
+        exhaustion = now + timedelta(seconds=remaining / calls_per_second)
+        if exhaustion >= resets_at:
+            return None
+        return exhaustion.isoformat()
+
+    def _get_budget(self, key_id: str) -> _KeyBudget:
+        """Get the budget for a key, refilling tokens and rolling over the day.
+
+        Args:
+            key_id: Hashed API key identifier.
+
+        Returns:
+            Up-to-date budget for the key.
+        """
+        today = datetime.now(UTC).date()
+        budget = self._budgets.get(key_id)
+        if budget is None:
+            budget = _KeyBudget(self.calls_per_minute, today)
+            self._budgets[key_id] = budget
+
+        if budget.day != today:
+            budget.day = today
+            budget.calls_today = 0
+
+        now = time.monotonic()
+        refill = (now - budget.last_refill) * self.calls_per_minute / SECONDS_PER_MINUTE
+        budget.minute_tokens = min(float(self.calls_per_minute), budget.minute_tokens + refill)
+        budget.last_refill = now
+        return budget
+
+    def _seconds_until_reset(self) -> float:
+        """Get the number of seconds until the daily budget resets."""
+        now = datetime.now(UTC)
+        return (self._next_reset(now) - now).total_seconds()
+
+    @staticmethod
+    def _next_reset(now: datetime) -> datetime:
+        """Get the next daily reset time (midnight UTC).
+
+        Args:
+            now: Current UTC time.
+
+        Returns:
+            Next midnight UTC.
+        """
+        return datetime.combine(now.date() + timedelta(days=1), datetime.min.time(), tzinfo=UTC)
+
+    @staticmethod
+    def _key_id(api_key: str) -> str:
+        """Get a non-reversible identifier for an API key.
+
+        Args:
+            api_key: API key to identify.
+
+        Returns:
+            Short hash of the API key, safe to persist and expose.
+        """
+        return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:QUOTA_KEY_ID_LENGTH]
+
+    def _load_state(self) -> None:
+        """Load persisted daily consumption counters."""
+        if self.state_file is None or not file_utils.file_exists(self.state_file):
+            return
+
+        try:
+            state = file_utils.read_json(self.state_file)
+            if not isinstance(state, dict):
+                return
+
+            for key_id, entry in state.items():
+                if not isinstance(entry, dict):
+                    continue
+                day = entry.get("date")
+                calls = entry.get("calls")
+                if isinstance(day, str) and isinstance(calls, int):
+                    self._budgets[key_id] = _KeyBudget(
+                        self.calls_per_minute, date.fromisoformat(day), calls
+                    )
+        except Exception as e:
+            self.logger.warning(f"Error reading API quota state: {e}")
@@ -4,13 +4,25 @@ Provides functionality to render weather data into HTML and convert it to
 images suitable for display on the e-paper screen using Playwright.
 """
 
+import hashlib
 import logging
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
+from typing import cast
 
 import jinja2
-
-from rpi_weather_display.constants import AQI_LEVELS
+from typing_extensions import TypedDict
+
+from rpi_weather_display.constants import (
+    AQI_LEVELS,
+    FRAME_LAYOUT_HISTORY,
+    SECTION_TEMPLATE,
+    TILE_CACHE_SIZE_MB,
+    TILE_CACHE_TTL_SECONDS,
+    TILE_VIEWPORT_HEIGHT,
+)
 from rpi_weather_display.models.config import AppConfig
 from rpi_weather_display.models.system import BatteryStatus
 from rpi_weather_display.models.weather import (
@@ -19,32 +31,85 @@ from rpi_weather_display.models.weather import (
     WeatherData,
 )
 from rpi_weather_display.server.browser_manager import browser_manager
+from rpi_weather_display.server.daily_extremes import DailyExtremesTracker
+from rpi_weather_display.server.display_fingerprint import (
+    SECTION_TEMPLATES,
+    collect_section_values,
+    compute_fingerprint,
+)
+from rpi_weather_display.server.metrics import (
+    cache_requests_total,
+    screenshot_seconds,
+    template_render_seconds,
+)
 from rpi_weather_display.server.moon_phase_helper import MoonPhaseHelper
 from rpi_weather_display.server.template_filter_manager import TemplateFilterManager
-from rpi_weather_display.server.time_formatter import TimeFormatter
+from rpi_weather_display.server.tile_compositor import (
+    FrameLayout,
+    composite_tiles,
+    diff_layouts,
+)
+from rpi_weather_display.server.time_formatter import (
+    TimeFormatCacheStats,
+    TimeFormatter,
+    get_format_cache_stats,
+)
+from rpi_weather_display.server.tracing import span
 from rpi_weather_display.server.weather_calculator import WeatherCalculator
 from rpi_weather_display.server.weather_icon_mapper import WeatherIconMapper
 from rpi_weather_display.server.wind_helper import WindHelper
 from rpi_weather_display.utils import get_battery_icon
+from rpi_weather_display.utils.cache_manager import MemoryAwareCache
+from rpi_weather_display.utils.dirty_regions import Rect
 from rpi_weather_display.utils.error_utils import get_error_location
+from rpi_weather_display.utils.file_utils import write_bytes
+
+
+class RendererMetrics(TypedDict):
+    """Renderer statistics."""
+
+    time_format_cache: TimeFormatCacheStats
+
+
+@dataclass(frozen=True)
+class PreparedDisplay:
+    """Template context of a render, with the content it displays.
+
+    Attributes:
+        context: Template context.
+        section_values: Displayed values keyed by section.
+        fingerprint: Hex digest of the displayed content.
+    """
+
+    context: dict[str, object]
+    section_values: dict[str, list[str]]
+    fingerprint: str
 
 
 class WeatherRenderer:
     """Renderer for weather data to e-paper display images."""
 
-    def __init__(self, config: AppConfig, template_dir: Path) -> None:
+    def __init__(
+        self,
+        config: AppConfig,
+        template_dir: Path,
+        daily_extremes: DailyExtremesTracker | None = None,
+    ) -> None:
         """Initialize the renderer.
 
         Args:
             config: Application configuration.
             template_dir: Path to the templates directory.
+            daily_extremes: Tracker for daily extremes, shared between renderers.
         """
         self.config = config
         self.logger = logging.getLogger(__name__)
         
         # Initialize helper components
         self.time_formatter = TimeFormatter(config.display)
-        self.weather_calculator = WeatherCalculator()
+        self.weather_calculator = WeatherCalculator(
+            daily_extremes, config.weather.location_key
+        )
         self.icon_mapper = WeatherIconMapper()
 
         # Set up Jinja2 environment
@@ -55,6 +120,16 @@ class WeatherRenderer:
         # Set up template filters
         self.filter_manager = TemplateFilterManager(self.jinja_env, self.icon_mapper)
 
+        # Hash of the template sources, computed on first fingerprint
+        self._template_version: str | None = None
+
+        # Rendered section tiles keyed by section and fingerprint, and the
+        # layouts of recent frames keyed by frame fingerprint
+        self._tile_cache: MemoryAwareCache[bytes] = MemoryAwareCache(
+            TILE_CACHE_SIZE_MB, TILE_CACHE_TTL_SECONDS, sizer=len
+        )
+        self._frame_layouts: OrderedDict[str, FrameLayout] = OrderedDict()
+
         # Register initial filters
         self._register_basic_filters()
 
@@ -99,43 +174,56 @@ class WeatherRenderer:
         """
         _ = now  # Mark as intentionally unused
         time_format = self.config.display.time_format
+        utc_offset = weather_data.timezone_offset
 
         # Prepare all time data
-        current_times = self._prepare_current_times(weather_data.current, time_format)
-        daily_times = self._prepare_daily_times(weather_data.daily, time_format)
+        current_times = self._prepare_current_times(
+            weather_data.current, time_format, utc_offset
+        )
+        daily_times = self._prepare_daily_times(weather_data.daily, time_format, utc_offset)
         hourly_times = self._prepare_hourly_times(
-            weather_data.hourly, time_format, self.config.weather.hourly_forecast_count
+            weather_data.hourly,
+            time_format,
+            self.config.weather.hourly_forecast_count,
+            utc_offset,
         )
 
         return current_times, daily_times, hourly_times
 
-    def _prepare_current_times(self, current: object, time_format: str | None) -> dict[str, str]:
+    def _prepare_current_times(
+        self, current: object, time_format: str | None, utc_offset: int | None = None
+    ) -> dict[str, str]:
         """Prepare current weather time data.
         
         Args:
             current: Current weather data object
             time_format: Time format string
+            utc_offset: Location's offset from UTC in seconds
             
         Returns:
             Dictionary with sunrise and sunset times
         """
         return {
             "sunrise_local": self.time_formatter.format_timestamp_if_exists(
-                current, "sunrise", time_format
+                current, "sunrise", time_format, utc_offset
             ),
             "sunset_local": self.time_formatter.format_timestamp_if_exists(
-                current, "sunset", time_format
+                current, "sunset", time_format, utc_offset
             ),
         }
 
     def _prepare_daily_times(
-        self, daily_forecast: list[DailyWeather], time_format: str | None
+        self,
+        daily_forecast: list[DailyWeather],
+        time_format: str | None,
+        utc_offset: int | None = None,
     ) -> list[dict[str, str]]:
         """Prepare daily forecast time data.
         
         Args:
             daily_forecast: List of daily forecast objects
             time_format: Time format string
+            utc_offset: Location's offset from UTC in seconds
             
         Returns:
             List of dictionaries with daily time data
@@ -144,14 +232,14 @@ class WeatherRenderer:
         for day in daily_forecast:
             weekday_short = ""
             if hasattr(day, "dt") and day.dt:
-                weekday_short = self.time_formatter.get_weekday_short(day.dt)
+                weekday_short = self.time_formatter.get_weekday_short(day.dt, utc_offset)
             
             day_times: dict[str, str] = {
                 "sunrise_local": self.time_formatter.format_timestamp_if_exists(
-                    day, "sunrise", time_format
+                    day, "sunrise", time_format, utc_offset
                 ),
                 "sunset_local": self.time_formatter.format_timestamp_if_exists(
-                    day, "sunset", time_format
+                    day, "sunset", time_format, utc_offset
                 ),
                 "weekday_short": weekday_short,
             }
@@ -159,7 +247,11 @@ class WeatherRenderer:
         return daily_times
 
     def _prepare_hourly_times(
-        self, hourly_forecast: list[HourlyWeather], time_format: str | None, count: int
+        self,
+        hourly_forecast: list[HourlyWeather],
+        time_format: str | None,
+        count: int,
+        utc_offset: int | None = None,
     ) -> list[dict[str, str]]:
         """Prepare hourly forecast time data.
         
@@ -167,19 +259,17 @@ class WeatherRenderer:
             hourly_forecast: List of hourly forecast objects
             time_format: Time format string
             count: Number of hours to include
+            utc_offset: Location's offset from UTC in seconds
             
         Returns:
             List of dictionaries with hourly time data
         """
         hourly_times: list[dict[str, str]] = []
         for hour in hourly_forecast[:count]:
-            hour_dt = datetime.fromtimestamp(hour.dt)
-            hour_12 = hour_dt.hour if hour_dt.hour <= 12 else hour_dt.hour - 12
-            hourly_times.append({
-                "local_time": self.time_formatter.format_time(hour_dt, time_format),
-                "hour": str(hour_12),
-                "ampm": hour_dt.strftime("%p").lower(),
-            })
+            local_time, hour_12, ampm = self.time_formatter.get_hour_parts(
+                hour.dt, time_format, utc_offset
+            )
+            hourly_times.append({"local_time": local_time, "hour": hour_12, "ampm": ampm})
         return hourly_times
 
     def _prepare_units(self) -> dict[str, str | bool]:
@@ -235,7 +325,9 @@ class WeatherRenderer:
             if max_uvi > 0.0:
                 uvi_max = f"{max_uvi:.1f}"
                 uvi_time = self.time_formatter.format_time(
-                    datetime.fromtimestamp(max_uvi_timestamp), self.config.display.time_format
+                    max_uvi_timestamp,
+                    self.config.display.time_format,
+                    weather_data.timezone_offset,
                 )
 
         return uvi_max, uvi_time
@@ -271,7 +363,10 @@ class WeatherRenderer:
         # Current date and time
         now = datetime.now()
         date_str = now.strftime("%A, %B %d, %Y")
-        last_refresh = self.time_formatter.format_datetime_display(now)
+        # Show when the data was fetched rather than when it was rendered, so
+        # renders of the same data look the same
+        last_updated = weather_data.last_updated
+        last_refresh = self.time_formatter.format_datetime_display(last_updated)
         
         # Prepare time data
         current_times, daily_times, hourly_times = self._prepare_time_data(weather_data, now)
@@ -296,7 +391,7 @@ class WeatherRenderer:
             "config": self.config,
             # Date and time
             "date": date_str,
-            "last_updated": now,
+            "last_updated": last_updated,
             "last_refresh": last_refresh,
             # Units
             **units,
@@ -334,7 +429,7 @@ class WeatherRenderer:
         # Calculate total daylight hours for today
         daylight = self._calculate_daylight(weather_data)
         
-        # Find maximum UV index for today (cached to persist across API calls)
+        # Find maximum UV index for today (tracked to persist across API calls)
         uvi_max, uvi_time = self._calculate_max_uvi(weather_data, now)
         
         # Get air quality description from AQI value
@@ -388,12 +483,123 @@ class WeatherRenderer:
         # Delegate to the filter manager
         self.filter_manager.register_all_filters()
 
-    async def generate_html(self, weather_data: WeatherData, battery_status: BatteryStatus) -> str:
+    def _get_template_version(self) -> str:
+        """Get a hash of the template sources.
+
+        Returns:
+            Hex digest covering every template, or an empty string if the
+            templates can't be listed
+        """
+        if self._template_version is None:
+            digest = hashlib.sha256()
+            loader = self.jinja_env.loader
+            try:
+                if loader is not None:
+                    for name in loader.list_templates():
+                        source, _, _ = loader.get_source(self.jinja_env, name)
+                        digest.update(name.encode())
+                        digest.update(source.encode())
+                self._template_version = digest.hexdigest()
+            except Exception as e:
+                self.logger.warning(f"Could not read templates for fingerprinting: {e}")
+                self._template_version = ""
+        return self._template_version
+
+    def _collect_section_values(
+        self, weather_data: WeatherData, battery_status: BatteryStatus
+    ) -> tuple[dict[str, object], dict[str, list[str]]]:
+        """Build the template context and the values each section displays.
+
+        Args:
+            weather_data: Weather data to display.
+            battery_status: Battery status information.
+
+        Returns:
+            Tuple of (template context, displayed values keyed by section).
+        """
+        self._setup_jinja_filters()
+        with span("context"):
+            context = self._build_template_context(weather_data, battery_status)
+        filters = {**self.jinja_env.filters, **self.jinja_env.globals}
+        return context, collect_section_values(context, filters)
+
+    def _fingerprint(self, values: list[str]) -> str:
+        """Hash displayed values together with the render profile and templates.
+
+        Args:
+            values: Displayed values.
+
+        Returns:
+            Hex digest of the values as this renderer would display them.
+        """
+        return compute_fingerprint([
+            self.config.model_dump_json(include={"weather", "display"}),
+            self._get_template_version(),
+            *values,
+        ])
+
+    def _frame_fingerprint(self, section_values: dict[str, list[str]]) -> str:
+        """Fingerprint a full frame from the values of its sections.
+
+        Args:
+            section_values: Displayed values keyed by section.
+
+        Returns:
+            Hex digest of the frame's displayed content.
+        """
+        return self._fingerprint([value for values in section_values.values() for value in values])
+
+    def prepare_display(
+        self, weather_data: WeatherData, battery_status: BatteryStatus
+    ) -> PreparedDisplay:
+        """Build the template context and fingerprint what it would display.
+
+        Formats the strings and icon IDs the templates would display and
+        hashes them together with the render profile and template sources.
+        Renders with equal fingerprints produce the same image. Passing the
+        result to render_weather_image() renders it without building the
+        context again.
+
+        Args:
+            weather_data: Weather data to display.
+            battery_status: Battery status information.
+
+        Returns:
+            Template context, displayed values and fingerprint of the render.
+        """
+        context, section_values = self._collect_section_values(weather_data, battery_status)
+        return PreparedDisplay(context, section_values, self._frame_fingerprint(section_values))
+
+    def get_dirty_regions(self, previous_fingerprint: str, fingerprint: str) -> list[Rect] | None:
+        """Get the regions that differ between two recently rendered frames.
+
+        Only frames composited from section tiles have known layouts.
+
+        Args:
+            previous_fingerprint: Display fingerprint of the frame being replaced.
+            fingerprint: Display fingerprint of the new frame.
+
+        Returns:
+            Rectangles to refresh, or None if either frame's layout is unknown.
+        """
+        previous = self._frame_layouts.get(previous_fingerprint)
+        current = self._frame_layouts.get(fingerprint)
+        if previous is None or current is None:
+            return None
+        return diff_layouts(previous, current)
+
+    async def generate_html(
+        self,
+        weather_data: WeatherData,
+        battery_status: BatteryStatus,
+        context: dict[str, object] | None = None,
+    ) -> str:
         """Generate HTML for the weather display.
 
         Args:
             weather_data: Weather data to display.
             battery_status: Battery status information.
+            context: Template context already built for the data, if any.
 
         Returns:
             HTML content as a string.
@@ -403,11 +609,14 @@ class WeatherRenderer:
             self._setup_jinja_filters()
 
             # Build template context
-            context = self._build_template_context(weather_data, battery_status)
+            if context is None:
+                with span("context"):
+                    context = self._build_template_context(weather_data, battery_status)
 
             # Get and render template
             template = self.jinja_env.get_template("dashboard.html.j2")
-            return template.render(**context)
+            with template_render_seconds.time("dashboard.html.j2"), span("jinja"):
+                return template.render(**context)
 
         except jinja2.exceptions.TemplateError as e:
             error_location = get_error_location()
@@ -441,15 +650,21 @@ class WeatherRenderer:
         return self.icon_mapper.get_icon_for_code(icon_code)
 
     async def render_image(
-        self, html: str, width: int, height: int, output_path: Path | None = None
+        self,
+        html: str,
+        width: int,
+        height: int,
+        output_path: Path | None = None,
+        full_page: bool = False,
     ) -> bytes | Path:
         """Render HTML to an image.
 
         Args:
             html: HTML content to render.
             width: Width of the image.
-            height: Height of the image.
+            height: Height of the viewport.
             output_path: Path to save the image, or None to return bytes.
+            full_page: Whether to capture the whole page instead of the viewport.
 
         Returns:
             Path to the rendered image file, or bytes if output_path is None.
@@ -459,19 +674,25 @@ class WeatherRenderer:
             # Get a page instance from the browser pool (managed for performance)
             page = await browser_manager.get_page(width, height)
 
-            # Load the HTML content into the page
-            await page.set_content(html)
-
-            # Wait for all network resources to load (fonts, images, etc.)
-            await page.wait_for_load_state("networkidle")
-
-            # Capture screenshot - either to file or memory
-            if output_path:
-                await page.screenshot(path=str(output_path), type="png")
-                return output_path
-            # Return raw bytes for direct transmission
-            screenshot: bytes = await page.screenshot(type="png")
-            return screenshot
+            with screenshot_seconds.time():
+                # Load the HTML content into the page
+                with span("set-content"):
+                    await page.set_content(html)
+
+                # Wait for all network resources to load (fonts, images, etc.)
+                with span("load-wait"):
+                    await page.wait_for_load_state("networkidle")
+
+                # Capture screenshot - either to file or memory
+                with span("screenshot"):
+                    if output_path:
+                        await page.screenshot(
+                            path=str(output_path), type="png", full_page=full_page
+                        )
+                        return output_path
+                    # Return raw bytes for direct transmission
+                    screenshot: bytes = await page.screenshot(type="png", full_page=full_page)
+                    return screenshot
         except Exception as e:
             error_location = get_error_location()
             self.logger.error(f"Error rendering image [{error_location}]: {e}")
@@ -486,6 +707,7 @@ class WeatherRenderer:
         weather_data: WeatherData,
         battery_status: BatteryStatus,
         output_path: Path | None = None,
+        prepared: PreparedDisplay | None = None,
     ) -> bytes | Path:
         """Render weather data to an image.
 
@@ -493,16 +715,99 @@ class WeatherRenderer:
             weather_data: Weather data to display.
             battery_status: Battery status information.
             output_path: Path to save the image, or None to return bytes.
+            prepared: Result of prepare_display() for the same data, if any.
 
         Returns:
             Path to the rendered image file, or bytes if output_path is None.
         """
+        if self.config.display.tiled_rendering:
+            if prepared is None:
+                prepared = self.prepare_display(weather_data, battery_status)
+            return await self._render_tiled_image(prepared, output_path)
+
         # Generate HTML
-        html = await self.generate_html(weather_data, battery_status)
+        html = await self.generate_html(
+            weather_data, battery_status, prepared.context if prepared else None
+        )
 
         # Render to image
         return await self.render_image(
             html, self.config.display.width, self.config.display.height, output_path
         )
 
+    async def _render_tiled_image(
+        self, prepared: PreparedDisplay, output_path: Path | None = None
+    ) -> bytes | Path:
+        """Render weather data by compositing per-section image tiles.
+
+        Each section is fingerprinted on its own, and only sections without a
+        cached tile for their fingerprint are rendered. The frame's layout is
+        kept so later renders can report which regions changed.
 
+        Args:
+            prepared: Template context and displayed values of the render.
+            output_path: Path to save the image, or None to return bytes.
+
+        Returns:
+            Path to the rendered image file, or bytes if output_path is None.
+        """
+        tiles: list[tuple[str, str, bytes]] = []
+        for name, values in prepared.section_values.items():
+            fingerprint = self._fingerprint([name, *values])
+            key = f"{name}:{fingerprint}"
+            tile = self._tile_cache.get(key)
+            cache_requests_total.inc("tile", "miss" if tile is None else "hit")
+            if tile is None:
+                self.logger.debug(f"Rendering {name} section tile")
+                tile = await self._render_section_tile(name, prepared.context)
+                self._tile_cache.put(key, tile)
+            tiles.append((name, fingerprint, tile))
+
+        with span("composite"):
+            image, layout = composite_tiles(
+                tiles, self.config.display.width, self.config.display.height
+            )
+        self._frame_layouts[prepared.fingerprint] = layout
+        while len(self._frame_layouts) > FRAME_LAYOUT_HISTORY:
+            self._frame_layouts.popitem(last=False)
+
+        if output_path:
+            write_bytes(output_path, image)
+            return output_path
+        return image
+
+    async def _render_section_tile(self, name: str, context: dict[str, object]) -> bytes:
+        """Render one dashboard section into an image tile.
+
+        Args:
+            name: Section name, a key of SECTION_TEMPLATES.
+            context: Template context.
+
+        Returns:
+            PNG data of the section, as wide as the display and as tall as
+            its content.
+        """
+        try:
+            template = self.jinja_env.get_template(SECTION_TEMPLATE)
+            with template_render_seconds.time(SECTION_TEMPLATES[name]), span("jinja"):
+                html = template.render(**context, section_template=SECTION_TEMPLATES[name])
+        except jinja2.exceptions.TemplateError as e:
+            error_location = get_error_location()
+            self.logger.error(f"Template error in {name} section [{error_location}]: {e}")
+            raise
+
+        tile = await self.render_image(
+            html, self.config.display.width, TILE_VIEWPORT_HEIGHT, full_page=True
+        )
+        return cast(bytes, tile)
+
+    def get_metrics(self) -> RendererMetrics:
+        """Get renderer statistics.
+
+        The timestamp formatting cache is shared by all renderers, so its
+        counts cover every render since the server started.
+
+        Returns:
+            Dictionary with the time formatting cache hit rate.
+        """
+        return {"time_format_cache": get_format_cache_stats()}
@@ -0,0 +1,74 @@
+"""Compositing of dashboard section tiles into display frames.
+
+Each dashboard section is rendered on its own into an image tile as wide as
+the display. Tiles are stacked top to bottom in page order, which matches
+the page layout since the sections carry no vertical margins between them,
+and cropped to the display height.
+
+The rectangle each tile covers is recorded in a frame layout together with
+the tile's fingerprint. Comparing the layouts of two frames gives the exact
+regions that differ between them without comparing pixels.
+"""
+
+from collections.abc import Sequence
+from io import BytesIO
+
+from PIL import Image
+
+from rpi_weather_display.utils.dirty_regions import Rect
+
+FrameLayout = dict[str, tuple[str, Rect]]  # Section -> (tile fingerprint, rect in the frame)
+
+_BACKGROUND = "white"
+
+
+def composite_tiles(
+    tiles: Sequence[tuple[str, str, bytes]], width: int, height: int
+) -> tuple[bytes, FrameLayout]:
+    """Stack section tiles into a full display frame.
+
+    Args:
+        tiles: (section name, tile fingerprint, PNG data) in page order
+        width: Frame width in pixels
+        height: Frame height in pixels
+
+    Returns:
+        Tuple of (frame as PNG data, layout of the tiles in the frame)
+    """
+    layout: FrameLayout = {}
+    buffer = BytesIO()
+    with Image.new("RGB", (width, height), _BACKGROUND) as frame:
+        top = 0
+        for name, fingerprint, data in tiles:
+            with Image.open(BytesIO(data)) as tile:
+                frame.paste(tile, (0, top))
+                bottom = top + tile.height
+            layout[name] = (fingerprint, (0, min(top, height), width, min(bottom, height)))
+            top = bottom
+        frame.save(buffer, format="PNG")
+    return buffer.getvalue(), layout
+
+
+def diff_layouts(old: FrameLayout, new: FrameLayout) -> list[Rect]:
+    """Get the regions that differ between two frames.
+
+    A section is dirty when its tile changed or moved. Moved tiles dirty
+    both the area they left and the area they now cover.
+
+    Args:
+        old: Layout of the frame being replaced
+        new: Layout of the new frame
+
+    Returns:
+        Non-empty rectangles to refresh, ordered top to bottom
+    """
+    regions: set[Rect] = set()
+    for name, placement in new.items():
+        previous = old.get(name)
+        if previous == placement:
+            continue
+        regions.add(placement[1])
+        if previous is not None:
+            regions.add(previous[1])
+    regions.update(rect for name, (_, rect) in old.items() if name not in new)
+    return sorted(rect for rect in regions if rect[1] < rect[3])
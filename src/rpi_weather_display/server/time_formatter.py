@@ -2,135 +2,255 @@
 
 Provides consistent formatting of timestamps, dates, and times
 according to user configuration.
+
+Formatting Unix timestamps is memoized in a module-level LRU cache keyed by
+(timestamp, format, UTC offset). Forecast timestamps barely change between
+renders, so the cache is shared by every formatter and render instead of
+converting and formatting each hourly and daily entry again.
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
+from typing_extensions import TypedDict
+
+from rpi_weather_display.constants import TIME_FORMAT_CACHE_SIZE
+
 if TYPE_CHECKING:
     from rpi_weather_display.models.config import DisplayConfig
 
+# Formatting styles understood by _format; STRFTIME_STYLE applies the format
+# string as is, the others build the default layout when no format is given.
+STRFTIME_STYLE = "strftime"
+TIME_STYLE = "time"
+DISPLAY_STYLE = "display"
+HOUR_STYLE = "hour"
+AMPM_STYLE = "ampm"
+
+
+class TimeFormatCacheStats(TypedDict):
+    """Hit and miss counts for the shared timestamp formatting cache."""
+
+    hits: int
+    misses: int
+    hit_rate: float
+    entries: int
+    max_entries: int
+
+
+def _format(dt: datetime, style: str, format_str: str | None) -> str:
+    """Format a datetime in one of the supported styles.
+
+    Args:
+        dt: Datetime to format
+        style: Formatting style, such as TIME_STYLE
+        format_str: Format string, or None for the style's default layout
+
+    Returns:
+        Formatted string
+    """
+    if format_str is not None:
+        return dt.strftime(format_str)
+
+    # 12-hour clock shows 12 for noon/midnight
+    hour = dt.hour % 12 or 12
+    if style == TIME_STYLE:
+        # Default: 12-hour format without leading zeros
+        return f"{hour}:{dt.minute:02d} {dt.strftime('%p')}"
+    if style == DISPLAY_STYLE:
+        # Default: MM/DD/YYYY HH:MM AM/PM without leading zeros
+        return f"{dt.month}/{dt.day}/{dt.year} {hour}:{dt.minute:02d} {dt.strftime('%p')}"
+    if style == HOUR_STYLE:
+        return str(dt.hour if dt.hour <= 12 else dt.hour - 12)
+    if style == AMPM_STYLE:
+        return dt.strftime("%p").lower()
+    raise ValueError(f"No default format for style: {style}")
+
+
+@lru_cache(maxsize=TIME_FORMAT_CACHE_SIZE)
+def format_timestamp(
+    timestamp: int,
+    format_str: str | None,
+    utc_offset: int | None = None,
+    style: str = STRFTIME_STYLE,
+) -> str:
+    """Format a Unix timestamp, memoizing the result.
+
+    Args:
+        timestamp: Unix timestamp
+        format_str: Format string, or None for the style's default layout
+        utc_offset: Offset from UTC in seconds of the location being shown,
+            such as the API's timezone_offset, or None for server local time
+        style: Formatting style used when format_str is None
+
+    Returns:
+        Formatted string
+    """
+    tz = None if utc_offset is None else timezone(timedelta(seconds=utc_offset))
+    return _format(datetime.fromtimestamp(timestamp, tz), style, format_str)
+
+
+def get_format_cache_stats() -> TimeFormatCacheStats:
+    """Get hit and miss counts for the shared timestamp formatting cache.
+
+    Returns:
+        Dictionary with cache hits, misses, hit rate and entry counts
+    """
+    info = format_timestamp.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "hit_rate": info.hits / lookups if lookups else 0.0,
+        "entries": info.currsize,
+        "max_entries": info.maxsize or 0,
+    }
+
 
 class TimeFormatter:
     """Formats times and dates for display.
-    
+
     This class centralizes all time and date formatting logic,
-    supporting various formats based on user configuration.
+    supporting various formats based on user configuration. Unix timestamps
+    are converted to the location's time when a UTC offset is given and to
+    server local time otherwise.
     """
-    
+
     def __init__(self, display_config: "DisplayConfig") -> None:
         """Initialize the time formatter.
-        
+
         Args:
             display_config: Display configuration with format settings
         """
         self.display_config = display_config
-        
-    def format_datetime(self, dt: datetime | int, format_str: str | None = None) -> str:
+
+    def _configured_format(self, attr: str) -> str | None:
+        """Get an optional format string from the display configuration.
+
+        Args:
+            attr: Name of the format setting
+
+        Returns:
+            The format string, or None if it isn't set
+        """
+        return getattr(self.display_config, attr, None) or None
+
+    def format_datetime(
+        self, dt: datetime | int, format_str: str | None = None, utc_offset: int | None = None
+    ) -> str:
         """Format a datetime object or Unix timestamp.
-        
+
         Args:
             dt: Datetime object or Unix timestamp
             format_str: Format string (uses config default if None)
-            
+            utc_offset: Location's offset from UTC in seconds for timestamps
+
         Returns:
             Formatted datetime string
         """
-        if isinstance(dt, int):
-            dt = datetime.fromtimestamp(dt)
-            
         if format_str is None:
             format_str = self.display_config.timestamp_format
-            
+
+        if isinstance(dt, int):
+            return format_timestamp(dt, format_str, utc_offset)
         return dt.strftime(format_str)
-    
-    def format_time(self, dt: datetime | int, format_str: str | None = None) -> str:
+
+    def format_time(
+        self, dt: datetime | int, format_str: str | None = None, utc_offset: int | None = None
+    ) -> str:
         """Format a time for display.
-        
+
         Uses AM/PM format without leading zeros by default,
         or the specified format from config.
-        
+
         Args:
             dt: Datetime object or Unix timestamp
             format_str: Format string (uses config default if None)
-            
+            utc_offset: Location's offset from UTC in seconds for timestamps
+
         Returns:
             Formatted time string
         """
-        if isinstance(dt, int):
-            dt = datetime.fromtimestamp(dt)
-            
         if format_str is None:
-            # Check for time_format in config
-            if hasattr(self.display_config, "time_format") and self.display_config.time_format:
-                return dt.strftime(self.display_config.time_format)
-            # Default: 12-hour format without leading zeros
-            hour = dt.hour % 12
-            if hour == 0:
-                hour = 12  # 12-hour clock shows 12 for noon/midnight
-            return f"{hour}:{dt.minute:02d} {dt.strftime('%p')}"
-        return dt.strftime(format_str)
-    
-    def format_datetime_display(self, dt: datetime | int, format_str: str | None = None) -> str:
+            format_str = self._configured_format("time_format")
+
+        if isinstance(dt, int):
+            return format_timestamp(dt, format_str, utc_offset, TIME_STYLE)
+        return _format(dt, TIME_STYLE, format_str)
+
+    def format_datetime_display(
+        self, dt: datetime | int, format_str: str | None = None, utc_offset: int | None = None
+    ) -> str:
         """Format a datetime for prominent display.
-        
+
         Args:
             dt: Datetime object or Unix timestamp
             format_str: Optional format string to override config
-            
+            utc_offset: Location's offset from UTC in seconds for timestamps
+
         Returns:
             Formatted datetime string
         """
-        if isinstance(dt, int):
-            dt = datetime.fromtimestamp(dt)
-            
         # Use provided format, config format, or default
-        if format_str is not None:
-            return dt.strftime(format_str)
-            
-        if (hasattr(self.display_config, "display_datetime_format") 
-            and self.display_config.display_datetime_format):
-            return dt.strftime(self.display_config.display_datetime_format)
-            
-        # Default: MM/DD/YYYY HH:MM AM/PM without leading zeros
-        month = dt.month
-        day = dt.day
-        year = dt.year
-        hour = dt.hour % 12
-        if hour == 0:
-            hour = 12
-        minute = dt.minute
-        am_pm = dt.strftime("%p")
-        
-        return f"{month}/{day}/{year} {hour}:{minute:02d} {am_pm}"
-    
+        if format_str is None:
+            format_str = self._configured_format("display_datetime_format")
+
+        if isinstance(dt, int):
+            return format_timestamp(dt, format_str, utc_offset, DISPLAY_STYLE)
+        return _format(dt, DISPLAY_STYLE, format_str)
+
     def format_timestamp_if_exists(
-        self, obj: object, attr: str, time_format: str | None = None
+        self,
+        obj: object,
+        attr: str,
+        time_format: str | None = None,
+        utc_offset: int | None = None,
     ) -> str:
         """Format a timestamp attribute if it exists on an object.
-        
+
         Args:
             obj: Object that may have the timestamp attribute
             attr: Name of the timestamp attribute
             time_format: Optional time format string
-            
+            utc_offset: Location's offset from UTC in seconds
+
         Returns:
             Formatted time string or empty string if attribute doesn't exist
         """
         if hasattr(obj, attr):
             timestamp = getattr(obj, attr)
             if timestamp:
-                return self.format_time(timestamp, time_format)
+                return self.format_time(timestamp, time_format, utc_offset)
         return ""
-    
-    def get_weekday_short(self, timestamp: int) -> str:
+
+    def get_weekday_short(self, timestamp: int, utc_offset: int | None = None) -> str:
         """Get short weekday name from timestamp.
-        
+
         Args:
             timestamp: Unix timestamp
-            
+            utc_offset: Location's offset from UTC in seconds
+
         Returns:
             Short weekday name (e.g., "Mon", "Tue")
         """
-        dt = datetime.fromtimestamp(timestamp)
-        return dt.strftime("%a")
\ No newline at end of file
+        return format_timestamp(timestamp, "%a", utc_offset)
+
+    def get_hour_parts(
+        self, timestamp: int, time_format: str | None = None, utc_offset: int | None = None
+    ) -> tuple[str, str, str]:
+        """Get the labels shown for an hourly forecast entry.
+
+        Args:
+            timestamp: Unix timestamp of the hour
+            time_format: Optional time format string
+            utc_offset: Location's offset from UTC in seconds
+
+        Returns:
+            Tuple of (formatted time, hour on a 12-hour clock, lowercase am/pm)
+        """
+        return (
+            self.format_time(timestamp, time_format, utc_offset),
+            format_timestamp(timestamp, None, utc_offset, HOUR_STYLE),
+            format_timestamp(timestamp, None, utc_offset, AMPM_STYLE),
+        )
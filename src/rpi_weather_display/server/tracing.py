@@ -0,0 +1,141 @@
+"""Per-request stage tracing for the server.
+
+A trace is started for a request and made current in a context variable,
+so code anywhere below the request handler can time its stages with span()
+without a trace being passed to it. Spans outside a trace, such as when
+tracing is disabled, cost a context variable lookup and record nothing.
+
+A finished trace is reported in a Server-Timing header, which browser
+developer tools and curl show alongside the response, and as a log record
+carrying the trace's operation ID.
+"""
+
+import time
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TypedDict
+
+_MILLISECONDS_PER_SECOND = 1000
+
+
+class TraceRecord(TypedDict):
+    """Log record fields of a finished trace."""
+
+    operation: str
+    operation_id: str
+    total_ms: float
+    spans: dict[str, float]
+
+
+class RequestTrace:
+    """Stage durations of one request."""
+
+    def __init__(self, operation: str) -> None:
+        """Start a trace.
+
+        Args:
+            operation: Name of the traced operation, such as "render"
+        """
+        self.operation = operation
+        self.operation_id = uuid.uuid4().hex
+        self.spans: dict[str, float] = {}
+        self._start = time.perf_counter()
+
+    def record(self, name: str, seconds: float) -> None:
+        """Add the duration of a stage.
+
+        Stages run more than once, such as one template render per dashboard
+        section, are reported as their total duration.
+
+        Args:
+            name: Stage name
+            seconds: Duration of the stage
+        """
+        self.spans[name] = self.spans.get(name, 0.0) + seconds
+
+    @property
+    def elapsed(self) -> float:
+        """Get the seconds since the trace started."""
+        return time.perf_counter() - self._start
+
+    def server_timing(self) -> str:
+        """Format the stage durations as a Server-Timing header value.
+
+        Returns:
+            Header value such as "fetch-onecall;dur=212.4, total;dur=1530.2"
+        """
+        entries = [
+            f"{name};dur={seconds * _MILLISECONDS_PER_SECOND:.1f}"
+            for name, seconds in self.spans.items()
+        ]
+        entries.append(f"total;dur={self.elapsed * _MILLISECONDS_PER_SECOND:.1f}")
+        return ", ".join(entries)
+
+    def to_record(self) -> TraceRecord:
+        """Get the trace as structured log record fields.
+
+        Returns:
+            Operation, operation ID and durations in milliseconds
+        """
+        return {
+            "operation": self.operation,
+            "operation_id": self.operation_id,
+            "total_ms": round(self.elapsed * _MILLISECONDS_PER_SECOND, 1),
+            "spans": {
+                name: round(seconds * _MILLISECONDS_PER_SECOND, 1)
+                for name, seconds in self.spans.items()
+            },
+        }
+
+
+_current_trace: ContextVar[RequestTrace | None] = ContextVar("current_trace", default=None)
+
+
+@contextmanager
+def start_trace(operation: str) -> Iterator[RequestTrace]:
+    """Trace the stages of the block.
+
+    Args:
+        operation: Name of the traced operation
+
+    Yields:
+        The trace, current until the block exits
+    """
+    trace = RequestTrace(operation)
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _current_trace.reset(token)
+
+
+def current_trace() -> RequestTrace | None:
+    """Get the trace of the request being handled.
+
+    Returns:
+        The current trace, or None outside a traced request
+    """
+    return _current_trace.get()
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """Time the block as a stage of the current trace.
+
+    Args:
+        name: Stage name, a Server-Timing metric name such as "jinja"
+
+    Yields:
+        None
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace.record(name, time.perf_counter() - start)
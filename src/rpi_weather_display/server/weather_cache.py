@@ -0,0 +1,107 @@
+"""Shared weather data cache with upstream fetch deduplication.
+
+Provides a cache index that can be shared by several weather API clients so
+that devices resolving to the same cache key share one upstream fetch per
+update interval, including requests that arrive while a fetch is in flight.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+
+from typing_extensions import TypedDict
+
+from rpi_weather_display.constants import WEATHER_API_CACHE_SIZE_MB
+from rpi_weather_display.models.weather import WeatherData
+from rpi_weather_display.utils.cache_manager import MemoryAwareCache
+
+
+class WeatherCacheStats(TypedDict):
+    """Statistics for weather data requests and upstream fetches."""
+
+    requests: int
+    upstream_fetches: int
+    dedupe_ratio: float
+    cached_entries: int
+    cache_size_mb: float
+
+
+class WeatherCacheIndex:
+    """Weather data cache shared across locations and API clients.
+
+    Combines a memory-aware cache of weather data with a table of in-flight
+    upstream fetches, so concurrent requests for the same key wait on a single
+    fetch instead of each calling the API.
+
+    Attributes:
+        cache: Memory-aware cache of weather data keyed by location
+        requests: Number of weather data requests served
+        upstream_fetches: Number of fetches actually sent upstream
+        logger: Logger instance
+    """
+
+    def __init__(
+        self, ttl_seconds: int, max_size_mb: float = WEATHER_API_CACHE_SIZE_MB
+    ) -> None:
+        """Initialize the cache index.
+
+        Args:
+            ttl_seconds: Time-to-live for cached weather data in seconds.
+            max_size_mb: Maximum cache size in megabytes.
+        """
+        self.cache = MemoryAwareCache[WeatherData](
+            max_size_mb=max_size_mb, ttl_seconds=ttl_seconds
+        )
+        self.requests = 0
+        self.upstream_fetches = 0
+        self._in_flight: dict[str, asyncio.Task[WeatherData]] = {}
+        self.logger = logging.getLogger(__name__)
+
+    def record_request(self) -> None:
+        """Record that a weather data request was received."""
+        self.requests += 1
+
+    async def fetch_once(
+        self, key: str, fetcher: Callable[[], Awaitable[WeatherData]]
+    ) -> WeatherData:
+        """Fetch weather data, joining any fetch already in flight for the key.
+
+        Args:
+            key: Cache key identifying the location.
+            fetcher: Coroutine function performing the upstream fetch.
+
+        Returns:
+            Weather data from the shared fetch.
+        """
+        task = self._in_flight.get(key)
+        if task is None:
+            self.upstream_fetches += 1
+            task = asyncio.ensure_future(fetcher())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        else:
+            self.logger.debug(f"Joining in-flight weather fetch for {key}")
+
+        # Shield so one cancelled caller does not cancel the fetch for the others
+        return await asyncio.shield(task)
+
+    @property
+    def dedupe_ratio(self) -> float:
+        """Get the fraction of requests served without their own upstream fetch."""
+        if self.requests == 0:
+            return 0.0
+        return max(0.0, 1 - self.upstream_fetches / self.requests)
+
+    def get_stats(self) -> WeatherCacheStats:
+        """Get request, fetch and cache statistics.
+
+        Returns:
+            Dictionary of cache statistics.
+        """
+        return {
+            "requests": self.requests,
+            "upstream_fetches": self.upstream_fetches,
+            "dedupe_ratio": round(self.dedupe_ratio, 4),
+            "cached_entries": self.cache.item_count,
+            "cache_size_mb": round(self.cache.size_mb, 3),
+        }
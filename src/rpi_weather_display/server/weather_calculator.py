@@ -5,8 +5,7 @@ and other weather metrics.
 """
 
 import logging
-from datetime import date, datetime, timedelta
-from pathlib import Path
+from datetime import datetime, timedelta
 from typing import TYPE_CHECKING
 
 from rpi_weather_display.constants import (
@@ -14,15 +13,17 @@ from rpi_weather_display.constants import (
     HPA_TO_MMHG,
     SECONDS_PER_HOUR,
     SECONDS_PER_MINUTE,
-    UVI_CACHE_FILENAME,
 )
-from rpi_weather_display.utils import file_utils, path_resolver
+from rpi_weather_display.server.daily_extremes import DailyExtremesTracker
 
 if TYPE_CHECKING:
     from rpi_weather_display.models.weather import WeatherData
 
 logger = logging.getLogger(__name__)
 
+# Metric name used in the daily extremes tracker
+UVI_METRIC = "uvi"
+
 
 class WeatherCalculator:
     """Performs weather-related calculations.
@@ -31,7 +32,27 @@ class WeatherCalculator:
     - Daylight duration
     - UV index tracking
     - Pressure unit conversions
+    - Daily extremes tracking
+
+    Attributes:
+        daily_extremes: Tracker holding today's extremes in memory
+        location: Key identifying the location in the daily extremes tracker
     """
+
+    def __init__(
+        self, daily_extremes: DailyExtremesTracker | None = None, location: str = ""
+    ) -> None:
+        """Initialize the calculator.
+
+        Args:
+            daily_extremes: Tracker for daily extremes, shared between calculators.
+                Defaults to an unpersisted tracker of its own.
+            location: Key identifying the location the weather data is for.
+        """
+        self.daily_extremes = (
+            daily_extremes if daily_extremes is not None else DailyExtremesTracker()
+        )
+        self.location = location
     
     def calculate_daylight_hours(self, sunrise: int, sunset: int) -> str:
         """Calculate daylight duration from sunrise and sunset timestamps.
@@ -69,10 +90,11 @@ class WeatherCalculator:
         return pressure_hpa
     
     def get_daily_max_uvi(self, weather_data: "WeatherData", now: datetime) -> tuple[float, int]:
-        """Calculate the max UVI for today with caching.
+        """Calculate the max UVI for today.
         
         Finds the maximum UV index value from hourly forecasts for the current day
-        and persists it in a cache file to maintain the max value between API calls.
+        and keeps it in the daily extremes tracker, so the max is maintained
+        between API calls without reading or writing files on each render.
         
         Args:
             weather_data: Weather data containing current and hourly forecasts
@@ -81,25 +103,18 @@ class WeatherCalculator:
         Returns:
             Tuple of (max_uvi, max_uvi_timestamp)
         """
-        cache_file = path_resolver.get_cache_file(UVI_CACHE_FILENAME)
-        today = now.date()
-        
-        # Calculate current max from API data
         max_uvi, max_uvi_timestamp = self._calculate_current_max_uvi(weather_data, now)
-        
-        # Check cache for higher value
-        cached_uvi, cached_timestamp = self._read_uvi_cache(cache_file, today)
-        
-        # Use cached value if higher
-        if cached_uvi is not None and cached_uvi > max_uvi:
-            return cached_uvi, cached_timestamp or 0
-        
-        # Save new max value
-        if max_uvi > 0:
-            self._write_uvi_cache(cache_file, today, max_uvi, max_uvi_timestamp)
-        
-        return max_uvi, max_uvi_timestamp
-    
+
+        # Nothing to track until the UV index rises above zero
+        today = now.date()
+        if max_uvi <= 0:
+            tracked = self.daily_extremes.get_max(self.location, UVI_METRIC, today)
+            return tracked or (max_uvi, max_uvi_timestamp)
+
+        return self.daily_extremes.update_max(
+            self.location, UVI_METRIC, today, max_uvi, max_uvi_timestamp
+        )
+
     def _calculate_current_max_uvi(
         self, weather_data: "WeatherData", now: datetime
     ) -> tuple[float, int]:
@@ -129,7 +144,14 @@ class WeatherCalculator:
         today_start = int(today_start_dt.timestamp())
         today_end = int(today_end_dt.timestamp())
         
-        # Check hourly forecast for today's max UVI
+        # Check hourly forecast for today's max UVI, vectorized when possible
+        columns = weather_data.columns
+        if columns is not None:
+            hourly_max = columns.hourly_max_between(columns.hourly_uvi, today_start, today_end)
+            if hourly_max is not None and hourly_max[0] > max_uvi:
+                max_uvi, max_uvi_timestamp = hourly_max
+            return max_uvi, max_uvi_timestamp
+
         for hour in weather_data.hourly:
             if (today_start <= hour.dt <= today_end 
                 and hasattr(hour, "uvi") 
@@ -138,65 +160,3 @@ class WeatherCalculator:
                 max_uvi_timestamp = hour.dt
                 
         return max_uvi, max_uvi_timestamp
-    
-    def _read_uvi_cache(self, cache_file: Path, today: date) -> tuple[float | None, int | None]:
-        """Read UVI cache file and return values if valid for today.
-        
-        Args:
-            cache_file: Path to the cache file
-            today: Today's date for validation
-            
-        Returns:
-            Tuple of (cached_uvi, cached_timestamp) or (None, None) if invalid
-        """
-        if not file_utils.file_exists(cache_file):
-            return None, None
-            
-        try:
-            cache_data = file_utils.read_json(cache_file)
-            
-            # Validate cache structure
-            if not isinstance(cache_data, dict):
-                return None, None
-                
-            # Check date
-            date_str = cache_data.get("date")
-            if not isinstance(date_str, str):
-                return None, None
-                
-            cache_date = datetime.fromisoformat(date_str).date()
-            if cache_date != today:
-                return None, None
-                
-            # Extract and validate values
-            max_uvi_value = cache_data.get("max_uvi")
-            timestamp_value = cache_data.get("timestamp")
-            
-            if isinstance(max_uvi_value, int | float) and isinstance(timestamp_value, int):
-                return float(max_uvi_value), timestamp_value
-                
-        except Exception as e:
-            logger.debug(f"Error reading UVI cache: {e}")
-            
-        return None, None
-    
-    def _write_uvi_cache(
-        self, cache_file: Path, today: date, max_uvi: float, timestamp: int
-    ) -> None:
-        """Write UVI values to cache file.
-        
-        Args:
-            cache_file: Path to the cache file
-            today: Today's date
-            max_uvi: Maximum UVI value to cache
-            timestamp: Timestamp of the maximum UVI
-        """
-        try:
-            cache_data = {
-                "date": today.isoformat(),
-                "max_uvi": max_uvi,
-                "timestamp": timestamp,
-            }
-            file_utils.write_json(cache_file, cache_data)  # type: ignore[arg-type]
-        except Exception as e:
-            logger.warning(f"Failed to cache max UVI: {e}")
\ No newline at end of file
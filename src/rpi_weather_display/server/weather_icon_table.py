@@ -0,0 +1,130 @@
+"""Weather icon lookup table generated from owm_icon_map.csv.
+
+Generated by deploy/scripts/build_icon_map.py - do not edit by hand.
+"""
+
+from collections.abc import Mapping
+from types import MappingProxyType
+
+# (OpenWeatherMap condition ID, icon code) -> Weather Icons class
+ICONS_BY_CONDITION: Mapping[tuple[int, str], str] = MappingProxyType({
+    (200, "11d"): "wi-thunderstorm",
+    (201, "11d"): "wi-thunderstorm",
+    (202, "11d"): "wi-thunderstorm",
+    (210, "11d"): "wi-lightning",
+    (211, "11d"): "wi-lightning",
+    (212, "11d"): "wi-lightning",
+    (221, "11d"): "wi-lightning",
+    (230, "11d"): "wi-thunderstorm",
+    (231, "11d"): "wi-thunderstorm",
+    (232, "11d"): "wi-thunderstorm",
+    (300, "09d"): "wi-sprinkle",
+    (301, "09d"): "wi-sprinkle",
+    (302, "09d"): "wi-rain",
+    (310, "09d"): "wi-rain-mix",
+    (311, "09d"): "wi-rain",
+    (312, "09d"): "wi-rain",
+    (313, "09d"): "wi-showers",
+    (314, "09d"): "wi-rain",
+    (321, "09d"): "wi-sprinkle",
+    (500, "10d"): "wi-sprinkle",
+    (501, "10d"): "wi-rain",
+    (502, "10d"): "wi-rain",
+    (503, "10d"): "wi-rain",
+    (504, "10d"): "wi-rain",
+    (511, "13d"): "wi-rain-mix",
+    (520, "09d"): "wi-showers",
+    (521, "09d"): "wi-showers",
+    (522, "09d"): "wi-showers",
+    (531, "09d"): "wi-storm-showers",
+    (600, "13d"): "wi-snow",
+    (601, "13d"): "wi-snow",
+    (602, "13d"): "wi-sleet",
+    (611, "13d"): "wi-rain-mix",
+    (612, "13d"): "wi-rain-mix",
+    (613, "13d"): "wi-sleet",
+    (615, "13d"): "wi-rain-mix",
+    (616, "13d"): "wi-rain-mix",
+    (620, "13d"): "wi-rain-mix",
+    (621, "13d"): "wi-snow",
+    (622, "13d"): "wi-snow",
+    (701, "50d"): "wi-fog",
+    (711, "50d"): "wi-smoke",
+    (721, "50d"): "wi-day-haze",
+    (731, "50d"): "wi-dust",
+    (741, "50d"): "wi-fog",
+    (751, "50d"): "wi-sandstorm",
+    (761, "50d"): "wi-dust",
+    (762, "50d"): "wi-dust",
+    (771, "50d"): "wi-cloudy-gusts",
+    (781, "50d"): "wi-tornado",
+    (800, "01d"): "wi-day-sunny",
+    (800, "01n"): "wi-day-sunny",
+    (801, "02d"): "wi-cloud",
+    (801, "02n"): "wi-cloud",
+    (802, "03d"): "wi-cloud",
+    (802, "03n"): "wi-cloud",
+    (803, "04d"): "wi-cloudy",
+    (803, "04n"): "wi-cloudy",
+    (804, "04d"): "wi-cloudy",
+    (804, "04n"): "wi-cloudy",
+})
+
+# OpenWeatherMap condition ID -> Weather Icons class, for unlisted icon codes
+ICONS_BY_ID: Mapping[int, str] = MappingProxyType({
+    200: "wi-thunderstorm",
+    201: "wi-thunderstorm",
+    202: "wi-thunderstorm",
+    210: "wi-lightning",
+    211: "wi-lightning",
+    212: "wi-lightning",
+    221: "wi-lightning",
+    230: "wi-thunderstorm",
+    231: "wi-thunderstorm",
+    232: "wi-thunderstorm",
+    300: "wi-sprinkle",
+    301: "wi-sprinkle",
+    302: "wi-rain",
+    310: "wi-rain-mix",
+    311: "wi-rain",
+    312: "wi-rain",
+    313: "wi-showers",
+    314: "wi-rain",
+    321: "wi-sprinkle",
+    500: "wi-sprinkle",
+    501: "wi-rain",
+    502: "wi-rain",
+    503: "wi-rain",
+    504: "wi-rain",
+    511: "wi-rain-mix",
+    520: "wi-showers",
+    521: "wi-showers",
+    522: "wi-showers",
+    531: "wi-storm-showers",
+    600: "wi-snow",
+    601: "wi-snow",
+    602: "wi-sleet",
+    611: "wi-rain-mix",
+    612: "wi-rain-mix",
+    613: "wi-sleet",
+    615: "wi-rain-mix",
+    616: "wi-rain-mix",
+    620: "wi-rain-mix",
+    621: "wi-snow",
+    622: "wi-snow",
+    701: "wi-fog",
+    711: "wi-smoke",
+    721: "wi-day-haze",
+    731: "wi-dust",
+    741: "wi-fog",
+    751: "wi-sandstorm",
+    761: "wi-dust",
+    762: "wi-dust",
+    771: "wi-cloudy-gusts",
+    781: "wi-tornado",
+    800: "wi-day-sunny",
+    801: "wi-cloud",
+    802: "wi-cloud",
+    803: "wi-cloudy",
+    804: "wi-cloudy",
+})
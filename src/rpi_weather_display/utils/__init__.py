@@ -1,21 +1,73 @@
-"""Module initialization."""
-
-from rpi_weather_display.utils.battery_utils import (
-    calculate_drain_rate,
-    estimate_remaining_time,
-    get_battery_icon,
-    get_battery_text_description,
-    is_battery_critical,
-    is_battery_low,
-    is_charging,
-    is_discharge_rate_abnormal,
-    should_conserve_power,
-    should_double_intervals,
-)
-from rpi_weather_display.utils.path_utils import PathResolver, path_resolver
-from rpi_weather_display.utils.power_manager import PowerStateManager
-from rpi_weather_display.utils.power_state_controller import PowerState, PowerStateCallback
-from rpi_weather_display.utils.time_utils import is_quiet_hours
+"""Module initialization.
+
+Exports are imported on first use, so importing a lightweight submodule such
+as pijuice_adapter doesn't import the power manager and pydantic models too.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rpi_weather_display.utils.battery_utils import (
+        calculate_drain_rate,
+        estimate_remaining_time,
+        get_battery_icon,
+        get_battery_text_description,
+        is_battery_critical,
+        is_battery_low,
+        is_charging,
+        is_discharge_rate_abnormal,
+        should_conserve_power,
+        should_double_intervals,
+    )
+    from rpi_weather_display.utils.path_utils import PathResolver, path_resolver
+    from rpi_weather_display.utils.power_manager import PowerStateManager
+    from rpi_weather_display.utils.power_state_controller import (
+        PowerState,
+        PowerStateCallback,
+    )
+    from rpi_weather_display.utils.time_utils import is_quiet_hours
+
+# Submodule defining each export
+_EXPORT_MODULES = {
+    "is_quiet_hours": "time_utils",
+    "is_battery_critical": "battery_utils",
+    "is_battery_low": "battery_utils",
+    "is_charging": "battery_utils",
+    "should_conserve_power": "battery_utils",
+    "should_double_intervals": "battery_utils",
+    "get_battery_icon": "battery_utils",
+    "get_battery_text_description": "battery_utils",
+    "estimate_remaining_time": "battery_utils",
+    "calculate_drain_rate": "battery_utils",
+    "is_discharge_rate_abnormal": "battery_utils",
+    "PowerState": "power_state_controller",
+    "PowerStateCallback": "power_state_controller",
+    "PowerStateManager": "power_manager",
+    "PathResolver": "path_utils",
+    "path_resolver": "path_utils",
+}
+
+
+def __getattr__(name: str) -> object:
+    """Import an export from its submodule on first use.
+
+    Args:
+        name: Name of the export
+
+    Returns:
+        The exported object
+
+    Raises:
+        AttributeError: If the name isn't exported
+    """
+    module = _EXPORT_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     # Time utilities
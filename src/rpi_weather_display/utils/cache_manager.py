@@ -5,8 +5,11 @@ memory usage, especially important for resource-constrained environments.
 """
 
 import logging
+import sys
 import time
 from collections import OrderedDict
+from collections.abc import Callable
+from functools import cache
 from pathlib import Path
 from typing import Generic, TypeVar
 
@@ -22,16 +25,96 @@ from rpi_weather_display.utils.error_utils import get_error_location
 
 T = TypeVar("T")
 
+# Types whose instances hold no references to other objects
+_ATOMIC_TYPES = frozenset({str, bytes, int, float, complex, bool, type(None)})
+_SEQUENCE_TYPES = frozenset({list, tuple, set, frozenset})
+# Range of integers CPython preallocates and shares process-wide
+_SMALL_INT_RANGE = range(-5, 257)
+
+
+@cache
+def _slot_names(cls: type) -> tuple[str, ...]:
+    """Get the instance slot names declared by a class and its bases.
+
+    Args:
+        cls: Class to inspect
+
+    Returns:
+        Slot names, excluding the __dict__ and __weakref__ slots
+    """
+    names: list[str] = []
+    for klass in cls.__mro__:
+        slots = klass.__dict__.get("__slots__", ())
+        names.extend([slots] if isinstance(slots, str) else slots)
+    return tuple(name for name in names if name not in ("__dict__", "__weakref__"))
+
+
+def deep_sizeof(obj: object) -> int:
+    """Estimate the memory used by an object and everything it references.
+
+    Walks containers, instance dictionaries and slots (which covers Pydantic
+    models), summing sys.getsizeof for each object. Objects reachable through
+    several references, such as repeated strings, are counted once. Objects
+    shared process-wide rather than owned by the measured object are skipped:
+    classes, singletons, small integers and attribute names.
+
+    Args:
+        obj: Object to measure
+
+    Returns:
+        Approximate size in bytes
+    """
+    seen: set[int] = set()
+    total = 0
+    stack = [obj]
+
+    while stack:
+        current = stack.pop()
+        current_type = type(current)
+        if (
+            id(current) in seen
+            or current is None
+            or current_type is bool
+            or (current_type is int and current in _SMALL_INT_RANGE)
+            or isinstance(current, type)
+        ):
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+
+        if current_type in _ATOMIC_TYPES:
+            continue
+        if current_type is dict:
+            stack.extend(current.keys())  # type: ignore[attr-defined]
+            stack.extend(current.values())  # type: ignore[attr-defined]
+        elif current_type in _SEQUENCE_TYPES:
+            stack.extend(current)  # type: ignore[call-overload]
+        else:
+            # Instance dictionary keys are attribute names shared with the class
+            instance_dict = getattr(current, "__dict__", None)
+            if instance_dict is not None:
+                seen.add(id(instance_dict))
+                total += sys.getsizeof(instance_dict)
+                stack.extend(instance_dict.values())
+            for name in _slot_names(current_type):
+                value = getattr(current, name, None)
+                if value is not None:
+                    stack.append(value)
+
+    return total
+
 
 class MemoryAwareCache(Generic[T]):
     """LRU cache with memory size limits.
 
     Implements a Least Recently Used (LRU) cache that tracks the memory
     size of cached items and evicts old items when size limits are exceeded.
+    Item sizes are given by the caller or measured with a pluggable sizer.
 
     Attributes:
         max_size_bytes: Maximum cache size in bytes
         ttl_seconds: Time-to-live for cache entries in seconds
+        sizer: Function measuring the size of items put without an explicit size
         _cache: OrderedDict storing cache entries
         _sizes: Dictionary tracking size of each entry
         _timestamps: Dictionary tracking insertion time of each entry
@@ -43,26 +126,35 @@ class MemoryAwareCache(Generic[T]):
         self,
         max_size_mb: float = DEFAULT_MEMORY_CACHE_SIZE_MB,
         ttl_seconds: int = DEFAULT_CACHE_TTL_SECONDS,
+        sizer: Callable[[T], int] = deep_sizeof,
     ) -> None:
         """Initialize the cache.
 
         Args:
             max_size_mb: Maximum cache size in megabytes
             ttl_seconds: Time-to-live for cache entries in seconds
+            sizer: Function measuring item sizes in bytes. Defaults to a deep
+                sys.getsizeof walk of the item.
         """
         self.max_size_bytes = int(max_size_mb * BYTES_PER_MEGABYTE)
         self.ttl_seconds = ttl_seconds
+        self.sizer = sizer
         self._cache: OrderedDict[str, T] = OrderedDict()
         self._sizes: dict[str, int] = {}
         self._timestamps: dict[str, float] = {}
         self._current_size = 0
         self.logger = logging.getLogger(__name__)
 
-    def get(self, key: str) -> T | None:
+    def get(
+        self, key: str, ttl_seconds: int | None = None, evict_expired: bool = True
+    ) -> T | None:
         """Get an item from the cache.
 
         Args:
             key: Cache key
+            ttl_seconds: Optional time-to-live overriding the cache default
+            evict_expired: Whether to remove the item if it has expired. Expired
+                items that are kept remain available through get_stale.
 
         Returns:
             Cached item or None if not found/expired
@@ -71,22 +163,41 @@ class MemoryAwareCache(Generic[T]):
             return None
 
         # Check if expired
-        if time.time() - self._timestamps[key] > self.ttl_seconds:
-            self._remove(key)
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        if time.time() - self._timestamps[key] > ttl:
+            if evict_expired:
+                self._remove(key)
             return None
 
         # Move to end (most recently used)
         self._cache.move_to_end(key)
         return self._cache[key]
 
-    def put(self, key: str, value: T, size_bytes: int) -> None:
+    def get_stale(self, key: str) -> T | None:
+        """Get an item from the cache regardless of its age.
+
+        Used as a fallback when fresh data cannot be obtained.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached item or None if not found
+        """
+        return self._cache.get(key)
+
+    def put(self, key: str, value: T, size_bytes: int | None = None) -> None:
         """Put an item in the cache.
 
         Args:
             key: Cache key
             value: Item to cache
-            size_bytes: Size of the item in bytes
+            size_bytes: Size of the item in bytes, measured with the cache's
+                sizer if not given
         """
+        if size_bytes is None:
+            size_bytes = self.sizer(value)
+
         # Remove if already exists
         if key in self._cache:
             self._remove(key)
@@ -106,6 +217,21 @@ class MemoryAwareCache(Generic[T]):
             f"total size: {self._current_size / BYTES_PER_MEGABYTE:.1f}MB"
         )
 
+    def get_expiry(self, key: str, ttl_seconds: int | None = None) -> float | None:
+        """Get the time at which a cached item expires.
+
+        Args:
+            key: Cache key
+            ttl_seconds: Optional time-to-live overriding the cache default
+
+        Returns:
+            Expiry as a Unix timestamp, or None if the key is not cached
+        """
+        if key not in self._timestamps:
+            return None
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        return self._timestamps[key] + ttl
+
     def _remove(self, key: str) -> None:
         """Remove an item from the cache.
 
@@ -202,8 +328,11 @@ class FileCache:
         if not path.exists():
             return False
 
-        # Check age
-        age = time.time() - path.stat().st_mtime
+        # Check age; the file may be removed by a cleanup in the meantime
+        try:
+            age = time.time() - path.stat().st_mtime
+        except FileNotFoundError:
+            return False
         return age < self.ttl_seconds
 
     def cleanup(self) -> None:
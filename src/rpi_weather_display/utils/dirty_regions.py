@@ -0,0 +1,121 @@
+"""Dirty regions exchanged between the server and the client.
+
+A dirty region is a rectangle (left, top, right, bottom) in display pixels,
+the bounding box format used by the client's partial refresh. The server
+sends the regions that differ from the image a client already shows in a
+response header, as semicolon-separated rectangles of comma-separated
+coordinates, for example "0,0,1872,48;0,48,1872,520".
+
+Several small partial updates can be slower than one covering them all,
+since every update has a fixed cost on top of the pixels it refreshes.
+merge_regions weighs the two to decide which regions to update together.
+"""
+
+import math
+from collections.abc import Iterable
+
+Rect = tuple[int, int, int, int]
+
+_REGION_SEPARATOR = ";"
+_COORDINATE_SEPARATOR = ","
+
+
+def format_regions(regions: Iterable[Rect]) -> str:
+    """Format dirty regions as a header value.
+
+    Args:
+        regions: Rectangles as (left, top, right, bottom)
+
+    Returns:
+        Header value listing the rectangles
+    """
+    return _REGION_SEPARATOR.join(
+        _COORDINATE_SEPARATOR.join(str(coordinate) for coordinate in region)
+        for region in regions
+    )
+
+
+def parse_regions(value: str) -> list[Rect] | None:
+    """Parse dirty regions from a header value.
+
+    Args:
+        value: Header value as produced by format_regions
+
+    Returns:
+        Rectangles as (left, top, right, bottom), an empty list if nothing
+        changed, or None if the value is malformed
+    """
+    regions: list[Rect] = []
+    for part in filter(None, value.split(_REGION_SEPARATOR)):
+        try:
+            left, top, right, bottom = (int(c) for c in part.split(_COORDINATE_SEPARATOR))
+        except ValueError:
+            return None
+        if left < 0 or top < 0 or right <= left or bottom <= top:
+            return None
+        regions.append((left, top, right, bottom))
+    return regions
+
+
+def _area(region: Rect) -> int:
+    """Get the number of pixels in a region."""
+    return (region[2] - region[0]) * (region[3] - region[1])
+
+
+def _union(first: Rect, second: Rect) -> Rect:
+    """Get the bounding box of two regions."""
+    return (
+        min(first[0], second[0]),
+        min(first[1], second[1]),
+        max(first[2], second[2]),
+        max(first[3], second[3]),
+    )
+
+
+def _overlaps(first: Rect, second: Rect) -> bool:
+    """Check whether two regions share any pixels."""
+    return (
+        first[0] < second[2]
+        and second[0] < first[2]
+        and first[1] < second[3]
+        and second[1] < first[3]
+    )
+
+
+def merge_regions(regions: Iterable[Rect], update_cost: int, max_regions: int) -> list[Rect]:
+    """Merge regions that are cheaper to refresh as one update.
+
+    Refreshing a region costs update_cost plus its area in pixels. Pairs of
+    regions are merged into their bounding box, most saving first, while
+    that costs no more than refreshing them separately. Overlapping regions
+    are always merged, so the result is disjoint, and the regions whose
+    merge costs least are merged until at most max_regions are left.
+
+    Args:
+        regions: Rectangles as (left, top, right, bottom)
+        update_cost: Fixed cost of one update, in refreshed pixels
+        max_regions: Most regions to return
+
+    Returns:
+        Disjoint rectangles ordered top to bottom
+    """
+    merged = list(dict.fromkeys(regions))
+    while len(merged) > 1:
+        best_saving = -math.inf
+        best_pair = (0, 1)
+        for i, first in enumerate(merged):
+            for j in range(i + 1, len(merged)):
+                second = merged[j]
+                if _overlaps(first, second):
+                    saving = math.inf
+                else:
+                    union = _area(_union(first, second))
+                    saving = update_cost + _area(first) + _area(second) - union
+                if saving > best_saving:
+                    best_saving = saving
+                    best_pair = (i, j)
+        if best_saving < 0 and len(merged) <= max_regions:
+            break
+        i, j = best_pair
+        merged[i] = _union(merged[i], merged.pop(j))
+    return sorted(merged, key=lambda region: (region[1], region[0]))
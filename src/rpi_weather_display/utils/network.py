@@ -66,6 +66,7 @@ class AsyncNetworkManager:
         self.logger = logging.getLogger(__name__)
         self.app_config = None  # Will hold reference to AppConfig if available
         self.current_battery_status = None  # Will hold current battery status if available
+        self.last_radio_on_seconds: float | None = None  # Radio-on time of the last context
 
         # Semaphore to limit concurrent subprocess operations
         self._subprocess_semaphore = asyncio.Semaphore(3)
@@ -372,6 +373,9 @@ class AsyncNetworkManager:
         The async implementation allows other coroutines to run while waiting
         for network operations.
 
+        The time from entering the context until WiFi is disabled on leaving
+        it is recorded as last_radio_on_seconds.
+
         Yields:
             True if connected, False otherwise.
 
@@ -382,6 +386,9 @@ class AsyncNetworkManager:
                     await fetch_data()
                 # WiFi automatically disabled on exit
         """
+        radio_on = time.monotonic()
+        self.last_radio_on_seconds = None
+
         # Try to enable WiFi if it's not already enabled
         connected = await self._check_connectivity()
 
@@ -404,6 +411,7 @@ class AsyncNetworkManager:
             # Only disable if app_config exists and debug mode is off
             if self.app_config is None or not self.app_config.debug:
                 await self._disable_wifi()
+            self.last_radio_on_seconds = time.monotonic() - radio_on
 
     async def _try_connect(self) -> bool:
         """Try to establish network connectivity asynchronously.
@@ -13,6 +13,8 @@ if TYPE_CHECKING:
     from pijuice import PiJuice  # pyright: ignore[reportMissingModuleSource]
 
 from rpi_weather_display.constants import (
+    PIJUICE_CHARGING_STATES,
+    PIJUICE_POWER_PRESENT,
     PIJUICE_STATUS_OK,
     PIJUICE_YEAR_OFFSET,
 )
@@ -258,6 +260,8 @@ class PiJuiceAdapter:
                 "year": wakeup_time.year - PIJUICE_YEAR_OFFSET,
             }
 
+            # Forget whether the previous alarm fired, so the flag tells if this one did
+            self.pijuice.rtcAlarm.ClearAlarmFlag()
             response = self.pijuice.rtcAlarm.SetAlarm(alarm_config)
             if response.get("error") != PIJUICE_STATUS_OK:
                 raise WakeupSchedulingError(
@@ -298,6 +302,41 @@ class PiJuiceAdapter:
                 e
             ) from None
 
+    def get_alarm_flag(self) -> bool | None:
+        """Check whether the RTC alarm has fired since it was set.
+
+        Returns:
+            True if the alarm fired, False if not, or None if unknown
+        """
+        if not self.pijuice:
+            return None
+
+        try:
+            response = self.pijuice.rtcAlarm.GetControlStatus()
+            data = response["data"]
+            if response["error"] != PIJUICE_STATUS_OK or not isinstance(data, dict):
+                return None
+            return bool(data.get("alarm_flag", False))
+        except Exception as e:
+            logger.error(f"Failed to get alarm flag: {e}")
+            return None
+
+    def is_on_external_power(self) -> bool:
+        """Check whether the PiJuice is charging or powered from an external supply.
+
+        Returns:
+            True if power is present on either input, or the battery is charging
+        """
+        status = self.get_status()
+        if status["error"] != PIJUICE_STATUS_OK:
+            return False
+        data = status["data"]
+        return (
+            data.get("battery") in PIJUICE_CHARGING_STATES
+            or data.get("powerInput") == PIJUICE_POWER_PRESENT
+            or data.get("powerInput5vIo") == PIJUICE_POWER_PRESENT
+        )
+
     def disable_wakeup(self) -> bool:
         """Disable wakeup alarm.
 
@@ -44,6 +44,7 @@ class PowerStateManager:
         self._battery_monitor: BatteryMonitor | None = None
         self._power_controller: PowerStateController | None = None
         self._metrics_collector = SystemMetricsCollector()
+        self._scheduled_wakeup: datetime | None = None
         self._initialized = False
 
     def initialize(self) -> None:
@@ -142,6 +143,15 @@ class PowerStateManager:
         if self._power_controller:
             self._power_controller.record_weather_update()
 
+    def set_server_next_update(self, next_update: datetime) -> None:
+        """Record the next content update advised by the server.
+
+        Args:
+            next_update: Time of the next content change
+        """
+        if self._power_controller:
+            self._power_controller.set_server_next_update(next_update)
+
     def calculate_sleep_time(self) -> int:
         """Calculate appropriate sleep time based on power state and conditions.
 
@@ -210,13 +220,27 @@ class PowerStateManager:
             minutes = self._power_controller.calculate_sleep_time()
 
         wake_time = datetime.now() + timedelta(minutes=minutes)
-        
+        if dynamic and self._power_controller:
+            wake_time = self._power_controller.align_wakeup_time(wake_time)
+
         try:
-            return self._pijuice_adapter.set_alarm(wake_time)
+            scheduled = self._pijuice_adapter.set_alarm(wake_time)
         except WakeupSchedulingError:
             logger.error(f"Failed to schedule wakeup for {wake_time}")
             raise
 
+        if scheduled:
+            self._scheduled_wakeup = wake_time
+        return scheduled
+
+    def get_scheduled_wakeup(self) -> datetime | None:
+        """Get the wakeup last scheduled with the PiJuice.
+
+        Returns:
+            Time of the scheduled wakeup, or None if none was scheduled
+        """
+        return self._scheduled_wakeup
+
     # System metrics
     def get_system_metrics(self) -> dict[str, float]:
         """Get comprehensive system metrics.
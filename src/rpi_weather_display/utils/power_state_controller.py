@@ -5,6 +5,7 @@ battery status, quiet hours, and system conditions.
 """
 
 import logging
+import math
 from collections.abc import Callable
 from datetime import datetime, timedelta
 from enum import Enum, auto
@@ -25,6 +26,7 @@ from rpi_weather_display.constants import (
     MIN_SLEEP_MINUTES,
     MINIMUM_MOCK_SLEEP_TIME,
     SECONDS_PER_MINUTE,
+    SERVER_UPDATE_GRACE_SECONDS,
     SYSTEM_HALT_DELAY,
     TWELVE_HOURS_IN_MINUTES,
 )
@@ -84,6 +86,7 @@ class PowerStateController:
         self._state_callbacks: list[PowerStateCallback] = []
         self._last_display_refresh: datetime | None = None
         self._last_weather_update: datetime | None = None
+        self._server_next_update: datetime | None = None
         self._initialized = False
 
     def initialize(self) -> bool:
@@ -373,6 +376,74 @@ class PowerStateController:
         """Record that a weather update occurred."""
         self._last_weather_update = datetime.now()
 
+    def set_server_next_update(self, next_update: datetime) -> None:
+        """Record when the server expects its rendered content to change next.
+
+        Args:
+            next_update: Time of the next content change advised by the server
+        """
+        self._server_next_update = next_update
+        logger.debug(f"Server advised next content update at {next_update.isoformat()}")
+
+    def get_server_wakeup_target(self) -> datetime | None:
+        """Get the time to wake up for the server's next content change.
+
+        Returns:
+            Advised update time plus a grace period, or None if no future update is known
+        """
+        if self._server_next_update is None:
+            return None
+
+        target = self._server_next_update + timedelta(seconds=SERVER_UPDATE_GRACE_SECONDS)
+        if target <= datetime.now():
+            return None
+        return target
+
+    def _align_to_server_schedule(self, sleep_minutes: float) -> float:
+        """Extend sleep so the client does not wake before new content is available.
+
+        Args:
+            sleep_minutes: Sleep time calculated from power state and battery level
+
+        Returns:
+            Sleep time in minutes, never ending before the server's next update
+        """
+        target = self.get_server_wakeup_target()
+        if target is None:
+            return sleep_minutes
+
+        minutes_until_update = math.ceil(
+            (target - datetime.now()).total_seconds() / SECONDS_PER_MINUTE
+        )
+        if minutes_until_update > sleep_minutes:
+            logger.info(
+                f"Extending sleep to {minutes_until_update} minutes to match server update",
+                extra={"server_next_update": target.isoformat()},
+            )
+            return minutes_until_update
+        return sleep_minutes
+
+    def align_wakeup_time(self, wake_time: datetime) -> datetime:
+        """Snap a wakeup time onto the server's next content change.
+
+        Sleep times are whole minutes, so a wakeup derived from them may land up
+        to a minute after the advised update. Such wakeups are moved back to the
+        exact update time so the RTC alarm fires as soon as new content exists.
+
+        Args:
+            wake_time: Proposed wakeup time
+
+        Returns:
+            Server update time if the proposed wakeup rounds onto it, else wake_time
+        """
+        target = self.get_server_wakeup_target()
+        if target is None:
+            return wake_time
+
+        if target <= wake_time < target + timedelta(minutes=1):
+            return target
+        return wake_time
+
     def calculate_sleep_time(self) -> int:
         """Calculate appropriate sleep time based on power state and conditions.
 
@@ -426,6 +497,9 @@ class PowerStateController:
             logger.warning("Abnormal discharge rate detected, extending sleep time")
             sleep_minutes *= ABNORMAL_SLEEP_FACTOR
 
+        # Don't wake up before the server has new content
+        sleep_minutes = self._align_to_server_schedule(sleep_minutes)
+
         # Apply configured limits
         sleep_minutes = max(MIN_SLEEP_MINUTES, min(sleep_minutes, MAX_SLEEP_MINUTES))
 
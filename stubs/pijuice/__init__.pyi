@@ -144,6 +144,10 @@ class RtcAlarmAPI:
         """Get RTC wakeup status."""
         ...
 
+    def GetControlStatus(self) -> PiJuiceAPIResponse:
+        """Get RTC wakeup enabled status and whether the alarm has fired."""
+        ...
+
     def ClearAlarmFlag(self) -> PiJuiceAPIResponse:
         """Clear RTC alarm flag."""
         ...
@@ -0,0 +1,108 @@
+"""Startup benchmark of the client's fast-path boot decision.
+
+Runs a fresh interpreter for each measurement, from process start to the
+boot decision, and compares the fast path with importing the full client
+as every wakeup did before. Wall and CPU times are printed. It is marked
+slow, so it only runs when selected, e.g. ``pytest tests/benchmarks -m slow -s``.
+"""
+
+import json
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from rpi_weather_display.client.boot import BootState, write_boot_state
+
+RUNS = 5
+HEAVY_MODULES = ("httpx", "PIL", "numpy", "pydantic", "rpi_weather_display.client.main")
+
+# Kept before the test fixtures mock subprocess.run
+_subprocess_run = subprocess.run
+
+_FAST_PATH = """
+import sys, time
+from pathlib import Path
+from rpi_weather_display.client.boot import read_boot_state, seconds_until_due
+remaining = seconds_until_due(read_boot_state(Path(sys.argv[1])), time.time())
+# Imported to check the wake reason before going back to sleep
+import rpi_weather_display.utils.pijuice_adapter
+"""
+
+_FULL_CLIENT = """
+import sys
+import rpi_weather_display.client.main
+remaining = None
+"""
+
+_REPORT = """
+import json
+heavy = [name for name in {heavy!r} if name in sys.modules]
+print(json.dumps({{"remaining": remaining, "heavy": heavy}}))
+"""
+
+
+def _run(code: str, state_path: Path) -> tuple[float, float, dict[str, object]]:
+    """Run a fresh interpreter up to its boot decision.
+
+    Returns:
+        Tuple of (wall seconds, CPU seconds, decision report)
+    """
+    script = code + _REPORT.format(heavy=HEAVY_MODULES)
+    before = resource.getrusage(resource.RUSAGE_CHILDREN)
+    start = time.perf_counter()
+    result = _subprocess_run(
+        [sys.executable, "-c", script, str(state_path)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    wall = time.perf_counter() - start
+    after = resource.getrusage(resource.RUSAGE_CHILDREN)
+    cpu = (after.ru_utime - before.ru_utime) + (after.ru_stime - before.ru_stime)
+    return wall, cpu, json.loads(result.stdout)
+
+
+@pytest.fixture()
+def state_path(tmp_path: Path) -> Path:
+    """Write a boot state for a wakeup an hour from now."""
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("debug: false\n")
+    path = tmp_path / "boot_state.json"
+    write_boot_state(
+        path,
+        BootState(
+            next_wakeup=time.time() + 3600,
+            written=time.time(),
+            battery_level=80,
+            config_path=str(config_path),
+            config_mtime=config_path.stat().st_mtime,
+        ),
+    )
+    return path
+
+
+@pytest.mark.slow()
+@pytest.mark.benchmark(group="client-boot")
+def test_boot_decision_startup(state_path: Path) -> None:
+    """Test the fast path decides without the full client's imports, and faster."""
+    fast = [_run(_FAST_PATH, state_path) for _ in range(RUNS)]
+    full = [_run(_FULL_CLIENT, state_path) for _ in range(RUNS)]
+
+    fast_wall = min(run[0] for run in fast)
+    fast_cpu = min(run[1] for run in fast)
+    full_wall = min(run[0] for run in full)
+    full_cpu = min(run[1] for run in full)
+    print(
+        f"\nStart to boot decision: fast path {fast_wall * 1000:.0f} ms wall, "
+        f"{fast_cpu * 1000:.0f} ms CPU; full client {full_wall * 1000:.0f} ms wall, "
+        f"{full_cpu * 1000:.0f} ms CPU"
+    )
+
+    report = fast[0][2]
+    assert report["heavy"] == []
+    assert isinstance(report["remaining"], float)
+    assert fast_wall < full_wall
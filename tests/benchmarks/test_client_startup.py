@@ -0,0 +1,323 @@
+"""Startup profile of the client, from exec to the first refresh.
+
+Runs the client in a fresh interpreter pinned to one CPU core, with a fake
+IT8951 driver standing in for the panel, a simulated WiFi radio taking
+ASSOCIATION_SECONDS to associate, and a local stub server answering render
+requests. Records:
+
+- per-module import times, parsed from ``python -X importtime``
+- how long ``AppConfig.from_yaml`` and ``PathResolver()`` take
+- time from exec to the first network byte (the render request arriving at
+  the stub server), to the first pixel (the first frame handed to the
+  driver) and to the end of the refresh
+- how long the radio is on, from enabling WiFi to disabling it
+
+The best of several runs is compared with client_startup_budget.json, and
+the test fails listing every measurement over its budget. It is marked slow,
+so it only runs when selected, e.g. ``pytest tests/benchmarks -m slow -s``,
+which also prints the profile.
+"""
+
+import io
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, ClassVar
+
+import pytest
+import yaml
+from PIL import Image, ImageDraw
+
+RUNS = 3
+TOP_IMPORTS = 10  # Slowest modules printed with the profile
+WIDTH, HEIGHT = 1872, 1404  # Full panel resolution
+ASSOCIATION_SECONDS = 0.5  # Simulated time for WiFi to associate
+BUDGET_PATH = Path(__file__).parent / "client_startup_budget.json"
+TEST_CONFIG_PATH = Path(__file__).parent.parent / "data" / "test_config.yaml"
+
+# Kept before the test fixtures mock subprocess.run
+_subprocess_run = subprocess.run
+
+_CLIENT = """
+import asyncio, json, sys, time, types
+from pathlib import Path
+
+timings = {}
+
+
+class FakeEPD:
+    def set_rotation(self, rotation):
+        pass
+
+    def sleep(self):
+        pass
+
+
+class FakeDisplay:
+    def __init__(self, vcom):
+        self.width, self.height, self.epd = %(width)d, %(height)d, FakeEPD()
+
+    def _draw(self):
+        timings.setdefault("first_pixel", time.time())
+
+    def display(self, img):
+        self._draw()
+
+    def display_partial(self, img, bbox=None):
+        self._draw()
+
+    def clear(self):
+        pass
+
+    def sleep(self):
+        pass
+
+
+# The panel driver is faked, as it is on a development machine
+driver = types.ModuleType("IT8951.display")
+driver.AutoEPDDisplay = FakeDisplay
+sys.modules["IT8951"] = types.ModuleType("IT8951")
+sys.modules["IT8951.display"] = driver
+
+import rpi_weather_display.client.main as client_main
+from rpi_weather_display.models.config import AppConfig
+from rpi_weather_display.utils.network import AsyncNetworkManager
+from rpi_weather_display.utils.path_utils import PathResolver
+
+timings["imported"] = time.time()
+
+
+radio = {"associated": False}
+
+
+async def check_connectivity(self):
+    return radio["associated"]
+
+
+async def enable_wifi(self):
+    timings["radio_on"] = time.time()
+    await asyncio.sleep(%(association)f)
+    radio["associated"] = True
+
+
+async def disable_wifi(self):
+    timings.setdefault("radio_off", time.time())
+    radio["associated"] = False
+
+
+# The radio is simulated, taking a fixed time to associate
+AsyncNetworkManager._check_connectivity = check_connectivity
+AsyncNetworkManager._enable_wifi = enable_wifi
+AsyncNetworkManager._disable_wifi = disable_wifi
+
+config_path = Path(sys.argv[1])
+start = time.perf_counter()
+AppConfig.from_yaml(config_path)
+timings["config_load_ms"] = (time.perf_counter() - start) * 1000
+start = time.perf_counter()
+PathResolver()
+timings["path_resolver_ms"] = (time.perf_counter() - start) * 1000
+
+client = client_main.AsyncWeatherDisplayClient(config_path)
+asyncio.run(client._initialize_and_update())
+timings["refreshed"] = time.time()
+print(json.dumps(timings))
+"""
+
+
+def parse_importtime(stderr: str) -> dict[str, tuple[float, float]]:
+    """Parse the report of ``python -X importtime``.
+
+    Args:
+        stderr: Standard error of the interpreter, possibly with other output
+
+    Returns:
+        Self and cumulative import time in milliseconds, by module
+    """
+    imports: dict[str, tuple[float, float]] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # Column headings
+        self_us, cumulative_us, name = fields
+        imports[name.strip()] = (int(self_us) / 1000, int(cumulative_us) / 1000)
+    return imports
+
+
+class _RenderHandler(BaseHTTPRequestHandler):
+    """Stub server answering render requests with a dashboard-sized image."""
+
+    image: ClassVar[bytes] = b""
+    arrivals: ClassVar[list[float]] = []
+
+    def do_POST(self) -> None:
+        """Record when the request arrived and send the image."""
+        self.arrivals.append(time.time())
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Content-Type", "image/png")
+        self.send_header("Content-Length", str(len(self.image)))
+        self.end_headers()
+        self.wfile.write(self.image)
+
+    def log_message(self, *args: Any) -> None:
+        """Keep request logs out of the benchmark output."""
+
+
+@pytest.fixture()
+def stub_server() -> Iterator[tuple[int, list[float]]]:
+    """Serve render requests from a local stub server.
+
+    Yields:
+        Tuple of (port, arrival time of each request)
+    """
+    image = Image.new("L", (WIDTH, HEIGHT), 255)
+    draw = ImageDraw.Draw(image)
+    for top in range(100, HEIGHT, 120):
+        draw.rectangle((40, top, WIDTH - 40, top + 60), fill=96)
+    buffer = io.BytesIO()
+    image.save(buffer, "PNG")
+
+    handler = type("Handler", (_RenderHandler,), {"image": buffer.getvalue(), "arrivals": []})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server.server_address[1], handler.arrivals
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture()
+def client_config(tmp_path: Path, stub_server: tuple[int, list[float]]) -> Path:
+    """Write a client config pointing at the stub server."""
+    config = yaml.safe_load(TEST_CONFIG_PATH.read_text())
+    config["debug"] = False  # Disables the radio after the update
+    config["development_mode"] = True
+    config["display"].update(width=WIDTH, height=HEIGHT, persist_last_frame=False)
+    config["server"].update(url="http://127.0.0.1", port=stub_server[0])
+    path = tmp_path / "config.yaml"
+    path.write_text(yaml.safe_dump(config))
+    return path
+
+
+def _pin_to_one_core() -> Callable[[], None] | None:
+    """Get a function pinning the child process to one CPU core, where supported."""
+    if not hasattr(os, "sched_setaffinity"):
+        return None
+    core = min(os.sched_getaffinity(0))
+    return lambda: os.sched_setaffinity(0, {core})
+
+
+def _run_client(config_path: Path, arrivals: list[float]) -> dict[str, Any]:
+    """Run the client in a fresh interpreter up to its first refresh.
+
+    Returns:
+        Measurements in milliseconds, with per-module import times under "imports"
+    """
+    env = {**os.environ, "TMPDIR": str(config_path.parent)}
+    arrivals.clear()
+    exec_time = time.time()
+    result = _subprocess_run(
+        [sys.executable, "-X", "importtime", "-c", _CLIENT % {"width": WIDTH, "height": HEIGHT, "association": ASSOCIATION_SECONDS},
+         str(config_path)],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+        preexec_fn=_pin_to_one_core(),
+    )
+    timings = json.loads(result.stdout.splitlines()[-1])
+    assert arrivals, "The client never reached the stub server"
+    assert "first_pixel" in timings, "The client never drew a frame"
+
+    def since_exec(timestamp: float) -> float:
+        return (timestamp - exec_time) * 1000
+
+    return {
+        "imports": parse_importtime(result.stderr),
+        "import_ms": since_exec(timings["imported"]),
+        "config_load_ms": timings["config_load_ms"],
+        "path_resolver_ms": timings["path_resolver_ms"],
+        "first_network_byte_ms": since_exec(arrivals[0]),
+        "first_pixel_ms": since_exec(timings["first_pixel"]),
+        "refresh_ms": since_exec(timings["refreshed"]),
+        "radio_on_ms": (timings["radio_off"] - timings["radio_on"]) * 1000,
+    }
+
+
+def _best(runs: list[dict[str, Any]]) -> dict[str, Any]:
+    """Combine runs into the best time of each measurement."""
+    best: dict[str, Any] = {
+        key: min(run[key] for run in runs) for key in runs[0] if key != "imports"
+    }
+    best["imports"] = {
+        name: min(run["imports"].get(name, times) for run in runs)
+        for name, times in runs[0]["imports"].items()
+    }
+    return best
+
+
+def _over_budget(profile: dict[str, Any], budget: dict[str, Any]) -> list[str]:
+    """List the measurements exceeding their budget."""
+    failures = [
+        f"{key}: {profile[key]:.0f} ms > {limit} ms"
+        for key, limit in budget.items()
+        if key != "imports_ms" and profile[key] > limit
+    ]
+    for name, limit in budget["imports_ms"].items():
+        if name not in profile["imports"]:
+            failures.append(f"import {name}: not imported by the client")
+        elif profile["imports"][name][1] > limit:
+            failures.append(f"import {name}: {profile['imports'][name][1]:.0f} ms > {limit} ms")
+    return failures
+
+
+class TestParseImporttime:
+    """Tests for parsing the import time report."""
+
+    def test_parse(self) -> None:
+        """Test modules are parsed with self and cumulative times, ignoring other output."""
+        stderr = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |   _io\n"
+            "INFO starting\n"
+            "import time:      1500 |       2750 | rpi_weather_display.client\n"
+        )
+
+        assert parse_importtime(stderr) == {
+            "_io": (0.12, 0.12),
+            "rpi_weather_display.client": (1.5, 2.75),
+        }
+
+
+@pytest.mark.slow()
+@pytest.mark.benchmark(group="client-startup")
+def test_client_startup_budget(
+    client_config: Path, stub_server: tuple[int, list[float]]
+) -> None:
+    """Test the client reaches its first refresh within the startup budget."""
+    budget: dict[str, Any] = json.loads(BUDGET_PATH.read_text())
+    profile = _best([_run_client(client_config, stub_server[1]) for _ in range(RUNS)])
+
+    slowest = sorted(profile["imports"].items(), key=lambda item: item[1][0], reverse=True)
+    print("\nClient startup, from exec:")
+    for key in ("import_ms", "first_network_byte_ms", "first_pixel_ms", "refresh_ms", "radio_on_ms"):
+        print(f"  {key}: {profile[key]:.0f} ms")
+    print(f"  config_load_ms: {profile['config_load_ms']:.1f} ms")
+    print(f"  path_resolver_ms: {profile['path_resolver_ms']:.2f} ms")
+    print("Slowest imports (self, cumulative):")
+    for name, (self_ms, cumulative_ms) in slowest[:TOP_IMPORTS]:
+        print(f"  {name}: {self_ms:.1f} ms, {cumulative_ms:.1f} ms")
+
+    failures = _over_budget(profile, budget)
+    assert not failures, "Startup over budget:\n" + "\n".join(failures)
@@ -0,0 +1,107 @@
+"""Microbenchmarks for derived forecast metrics.
+
+Compares vectorized calculations over the columnar forecast view with
+Python loops over the forecast models, using large synthetic forecasts so
+per-item overhead dominates. Run with ``pytest tests/benchmarks
+--benchmark-only`` to see timing tables.
+"""
+
+# pyright: reportPrivateUsage=false
+
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from rpi_weather_display.models.forecast_columns import ForecastColumns
+from rpi_weather_display.models.weather import WeatherData
+from rpi_weather_display.server.weather_calculator import WeatherCalculator
+
+MOCK_RESPONSE_PATH = Path(__file__).parent.parent / "data" / "mock_weather_response.json"
+SYNTHETIC_HOURS = 24 * 365  # A year of hourly forecasts
+NOW = datetime(2024, 6, 1, 12, 0, 0)
+
+
+@pytest.fixture(scope="module")
+def large_weather() -> WeatherData:
+    """Create weather data with a large synthetic hourly forecast."""
+    data: dict[str, Any] = json.loads(MOCK_RESPONSE_PATH.read_bytes())
+    hour = data["hourly"][0]
+    start = int((NOW - timedelta(days=180)).timestamp())
+    data["hourly"] = [
+        {**hour, "dt": start + i * 3600, "uvi": (i * 7) % 11, "temp": 10 + (i * 13) % 17}
+        for i in range(SYNTHETIC_HOURS)
+    ]
+    return WeatherData.model_validate(data)
+
+
+def _temperature_range_loop(weather: WeatherData) -> tuple[float, float]:
+    """Find the hourly temperature range by iterating the models."""
+    temps = [hour.temp for hour in weather.hourly]
+    return min(temps), max(temps)
+
+
+def _temperature_range_vectorized(columns: ForecastColumns) -> tuple[float, float]:
+    """Find the hourly temperature range from the columnar view."""
+    return float(columns.hourly_temp.min()), float(columns.hourly_temp.max())
+
+
+def test_paths_agree(large_weather: WeatherData) -> None:
+    """Test the vectorized and looped calculations give the same results."""
+    calculator = WeatherCalculator()
+    columns = large_weather.columns
+    assert columns is not None
+
+    vectorized = calculator._calculate_current_max_uvi(large_weather, NOW)
+    with patch.object(WeatherData, "columns", None):
+        looped = calculator._calculate_current_max_uvi(large_weather, NOW)
+
+    assert vectorized == looped
+    assert _temperature_range_vectorized(columns) == _temperature_range_loop(large_weather)
+
+
+@pytest.mark.benchmark(group="forecast-max-uvi")
+def test_benchmark_max_uvi_vectorized(benchmark: Any, large_weather: WeatherData) -> None:
+    """Benchmark today's max UVI over the cached columnar view."""
+    calculator = WeatherCalculator()
+    assert large_weather.columns is not None  # Build the view outside the timed loop
+
+    max_uvi, _ = benchmark(calculator._calculate_current_max_uvi, large_weather, NOW)
+    assert max_uvi == 10
+
+
+@pytest.mark.benchmark(group="forecast-max-uvi")
+def test_benchmark_max_uvi_loop(benchmark: Any, large_weather: WeatherData) -> None:
+    """Benchmark today's max UVI by iterating the models."""
+    calculator = WeatherCalculator()
+
+    with patch.object(WeatherData, "columns", None):
+        max_uvi, _ = benchmark(calculator._calculate_current_max_uvi, large_weather, NOW)
+    assert max_uvi == 10
+
+
+@pytest.mark.benchmark(group="forecast-max-uvi")
+def test_benchmark_build_columns(benchmark: Any, large_weather: WeatherData) -> None:
+    """Benchmark building the columnar view, paid once per weather data object."""
+    columns = benchmark(ForecastColumns.build, large_weather.hourly, large_weather.daily)
+    assert columns is not None
+
+
+@pytest.mark.benchmark(group="forecast-temperature-range")
+def test_benchmark_temperature_range_vectorized(
+    benchmark: Any, large_weather: WeatherData
+) -> None:
+    """Benchmark the hourly temperature range over the columnar view."""
+    columns = large_weather.columns
+    assert columns is not None
+
+    assert benchmark(_temperature_range_vectorized, columns) == (10, 26)
+
+
+@pytest.mark.benchmark(group="forecast-temperature-range")
+def test_benchmark_temperature_range_loop(benchmark: Any, large_weather: WeatherData) -> None:
+    """Benchmark the hourly temperature range by iterating the models."""
+    assert benchmark(_temperature_range_loop, large_weather) == (10, 26)
@@ -0,0 +1,132 @@
+"""Microbenchmarks for finding the changed regions between display frames.
+
+Compares the tile-hash diff, which keeps hashes of the displayed frame and
+compares the pixels of changed tiles only, with the previous full-frame
+int16 subtraction. Run with
+``pytest tests/benchmarks --benchmark-only`` to see timing tables.
+"""
+
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw
+
+from rpi_weather_display.client.image_processor import DiffThresholds, ImageProcessor
+from rpi_weather_display.constants import DISPLAY_MARGIN
+from rpi_weather_display.models.config import DisplayConfig
+
+WIDTH, HEIGHT = 1872, 1404  # Full panel resolution
+PIXEL_THRESHOLD = 10
+MIN_CHANGED_PIXELS = 100
+
+
+@pytest.fixture()
+def processor() -> ImageProcessor:
+    """Create an image processor for the full panel."""
+    return ImageProcessor(DisplayConfig(width=WIDTH, height=HEIGHT))
+
+
+@pytest.fixture()
+def frames() -> tuple[Image.Image, Image.Image]:
+    """Create a dashboard-like frame and the next frame with the clock and a temperature changed."""
+    old_frame = Image.new("L", (WIDTH, HEIGHT), 255)
+    draw = ImageDraw.Draw(old_frame)
+    for top in range(100, HEIGHT, 120):
+        draw.rectangle((40, top, WIDTH - 40, top + 60), fill=96)
+    new_frame = old_frame.copy()
+    draw = ImageDraw.Draw(new_frame)
+    draw.rectangle((1600, 10, 1799, 49), fill=0)
+    draw.rectangle((100, 1300, 299, 1379), fill=0)
+    return old_frame, new_frame
+
+
+def _diff_full_frame(processor: ImageProcessor, old: Image.Image, new: Image.Image) -> Any:
+    """Diff by subtracting the whole frames as int16 arrays, as the client did before."""
+    diff = np.abs(np.array(old).astype(np.int16) - np.array(new).astype(np.int16))
+    if np.max(diff) < PIXEL_THRESHOLD:
+        return None
+    rows, columns = np.where(diff > PIXEL_THRESHOLD)
+    if len(rows) < MIN_CHANGED_PIXELS:
+        return None
+    return (
+        max(0, int(np.min(columns)) - DISPLAY_MARGIN),
+        max(0, int(np.min(rows)) - DISPLAY_MARGIN),
+        min(diff.shape[1], int(np.max(columns)) + DISPLAY_MARGIN),
+        min(diff.shape[0], int(np.max(rows)) + DISPLAY_MARGIN),
+    )
+
+
+def _diff_tile_hashes(
+    processor: ImageProcessor, old: Image.Image, new: Image.Image, old_hashes: bytes
+) -> Any:
+    """Diff by hashing the new frame's tiles and comparing changed tiles only."""
+    return processor.calculate_diff_regions(
+        old,
+        new,
+        DiffThresholds(PIXEL_THRESHOLD, MIN_CHANGED_PIXELS),
+        old_hashes,
+        processor.compute_tile_hashes(new),
+    )
+
+
+def _peak_allocation(diff: Callable[..., Any], *args: Any) -> int:
+    """Measure the peak traced memory allocated while diffing."""
+    diff(*args)  # Warm up
+    tracemalloc.start()
+    try:
+        diff(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_diffs_agree(processor: ImageProcessor, frames: tuple[Image.Image, Image.Image]) -> None:
+    """Test the tile-hash regions cover the full-frame bounding box's changes."""
+    old_frame, new_frame = frames
+    old_hashes = processor.compute_tile_hashes(old_frame)
+    assert old_hashes is not None
+
+    bbox = _diff_full_frame(processor, old_frame, new_frame)
+    regions = _diff_tile_hashes(processor, old_frame, new_frame, old_hashes)
+
+    assert regions == [(1595, 5, 1805, 55), (95, 1295, 305, 1385)]
+    assert bbox == (
+        min(r[0] for r in regions),
+        min(r[1] for r in regions),
+        max(r[2] for r in regions) - 1,
+        max(r[3] for r in regions) - 1,
+    )
+
+
+def test_diff_peak_allocations(
+    processor: ImageProcessor, frames: tuple[Image.Image, Image.Image]
+) -> None:
+    """Test the tile-hash diff avoids full-frame int16 temporaries."""
+    old_frame, new_frame = frames
+    old_hashes = processor.compute_tile_hashes(old_frame)
+
+    full_peak = _peak_allocation(_diff_full_frame, processor, old_frame, new_frame)
+    tile_peak = _peak_allocation(_diff_tile_hashes, processor, old_frame, new_frame, old_hashes)
+
+    print(f"\nPeak allocations: full frame {full_peak:,} B, tile hashes {tile_peak:,} B")
+    assert tile_peak * 10 < full_peak
+
+
+@pytest.mark.benchmark(group="frame-diff")
+def test_benchmark_diff_full_frame(
+    benchmark: Any, processor: ImageProcessor, frames: tuple[Image.Image, Image.Image]
+) -> None:
+    """Benchmark the full-frame int16 subtraction."""
+    assert benchmark(_diff_full_frame, processor, *frames) is not None
+
+
+@pytest.mark.benchmark(group="frame-diff")
+def test_benchmark_diff_tile_hashes(
+    benchmark: Any, processor: ImageProcessor, frames: tuple[Image.Image, Image.Image]
+) -> None:
+    """Benchmark the tile-hash diff against kept hashes of the old frame."""
+    old_hashes = processor.compute_tile_hashes(frames[0])
+    assert benchmark(_diff_tile_hashes, processor, *frames, old_hashes)
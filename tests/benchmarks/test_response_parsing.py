@@ -0,0 +1,98 @@
+"""Microbenchmarks for parsing upstream weather API responses.
+
+Compares validating the raw response bytes straight into models with the
+previous approach of decoding JSON into dictionaries first. Run with
+``pytest tests/benchmarks --benchmark-only`` to see timing tables.
+"""
+
+# pyright: reportPrivateUsage=false
+
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from rpi_weather_display.models.config import AppConfig
+from rpi_weather_display.models.weather import (
+    CurrentWeather,
+    DailyWeather,
+    HourlyWeather,
+    OneCallResponse,
+    WeatherData,
+)
+from rpi_weather_display.server.api import WeatherAPIClient
+
+MOCK_RESPONSE_PATH = Path(__file__).parent.parent / "data" / "mock_weather_response.json"
+HOURLY_ENTRIES = 48  # One Call returns 48 hourly forecasts
+DAILY_ENTRIES = 8  # One Call returns 8 daily forecasts
+
+
+@pytest.fixture()
+def response_bytes() -> bytes:
+    """Create a full-size One Call response from the fixture response."""
+    data: dict[str, Any] = json.loads(MOCK_RESPONSE_PATH.read_bytes())
+    hour, day = data["hourly"][0], data["daily"][0]
+    data["hourly"] = [{**hour, "dt": hour["dt"] + i * 3600} for i in range(HOURLY_ENTRIES)]
+    data["daily"] = [{**day, "dt": day["dt"] + i * 86400} for i in range(DAILY_ENTRIES)]
+    del data["air_pollution"]
+    return json.dumps(data).encode("utf-8")
+
+
+@pytest.fixture()
+def api_client(app_config: AppConfig) -> WeatherAPIClient:
+    """Create an API client for building WeatherData."""
+    return WeatherAPIClient(app_config.weather)
+
+
+def _parse_from_bytes(client: WeatherAPIClient, raw: bytes) -> WeatherData:
+    """Parse by validating the response bytes directly."""
+    return client._build_weather_data(OneCallResponse.model_validate_json(raw), None)
+
+
+def _parse_via_dicts(client: WeatherAPIClient, raw: bytes) -> WeatherData:
+    """Parse as the client did before, decoding into dictionaries with response.json().
+
+    Each entry was then built into its model from the decoded dictionary.
+    """
+    data: dict[str, Any] = json.loads(raw)
+    return WeatherData(
+        lat=data["lat"],
+        lon=data["lon"],
+        timezone=data["timezone"],
+        timezone_offset=data["timezone_offset"],
+        current=CurrentWeather(**data["current"]),
+        hourly=[HourlyWeather(**hour) for hour in data["hourly"][:24]],
+        daily=[DailyWeather(**day) for day in data["daily"][: client.config.forecast_days]],
+        air_pollution=None,
+        last_updated=datetime.now(),
+    )
+
+
+def test_parsers_agree(api_client: WeatherAPIClient, response_bytes: bytes) -> None:
+    """Test both parsing paths produce the same weather data."""
+    direct = _parse_from_bytes(api_client, response_bytes)
+    via_dicts = _parse_via_dicts(api_client, response_bytes)
+
+    exclude = {"last_updated"}
+    assert direct.model_dump(exclude=exclude) == via_dicts.model_dump(exclude=exclude)
+    assert len(direct.hourly) == 24
+
+
+@pytest.mark.benchmark(group="weather-response-parse")
+def test_benchmark_parse_from_bytes(
+    benchmark: Any, api_client: WeatherAPIClient, response_bytes: bytes
+) -> None:
+    """Benchmark validating the response bytes directly."""
+    weather = benchmark(_parse_from_bytes, api_client, response_bytes)
+    assert len(weather.daily) == api_client.config.forecast_days
+
+
+@pytest.mark.benchmark(group="weather-response-parse")
+def test_benchmark_parse_via_dicts(
+    benchmark: Any, api_client: WeatherAPIClient, response_bytes: bytes
+) -> None:
+    """Benchmark decoding into dictionaries before building models."""
+    weather = benchmark(_parse_via_dicts, api_client, response_bytes)
+    assert len(weather.daily) == api_client.config.forecast_days
@@ -0,0 +1,238 @@
+"""Tests for the fast-path client entry point."""
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from rpi_weather_display.client import boot
+from rpi_weather_display.client.boot import (
+    BootState,
+    boot_state_path,
+    read_boot_state,
+    seconds_until_due,
+    write_boot_state,
+)
+from rpi_weather_display.constants import (
+    BOOT_FULL_ENV_VAR,
+    BOOT_STATE_FILENAME,
+    BOOT_WAKE_GRACE_SECONDS,
+)
+
+NOW = 1_716_624_000.0
+
+
+@pytest.fixture()
+def config_path(tmp_path: Path) -> Path:
+    """Create a configuration file."""
+    path = tmp_path / "config.yaml"
+    path.write_text("debug: false\n")
+    return path
+
+
+@pytest.fixture()
+def state(config_path: Path) -> BootState:
+    """Create a boot state for a wakeup an hour from now."""
+    return BootState(
+        next_wakeup=NOW + 3600,
+        written=NOW - 60,
+        battery_level=80,
+        config_path=str(config_path),
+        config_mtime=config_path.stat().st_mtime,
+    )
+
+
+class TestBootState:
+    """Tests for reading and writing the boot state."""
+
+    def test_round_trip(self, tmp_path: Path, state: BootState) -> None:
+        """Test a written state reads back unchanged."""
+        path = tmp_path / "state" / BOOT_STATE_FILENAME
+
+        write_boot_state(path, state)
+
+        assert read_boot_state(path) == state
+        assert [p.name for p in path.parent.iterdir()] == [BOOT_STATE_FILENAME]
+
+    def test_read_missing(self, tmp_path: Path) -> None:
+        """Test a missing state file reads as no state."""
+        assert read_boot_state(tmp_path / BOOT_STATE_FILENAME) is None
+
+    @pytest.mark.parametrize("content", ["", "not json", "[]", '{"next_wakeup": 1}'])
+    def test_read_invalid(self, tmp_path: Path, content: str) -> None:
+        """Test an invalid state file reads as no state."""
+        path = tmp_path / BOOT_STATE_FILENAME
+        path.write_text(content)
+
+        assert read_boot_state(path) is None
+
+    def test_boot_state_path(self, tmp_path: Path) -> None:
+        """Test the state file is kept in the XDG state directory."""
+        with patch.dict("os.environ", {"XDG_STATE_HOME": str(tmp_path)}):
+            assert boot_state_path().parent.parent == tmp_path
+
+
+class TestSecondsUntilDue:
+    """Tests for deciding whether the client has anything to do."""
+
+    def test_not_due(self, state: BootState) -> None:
+        """Test an early wakeup reports the time left until the scheduled one."""
+        assert seconds_until_due(state, NOW) == 3600
+
+    def test_no_state(self) -> None:
+        """Test the client runs without a boot state."""
+        assert seconds_until_due(None, NOW) is None
+
+    def test_due(self, state: BootState) -> None:
+        """Test wakeups close to or past the scheduled one run the client."""
+        due = state["next_wakeup"] - BOOT_WAKE_GRACE_SECONDS
+        assert seconds_until_due(state, due) is None
+        assert seconds_until_due(state, state["next_wakeup"] + 1) is None
+
+    def test_clock_behind(self, state: BootState) -> None:
+        """Test a clock behind the time the state was written runs the client."""
+        assert seconds_until_due(state, state["written"] - 1) is None
+
+    def test_config_changed(self, state: BootState, config_path: Path) -> None:
+        """Test a changed or missing configuration runs the client."""
+        changed = {**state, "config_mtime": state["config_mtime"] - 1}
+        assert seconds_until_due(BootState(**changed), NOW) is None
+
+        config_path.unlink()
+        assert seconds_until_due(state, NOW) is None
+
+
+@pytest.fixture()
+def adapter() -> MagicMock:
+    """Create a PiJuice adapter woken by its alarm while on battery."""
+    adapter = MagicMock()
+    adapter.get_alarm_flag.return_value = True
+    adapter.is_on_external_power.return_value = False
+    adapter.set_alarm.return_value = True
+    return adapter
+
+
+class TestMain:
+    """Tests for the entry point."""
+
+    def test_sleeps_when_not_due(self, state: BootState, adapter: MagicMock) -> None:
+        """Test an early wakeup goes back to sleep without starting the client."""
+        with (
+            patch.object(boot, "read_boot_state", return_value=state),
+            patch.object(boot.time, "time", return_value=NOW),
+            patch.object(boot, "_connect_pijuice", return_value=adapter),
+            patch.object(boot, "_sleep_until", return_value=True) as mock_sleep,
+            patch("rpi_weather_display.client.main.main") as mock_client_main,
+        ):
+            boot.main()
+
+        mock_sleep.assert_called_once_with(adapter, state["next_wakeup"])
+        mock_client_main.assert_not_called()
+
+    def test_runs_client_when_due(self, state: BootState) -> None:
+        """Test the client runs when its wakeup is due."""
+        with (
+            patch.object(boot, "read_boot_state", return_value=state),
+            patch.object(boot.time, "time", return_value=state["next_wakeup"]),
+            patch.object(boot, "_connect_pijuice") as mock_connect,
+            patch.object(boot, "_sleep_until") as mock_sleep,
+            patch("rpi_weather_display.client.main.main") as mock_client_main,
+        ):
+            boot.main()
+
+        mock_connect.assert_not_called()
+        mock_sleep.assert_not_called()
+        mock_client_main.assert_called_once()
+
+    def test_runs_client_when_sleep_fails(self, state: BootState, adapter: MagicMock) -> None:
+        """Test the client runs when the device can't be put back to sleep."""
+        with (
+            patch.object(boot, "read_boot_state", return_value=state),
+            patch.object(boot.time, "time", return_value=NOW),
+            patch.object(boot, "_connect_pijuice", return_value=adapter),
+            patch.object(boot, "_sleep_until", return_value=False),
+            patch("rpi_weather_display.client.main.main") as mock_client_main,
+        ):
+            boot.main()
+
+        mock_client_main.assert_called_once()
+
+    @pytest.mark.parametrize(
+        ("alarm_flag", "external_power"),
+        [(False, False), (None, False), (True, True)],
+        ids=["button", "unknown", "charging"],
+    )
+    def test_runs_client_when_woken_otherwise(
+        self,
+        state: BootState,
+        adapter: MagicMock,
+        alarm_flag: bool | None,
+        external_power: bool,
+    ) -> None:
+        """Test the client runs when not woken by the alarm, or on external power."""
+        adapter.get_alarm_flag.return_value = alarm_flag
+        adapter.is_on_external_power.return_value = external_power
+        with (
+            patch.object(boot, "read_boot_state", return_value=state),
+            patch.object(boot.time, "time", return_value=NOW),
+            patch.object(boot, "_connect_pijuice", return_value=adapter),
+            patch.object(boot, "_sleep_until") as mock_sleep,
+            patch("rpi_weather_display.client.main.main") as mock_client_main,
+        ):
+            boot.main()
+
+        mock_sleep.assert_not_called()
+        mock_client_main.assert_called_once()
+
+    def test_runs_client_without_pijuice(self, state: BootState) -> None:
+        """Test the client runs when the PiJuice can't be reached."""
+        with (
+            patch.object(boot, "read_boot_state", return_value=state),
+            patch.object(boot.time, "time", return_value=NOW),
+            patch.object(boot, "_connect_pijuice", return_value=None),
+            patch.object(boot, "_sleep_until") as mock_sleep,
+            patch("rpi_weather_display.client.main.main") as mock_client_main,
+        ):
+            boot.main()
+
+        mock_sleep.assert_not_called()
+        mock_client_main.assert_called_once()
+
+    def test_full_boot_requested(self, state: BootState) -> None:
+        """Test the environment variable turns the fast path off."""
+        with (
+            patch.dict("os.environ", {BOOT_FULL_ENV_VAR: "1"}),
+            patch.object(boot, "read_boot_state", return_value=state),
+            patch.object(boot.time, "time", return_value=NOW),
+            patch.object(boot, "_connect_pijuice") as mock_connect,
+            patch("rpi_weather_display.client.main.main") as mock_client_main,
+        ):
+            boot.main()
+
+        mock_connect.assert_not_called()
+        mock_client_main.assert_called_once()
+
+    def test_sleep_until(self, adapter: MagicMock, mock_subprocess_run: MagicMock) -> None:
+        """Test going back to sleep re-arms the alarm before shutting down."""
+        assert boot._sleep_until(adapter, NOW) is True
+
+        adapter.set_alarm.assert_called_once()
+        mock_subprocess_run.assert_called_once()
+        assert "/sbin/shutdown" in mock_subprocess_run.call_args.args[0]
+
+    def test_sleep_until_alarm_fails(
+        self, adapter: MagicMock, mock_subprocess_run: MagicMock
+    ) -> None:
+        """Test the system isn't shut down when the alarm can't be re-armed."""
+        adapter.set_alarm.side_effect = RuntimeError("I2C error")
+
+        assert boot._sleep_until(adapter, NOW) is False
+
+        mock_subprocess_run.assert_not_called()
+
+    def test_connect_pijuice_unavailable(self) -> None:
+        """Test no adapter is returned when the PiJuice can't be initialized."""
+        with patch("rpi_weather_display.utils.pijuice_adapter.PiJuiceAdapter") as mock_adapter:
+            mock_adapter.return_value.initialize.return_value = False
+
+            assert boot._connect_pijuice() is None
@@ -1,14 +1,25 @@
 """Tests for the async weather display client."""
 
 import asyncio
+import hashlib
+import threading
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import datetime
 from pathlib import Path
-from typing import Any
 from unittest.mock import AsyncMock, Mock, patch
 
 import httpx
 import pytest
 
+from rpi_weather_display.client.boot import read_boot_state
 from rpi_weather_display.client.main import AsyncWeatherDisplayClient, main
+from rpi_weather_display.constants import (
+    DIRTY_REGIONS_HEADER,
+    ETAG_HEADER,
+    IF_NONE_MATCH_HEADER,
+    NEXT_UPDATE_HEADER,
+)
 from rpi_weather_display.models.system import BatteryState, BatteryStatus
 from rpi_weather_display.utils.power_manager import PowerState
 
@@ -21,6 +32,7 @@ class TestAsyncWeatherDisplayClient:
         # Create network manager as a Mock with proper async context manager
         client.network_manager = Mock()
         client.network_manager.update_battery_status = Mock()
+        client.network_manager.last_radio_on_seconds = None  # WiFi not yet used
         
         # Create a proper async context manager mock
         context_manager = AsyncMock()
@@ -30,6 +42,23 @@ class TestAsyncWeatherDisplayClient:
         # Use a lambda to return the context manager to avoid async detection issues
         client.network_manager.ensure_connectivity = lambda: context_manager
 
+    def _mock_stream(
+        self, client: AsyncWeatherDisplayClient, *results: httpx.Response | Exception
+    ) -> Mock:
+        """Helper to mock streamed server responses, or errors raised sending requests."""
+        outcomes = iter(results)
+
+        @asynccontextmanager
+        async def stream(*_args: object, **_kwargs: object) -> AsyncIterator[httpx.Response]:
+            outcome = next(outcomes)
+            if isinstance(outcome, Exception):
+                raise outcome
+            yield outcome
+
+        client._http_client = AsyncMock()
+        client._http_client.stream = Mock(side_effect=stream)
+        return client._http_client.stream
+
     @pytest.fixture()
     def mock_config_path(self, tmp_path: Path) -> Path:
         """Create a mock configuration file."""
@@ -59,7 +88,9 @@ debug: false
         return config_path
 
     @pytest.fixture()
-    def async_client(self, mock_config_path: Path) -> AsyncWeatherDisplayClient:
+    def async_client(
+        self, mock_config_path: Path, tmp_path: Path
+    ) -> AsyncWeatherDisplayClient:
         """Create an AsyncWeatherDisplayClient instance."""
         with patch("rpi_weather_display.client.main.PowerStateManager"), \
              patch("rpi_weather_display.client.main.EPaperDisplay"), \
@@ -74,6 +105,9 @@ debug: false
             mock_logging.return_value = mock_logger
             
             client = AsyncWeatherDisplayClient(mock_config_path)
+            client.current_image_path = tmp_path / "current.png"
+            client.boot_state_path = tmp_path / "boot_state.json"
+            client.network_manager.last_radio_on_seconds = None
             # Mock the http client
             client._http_client = AsyncMock(spec=httpx.AsyncClient)
             return client
@@ -136,22 +170,138 @@ debug: false
         self._mock_network_manager(async_client, connected=True)
         
         # Mock HTTP response
-        mock_response = AsyncMock()
-        mock_response.status_code = 200
-        mock_response.content = b"image_data"
+        mock_stream = self._mock_stream(async_client, httpx.Response(200, content=b"image_data"))
         
-        async_client._http_client = AsyncMock()
-        async_client._http_client.post = AsyncMock(return_value=mock_response)
+        result = await async_client.update_weather()
         
-        # Mock file write
-        with patch("rpi_weather_display.client.main.write_bytes") as mock_write:
-            result = await async_client.update_weather()
-            
-            assert result is True
-            async_client.network_manager.update_battery_status.assert_called_once()  # type: ignore[attr-defined]
-            async_client._http_client.post.assert_called_once()
-            mock_write.assert_called_once()
-            async_client.power_manager.record_weather_update.assert_called_once()
+        assert result is True
+        async_client.network_manager.update_battery_status.assert_called_once()  # type: ignore[attr-defined]
+        mock_stream.assert_called_once()
+        assert async_client.current_image_path.read_bytes() == b"image_data"
+        assert async_client._image_digest == hashlib.sha256(b"image_data").hexdigest()
+        async_client.power_manager.record_weather_update.assert_called_once()
+
+    @pytest.mark.asyncio()
+    async def test_update_weather_records_server_next_update(
+        self, async_client: AsyncWeatherDisplayClient
+    ) -> None:
+        """Test the server-advised next update is passed to the power manager."""
+        async_client.power_manager = Mock()
+        async_client.power_manager.get_battery_status.return_value = BatteryStatus(
+            level=80, state=BatteryState.DISCHARGING, voltage=3.7, current=-0.5, temperature=25.0
+        )
+        async_client.power_manager.get_system_metrics.return_value = {}
+        self._mock_network_manager(async_client, connected=True)
+
+        next_update = datetime(2024, 5, 25, 11, 0, 0)
+        mock_response = httpx.Response(
+            200,
+            content=b"image_data",
+            headers={NEXT_UPDATE_HEADER: str(int(next_update.timestamp()))},
+        )
+        self._mock_stream(async_client, mock_response)
+
+        result = await async_client.update_weather()
+
+        assert result is True
+        async_client.power_manager.set_server_next_update.assert_called_once_with(next_update)
+
+    @pytest.mark.asyncio()
+    async def test_update_weather_sends_etag(
+        self, async_client: AsyncWeatherDisplayClient
+    ) -> None:
+        """Test the image ETag is sent back so the server can skip unchanged images."""
+        async_client.power_manager = Mock()
+        async_client.power_manager.get_battery_status.return_value = BatteryStatus(
+            level=80, state=BatteryState.DISCHARGING, voltage=3.7, current=-0.5, temperature=25.0
+        )
+        async_client.power_manager.get_system_metrics.return_value = {}
+        self._mock_network_manager(async_client, connected=True)
+
+        mock_stream = self._mock_stream(
+            async_client,
+            httpx.Response(200, content=b"image_data", headers={ETAG_HEADER: '"abc"'}),
+            httpx.Response(304),
+        )
+
+        with patch("rpi_weather_display.client.main.file_exists", return_value=True):
+            assert await async_client.update_weather() is True
+            assert await async_client.update_weather() is True
+
+        first_call, second_call = mock_stream.call_args_list
+        assert first_call.kwargs["headers"] == {}
+        assert second_call.kwargs["headers"] == {IF_NONE_MATCH_HEADER: '"abc"'}
+        # The 304 response keeps the image already on disk
+        assert async_client.current_image_path.read_bytes() == b"image_data"
+        assert async_client._image_etag == '"abc"'
+
+    @pytest.mark.asyncio()
+    async def test_update_weather_rejects_oversized_image(
+        self, async_client: AsyncWeatherDisplayClient
+    ) -> None:
+        """Test images over the size limit are rejected, keeping the cached image."""
+        async_client.power_manager = Mock()
+        async_client.power_manager.get_battery_status.return_value = BatteryStatus(
+            level=80, state=BatteryState.DISCHARGING, voltage=3.7, current=-0.5, temperature=25.0
+        )
+        async_client.power_manager.get_system_metrics.return_value = {}
+        self._mock_network_manager(async_client, connected=True)
+        async_client.current_image_path.write_bytes(b"image_data")
+
+        async def chunks() -> AsyncIterator[bytes]:
+            for _ in range(3):
+                yield b"x" * 4
+
+        self._mock_stream(
+            async_client,
+            # Announced as too large
+            httpx.Response(200, content=b"x" * 20, headers={"Content-Length": "20"}),
+            # Streamed without a length
+            httpx.Response(200, content=chunks()),
+        )
+
+        with patch("rpi_weather_display.client.main.MAX_IMAGE_DOWNLOAD_BYTES", 10):
+            assert await async_client.update_weather() is False
+            assert await async_client.update_weather() is False
+
+        assert async_client.current_image_path.read_bytes() == b"image_data"
+        # No partial downloads are left behind
+        assert list(async_client.current_image_path.parent.glob("*.png")) == [
+            async_client.current_image_path
+        ]
+        assert async_client._image_digest is None
+        async_client.power_manager.record_weather_update.assert_not_called()
+
+    def test_track_dirty_regions(self, async_client: AsyncWeatherDisplayClient) -> None:
+        """Test dirty regions are merged across downloads until the next refresh."""
+        assert async_client._dirty_regions is None
+
+        # Unknown until an image has been displayed
+        async_client._track_dirty_regions(
+            httpx.Response(200, headers={DIRTY_REGIONS_HEADER: "0,0,10,10"})
+        )
+        assert async_client._dirty_regions is None
+
+        async_client._dirty_regions = []
+        async_client._track_dirty_regions(
+            httpx.Response(200, headers={DIRTY_REGIONS_HEADER: "0,0,10,10"})
+        )
+        async_client._track_dirty_regions(
+            httpx.Response(200, headers={DIRTY_REGIONS_HEADER: "0,20,10,30"})
+        )
+        assert async_client._dirty_regions == [(0, 0, 10, 10), (0, 20, 10, 30)]
+
+        # A download without regions makes them unknown again
+        async_client._track_dirty_regions(httpx.Response(200))
+        assert async_client._dirty_regions is None
+
+    def test_parse_next_update_invalid_header(
+        self, async_client: AsyncWeatherDisplayClient
+    ) -> None:
+        """Test missing or malformed next-update headers are ignored."""
+        assert async_client._parse_next_update(httpx.Response(200)) is None
+        response = httpx.Response(200, headers={NEXT_UPDATE_HEADER: "soon"})
+        assert async_client._parse_next_update(response) is None
 
     @pytest.mark.asyncio()
     async def test_update_weather_no_network(self, async_client: AsyncWeatherDisplayClient) -> None:
@@ -170,8 +320,8 @@ debug: false
         assert result is False
         async_client.network_manager.update_battery_status.assert_called_once()  # type: ignore[attr-defined]
         # HTTP client should not be called if no network
-        if async_client._http_client and hasattr(async_client._http_client, 'post'):
-            async_client._http_client.post.assert_not_called()  # type: ignore[attr-defined]
+        if async_client._http_client and hasattr(async_client._http_client, 'stream'):
+            async_client._http_client.stream.assert_not_called()  # type: ignore[attr-defined]
 
     @pytest.mark.asyncio()
     async def test_update_weather_server_error(self, async_client: AsyncWeatherDisplayClient) -> None:
@@ -187,12 +337,7 @@ debug: false
         self._mock_network_manager(async_client, connected=True)
         
         # Mock HTTP error response
-        mock_response = AsyncMock()
-        mock_response.status_code = 500
-        mock_response.text = "Internal Server Error"
-        
-        async_client._http_client = AsyncMock()
-        async_client._http_client.post = AsyncMock(return_value=mock_response)
+        self._mock_stream(async_client, httpx.Response(500, text="Internal Server Error"))
         
         result = await async_client.update_weather()
         
@@ -213,10 +358,7 @@ debug: false
         self._mock_network_manager(async_client, connected=True)
         
         # Mock network error
-        async_client._http_client = AsyncMock()
-        async_client._http_client.post = AsyncMock(
-            side_effect=httpx.NetworkError("Connection failed")
-        )
+        self._mock_stream(async_client, httpx.NetworkError("Connection failed"))
         
         result = await async_client.update_weather()
         
@@ -236,10 +378,7 @@ debug: false
         self._mock_network_manager(async_client, connected=True)
         
         # Mock timeout error
-        async_client._http_client = AsyncMock()
-        async_client._http_client.post = AsyncMock(
-            side_effect=httpx.TimeoutException("Request timed out")
-        )
+        self._mock_stream(async_client, httpx.TimeoutException("Request timed out"))
         
         result = await async_client.update_weather()
         
@@ -259,10 +398,7 @@ debug: false
         self._mock_network_manager(async_client, connected=True)
         
         # Mock HTTP error
-        async_client._http_client = AsyncMock()
-        async_client._http_client.post = AsyncMock(
-            side_effect=httpx.HTTPError("HTTP error occurred")
-        )
+        self._mock_stream(async_client, httpx.HTTPError("HTTP error occurred"))
         
         result = await async_client.update_weather()
         
@@ -282,16 +418,16 @@ debug: false
         self._mock_network_manager(async_client, connected=True)
         
         # Mock general exception
-        async_client._http_client = AsyncMock()
-        async_client._http_client.post = AsyncMock(
-            side_effect=Exception("Unexpected error")
-        )
+        self._mock_stream(async_client, Exception("Unexpected error"))
         
         result = await async_client.update_weather()
         
         assert result is False
 
-    def test_refresh_display_with_cached_image(self, async_client: AsyncWeatherDisplayClient) -> None:
+    @pytest.mark.asyncio()
+    async def test_refresh_display_with_cached_image(
+        self, async_client: AsyncWeatherDisplayClient
+    ) -> None:
         """Test display refresh with cached image."""
         # Mock dependencies
         async_client.power_manager = Mock()
@@ -299,16 +435,68 @@ debug: false
             level=80, state=BatteryState.DISCHARGING, voltage=3.7, current=-0.5, temperature=25.0
         )
         async_client.display = Mock()
+        display_threads: list[str] = []
+        async_client.display.display_image.side_effect = (
+            lambda *_args: display_threads.append(threading.current_thread().name)
+        )
+        async_client._dirty_regions = [(0, 0, 10, 10)]
         
         # Mock cached image exists
         with patch("rpi_weather_display.client.main.file_exists", return_value=True):
-            async_client.refresh_display()
+            await async_client.refresh_display()
             
             async_client.display.update_battery_status.assert_called_once()
-            async_client.display.display_image.assert_called_once()
+            async_client.display.display_image.assert_called_once_with(
+                async_client.current_image_path, [(0, 0, 10, 10)], None
+            )
+            # The panel is driven from the display thread, not the event loop
+            assert display_threads[0].startswith("display")
             async_client.power_manager.record_display_refresh.assert_called_once()
+            # The displayed image is now the cached one
+            assert async_client._dirty_regions == []
 
-    def test_refresh_display_no_cached_image_update_success(self, async_client: AsyncWeatherDisplayClient) -> None:
+    @pytest.mark.asyncio()
+    async def test_refresh_display_skips_displayed_image(
+        self, async_client: AsyncWeatherDisplayClient
+    ) -> None:
+        """Test a download matching the displayed image isn't decoded or displayed."""
+        async_client.power_manager = Mock()
+        async_client.power_manager.get_battery_status.return_value = BatteryStatus(
+            level=80, state=BatteryState.DISCHARGING, voltage=3.7, current=-0.5, temperature=25.0
+        )
+        async_client.power_manager.get_system_metrics.return_value = {}
+        async_client.display = Mock()
+        async_client.display.displayed_digest = hashlib.sha256(b"image_data").hexdigest()
+        self._mock_network_manager(async_client, connected=True)
+        mock_stream = self._mock_stream(
+            async_client,
+            httpx.Response(200, content=b"image_data"),
+            httpx.Response(200, content=b"new_image_data"),
+            httpx.Response(304),
+        )
+
+        with patch("rpi_weather_display.client.main.file_exists", return_value=True):
+            assert await async_client.update_weather()
+            await async_client.refresh_display()
+            async_client.display.display_image.assert_not_called()
+            async_client.power_manager.record_display_refresh.assert_called_once()
+
+            assert await async_client.update_weather()
+            await async_client.refresh_display()
+            async_client.display.display_image.assert_called_once_with(
+                async_client.current_image_path,
+                None,
+                hashlib.sha256(b"new_image_data").hexdigest(),
+            )
+
+            # Skipped refreshes are reported with the system metrics
+            assert await async_client.update_weather()
+        assert mock_stream.call_args.kwargs["json"]["metrics"] == {"refreshes_skipped": 1}
+
+    @pytest.mark.asyncio()
+    async def test_refresh_display_no_cached_image_update_success(
+        self, async_client: AsyncWeatherDisplayClient
+    ) -> None:
         """Test display refresh without cached image - update succeeds."""
         # Mock dependencies
         async_client.power_manager = Mock()
@@ -321,32 +509,21 @@ debug: false
         async_client.update_weather = AsyncMock(return_value=True)
         
         # Mock no cached image exists
-        with patch("rpi_weather_display.client.main.file_exists", return_value=False), \
-             patch("rpi_weather_display.client.main.asyncio.new_event_loop") as mock_loop_fn, \
-             patch("rpi_weather_display.client.main.asyncio.set_event_loop"):
-            
-            # Mock event loop to actually run the coroutine
-            mock_loop = Mock()
-            mock_loop_fn.return_value = mock_loop
-            
-            # Make run_until_complete actually execute the coroutine
-            async def run_coro(coro: Any) -> Any:
-                return await coro
+        with patch("rpi_weather_display.client.main.file_exists", return_value=False):
+            await async_client.refresh_display()
             
-            mock_loop.run_until_complete.side_effect = lambda coro: asyncio.run(run_coro(coro))
-            
-            async_client.refresh_display()
-            
-            # Verify update was attempted
-            mock_loop.run_until_complete.assert_called_once()
-            mock_loop.close.assert_called_once()
+            # Verify update was awaited on the running event loop
+            async_client.update_weather.assert_awaited_once_with()
             
             # Verify display was updated
             async_client.display.update_battery_status.assert_called_once()
             async_client.display.display_image.assert_called_once()
             async_client.power_manager.record_display_refresh.assert_called_once()
 
-    def test_refresh_display_no_cached_image_update_fails(self, async_client: AsyncWeatherDisplayClient) -> None:
+    @pytest.mark.asyncio()
+    async def test_refresh_display_no_cached_image_update_fails(
+        self, async_client: AsyncWeatherDisplayClient
+    ) -> None:
         """Test display refresh without cached image - update fails."""
         # Mock dependencies
         async_client.power_manager = Mock()
@@ -359,31 +536,18 @@ debug: false
         async_client.update_weather = AsyncMock(return_value=False)
         
         # Mock no cached image exists
-        with patch("rpi_weather_display.client.main.file_exists", return_value=False), \
-             patch("rpi_weather_display.client.main.asyncio.new_event_loop") as mock_loop_fn, \
-             patch("rpi_weather_display.client.main.asyncio.set_event_loop"):
-            
-            # Mock event loop to actually run the coroutine
-            mock_loop = Mock()
-            mock_loop_fn.return_value = mock_loop
-            
-            # Make run_until_complete actually execute the coroutine
-            async def run_coro(coro: Any) -> Any:
-                return await coro
-            
-            mock_loop.run_until_complete.side_effect = lambda coro: asyncio.run(run_coro(coro))
-            
-            async_client.refresh_display()
+        with patch("rpi_weather_display.client.main.file_exists", return_value=False):
+            await async_client.refresh_display()
             
             # Verify update was attempted
-            mock_loop.run_until_complete.assert_called_once()
-            mock_loop.close.assert_called_once()
+            async_client.update_weather.assert_awaited_once_with()
             
             # Verify display was NOT updated
             async_client.display.display_image.assert_not_called()
             async_client.power_manager.record_display_refresh.assert_not_called()
 
-    def test_refresh_display_exception(self, async_client: AsyncWeatherDisplayClient) -> None:
+    @pytest.mark.asyncio()
+    async def test_refresh_display_exception(self, async_client: AsyncWeatherDisplayClient) -> None:
         """Test display refresh with exception."""
         # Mock dependencies
         async_client.power_manager = Mock()
@@ -396,11 +560,92 @@ debug: false
         # Mock cached image exists
         with patch("rpi_weather_display.client.main.file_exists", return_value=True):
             # Should not raise exception
-            async_client.refresh_display()
+            await async_client.refresh_display()
             
             # Verify exception was caught
             async_client.display.display_image.assert_called_once()
 
+    @pytest.mark.asyncio()
+    async def test_update_weather_local_work_overlaps_wifi_connection(
+        self, async_client: AsyncWeatherDisplayClient
+    ) -> None:
+        """Test local work happens while WiFi connects, and cycle timings are reported."""
+        battery = BatteryStatus(
+            level=80, state=BatteryState.DISCHARGING, voltage=3.7, current=-0.5, temperature=25.0
+        )
+        events: list[str] = []
+        async_client.power_manager = Mock()
+        async_client.power_manager.get_battery_status.side_effect = (
+            lambda: events.append("battery") or battery
+        )
+        async_client.power_manager.get_system_metrics.side_effect = (
+            lambda: events.append("metrics") or {}
+        )
+        async_client.display = Mock()
+        async_client.display.prepare.side_effect = lambda: events.append("prepare")
+        self._mock_network_manager(async_client, connected=True)
+        async_client.network_manager.last_radio_on_seconds = 0.5
+        mock_stream = self._mock_stream(
+            async_client,
+            httpx.Response(200, content=b"image_data"),
+            httpx.Response(304),
+        )
+
+        async def connect(*_args: object) -> bool:
+            events.append("connecting")
+            await asyncio.sleep(0.1)
+            events.append("connected")
+            return True
+
+        context_manager = async_client.network_manager.ensure_connectivity()
+        context_manager.__aenter__ = AsyncMock(side_effect=connect)
+
+        assert await async_client.update_weather()
+
+        assert events[0] == "connecting"
+        assert sorted(events[1:4]) == ["battery", "metrics", "prepare"]
+        assert events[4] == "connected"
+        async_client.network_manager.update_battery_status.assert_called_once_with(battery)
+
+        # The cycle's timings are sent with the next request
+        assert await async_client.update_weather()
+        metrics = mock_stream.call_args.kwargs["json"]["metrics"]
+        assert metrics["last_radio_on_seconds"] == 0.5
+        assert metrics["last_wake_seconds"] >= 0.1
+
+    @pytest.mark.asyncio()
+    async def test_update_weather_refresh_overlaps_wifi_shutdown(
+        self, async_client: AsyncWeatherDisplayClient
+    ) -> None:
+        """Test the display refreshes while WiFi is being disabled after an update."""
+        async_client.power_manager = Mock()
+        async_client.power_manager.get_battery_status.return_value = BatteryStatus(
+            level=80, state=BatteryState.DISCHARGING, voltage=3.7, current=-0.5, temperature=25.0
+        )
+        async_client.power_manager.get_system_metrics.return_value = {}
+        async_client.display = Mock()
+        async_client.display.displayed_digest = None
+        self._mock_network_manager(async_client, connected=True)
+        self._mock_stream(async_client, httpx.Response(200, content=b"image_data"))
+        events: list[str] = []
+        async_client.display.display_image.side_effect = lambda *_args: events.append("display")
+
+        async def disable_wifi(*_args: object) -> None:
+            events.append("wifi off")
+            await asyncio.sleep(0.1)
+            events.append("wifi disabled")
+
+        context_manager = async_client.network_manager.ensure_connectivity()
+        context_manager.__aexit__ = AsyncMock(side_effect=disable_wifi)
+
+        assert await async_client.update_weather(refresh=True)
+
+        assert events == ["wifi off", "display", "wifi disabled"]
+        async_client.display.display_image.assert_called_once_with(
+            async_client.current_image_path, None, hashlib.sha256(b"image_data").hexdigest()
+        )
+        async_client.power_manager.record_display_refresh.assert_called_once()
+
     def test_handle_power_state_change_critical(self, async_client: AsyncWeatherDisplayClient) -> None:
         """Test handling critical power state change."""
         # Mock dependencies
@@ -411,30 +656,67 @@ debug: false
         # Mock the shutdown method to prevent async issues
         async_client.shutdown = AsyncMock()
         
-        # Mock asyncio event loop creation and skip the 5-second sleep
-        with patch("rpi_weather_display.client.main.asyncio.new_event_loop") as mock_loop_fn, \
-             patch("rpi_weather_display.client.main.asyncio.set_event_loop"), \
-             patch("rpi_weather_display.client.main.time.sleep"):
-            
-            mock_loop = Mock()
-            mock_loop_fn.return_value = mock_loop
-            
-            # Make run_until_complete actually execute the coroutine
-            async def run_coro(coro: Any) -> Any:
-                return await coro
-            
-            mock_loop.run_until_complete.side_effect = lambda coro: asyncio.run(run_coro(coro))
-            
+        # Skip the pause for the warning to be seen
+        with patch("rpi_weather_display.client.main.SLEEP_BEFORE_SHUTDOWN", 0):
             # Trigger critical state change
             async_client._handle_power_state_change(PowerState.NORMAL, PowerState.CRITICAL)
             
-            # Verify critical shutdown sequence
-            async_client.display.display_text.assert_called_once_with(
-                "CRITICAL BATTERY", "Shutting down to preserve battery"
+        # Verify critical shutdown sequence
+        async_client.display.display_text.assert_called_once_with(
+            "CRITICAL BATTERY", "Shutting down to preserve battery"
+        )
+        assert async_client._running is False
+        async_client.power_manager.schedule_wakeup.assert_called_once()
+        async_client.shutdown.assert_awaited_once()
+        async_client.power_manager.shutdown_system.assert_called_once()
+
+    @pytest.mark.asyncio()
+    async def test_handle_power_state_change_critical_on_loop(
+        self, async_client: AsyncWeatherDisplayClient
+    ) -> None:
+        """Test a critical state change on the event loop schedules the shutdown on it."""
+        async_client.display = Mock()
+        async_client.power_manager = Mock()
+        async_client.shutdown = AsyncMock()
+
+        with patch("rpi_weather_display.client.main.SLEEP_BEFORE_SHUTDOWN", 0):
+            async_client._handle_power_state_change(PowerState.NORMAL, PowerState.CRITICAL)
+            async_client.power_manager.shutdown_system.assert_not_called()
+
+            assert async_client._shutdown_task is not None
+            await async_client._shutdown_task
+
+        async_client.shutdown.assert_awaited_once()
+        async_client.power_manager.shutdown_system.assert_called_once()
+
+    @pytest.mark.asyncio()
+    async def test_handle_power_state_change_critical_on_worker_thread(
+        self, async_client: AsyncWeatherDisplayClient
+    ) -> None:
+        """Test a critical state change on a worker thread hands the shutdown to the loop."""
+        async_client.display = Mock()
+        async_client.power_manager = Mock()
+        async_client.shutdown = AsyncMock()
+        async_client._loop = asyncio.get_running_loop()
+
+        with patch("rpi_weather_display.client.main.SLEEP_BEFORE_SHUTDOWN", 0):
+            # Join the worker while blocking the loop, as if it were busy
+            worker = threading.Thread(
+                target=async_client._handle_power_state_change,
+                args=(PowerState.NORMAL, PowerState.CRITICAL),
             )
-            assert async_client._running is False
-            async_client.power_manager.schedule_wakeup.assert_called_once()
-            async_client.power_manager.shutdown_system.assert_called_once()
+            worker.start()
+            worker.join(timeout=5)
+            assert not worker.is_alive()
+            async_client.power_manager.shutdown_system.assert_not_called()
+
+            # The shutdown runs once the loop is free
+            await asyncio.sleep(0)
+            assert async_client._shutdown_task is not None
+            await async_client._shutdown_task
+
+        async_client.shutdown.assert_awaited_once()
+        async_client.power_manager.shutdown_system.assert_called_once()
 
     def test_handle_power_state_change_critical_with_exception(self, async_client: AsyncWeatherDisplayClient) -> None:
         """Test handling critical power state change with exceptions."""
@@ -447,16 +729,9 @@ debug: false
         async_client.power_manager.shutdown_system.side_effect = Exception("Final error")
         async_client._running = True
         
-        # Use patch to mock the event loop - make shutdown() fail to trigger exception handler
-        with patch("asyncio.new_event_loop") as mock_new_loop:
-            mock_loop = Mock()
-            mock_new_loop.return_value = mock_loop
-            # Make run_until_complete raise an exception to trigger the exception handler
-            mock_loop.run_until_complete = Mock(side_effect=Exception("Shutdown failed"))
-        
-            # Trigger critical state change - should raise due to shutdown failure in exception handler
-            with pytest.raises(RuntimeError, match="Failed to perform critical shutdown"):
-                async_client._handle_power_state_change(PowerState.NORMAL, PowerState.CRITICAL)
+        # Trigger critical state change - should raise due to shutdown failure in exception handler
+        with pytest.raises(RuntimeError, match="Failed to perform critical shutdown"):
+            async_client._handle_power_state_change(PowerState.NORMAL, PowerState.CRITICAL)
         
         # Verify shutdown was attempted in exception handler
         assert async_client.power_manager.shutdown_system.call_count == 1
@@ -476,44 +751,74 @@ debug: false
         assert async_client._running is True
         async_client.power_manager.shutdown_system.assert_not_called()
 
-    def test_handle_sleep_deep_sleep_scenario(self, async_client: AsyncWeatherDisplayClient) -> None:
+    @pytest.mark.asyncio()
+    async def test_handle_sleep_deep_sleep_scenario(self, async_client: AsyncWeatherDisplayClient) -> None:
         """Test deep sleep handling."""
         async_client.config.debug = False
         async_client.power_manager = Mock()
         async_client.power_manager.schedule_wakeup.return_value = True
+        wakeup = datetime(2024, 5, 25, 11, 0, 0)
+        async_client.power_manager.get_scheduled_wakeup.return_value = wakeup
+        async_client.power_manager.get_battery_status.return_value = BatteryStatus(
+            level=80, state=BatteryState.DISCHARGING, voltage=3.7, current=-0.5, temperature=25.0
+        )
         async_client.display = Mock()
         
         # Test with long sleep duration (should trigger deep sleep)
-        result = async_client._handle_sleep(30)  # 30 minutes
+        result = await async_client._handle_sleep(30)  # 30 minutes
         
         assert result is True
         async_client.power_manager.schedule_wakeup.assert_called_once_with(30, dynamic=True)
         async_client.display.sleep.assert_called_once()
         async_client.power_manager.shutdown_system.assert_called_once()
 
-    def test_handle_sleep_debug_mode(self, async_client: AsyncWeatherDisplayClient) -> None:
+        # The next boot can tell when the client is due
+        state = read_boot_state(async_client.boot_state_path)
+        assert state is not None
+        assert state["next_wakeup"] == wakeup.timestamp()
+        assert state["battery_level"] == 80
+        assert state["config_path"] == str(async_client.config_path.resolve())
+
+    @pytest.mark.asyncio()
+    async def test_handle_sleep_boot_state_fails(self, async_client: AsyncWeatherDisplayClient) -> None:
+        """Test deep sleep goes ahead when the boot state can't be saved."""
+        async_client.config.debug = False
+        async_client.power_manager = Mock()
+        async_client.power_manager.schedule_wakeup.return_value = True
+        async_client.power_manager.get_battery_status.side_effect = RuntimeError("no battery")
+        async_client.display = Mock()
+
+        assert await async_client._handle_sleep(30) is True
+
+        async_client.power_manager.shutdown_system.assert_called_once()
+        assert read_boot_state(async_client.boot_state_path) is None
+
+    @pytest.mark.asyncio()
+    async def test_handle_sleep_debug_mode(self, async_client: AsyncWeatherDisplayClient) -> None:
         """Test sleep handling in debug mode."""
         async_client.config.debug = True
         async_client.power_manager = Mock()
         
         # Should not trigger deep sleep in debug mode
-        result = async_client._handle_sleep(30)
+        result = await async_client._handle_sleep(30)
         
         assert result is False
         async_client.power_manager.schedule_wakeup.assert_not_called()
 
-    def test_handle_sleep_short_duration(self, async_client: AsyncWeatherDisplayClient) -> None:
+    @pytest.mark.asyncio()
+    async def test_handle_sleep_short_duration(self, async_client: AsyncWeatherDisplayClient) -> None:
         """Test sleep handling with short duration."""
         async_client.config.debug = False
         async_client.power_manager = Mock()
         
         # Test with short sleep duration (should not trigger deep sleep)
-        result = async_client._handle_sleep(5)  # 5 minutes
+        result = await async_client._handle_sleep(5)  # 5 minutes
         
         assert result is False
         async_client.power_manager.schedule_wakeup.assert_not_called()
 
-    def test_handle_sleep_schedule_wakeup_fails(self, async_client: AsyncWeatherDisplayClient) -> None:
+    @pytest.mark.asyncio()
+    async def test_handle_sleep_schedule_wakeup_fails(self, async_client: AsyncWeatherDisplayClient) -> None:
         """Test sleep handling when schedule_wakeup fails."""
         async_client.config.debug = False
         async_client.power_manager = Mock()
@@ -521,7 +826,7 @@ debug: false
         async_client.display = Mock()
         
         # Test with long sleep duration but wakeup scheduling fails
-        result = async_client._handle_sleep(30)  # 30 minutes
+        result = await async_client._handle_sleep(30)  # 30 minutes
         
         assert result is False
         async_client.power_manager.schedule_wakeup.assert_called_once_with(30, dynamic=True)
@@ -544,6 +849,7 @@ debug: false
         http_client_mock.aclose.assert_called_once()
         async_client.display.close.assert_called_once()
         assert async_client._http_client is None
+        assert async_client._display_executor is None
 
     @pytest.mark.asyncio()
     async def test_shutdown_no_http_client(self, async_client: AsyncWeatherDisplayClient) -> None:
@@ -592,7 +898,7 @@ debug: false
         # Mock methods
         async_client.initialize = Mock()
         async_client.update_weather = AsyncMock(return_value=True)
-        async_client.refresh_display = Mock()
+        async_client.refresh_display = AsyncMock()
         async_client.shutdown = AsyncMock()
         
         # Run for a short time then stop
@@ -608,8 +914,9 @@ debug: false
         
         # Verify initialization and updates were called
         async_client.initialize.assert_called_once()
-        async_client.update_weather.assert_called()
-        async_client.refresh_display.assert_called()
+        # The initial update refreshes the display itself
+        async_client.update_weather.assert_called_once_with(refresh=True)
+        async_client.refresh_display.assert_not_called()
 
     @pytest.mark.asyncio()
     async def test_run_quiet_hours_transitions(self, async_client: AsyncWeatherDisplayClient) -> None:
@@ -628,7 +935,7 @@ debug: false
         # Mock methods
         async_client.initialize = Mock()
         async_client.update_weather = AsyncMock(return_value=True)
-        async_client.refresh_display = Mock()
+        async_client.refresh_display = AsyncMock()
         async_client.shutdown = AsyncMock()
         
         # Simulate state transitions
@@ -644,8 +951,9 @@ debug: false
         
         async def stop_after_iterations() -> None:
             nonlocal iteration_count
-            while iteration_count < 4:  # Need 4 iterations to ensure transition happens
-                await asyncio.sleep(0.05)
+            # Need 3 iterations to ensure transition happens
+            while iteration_count < 3 and async_client._running:
+                await original_sleep(0.05)  # Not counted as an iteration
             async_client._running = False
         
         # Override sleep to count iterations
@@ -664,7 +972,7 @@ debug: false
         
         # Verify display sleep/wake transitions
         assert async_client.display.sleep.call_count >= 1
-        assert async_client.refresh_display.call_count >= 2  # Initial + wake from quiet hours
+        assert async_client.refresh_display.call_count >= 1  # Wake from quiet hours
 
     @pytest.mark.asyncio()
     async def test_run_with_charging_during_quiet_hours(self, async_client: AsyncWeatherDisplayClient) -> None:
@@ -686,7 +994,7 @@ debug: false
         # Mock methods
         async_client.initialize = Mock()
         async_client.update_weather = AsyncMock(return_value=True)
-        async_client.refresh_display = Mock()
+        async_client.refresh_display = AsyncMock()
         async_client.shutdown = AsyncMock()
         
         # Track iterations
@@ -694,8 +1002,9 @@ debug: false
         
         async def stop_after_iterations() -> None:
             nonlocal iteration_count
-            while iteration_count < 4:  # Need 4 iterations to ensure charging state is processed
-                await asyncio.sleep(0.05)
+            # Need 3 iterations to ensure charging state is processed
+            while iteration_count < 3 and async_client._running:
+                await original_sleep(0.05)  # Not counted as an iteration
             async_client._running = False
         
         # Override sleep to count iterations
@@ -713,7 +1022,7 @@ debug: false
             )
         
         # Verify display woke up when charging started
-        assert async_client.refresh_display.call_count >= 2  # Initial + wake when charging
+        assert async_client.refresh_display.call_count >= 1  # Wake when charging
 
     @pytest.mark.asyncio()
     async def test_run_with_update_triggers(self, async_client: AsyncWeatherDisplayClient) -> None:
@@ -733,7 +1042,7 @@ debug: false
         # Mock methods
         async_client.initialize = Mock()
         async_client.update_weather = AsyncMock(return_value=True)
-        async_client.refresh_display = Mock()
+        async_client.refresh_display = AsyncMock()
         async_client.shutdown = AsyncMock()
         
         # Track iterations
@@ -761,7 +1070,8 @@ debug: false
         
         # Verify update triggers
         assert async_client.update_weather.call_count == 2  # Initial + triggered
-        assert async_client.refresh_display.call_count == 2  # Initial + triggered
+        async_client.update_weather.assert_called_with(False)  # Refresh not due yet
+        assert async_client.refresh_display.call_count == 1  # Triggered
 
     @pytest.mark.asyncio()
     async def test_run_with_deep_sleep_trigger(self, async_client: AsyncWeatherDisplayClient) -> None:
@@ -781,15 +1091,37 @@ debug: false
         # Mock methods
         async_client.initialize = Mock()
         async_client.update_weather = AsyncMock(return_value=True)
-        async_client.refresh_display = Mock()
-        async_client._handle_sleep = Mock(return_value=True)  # Simulate deep sleep triggered
+        async_client.refresh_display = AsyncMock()
+        async_client._handle_sleep = AsyncMock(return_value=True)  # Simulate deep sleep triggered
         async_client.shutdown = AsyncMock()
         
         # Run the loop
         await async_client.run()
         
         # Verify deep sleep was triggered
-        async_client._handle_sleep.assert_called_once_with(15)
+        async_client._handle_sleep.assert_awaited_once_with(15)
+
+    @pytest.mark.asyncio()
+    async def test_run_waits_for_critical_shutdown(
+        self, async_client: AsyncWeatherDisplayClient
+    ) -> None:
+        """Test the main loop lets a critical shutdown finish instead of cancelling it."""
+        async_client.power_manager = Mock()
+        async_client.display = Mock()
+        async_client.shutdown = AsyncMock()
+
+        async def go_critical(refresh: bool = False) -> bool:
+            async_client._handle_power_state_change(PowerState.NORMAL, PowerState.CRITICAL)
+            return True
+
+        async_client.initialize = Mock()
+        async_client.update_weather = AsyncMock(side_effect=go_critical)
+
+        with patch("rpi_weather_display.client.main.SLEEP_BEFORE_SHUTDOWN", 0):
+            await async_client.run()
+
+        async_client.shutdown.assert_awaited_once()
+        async_client.power_manager.shutdown_system.assert_called_once()
 
     @pytest.mark.asyncio()
     async def test_run_with_keyboard_interrupt(self, async_client: AsyncWeatherDisplayClient) -> None:
@@ -809,7 +1141,7 @@ debug: false
         # Mock methods
         async_client.initialize = Mock()
         async_client.update_weather = AsyncMock(return_value=True)
-        async_client.refresh_display = Mock()
+        async_client.refresh_display = AsyncMock()
         async_client.shutdown = AsyncMock()
         
         # Simulate keyboard interrupt
@@ -846,7 +1178,7 @@ debug: false
         # Mock methods
         async_client.initialize = Mock()
         async_client.update_weather = AsyncMock(return_value=True)
-        async_client.refresh_display = Mock()
+        async_client.refresh_display = AsyncMock()
         async_client.shutdown = AsyncMock()
         
         # Run the loop
@@ -872,32 +1204,29 @@ debug: false
         max_concurrent = 0
         
         # Mock slow HTTP response that tracks concurrency
-        async def slow_post(*_args: object, **_kwargs: object) -> AsyncMock:
+        @asynccontextmanager
+        async def slow_stream(*_args: object, **_kwargs: object) -> AsyncIterator[httpx.Response]:
             nonlocal concurrent_count, max_concurrent
             concurrent_count += 1
             max_concurrent = max(max_concurrent, concurrent_count)
             try:
                 await asyncio.sleep(0.1)
-                response = AsyncMock()
-                response.status_code = 200
-                response.content = b"image_data"
-                return response
+                yield httpx.Response(200, content=b"image_data")
             finally:
                 concurrent_count -= 1
         
-        # Create a real mock client and assign the slow_post method
+        # Create a real mock client and assign the slow_stream method
         mock_http_client = AsyncMock()
-        mock_http_client.post = slow_post
+        mock_http_client.stream = slow_stream
         async_client._http_client = mock_http_client
         
         # Try to run more than semaphore limit
-        with patch("rpi_weather_display.client.main.write_bytes"):
-            results = await asyncio.gather(
-                async_client.update_weather(),
-                async_client.update_weather(),
-                async_client.update_weather(),
-                async_client.update_weather(),
-            )
+        results = await asyncio.gather(
+            async_client.update_weather(),
+            async_client.update_weather(),
+            async_client.update_weather(),
+            async_client.update_weather(),
+        )
         
         # All should succeed
         assert all(results)
@@ -913,6 +1242,7 @@ class TestAsyncMainFunction:
         # Create network manager as a Mock with proper async context manager
         client.network_manager = Mock()
         client.network_manager.update_battery_status = Mock()
+        client.network_manager.last_radio_on_seconds = None  # WiFi not yet used
         
         # Create a proper async context manager mock
         context_manager = AsyncMock()
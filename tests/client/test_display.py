@@ -86,6 +86,7 @@ class TestEPaperDisplay:
             timestamp_format="%Y-%m-%d %H:%M",
             pixel_diff_threshold=10,
             min_changed_pixels=100,
+            persist_last_frame=False,
         )
         self.display = EPaperDisplay(self.config)
 
@@ -113,6 +114,59 @@ class TestEPaperDisplay:
             assert self.display._display is not None
             assert isinstance(self.display._display, MockAutoEPDDisplay)
 
+    def test_frame_store_in_state_dir(self, tmp_path: Path) -> None:
+        """Test the displayed frame is kept in the XDG state directory by default."""
+        config = self.config.model_copy(update={"persist_last_frame": True})
+        with patch.dict("os.environ", {"XDG_STATE_HOME": str(tmp_path)}):
+            display = EPaperDisplay(config)
+
+        frame_store = display.partial_refresh_manager.frame_store
+        assert frame_store is not None
+        assert frame_store.path.parent.parent == tmp_path
+        display.close()
+
+    def test_initialize_keeps_restored_frame(self, tmp_path: Path) -> None:
+        """Test a frame stored before a reboot is diffed against, not cleared."""
+        config = self.config.model_copy(
+            update={"persist_last_frame": True, "last_frame_dir": str(tmp_path)}
+        )
+        frame = Image.new("L", (config.width, config.height), 255)
+        display = EPaperDisplay(config)
+        display.partial_refresh_manager._update_last_image(frame.copy())
+        display.close()
+
+        display = EPaperDisplay(config)
+        with (
+            patch(
+                "rpi_weather_display.client.display._import_it8951",
+                return_value=MockAutoEPDDisplay
+            ),
+            patch.object(MockAutoEPDDisplay, "clear") as mock_clear,
+        ):
+            display.initialize()
+
+        mock_clear.assert_not_called()
+        assert display.partial_refresh_manager.has_last_image
+        assert display.partial_refresh_manager.frame_store is not None
+        assert display.partial_refresh_manager.frame_store.path.parent == tmp_path
+
+        # Clearing the panel forgets the stored frame
+        display.clear()
+        assert EPaperDisplay(config).partial_refresh_manager.has_last_image is False
+
+    def test_initialize_clears_without_stored_frame(self) -> None:
+        """Test the panel is cleared at startup when its content is unknown."""
+        with (
+            patch(
+                "rpi_weather_display.client.display._import_it8951",
+                return_value=MockAutoEPDDisplay
+            ),
+            patch.object(MockAutoEPDDisplay, "clear") as mock_clear,
+        ):
+            self.display.initialize()
+
+        mock_clear.assert_called_once()
+
     def test_initialize_no_library(self) -> None:
         """Test initialization when IT8951 library is not available."""
         with (
@@ -190,27 +244,98 @@ class TestEPaperDisplay:
             # Should still clear last image
             mock_clear_last.assert_called_once()
 
-    def test_display_image(self) -> None:
-        """Test display_image method."""
-        # Create test image file
-        test_path = Path("test_image.png")
-        test_image_data = b"fake image data"
+    def test_display_image(self, tmp_path: Path) -> None:
+        """Test display_image decodes the file and displays it."""
+        test_path = tmp_path / "test_image.png"
+        Image.new("L", (100, 100), 128).save(test_path)
+        
+        displayed = []
+        
+        def display_pil_image(image: Image.Image, dirty_regions: object) -> None:
+            displayed.append((image.size, image.getextrema(), dirty_regions))
+        
+        with patch.object(self.display, "display_pil_image", side_effect=display_pil_image):
+            self.display.display_image(test_path)
+        
+        assert displayed == [((100, 100), (128, 128), None)]
+
+    def test_display_image_invalid_file(self, tmp_path: Path) -> None:
+        """Test display_image raises for files that aren't images."""
+        test_path = tmp_path / "test_image.png"
+        test_path.write_bytes(b"fake image data")
         
         with (
-            patch("rpi_weather_display.client.display.read_bytes", return_value=test_image_data),
-            patch("PIL.Image.open") as mock_open,
-            patch.object(self.display, "display_pil_image") as mock_display_pil
+            patch.object(self.display, "display_pil_image") as mock_display_pil,
+            # Some format probes seek past the end of the mapped file
+            pytest.raises((OSError, ValueError)),
         ):
-            # Create mock image
-            mock_image = MagicMock(spec=Image.Image)
-            mock_context = MagicMock()
-            mock_context.__enter__ = MagicMock(return_value=mock_image)
-            mock_context.__exit__ = MagicMock(return_value=False)
-            mock_open.return_value = mock_context
-            
             self.display.display_image(test_path)
-            
-            mock_display_pil.assert_called_once_with(mock_image)
+        mock_display_pil.assert_not_called()
+
+    def test_displayed_digest(self, tmp_path: Path) -> None:
+        """Test the displayed image's digest is kept with the frame across reboots."""
+        config = self.config.model_copy(
+            update={"persist_last_frame": True, "last_frame_dir": str(tmp_path)}
+        )
+        image_path = tmp_path / "image.png"
+        Image.new("L", (config.width, config.height), 255).save(image_path)
+        display = EPaperDisplay(config)
+        display._initialized = True
+        display._display = create_autospec(EPDDisplayProtocol, instance=True)
+        assert display.displayed_digest is None
+
+        display.display_image(image_path, digest="abc")
+        assert display.displayed_digest == "abc"
+        display.close()
+        assert EPaperDisplay(config).displayed_digest == "abc"
+
+        # A failed update leaves the panel's content unknown
+        display = EPaperDisplay(config)
+        with (
+            patch.object(display, "display_pil_image", side_effect=DisplayUpdateError("failed")),
+            pytest.raises(DisplayUpdateError),
+        ):
+            display.display_image(image_path, digest="def")
+        assert display.displayed_digest is None
+        assert EPaperDisplay(config).displayed_digest is None
+
+    def test_displayed_digest_forgotten_after_text(self, tmp_path: Path) -> None:
+        """Test showing a text screen means the same image is displayed again."""
+        config = self.config.model_copy(
+            update={"persist_last_frame": True, "last_frame_dir": str(tmp_path)}
+        )
+        image_path = tmp_path / "image.png"
+        Image.new("L", (config.width, config.height), 255).save(image_path)
+        display = EPaperDisplay(config)
+        display._initialized = True
+        display._display = create_autospec(EPDDisplayProtocol, instance=True)
+        display.display_image(image_path, digest="abc")
+
+        display.display_text("CRITICAL BATTERY", "Shutting down to preserve battery")
+        assert display.displayed_digest is None
+        display.close()
+
+        # After a reboot the panel still shows the text, so the image is redrawn
+        display = EPaperDisplay(config)
+        assert display.displayed_digest is None
+        display._initialized = True
+        display._display = create_autospec(EPDDisplayProtocol, instance=True)
+        display.display_image(image_path, digest="abc")
+        assert display._display.display.called or display._display.display_partial.called
+        assert display.displayed_digest == "abc"
+
+    def test_displayed_digest_cleared(self, tmp_path: Path) -> None:
+        """Test clearing the panel forgets the displayed image's digest."""
+        image_path = tmp_path / "test_image.png"
+        Image.new("L", (100, 100), 128).save(image_path)
+        with patch.object(self.display, "display_pil_image"):
+            self.display.display_image(image_path, digest="abc")
+        self.display.partial_refresh_manager._last_image = Image.new("L", (10, 10))
+        assert self.display.displayed_digest == "abc"
+
+        self.display.clear()
+
+        assert self.display.displayed_digest is None
 
     def test_display_pil_image_not_initialized(self) -> None:
         """Test display_pil_image in mock mode."""
@@ -250,7 +375,24 @@ class TestEPaperDisplay:
         ):
             self.display.display_pil_image(image)
             
-            mock_update.assert_called_once_with(processed_image, mock_display)
+            mock_update.assert_called_once_with(processed_image, mock_display, None)
+
+    def test_display_pil_image_dirty_regions(self) -> None:
+        """Test dirty regions are passed on unless the image is resized."""
+        self.display._display = create_autospec(EPDDisplayProtocol, instance=True)
+        self.display._initialized = True
+        regions = [(0, 0, 100, 20)]
+        image = Image.new("L", (self.config.width, self.config.height), 128)
+        small_image = Image.new("L", (100, 100), 128)
+
+        with patch.object(
+            self.display.partial_refresh_manager, "update_display", return_value=True
+        ) as mock_update:
+            self.display.display_pil_image(image, regions)
+            assert mock_update.call_args.args[2] == regions
+
+            self.display.display_pil_image(small_image, regions)
+            assert mock_update.call_args.args[2] is None
 
     def test_display_pil_image_exception(self) -> None:
         """Test display_pil_image with exception."""
@@ -392,6 +534,6 @@ class TestEPaperDisplay:
             self.display.close()
             
             mock_sleep.assert_called_once()
-            mock_clear.assert_called_once()
+            mock_clear.assert_called_once_with(keep_stored=True)
             assert not self.display._initialized
             assert self.display._display is None
\ No newline at end of file
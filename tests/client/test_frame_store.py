@@ -0,0 +1,147 @@
+"""Tests for the stored last displayed frame."""
+
+from pathlib import Path
+
+import pytest
+from PIL import Image, ImageDraw
+
+from rpi_weather_display.client.frame_store import FrameStore
+from rpi_weather_display.client.image_processor import DiffThresholds, ImageProcessor
+from rpi_weather_display.models.config import DisplayConfig
+
+WIDTH = 100
+HEIGHT = 70
+
+
+@pytest.fixture()
+def store(tmp_path: Path) -> FrameStore:
+    """Create a frame store in a temporary directory."""
+    return FrameStore(tmp_path / "last_frame.gray", WIDTH, HEIGHT)
+
+
+@pytest.fixture()
+def frame() -> Image.Image:
+    """Create a grayscale frame with some content."""
+    image = Image.new("L", (WIDTH, HEIGHT), 255)
+    ImageDraw.Draw(image).rectangle((10, 20, 60, 50), fill=0)
+    return image
+
+
+class TestFrameStore:
+    """Test cases for FrameStore."""
+
+    def test_round_trip(self, store: FrameStore, frame: Image.Image) -> None:
+        """Test a stored frame loads with the same pixels and hashes."""
+        processor = ImageProcessor(DisplayConfig(width=WIDTH, height=HEIGHT))
+        hashes = processor.compute_tile_hashes(frame)
+
+        store.save(frame, hashes)
+        loaded = store.load()
+
+        assert loaded is not None
+        image, loaded_hashes = loaded
+        assert image.mode == "L"
+        assert image.size == (WIDTH, HEIGHT)
+        assert image.tobytes() == frame.tobytes()
+        assert loaded_hashes == hashes
+        assert processor.calculate_diff_regions(image, frame, DiffThresholds(10, 1), hashes, hashes) == []
+
+    def test_round_trip_without_hashes(self, store: FrameStore, frame: Image.Image) -> None:
+        """Test a frame stored without hashes loads without them."""
+        store.save(frame)
+        loaded = store.load()
+
+        assert loaded is not None
+        assert loaded[0].tobytes() == frame.tobytes()
+        assert loaded[1] is None
+
+    def test_save_replaces_frame(self, store: FrameStore, frame: Image.Image) -> None:
+        """Test saving replaces the stored frame, even while the old one is loaded."""
+        store.save(frame)
+        loaded = store.load()
+        assert loaded is not None
+
+        store.save(Image.new("L", (WIDTH, HEIGHT), 136))
+
+        # The loaded frame keeps mapping the replaced file
+        assert loaded[0].tobytes() == frame.tobytes()
+        reloaded = store.load()
+        assert reloaded is not None
+        assert reloaded[0].getextrema() == (136, 136)
+
+    def test_save_packs_gray_levels(self, store: FrameStore) -> None:
+        """Test frames are stored as 16 gray levels, two pixels a byte."""
+        image = Image.new("L", (WIDTH, HEIGHT), 255)
+        image.paste(100, (0, 0, WIDTH, 10))
+        image.paste(9, (0, 10, WIDTH, 20))
+
+        store.save(image)
+        loaded = store.load()
+
+        assert store.path.stat().st_size == WIDTH * HEIGHT // 2
+        assert loaded is not None
+        assert loaded[0].getpixel((0, 0)) == 102
+        assert loaded[0].getpixel((0, 10)) == 17
+        assert loaded[0].getpixel((0, 20)) == 255
+
+    def test_round_trip_odd_width(self, tmp_path: Path) -> None:
+        """Test rows of frames an odd number of pixels wide start on a byte."""
+        store = FrameStore(tmp_path / "last_frame.gray", 5, 2)
+        image = Image.new("L", (5, 2))
+        image.putdata([0, 17, 34, 51, 68, 85, 102, 119, 136, 153])
+
+        store.save(image)
+        loaded = store.load()
+
+        assert store.path.stat().st_size == 6
+        assert loaded is not None
+        assert loaded[0].tobytes() == image.tobytes()
+
+    def test_save_drops_mismatched_hashes(
+        self, store: FrameStore, frame: Image.Image
+    ) -> None:
+        """Test hashes of another frame size aren't stored."""
+        store.save(frame, b"\x00" * 8)
+        loaded = store.load()
+
+        assert loaded is not None
+        assert loaded[1] is None
+
+    def test_save_wrong_size_clears(self, store: FrameStore, frame: Image.Image) -> None:
+        """Test a frame not matching the display replaces the stored one with nothing."""
+        store.save(frame)
+        store.save(Image.new("L", (WIDTH // 2, HEIGHT), 255))
+
+        assert store.load() is None
+
+    def test_save_wrong_mode_clears(self, store: FrameStore, frame: Image.Image) -> None:
+        """Test a frame that isn't grayscale isn't stored."""
+        store.save(frame)
+        store.save(frame.convert("RGB"))
+
+        assert store.load() is None
+
+    def test_load_missing(self, store: FrameStore) -> None:
+        """Test loading without a stored frame."""
+        assert store.load() is None
+
+    def test_load_empty(self, store: FrameStore) -> None:
+        """Test loading an empty file."""
+        store.path.write_bytes(b"")
+
+        assert store.load() is None
+
+    def test_load_other_display_size(self, store: FrameStore, frame: Image.Image) -> None:
+        """Test a frame stored for another display size is ignored."""
+        store.save(frame)
+        other = FrameStore(store.path, WIDTH, HEIGHT + 1)
+
+        assert other.load() is None
+
+    def test_clear(self, store: FrameStore, frame: Image.Image) -> None:
+        """Test clearing removes the stored frame, and tolerates none being stored."""
+        store.save(frame)
+        store.clear()
+        store.clear()
+
+        assert store.load() is None
@@ -3,9 +3,13 @@
 from typing import Any
 from unittest.mock import MagicMock, patch
 
-from PIL import Image
+from PIL import Image, ImageDraw
 
-from rpi_weather_display.client.image_processor import ImageProcessor, _import_numpy
+from rpi_weather_display.client.image_processor import (
+    DiffThresholds,
+    ImageProcessor,
+    _import_numpy,
+)
 from rpi_weather_display.models.config import DisplayConfig
 
 
@@ -132,237 +136,116 @@ class TestImageProcessor:
         assert result.size == (self.config.width, self.config.height)
         assert result.mode == "L"
 
-    def test_calculate_diff_bbox_no_numpy(self) -> None:
-        """Test calculate_diff_bbox when numpy is not available."""
+    def test_calculate_diff_regions_separate_changes(self) -> None:
+        """Test changes far apart get regions of their own."""
+        processor = ImageProcessor(DisplayConfig(width=1872, height=1404))
+        old_image = Image.new("L", (1872, 1404), 255)
+        new_image = old_image.copy()
+        draw = ImageDraw.Draw(new_image)
+        draw.rectangle((1600, 10, 1799, 49), fill=0)  # Clock in the header
+        draw.rectangle((100, 1300, 299, 1379), fill=0)  # Temperature at the bottom
+
+        result = processor.calculate_diff_regions(old_image, new_image, DiffThresholds(10, 100))
+
+        assert result == [(1595, 5, 1805, 55), (95, 1295, 305, 1385)]
+
+    def test_calculate_diff_regions_nearby_changes_merged(self) -> None:
+        """Test changes close together are refreshed as one region."""
+        old_image = Image.new("L", (400, 400), 255)
+        new_image = old_image.copy()
+        draw = ImageDraw.Draw(new_image)
+        draw.rectangle((10, 10, 49, 49), fill=0)
+        draw.rectangle((120, 10, 159, 49), fill=0)
+
+        thresholds = DiffThresholds(10, 100)
+        result = self.processor.calculate_diff_regions(old_image, new_image, thresholds)
+
+        assert result == [(5, 5, 165, 55)]
+
+    def test_calculate_diff_regions_no_changes(self) -> None:
+        """Test small or faint changes give no regions."""
+        old_image = Image.new("L", (100, 100), 128)
+        faint = Image.new("L", (100, 100), 133)
+        few = old_image.copy()
+        few.putpixel((50, 50), 0)
+
+        assert self.processor.calculate_diff_regions(old_image, faint, DiffThresholds(10, 1)) == []
+        assert self.processor.calculate_diff_regions(old_image, few, DiffThresholds(10, 100)) == []
+
+    def test_calculate_diff_regions_no_wraparound(self) -> None:
+        """Test large differences in both directions are not wrapped in uint8."""
         old_image = Image.new("L", (100, 100), 0)
         new_image = Image.new("L", (100, 100), 255)
-        
-        with patch("rpi_weather_display.client.image_processor._import_numpy", return_value=None):
-            result = self.processor.calculate_diff_bbox(old_image, new_image, 10, 100)
-            
-        assert result is None
+        old_image.paste(255, (0, 50, 100, 100))
+        new_image.paste(0, (0, 50, 100, 100))
+
+        thresholds = DiffThresholds(254, 100)
+        result = self.processor.calculate_diff_regions(old_image, new_image, thresholds)
+
+        assert result == [(0, 0, 100, 100)]
+
+    def test_calculate_diff_regions_rgb(self) -> None:
+        """Test a pixel of an image with several channels changes if any channel does."""
+        old_image = Image.new("RGB", (100, 100), (0, 0, 0))
+        new_image = old_image.copy()
+        new_image.paste((0, 0, 255), (10, 20, 30, 40))
+
+        thresholds = DiffThresholds(10, 100)
+        result = self.processor.calculate_diff_regions(old_image, new_image, thresholds)
+
+        assert result == [(5, 15, 35, 45)]
 
-    def test_calculate_diff_bbox_no_changes(self) -> None:
-        """Test calculate_diff_bbox with identical images."""
+    def test_compute_tile_hashes(self) -> None:
+        """Test tiles are hashed separately, including partial edge tiles."""
+        image = Image.new("L", (100, 40), 128)
+        changed = image.copy()
+        changed.putpixel((99, 39), 0)
+
+        hashes = self.processor.compute_tile_hashes(image)
+        changed_hashes = self.processor.compute_tile_hashes(changed)
+
+        # 4 x 2 tiles of 8-byte digests, differing only in the bottom-right tile
+        assert hashes is not None
+        assert changed_hashes is not None
+        assert len(hashes) == 8 * 8
+        assert hashes[:-8] == changed_hashes[:-8]
+        assert hashes[-8:] != changed_hashes[-8:]
+
+    def test_calculate_diff_regions_skips_matching_tiles(self) -> None:
+        """Test only tiles whose hashes differ have their pixels compared."""
+        old_image = Image.new("L", (400, 400), 255)
+        new_image = old_image.copy()
+        draw = ImageDraw.Draw(new_image)
+        draw.rectangle((10, 10, 49, 49), fill=0)
+        hashes = self.processor.compute_tile_hashes(old_image)
+
+        # Matching hashes mean nothing changed, whatever the pixels
+        assert self.processor.calculate_diff_regions(
+            old_image, new_image, DiffThresholds(10, 100), hashes, hashes
+        ) == []
+        assert self.processor.calculate_diff_regions(
+            old_image,
+            new_image,
+            DiffThresholds(10, 100),
+            hashes,
+            self.processor.compute_tile_hashes(new_image),
+        ) == [(5, 5, 55, 55)]
+
+    def test_calculate_diff_regions_no_numpy(self) -> None:
+        """Test regions can't be calculated without numpy."""
         image = Image.new("L", (100, 100), 128)
-        
-        with patch("rpi_weather_display.client.image_processor._import_numpy") as mock_import:
-            mock_np = MockNumpy()
-            mock_np.max = lambda arr: 0  # No difference
-            mock_import.return_value = mock_np
-            
-            result = self.processor.calculate_diff_bbox(image, image, 10, 100)
-            
-        assert result is None
-
-    def test_calculate_diff_bbox_below_threshold(self) -> None:
-        """Test calculate_diff_bbox with changes below threshold."""
-        old_image = Image.new("L", (100, 100), 0)
-        new_image = Image.new("L", (100, 100), 5)
-        
-        with patch("rpi_weather_display.client.image_processor._import_numpy") as mock_import:
-            mock_np = MockNumpy()
-            mock_np.max = lambda arr: 5  # Below threshold of 10
-            mock_import.return_value = mock_np
-            
-            result = self.processor.calculate_diff_bbox(old_image, new_image, 10, 100)
-            
-        assert result is None
-
-    def test_calculate_diff_bbox_too_few_pixels(self) -> None:
-        """Test calculate_diff_bbox with too few changed pixels."""
-        old_image = Image.new("L", (100, 100), 0)
-        new_image = Image.new("L", (100, 100), 255)
-        
-        with patch("rpi_weather_display.client.image_processor._import_numpy") as mock_import:
-            mock_np = MockNumpy()
-            mock_np.where = lambda condition: ([10], [20])  # Only 1 pixel
-            mock_import.return_value = mock_np
-            
-            result = self.processor.calculate_diff_bbox(old_image, new_image, 10, 100)
-            
-        assert result is None
-
-    def test_calculate_diff_bbox_success(self) -> None:
-        """Test successful calculate_diff_bbox."""
-        old_image = Image.new("L", (100, 100), 0)
-        new_image = Image.new("L", (100, 100), 255)
-        
-        # Instead of complex mocking, let's use a simpler approach
-        # Test with real numpy if available, otherwise skip
-        import_result = _import_numpy()
-        if import_result is None:
-            # numpy not available, test with simple check that it returns None
-            result = self.processor.calculate_diff_bbox(old_image, new_image, 10, 100)
-            assert result is None
-        else:
-            # numpy is available, use it directly
-            result = self.processor.calculate_diff_bbox(old_image, new_image, 10, 100)
-            # Should return a bounding box
-            assert result is not None
-            assert isinstance(result, tuple)
-            assert len(result) == 4
-            # Check bounds are reasonable
-            left, top, right, bottom = result
-            assert 0 <= left < right <= 100
-            assert 0 <= top < bottom <= 100
-
-    def test_calculate_diff_bbox_exception(self) -> None:
-        """Test calculate_diff_bbox with exception."""
-        old_image = Image.new("L", (100, 100), 0)
-        new_image = Image.new("L", (100, 100), 255)
-        
-        with patch("rpi_weather_display.client.image_processor._import_numpy") as mock_import:
-            mock_import.side_effect = Exception("Test error")
-            
-            # Capture logger output to verify error message
-            with patch.object(self.processor.logger, "debug") as mock_debug:
-                result = self.processor.calculate_diff_bbox(old_image, new_image, 10, 100)
-                
-            assert result is None
-            # Verify error was logged
-            mock_debug.assert_called_once()
-            args = mock_debug.call_args[0]
-            assert "Error calculating diff bbox" in args[0]
-            assert "Test error" in args[0]
-
-    def test_calculate_bbox_dimensions(self) -> None:
-        """Test _calculate_bbox_dimensions method."""
-        non_zero = ([10, 20, 30, 40], [50, 60, 70, 80])
-        diff_shape = (100, 100)
-        
-        mock_np = MockNumpy()
-        mock_np.min = lambda arr: 10 if arr is non_zero[0] else 50
-        mock_np.max = lambda arr: 40 if arr is non_zero[0] else 80
-        
-        result = self.processor._calculate_bbox_dimensions(non_zero, diff_shape, mock_np)  # type: ignore[arg-type]
-        
-        assert result is not None
-        left, top, right, bottom = result
-        
-        # Check margins are applied (DISPLAY_MARGIN = 5)
-        assert left == max(0, 50 - 5)   # min column - margin = 45
-        assert top == max(0, 10 - 5)    # min row - margin = 5
-        assert right == min(100, 80 + 5)  # max column + margin = 85
-        assert bottom == min(100, 40 + 5)  # max row + margin = 45
-
-    def test_calculate_bbox_dimensions_clipped(self) -> None:
-        """Test _calculate_bbox_dimensions with clipping at edges."""
-        # Test with values at edges
-        non_zero = ([0, 5], [0, 5])
-        diff_shape = (100, 100)
-        
-        mock_np = MockNumpy()
-        mock_np.min = lambda arr: 0
-        mock_np.max = lambda arr: 5
-        
-        result = self.processor._calculate_bbox_dimensions(non_zero, diff_shape, mock_np)  # type: ignore[arg-type]
-        
-        assert result is not None
-        left, top, right, bottom = result
-        
-        # Check that values are clipped to image bounds (DISPLAY_MARGIN = 5)
-        assert left == 0    # Can't go below 0
-        assert top == 0     # Can't go below 0
-        assert right == 10  # 5 + 5 margin = 10
-        assert bottom == 10 # 5 + 5 margin = 10
-
-    def test_calculate_bbox_dimensions_exception(self) -> None:
-        """Test _calculate_bbox_dimensions with exception."""
-        non_zero = ([10], [20])
-        diff_shape = (100, 100)
-        
-        mock_np = MagicMock()
-        mock_np.min.side_effect = Exception("Test error")
-        
-        result = self.processor._calculate_bbox_dimensions(non_zero, diff_shape, mock_np)  # type: ignore[arg-type]
-        
-        assert result is None
 
-    def test_calculate_diff_bbox_cleanup_on_low_max_diff(self) -> None:
-        """Test that cleanup happens when max_diff is below threshold."""
-        old_image = Image.new("L", (100, 100), 0)
-        new_image = Image.new("L", (100, 100), 5)
-        
-        # Create a custom mock to verify cleanup
-        cleanup_called = {"old": False, "new": False, "diff": False}
-        
-        class MockArray:
-            def __init__(self, name: str) -> None:
-                self.name = name
-                self.shape = (100, 100)
-                
-            def astype(self, dtype: Any) -> "MockArray":
-                return self
-                
-            def __sub__(self, other: Any) -> "MockArray":
-                return MockArray("diff")
-                
-            def __del__(self) -> None:
-                cleanup_called[self.name] = True
-        
-        with patch("rpi_weather_display.client.image_processor._import_numpy") as mock_import:
-            mock_np = MagicMock()
-            mock_np.array = lambda img: MockArray("old" if img is old_image else "new")
-            mock_np.abs = lambda x: x
-            mock_np.max = lambda arr: 5  # Below threshold
-            mock_np.int16 = int
-            mock_import.return_value = mock_np
-            
-            result = self.processor.calculate_diff_bbox(old_image, new_image, 10, 100)
-            
-        assert result is None
-        # Note: __del__ is not guaranteed to be called immediately in Python
-        # but the important thing is that the code attempts cleanup with del statements
-
-    def test_calculate_diff_bbox_cleanup_on_few_pixels(self) -> None:
-        """Test that cleanup happens when too few pixels changed."""
-        old_image = Image.new("L", (100, 100), 0)
-        new_image = Image.new("L", (100, 100), 255)
-        
-        with patch("rpi_weather_display.client.image_processor._import_numpy") as mock_import:
-            mock_np = MockNumpy()
-            # Override to return max_diff > threshold but few changed pixels
-            mock_np.max = lambda arr: 50  # Above threshold
-            mock_np.where = lambda condition: ([10, 20], [30, 40])  # Only 2 pixels
-            mock_import.return_value = mock_np
-            
-            result = self.processor.calculate_diff_bbox(old_image, new_image, 10, 100)
-            
-        assert result is None
-
-    def test_calculate_diff_bbox_with_real_numpy_integration(self) -> None:
-        """Test calculate_diff_bbox with real numpy if available (integration test)."""
-        # This test uses real numpy if available to ensure proper integration
-        np = _import_numpy()
-        if np is None:
-            # Skip this test if numpy is not available
-            return
-            
-        # Create images with significant differences
-        old_image = Image.new("L", (50, 50), 0)
+        with patch("rpi_weather_display.client.image_processor._import_numpy", return_value=None):
+            thresholds = DiffThresholds(10, 100)
+            assert self.processor.calculate_diff_regions(image, image, thresholds) is None
+
+    def test_calculate_diff_regions_exception(self) -> None:
+        """Test errors during the calculation give no regions."""
+        old_image = Image.new("L", (100, 100), 128)
         new_image = Image.new("L", (50, 50), 0)
-        
-        # Draw a white rectangle in the new image
-        from PIL import ImageDraw
-        draw = ImageDraw.Draw(new_image)
-        draw.rectangle((10, 10, 40, 40), fill=255)
-        
-        # Call the method with real numpy
-        result = self.processor.calculate_diff_bbox(old_image, new_image, 10, 100)
-        
-        # Should detect the changed region
-        assert result is not None
-        assert isinstance(result, tuple)
-        assert len(result) == 4
-        
-        # The bounding box should encompass the rectangle with margins
-        left, top, right, bottom = result
-        # With DISPLAY_MARGIN = 5, expect roughly (5, 5, 45, 45)
-        assert left <= 10  # Should include margin
-        assert top <= 10
-        assert right >= 40
-        assert bottom >= 40
+
+        thresholds = DiffThresholds(10, 100)
+        assert self.processor.calculate_diff_regions(old_image, new_image, thresholds) is None
 
     def test_preprocess_image_resampling_fallback(self) -> None:
         """Test that image preprocessing works with various PIL versions."""
@@ -382,29 +265,3 @@ class TestImageProcessor:
         assert result2.size == (self.config.width, self.config.height)
         assert result2.mode == "L"
 
-    def test_calculate_diff_bbox_successful_cleanup(self) -> None:
-        """Test that cleanup happens in the successful path."""
-        old_image = Image.new("L", (100, 100), 0)
-        new_image = Image.new("L", (100, 100), 0)
-        
-        # Draw a white rectangle to create a significant difference
-        from PIL import ImageDraw
-        draw = ImageDraw.Draw(new_image)
-        draw.rectangle((20, 20, 80, 80), fill=255)
-        
-        # Use real numpy if available for this test
-        np = _import_numpy()
-        if np is None:
-            # No numpy, just verify it returns None
-            result = self.processor.calculate_diff_bbox(old_image, new_image, 10, 100)
-            assert result is None
-        else:
-            # With numpy, should get a valid bbox
-            result = self.processor.calculate_diff_bbox(old_image, new_image, 10, 100)
-            assert result is not None
-            assert isinstance(result, tuple)
-            assert len(result) == 4
-            # Verify reasonable bounds
-            left, top, right, bottom = result
-            assert left < right
-            assert top < bottom
\ No newline at end of file
@@ -6,7 +6,8 @@ import pytest
 from PIL import Image
 
 from rpi_weather_display.client.battery_threshold_manager import BatteryThresholdManager
-from rpi_weather_display.client.image_processor import ImageProcessor
+from rpi_weather_display.client.frame_store import FrameStore
+from rpi_weather_display.client.image_processor import DiffThresholds, ImageProcessor
 from rpi_weather_display.client.partial_refresh_manager import (
     DisplayProtocol,
     PartialRefreshManager,
@@ -103,7 +104,7 @@ class TestPartialRefreshManager:
 
         # Configure mock to return a bounding box
         bbox = (10, 20, 90, 80)
-        self.mock_image_processor.calculate_diff_bbox.return_value = bbox
+        self.mock_image_processor.calculate_diff_regions.return_value = [bbox]
 
         # Display second image
         mock_display.reset_mock()
@@ -118,10 +119,82 @@ class TestPartialRefreshManager:
         self.mock_battery_manager.get_min_changed_pixels.assert_called()
 
         # Verify diff calculation
-        self.mock_image_processor.calculate_diff_bbox.assert_called_once_with(
-            first_image, second_image, 10, 100
+        hashes = self.mock_image_processor.compute_tile_hashes.return_value
+        self.mock_image_processor.calculate_diff_regions.assert_called_once_with(
+            first_image, second_image, DiffThresholds(10, 100), hashes, hashes
         )
 
+    def test_update_display_multiple_regions(self) -> None:
+        """Test each changed region is refreshed with its own partial update."""
+        first_image = Image.new("L", (100, 100), 128)
+        second_image = Image.new("L", (100, 100), 200)
+        mock_display = create_autospec(DisplayProtocol, instance=True)
+        self.manager.update_display(first_image, mock_display)
+        mock_display.reset_mock()
+
+        regions = [(60, 0, 100, 10), (0, 90, 40, 100)]
+        self.mock_image_processor.calculate_diff_regions.return_value = regions
+        result = self.manager.update_display(second_image, mock_display)
+
+        assert result is True
+        assert [c.args for c in mock_display.display_partial.call_args_list] == [
+            (second_image, region) for region in regions
+        ]
+        mock_display.display.assert_not_called()
+
+    def test_update_display_keeps_tile_hashes(self) -> None:
+        """Test the tile hashes of a displayed image are kept for the next diff."""
+        first_image = Image.new("L", (100, 100), 128)
+        second_image = Image.new("L", (100, 100), 200)
+        third_image = Image.new("L", (100, 100), 0)
+        mock_display = create_autospec(DisplayProtocol, instance=True)
+        self.manager.update_display(first_image, mock_display)
+        self.mock_image_processor.compute_tile_hashes.side_effect = [b"second", b"first", b"third"]
+        self.mock_image_processor.calculate_diff_regions.return_value = [(0, 0, 100, 100)]
+
+        self.manager.update_display(second_image, mock_display)
+        self.manager.update_display(third_image, mock_display)
+
+        # The first image is hashed once when first diffed, each new image as it arrives
+        hashed = [c.args[0] for c in self.mock_image_processor.compute_tile_hashes.call_args_list]
+        assert hashed == [second_image, first_image, third_image]
+        diffs = self.mock_image_processor.calculate_diff_regions.call_args_list
+        assert diffs[0].args[3:] == (b"first", b"second")
+        assert diffs[1].args[3:] == (b"second", b"third")
+        assert self.manager._last_tile_hashes == b"third"
+
+        self.manager.clear_last_image()
+        assert self.manager._last_tile_hashes is None
+
+    def test_update_display_dirty_regions(self) -> None:
+        """Test known dirty regions are refreshed without comparing images."""
+        first_image = Image.new("L", (1872, 1404), 128)
+        second_image = Image.new("L", (1872, 1404), 200)
+        mock_display = create_autospec(DisplayProtocol, instance=True)
+        self.manager.update_display(first_image, mock_display)
+        mock_display.reset_mock()
+
+        regions = [(0, 1000, 1872, 1404), (0, 0, 1872, 48)]
+        result = self.manager.update_display(second_image, mock_display, regions)
+
+        assert result is True
+        assert [c.args for c in mock_display.display_partial.call_args_list] == [
+            (second_image, (0, 0, 1872, 48)),
+            (second_image, (0, 1000, 1872, 1404)),
+        ]
+        self.mock_image_processor.calculate_diff_regions.assert_not_called()
+
+        # Adjacent regions are cheaper to refresh as one update
+        mock_display.reset_mock()
+        regions = [(0, 0, 1872, 48), (0, 48, 1872, 520)]
+        assert self.manager.update_display(first_image, mock_display, regions) is True
+        mock_display.display_partial.assert_called_once_with(first_image, (0, 0, 1872, 520))
+
+        # No dirty regions means nothing changed
+        mock_display.reset_mock()
+        assert self.manager.update_display(first_image, mock_display, []) is False
+        mock_display.display_partial.assert_not_called()
+
     def test_update_display_partial_refresh_no_changes(self) -> None:
         """Test partial refresh when no changes are detected."""
         # Set up initial image
@@ -133,7 +206,7 @@ class TestPartialRefreshManager:
         self.manager.update_display(first_image, mock_display)
 
         # Configure mock to return None (no changes)
-        self.mock_image_processor.calculate_diff_bbox.return_value = None
+        self.mock_image_processor.calculate_diff_regions.return_value = []
 
         # Display second image
         mock_display.reset_mock()
@@ -211,6 +284,81 @@ class TestPartialRefreshManager:
 
         assert self.manager._last_image is None
 
+    def test_init_restores_stored_frame(self) -> None:
+        """Test the stored frame becomes the last image."""
+        image = Image.new("L", (100, 100), 255)
+        frame_store = create_autospec(FrameStore, instance=True)
+        frame_store.load.return_value = (image, b"hashes")
+
+        manager = PartialRefreshManager(
+            self.config, self.mock_image_processor, self.mock_battery_manager, frame_store
+        )
+
+        assert manager.has_last_image
+        assert manager._last_image is image
+        assert manager._last_tile_hashes == b"hashes"
+        assert not self.manager.has_last_image
+
+    def test_prepare_last_image(self) -> None:
+        """Test preparing hashes a displayed image stored without tile hashes, once."""
+        self.manager.prepare_last_image()
+        self.mock_image_processor.compute_tile_hashes.assert_not_called()
+
+        image = Image.new("L", (100, 100), 255)
+        self.manager._last_image = image
+        self.manager.prepare_last_image()
+        self.manager.prepare_last_image()
+
+        self.mock_image_processor.compute_tile_hashes.assert_called_once_with(image)
+        hashes = self.mock_image_processor.compute_tile_hashes.return_value
+        assert self.manager._last_tile_hashes == hashes
+
+    def test_update_last_image_persists(self) -> None:
+        """Test the displayed image is stored with its tile hashes."""
+        frame_store = create_autospec(FrameStore, instance=True)
+        frame_store.load.return_value = None
+        manager = PartialRefreshManager(
+            self.config, self.mock_image_processor, self.mock_battery_manager, frame_store
+        )
+        image = Image.new("L", (100, 100), 255)
+
+        manager._update_last_image(image)
+
+        self.mock_image_processor.compute_tile_hashes.assert_called_once_with(image)
+        hashes = self.mock_image_processor.compute_tile_hashes.return_value
+        frame_store.save.assert_called_once_with(image, hashes)
+        assert manager._last_tile_hashes == hashes
+
+    def test_update_last_image_skips_stored_frame(self) -> None:
+        """Test a frame with the same tile hashes as the stored one isn't stored again."""
+        image = Image.new("L", (100, 100), 255)
+        frame_store = create_autospec(FrameStore, instance=True)
+        frame_store.load.return_value = (image, b"hashes")
+        manager = PartialRefreshManager(
+            self.config, self.mock_image_processor, self.mock_battery_manager, frame_store
+        )
+
+        manager._update_last_image(image.copy(), b"hashes")
+        frame_store.save.assert_not_called()
+
+        changed = Image.new("L", (100, 100), 0)
+        manager._update_last_image(changed, b"changed")
+        frame_store.save.assert_called_once_with(changed, b"changed")
+
+    def test_clear_last_image_stored(self) -> None:
+        """Test clearing removes the stored frame unless asked to keep it."""
+        frame_store = create_autospec(FrameStore, instance=True)
+        frame_store.load.return_value = None
+        manager = PartialRefreshManager(
+            self.config, self.mock_image_processor, self.mock_battery_manager, frame_store
+        )
+
+        manager.clear_last_image(keep_stored=True)
+        frame_store.clear.assert_not_called()
+
+        manager.clear_last_image()
+        frame_store.clear.assert_called_once()
+
     def test_battery_aware_thresholds(self) -> None:
         """Test that battery-aware thresholds are properly used."""
         # Set up different threshold values
@@ -226,14 +374,15 @@ class TestPartialRefreshManager:
 
         # Configure mock to return a bounding box
         bbox = (10, 20, 90, 80)
-        self.mock_image_processor.calculate_diff_bbox.return_value = bbox
+        self.mock_image_processor.calculate_diff_regions.return_value = [bbox]
 
         # Display second image
         self.manager.update_display(second_image, mock_display)
 
         # Verify correct threshold values were used
-        self.mock_image_processor.calculate_diff_bbox.assert_called_once_with(
-            first_image, second_image, 20, 200
+        hashes = self.mock_image_processor.compute_tile_hashes.return_value
+        self.mock_image_processor.calculate_diff_regions.assert_called_once_with(
+            first_image, second_image, DiffThresholds(20, 200), hashes, hashes
         )
 
     def test_display_protocol_implementation(self) -> None:
@@ -268,7 +417,7 @@ class TestPartialRefreshManager:
         # Test partial display
         new_image = Image.new("L", (100, 100), 200)
         bbox = (10, 20, 90, 80)
-        self.mock_image_processor.calculate_diff_bbox.return_value = bbox
+        self.mock_image_processor.calculate_diff_regions.return_value = [bbox]
 
         result = self.manager.update_display(new_image, display)
         assert result is True
@@ -288,7 +437,7 @@ class TestPartialRefreshManager:
         # Second update - partial refresh with changes
         image2 = Image.new("L", (100, 100), 100)
         bbox = (20, 20, 80, 80)
-        self.mock_image_processor.calculate_diff_bbox.return_value = bbox
+        self.mock_image_processor.calculate_diff_regions.return_value = [bbox]
         mock_display.reset_mock()
 
         result2 = self.manager.update_display(image2, mock_display)
@@ -297,7 +446,7 @@ class TestPartialRefreshManager:
 
         # Third update - no changes
         image3 = Image.new("L", (100, 100), 100)
-        self.mock_image_processor.calculate_diff_bbox.return_value = None
+        self.mock_image_processor.calculate_diff_regions.return_value = []
         mock_display.reset_mock()
 
         result3 = self.manager.update_display(image3, mock_display)
@@ -308,7 +457,7 @@ class TestPartialRefreshManager:
         # Fourth update - changes detected again
         image4 = Image.new("L", (100, 100), 150)
         bbox2 = (30, 30, 70, 70)
-        self.mock_image_processor.calculate_diff_bbox.return_value = bbox2
+        self.mock_image_processor.calculate_diff_regions.return_value = [bbox2]
         mock_display.reset_mock()
 
         result4 = self.manager.update_display(image4, mock_display)
@@ -328,7 +477,7 @@ class TestPartialRefreshManager:
 
         # Try to display similar image
         similar_image = Image.new("L", (100, 100), 130)  # Very similar
-        self.mock_image_processor.calculate_diff_bbox.return_value = None
+        self.mock_image_processor.calculate_diff_regions.return_value = []
         mock_display.reset_mock()
 
         result = self.manager.update_display(similar_image, mock_display)
@@ -355,7 +504,7 @@ class TestPartialRefreshManager:
 
         # Configure mock to return a bounding box (even for minimal changes)
         bbox = (0, 0, 100, 100)
-        self.mock_image_processor.calculate_diff_bbox.return_value = bbox
+        self.mock_image_processor.calculate_diff_regions.return_value = [bbox]
 
         # Display second image
         mock_display.reset_mock()
@@ -365,8 +514,9 @@ class TestPartialRefreshManager:
         mock_display.display_partial.assert_called_once_with(second_image, bbox)
 
         # Verify zero thresholds were passed
-        self.mock_image_processor.calculate_diff_bbox.assert_called_once_with(
-            first_image, second_image, 0, 0
+        hashes = self.mock_image_processor.compute_tile_hashes.return_value
+        self.mock_image_processor.calculate_diff_regions.assert_called_once_with(
+            first_image, second_image, DiffThresholds(0, 0), hashes, hashes
         )
 
     def test_display_protocol_methods(self) -> None:
@@ -420,9 +570,9 @@ class TestPartialRefreshManager:
         # Display first image
         self.manager.update_display(first_image, mock_display)
 
-        # Make calculate_diff_bbox raise PartialRefreshError - it will be wrapped by _handle_partial_refresh
+        # Make calculate_diff_regions raise PartialRefreshError - it will be wrapped by _handle_partial_refresh
         error = PartialRefreshError("Partial refresh error", {"test": "data"})
-        self.mock_image_processor.calculate_diff_bbox.side_effect = error
+        self.mock_image_processor.calculate_diff_regions.side_effect = error
 
         with pytest.raises(PartialRefreshError) as exc_info:
             self.manager.update_display(second_image, mock_display)
@@ -458,9 +608,9 @@ class TestPartialRefreshManager:
         # Set last image
         self.manager._last_image = first_image
 
-        # Make calculate_diff_bbox raise a general exception
+        # Make calculate_diff_regions raise a general exception
         original_error = ValueError("Invalid calculation")
-        self.mock_image_processor.calculate_diff_bbox.side_effect = original_error
+        self.mock_image_processor.calculate_diff_regions.side_effect = original_error
 
         with pytest.raises(PartialRefreshError) as exc_info:
             self.manager._handle_partial_refresh(second_image, mock_display)
@@ -469,7 +619,7 @@ class TestPartialRefreshManager:
         assert "Failed to perform partial refresh" in str(exc_info.value)
         assert exc_info.value.details["pixel_threshold"] == 10
         assert exc_info.value.details["min_changed_pixels"] == 100
-        assert exc_info.value.details["bbox"] is None
+        assert exc_info.value.details["regions"] is None
         assert "Invalid calculation" in exc_info.value.details["error"]
 
     def test_handle_partial_refresh_display_error(self) -> None:
@@ -484,7 +634,7 @@ class TestPartialRefreshManager:
 
         # Configure mock to return a bounding box
         bbox = (10, 20, 90, 80)
-        self.mock_image_processor.calculate_diff_bbox.return_value = bbox
+        self.mock_image_processor.calculate_diff_regions.return_value = [bbox]
 
         # Make display_partial raise an exception
         original_error = OSError("Display communication error")
@@ -497,7 +647,7 @@ class TestPartialRefreshManager:
         assert "Failed to perform partial refresh" in str(exc_info.value)
         assert exc_info.value.details["pixel_threshold"] == 10
         assert exc_info.value.details["min_changed_pixels"] == 100
-        assert exc_info.value.details["bbox"] == bbox
+        assert exc_info.value.details["regions"] == [bbox]
         assert "Display communication error" in exc_info.value.details["error"]
 
     def test_handle_full_refresh_exception_handling(self) -> None:
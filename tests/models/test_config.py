@@ -99,6 +99,38 @@ class TestWeatherConfig:
         error_details = str(excinfo.value)
         assert "Hourly forecast count must be between 1 and 48" in error_details
 
+    def test_location_grid_degrees_validator(self) -> None:
+        """Test validator for location_grid_degrees."""
+        assert WeatherConfig(api_key="test_key").location_grid_degrees == 0.0
+        grid = WeatherConfig(api_key="test_key", location_grid_degrees=0.05)
+        assert grid.location_grid_degrees == 0.05
+
+        with pytest.raises(ValidationError) as excinfo:
+            WeatherConfig(api_key="test_key", location_grid_degrees=-0.1)
+        assert "Location grid must be between 0 and 1 degree" in str(excinfo.value)
+
+    def test_api_call_limit_validator(self) -> None:
+        """Test validator for API call limits."""
+        config = WeatherConfig(api_key="test_key")
+        assert (config.api_calls_per_minute, config.api_calls_per_day) == (60, 1000)
+
+        with pytest.raises(ValidationError) as excinfo:
+            WeatherConfig(api_key="test_key", api_calls_per_day=1)
+        assert "API call limits must allow at least 2 calls" in str(excinfo.value)
+
+    def test_location_key(self) -> None:
+        """Test the location key covers coordinates or city, units and language."""
+        located = WeatherConfig(api_key="test_key", location={"lat": 51.5, "lon": -0.13})
+        assert located.location_key == "51.5,-0.13_metric_en"
+
+        on_equator = WeatherConfig(api_key="test_key", location={"lat": 0, "lon": 0})
+        assert on_equator.location_key == "0.0,0.0_metric_en"
+
+        by_city = WeatherConfig(
+            api_key="test_key", location={}, city_name="Paris", units="imperial", language="fr"
+        )
+        assert by_city.location_key == "city:Paris_imperial_fr"
+
 
 class TestDisplayConfig:
     """Test cases for DisplayConfig model."""
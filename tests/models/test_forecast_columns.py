@@ -0,0 +1,89 @@
+"""Tests for the columnar forecast view."""
+
+# pyright: reportPrivateUsage=false
+
+import json
+import math
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from rpi_weather_display.models.forecast_columns import ForecastColumns
+from rpi_weather_display.models.weather import WeatherData
+
+MOCK_RESPONSE_PATH = Path(__file__).parent.parent / "data" / "mock_weather_response.json"
+BASE_DT = 1_700_000_000
+
+
+def _weather(temps: list[float], uvis: list[float] | None = None) -> WeatherData:
+    """Create weather data with one hourly forecast per temperature."""
+    data: dict[str, Any] = json.loads(MOCK_RESPONSE_PATH.read_bytes())
+    hour = data["hourly"][0]
+    uvis = uvis or [0.0] * len(temps)
+    data["hourly"] = [
+        {**hour, "dt": BASE_DT + i * 3600, "temp": temp, "uvi": uvi}
+        for i, (temp, uvi) in enumerate(zip(temps, uvis, strict=True))
+    ]
+    return WeatherData.model_validate(data)
+
+
+class TestForecastColumns:
+    """Tests for ForecastColumns."""
+
+    def test_columns_match_models(self) -> None:
+        """Test every array is aligned with the forecast models."""
+        weather = _weather([10.0, 12.0, 11.0])
+        columns = weather.columns
+        assert columns is not None
+
+        assert columns.hourly_dt.tolist() == [hour.dt for hour in weather.hourly]
+        assert columns.hourly_temp.tolist() == [10.0, 12.0, 11.0]
+        assert columns.daily_temp_max.tolist() == [day.temp.max for day in weather.daily]
+        assert columns.daily_precipitation.tolist() == [
+            (day.rain or 0.0) + (day.snow or 0.0) for day in weather.daily
+        ]
+
+    def test_missing_optional_values(self) -> None:
+        """Test missing gusts become NaN and missing precipitation zero."""
+        weather = _weather([10.0, 11.0])
+        weather.hourly[0].wind_gust = None
+        weather.hourly[0].rain = None
+        weather.hourly[1].rain = {"1h": 0.4}
+        weather.hourly[1].snow = {"1h": 0.1}
+
+        columns = ForecastColumns.build(weather.hourly, weather.daily)
+        assert columns is not None
+
+        assert math.isnan(columns.hourly_wind_gust[0])
+        assert columns.hourly_precipitation.tolist() == pytest.approx([0.0, 0.5])
+
+    def test_view_is_cached(self) -> None:
+        """Test the view is built once per weather data object."""
+        weather = _weather([10.0])
+
+        assert weather.columns is weather.columns
+        assert "_columns" not in weather.model_dump()
+
+    def test_without_numpy(self) -> None:
+        """Test no view is built when numpy is not installed."""
+        weather = _weather([10.0])
+
+        with patch(
+            "rpi_weather_display.models.forecast_columns._import_numpy", return_value=None
+        ):
+            assert weather.columns is None
+
+    def test_hourly_max_between(self) -> None:
+        """Test the maximum is limited to the range and ties go to the earliest hour."""
+        weather = _weather([0.0] * 5, uvis=[1.0, 6.0, 3.0, 6.0, 9.0])
+        columns = weather.columns
+        assert columns is not None
+
+        end = BASE_DT + 3 * 3600
+        assert columns.hourly_max_between(columns.hourly_uvi, BASE_DT, end) == (
+            6.0,
+            BASE_DT + 3600,
+        )
+        assert columns.hourly_max_between(columns.hourly_uvi, 0, BASE_DT - 1) is None
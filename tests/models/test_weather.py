@@ -4,6 +4,7 @@ This module tests the Pydantic models for weather information, ensuring
 that models correctly validate input data and compute derived properties.
 """
 
+import json
 from datetime import datetime
 from typing import TypedDict
 
@@ -13,11 +14,13 @@ from pydantic import ValidationError
 from rpi_weather_display.models.weather import (
     AirPollution,
     AirPollutionData,
+    AirPollutionResponse,
     CurrentWeather,
     DailyFeelsLike,
     DailyTemp,
     DailyWeather,
     HourlyWeather,
+    OneCallResponse,
     WeatherCondition,
     WeatherData,
 )
@@ -424,6 +427,26 @@ def test_air_pollution_data(air_pollution_data: AirPollutionDataDict) -> None:
     # Check nested models
     assert pollution_data.components.co == 200.5
     assert pollution_data.components.pm2_5 == 8.2
+    # The AQI reported in main is copied into the components
+    assert pollution_data.components.aqi == 2
+
+
+def test_response_models_from_json(weather_data: WeatherDataDict) -> None:
+    """Test API response models validate directly from raw JSON bytes."""
+    air_pollution = weather_data["air_pollution"]
+    one_call = {key: value for key, value in weather_data.items() if key != "air_pollution"}
+
+    forecast = OneCallResponse.model_validate_json(json.dumps(one_call).encode("utf-8"))
+    assert forecast.current.temp == weather_data["current"]["temp"]
+    assert isinstance(forecast.hourly[0], HourlyWeather)
+    assert isinstance(forecast.daily[0].temp, DailyTemp)
+
+    air = AirPollutionResponse.model_validate_json(json.dumps({"list": [air_pollution]}))
+    assert air.entries[0].aqi == 2
+    assert AirPollutionResponse.model_validate_json(b'{"coord": {}, "list": []}').entries == []
+
+    with pytest.raises(ValidationError):
+        OneCallResponse.model_validate_json(b'{"lat": 1.0}')
 
 
 def test_weather_data(weather_data: WeatherDataDict) -> None:
@@ -3,6 +3,7 @@
 # File-level directive to ignore protected usage warnings
 # pyright: reportPrivateUsage=false
 
+import asyncio
 from collections.abc import Generator
 from pathlib import Path
 
@@ -21,6 +22,8 @@ from rpi_weather_display.exceptions import (
 from rpi_weather_display.models.config import AppConfig
 from rpi_weather_display.models.weather import WeatherData
 from rpi_weather_display.server.api import WeatherAPIClient
+from rpi_weather_display.server.quota_governor import QuotaGovernor, RequestPriority
+from rpi_weather_display.server.weather_cache import WeatherCacheIndex
 from rpi_weather_display.utils.file_utils import JsonData, read_json
 from rpi_weather_display.utils.path_utils import path_resolver
 
@@ -90,6 +93,18 @@ async def test_get_coordinates_from_config(app_config: AppConfig) -> None:
     assert lon == -85.456
 
 
+@pytest.mark.asyncio()
+async def test_get_coordinates_zero_coordinates(app_config: AppConfig) -> None:
+    """Test zero latitude and longitude are used rather than geocoding the city."""
+    app_config.weather.location = {"lat": 0.0, "lon": 0.0}
+    api_client = WeatherAPIClient(app_config.weather)
+
+    with patch.object(api_client, "_geocode_city") as mock_geocode:
+        assert await api_client.get_coordinates() == (0.0, 0.0)
+
+    mock_geocode.assert_not_called()
+
+
 @pytest.mark.asyncio()
 async def test_get_coordinates_no_location(app_config: AppConfig) -> None:
     """Test error when no location info is provided."""
@@ -341,6 +356,23 @@ async def test_get_weather_data_http_error_with_cache(
     assert result == weather
 
 
+@pytest.mark.asyncio()
+async def test_get_weather_data_invalid_response(
+    app_config: AppConfig, mock_httpx_client: AsyncMock
+) -> None:
+    """Test a response that fails model validation raises InvalidAPIResponseError."""
+    mock_httpx_client.get.return_value = create_mock_response(200, {"lat": 40.7128})
+    app_config.weather.location = {"lat": 40.7128, "lon": -74.0060}
+    api_client = WeatherAPIClient(app_config.weather)
+
+    with pytest.raises(InvalidAPIResponseError) as excinfo:
+        await api_client.get_weather_data()
+
+    assert excinfo.value.status_code == 200
+    assert excinfo.value.details["endpoint"] == api_client.BASE_URL
+    assert excinfo.value.details["errors"] > 0
+
+
 @pytest.mark.asyncio()
 async def test_get_weather_data_uses_cache(
     app_config: AppConfig, mock_weather_data: JsonData, mock_httpx_client: AsyncMock
@@ -617,3 +649,131 @@ async def test_get_coordinates_city_name_non_state_abbreviation(
     args, kwargs = mock_httpx_client.get.call_args
     assert args[0] == api_client.GEOCODING_URL
     assert kwargs["params"]["q"] == "Paris,France"  # With spaces removed, but no US added
+
+
+def test_snap_to_grid(app_config: AppConfig) -> None:
+    """Test coordinates are snapped to the configured grid."""
+    app_config.weather.location_grid_degrees = 0.05
+    api_client = WeatherAPIClient(app_config.weather)
+
+    assert api_client._snap_to_grid(40.7128, -74.0060) == (40.7, -74.0)
+    assert api_client._snap_to_grid(40.7261, -73.9749) == (40.75, -73.95)
+
+
+def test_snap_to_grid_disabled(app_config: AppConfig) -> None:
+    """Test coordinates are unchanged when the grid is disabled."""
+    app_config.weather.location_grid_degrees = 0.0
+    api_client = WeatherAPIClient(app_config.weather)
+
+    assert api_client._snap_to_grid(40.7128, -74.0060) == (40.7128, -74.0060)
+
+
+@pytest.mark.asyncio()
+async def test_get_weather_data_shares_grid_cell(
+    app_config: AppConfig, mock_weather_data: JsonData
+) -> None:
+    """Test nearby clients sharing a cache index make one upstream fetch."""
+    app_config.weather.location_grid_degrees = 0.1
+    cache_index = WeatherCacheIndex(ttl_seconds=1800)
+    weather = WeatherData.model_validate(mock_weather_data)
+    clients: list[WeatherAPIClient] = []
+    for offset in (0.0, 0.002, 0.004):
+        config = app_config.weather.model_copy(
+            update={"location": {"lat": 40.71 + offset, "lon": -74.0}}
+        )
+        clients.append(WeatherAPIClient(config, cache_index))
+
+    with patch.object(
+        WeatherAPIClient, "_fetch_weather_data", AsyncMock(return_value=weather)
+    ) as mock_fetch:
+        results = await asyncio.gather(*(client.get_weather_data() for client in clients))
+
+    mock_fetch.assert_awaited_once_with(40.7, -74.0)
+    assert all(result is weather for result in results)
+    assert cache_index.upstream_fetches == 1
+    assert cache_index.requests == 3
+
+
+@pytest.mark.asyncio()
+async def test_get_weather_data_background_quota_falls_back_to_cache(
+    app_config: AppConfig, mock_weather_data: JsonData
+) -> None:
+    """Test background refreshes refused by the quota governor serve cached data."""
+    governor = QuotaGovernor(calls_per_minute=60, calls_per_day=10)
+    api_client = WeatherAPIClient(app_config.weather, quota_governor=governor)
+    weather = WeatherData.model_validate(mock_weather_data)
+
+    with patch.object(
+        WeatherAPIClient, "_fetch_weather_data", AsyncMock(return_value=weather)
+    ) as mock_fetch:
+        # Interactive fetches use 2 calls each, leaving only the interactive reserve
+        for _ in range(4):
+            await api_client.get_weather_data(force_refresh=True)
+
+        result = await api_client.get_weather_data(
+            force_refresh=True, priority=RequestPriority.BACKGROUND
+        )
+        assert result is weather
+        assert mock_fetch.await_count == 4
+
+        # Interactive requests may still use the reserve
+        await api_client.get_weather_data(force_refresh=True)
+        assert mock_fetch.await_count == 5
+
+
+@pytest.mark.asyncio()
+async def test_prefetch_weather_data_near_expiry(
+    app_config: AppConfig, mock_weather_data: JsonData
+) -> None:
+    """Test served data is refreshed in the background only shortly before it expires."""
+    governor = QuotaGovernor(calls_per_minute=60, calls_per_day=10)
+    api_client = WeatherAPIClient(app_config.weather, quota_governor=governor)
+    weather = WeatherData.model_validate(mock_weather_data)
+
+    with patch.object(
+        WeatherAPIClient, "_fetch_weather_data", AsyncMock(return_value=weather)
+    ) as mock_fetch:
+        # Nothing served yet
+        await api_client.prefetch_weather_data()
+        assert mock_fetch.await_count == 0
+
+        # Freshly fetched data isn't close to expiry
+        await api_client.get_weather_data()
+        await api_client.prefetch_weather_data()
+        assert mock_fetch.await_count == 1
+
+        with patch("rpi_weather_display.server.api.WEATHER_PREFETCH_LEAD_SECONDS", 10**6):
+            await api_client.prefetch_weather_data()
+            assert mock_fetch.await_count == 2
+
+            # Background pre-fetches stop at the budget reserved for renders
+            await api_client.get_weather_data(force_refresh=True)
+            await api_client.get_weather_data(force_refresh=True)
+            await api_client.prefetch_weather_data()
+            assert mock_fetch.await_count == 4
+
+    assert governor.get_status()["keys"][0]["calls_today"] == 8
+
+
+@pytest.mark.asyncio()
+async def test_cache_ttl_stretches_as_quota_runs_low(
+    app_config: AppConfig, mock_weather_data: JsonData
+) -> None:
+    """Test cached data is kept longer as the daily budget runs low."""
+    governor = QuotaGovernor(calls_per_minute=1000, calls_per_day=1000)
+    api_client = WeatherAPIClient(app_config.weather, quota_governor=governor)
+    ttl = api_client._cache.ttl_seconds
+    weather = WeatherData.model_validate(mock_weather_data)
+
+    with patch.object(WeatherAPIClient, "_fetch_weather_data", AsyncMock(return_value=weather)):
+        await api_client.get_weather_data()
+
+    expiry = api_client.get_data_expiry()
+    assert expiry is not None
+    assert api_client._effective_ttl_seconds() == ttl
+
+    # Using all but the last API calls stretches the TTL towards the maximum
+    governor.acquire(app_config.weather.api_key, cost=998)
+    stretched = api_client.get_data_expiry()
+    assert stretched is not None
+    assert (stretched - expiry).total_seconds() == pytest.approx(3 * ttl, rel=0.01)
@@ -0,0 +1,281 @@
+"""Tests for the upstream circuit breaker."""
+
+# pyright: reportPrivateUsage=false
+
+import asyncio
+import json
+import threading
+import time
+from collections.abc import Generator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, ClassVar
+from unittest.mock import patch
+
+import pytest
+
+from rpi_weather_display.exceptions import (
+    APIAuthenticationError,
+    CircuitOpenError,
+    WeatherAPIError,
+)
+from rpi_weather_display.models.config import AppConfig
+from rpi_weather_display.server.api import WeatherAPIClient
+from rpi_weather_display.server.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerPolicy,
+    CircuitState,
+)
+from rpi_weather_display.utils.file_utils import read_json
+
+MOCK_RESPONSE_PATH = Path(__file__).parent.parent / "data" / "mock_weather_response.json"
+MONOTONIC = "rpi_weather_display.server.circuit_breaker.time.monotonic"
+
+
+async def _fail(breaker: CircuitBreaker) -> None:
+    """Make one failing call through the breaker."""
+    with pytest.raises(WeatherAPIError):
+        async with breaker.guard():
+            raise WeatherAPIError("Upstream error")
+
+
+async def _succeed(breaker: CircuitBreaker) -> None:
+    """Make one successful call through the breaker."""
+    async with breaker.guard():
+        pass
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker state transitions."""
+
+    @pytest.mark.asyncio()
+    async def test_opens_on_failure_rate(self) -> None:
+        """Test the circuit opens once the failure rate reaches the threshold."""
+        breaker = CircuitBreaker(
+            "test", CircuitBreakerPolicy(failure_rate_threshold=0.5, min_calls=4)
+        )
+
+        await _succeed(breaker)
+        await _fail(breaker)
+        await _succeed(breaker)
+        assert breaker.state is CircuitState.CLOSED
+
+        await _fail(breaker)
+        assert breaker.state is CircuitState.OPEN
+        assert breaker.times_opened == 1
+
+        with pytest.raises(CircuitOpenError) as excinfo:
+            await _succeed(breaker)
+        assert excinfo.value.details["retry_at"] is not None
+
+    @pytest.mark.asyncio()
+    async def test_opens_on_slow_calls(self) -> None:
+        """Test the circuit opens when calls succeed but are too slow."""
+        breaker = CircuitBreaker("test", CircuitBreakerPolicy(slow_call_seconds=2.0, min_calls=3))
+
+        with patch(MONOTONIC, side_effect=[0.0, 3.0, 3.0, 6.0, 6.0, 9.0, 9.0]):
+            for _ in range(3):
+                await _succeed(breaker)
+
+        assert breaker._state is CircuitState.OPEN
+        assert breaker.get_status()["slow_call_rate"] == 1.0
+
+    @pytest.mark.asyncio()
+    async def test_half_open_probe_closes_circuit(self) -> None:
+        """Test a successful probe after the cool-down closes the circuit."""
+        breaker = CircuitBreaker("test", CircuitBreakerPolicy(min_calls=1, open_seconds=30.0))
+
+        with patch(MONOTONIC, return_value=100.0):
+            await _fail(breaker)
+            assert breaker.state is CircuitState.OPEN
+
+        with patch(MONOTONIC, return_value=130.0):
+            assert breaker.state is CircuitState.HALF_OPEN
+            async with breaker.guard():
+                # Only one probe at a time
+                with pytest.raises(CircuitOpenError):
+                    await _succeed(breaker)
+
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.get_status()["calls_in_window"] == 0
+
+    @pytest.mark.asyncio()
+    async def test_half_open_probe_failure_reopens(self) -> None:
+        """Test a failed probe opens the circuit for another cool-down."""
+        breaker = CircuitBreaker("test", CircuitBreakerPolicy(min_calls=1, open_seconds=30.0))
+
+        with patch(MONOTONIC, return_value=100.0):
+            await _fail(breaker)
+        with patch(MONOTONIC, return_value=130.0):
+            await _fail(breaker)
+            assert breaker.state is CircuitState.OPEN
+        with patch(MONOTONIC, return_value=159.0):
+            assert breaker.state is CircuitState.OPEN
+
+        assert breaker.times_opened == 2
+
+    @pytest.mark.asyncio()
+    async def test_cancelled_probe_frees_probe_slot(self) -> None:
+        """Test a cancelled probe lets the next call probe instead of failing forever."""
+        breaker = CircuitBreaker("test", CircuitBreakerPolicy(min_calls=1, open_seconds=30.0))
+        started = asyncio.Event()
+
+        async def probe() -> None:
+            async with breaker.guard():
+                started.set()
+                await asyncio.sleep(60)
+
+        with patch(MONOTONIC, return_value=100.0):
+            await _fail(breaker)
+
+        with patch(MONOTONIC, return_value=130.0):
+            task = asyncio.create_task(probe())
+            await started.wait()
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+            assert breaker.state is CircuitState.HALF_OPEN
+            await _succeed(breaker)
+
+        assert breaker.state is CircuitState.CLOSED
+
+    @pytest.mark.asyncio()
+    async def test_non_outage_errors_not_recorded(self) -> None:
+        """Test authentication and rate limit errors don't count as outages."""
+        breaker = CircuitBreaker("test", CircuitBreakerPolicy(min_calls=1))
+
+        with pytest.raises(APIAuthenticationError):
+            async with breaker.guard():
+                raise APIAuthenticationError("Invalid API key", status_code=401)
+
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.get_status()["calls_in_window"] == 0
+
+
+class _StubOpenWeatherMap(BaseHTTPRequestHandler):
+    """Local stand-in for the OpenWeatherMap API with injectable faults."""
+
+    fault: ClassVar[str | None] = None  # None, "error" or "slow"
+    delay: ClassVar[float] = 0.0
+    requests: ClassVar[int] = 0
+    weather: ClassVar[dict[str, Any]] = {}
+
+    def do_GET(self) -> None:
+        """Serve a weather or air pollution response, or an injected fault."""
+        type(self).requests += 1
+        if self.fault == "slow":
+            time.sleep(self.delay)
+        if self.fault == "error":
+            self._send(503, {"message": "Service Unavailable"})
+        elif self.path.startswith("/air_pollution"):
+            self._send(200, {"list": []})
+        else:
+            self._send(200, self.weather)
+
+    def _send(self, status: int, body: dict[str, Any]) -> None:
+        """Send a JSON response."""
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args: Any) -> None:
+        """Silence request logging."""
+
+
+@pytest.fixture()
+def stub_server() -> Generator[str, None, None]:
+    """Run a local stub OpenWeatherMap server, yielding its base URL."""
+    _StubOpenWeatherMap.fault = None
+    _StubOpenWeatherMap.requests = 0
+    _StubOpenWeatherMap.weather = read_json(MOCK_RESPONSE_PATH)  # type: ignore[assignment]
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubOpenWeatherMap)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _stub_client(
+    app_config: AppConfig, base_url: str, breaker: CircuitBreaker
+) -> WeatherAPIClient:
+    """Create a weather API client pointed at the stub server."""
+    client = WeatherAPIClient(app_config.weather, circuit_breaker=breaker)
+    client.BASE_URL = f"{base_url}/onecall"
+    client.AIR_POLLUTION_URL = f"{base_url}/air_pollution"
+    return client
+
+
+@pytest.mark.integration()
+class TestCircuitBreakerFaultInjection:
+    """Fault injection tests against a local stub weather API."""
+
+    @pytest.mark.asyncio()
+    async def test_outage_serves_stale_cache_without_upstream_calls(
+        self, app_config: AppConfig, stub_server: str
+    ) -> None:
+        """Test an open circuit falls back to stale cache immediately."""
+        breaker = CircuitBreaker("stub", CircuitBreakerPolicy(min_calls=2, open_seconds=0.2))
+        client = _stub_client(app_config, stub_server, breaker)
+        fresh = await client.get_weather_data()
+
+        _StubOpenWeatherMap.fault = "error"
+        for _ in range(2):
+            assert await client.get_weather_data(force_refresh=True) is fresh
+        assert breaker.state is CircuitState.OPEN
+        upstream_requests = _StubOpenWeatherMap.requests
+
+        # Expired cache entries are still served while the circuit is open
+        with patch("time.time", return_value=time.time() + 86400):
+            for _ in range(5):
+                assert await client.get_weather_data() is fresh
+        assert _StubOpenWeatherMap.requests == upstream_requests
+
+        # Once the provider recovers, the half-open probe closes the circuit
+        _StubOpenWeatherMap.fault = None
+        time.sleep(0.25)
+        recovered = await client.get_weather_data(force_refresh=True)
+        assert recovered is not fresh
+        assert breaker.state is CircuitState.CLOSED
+
+    @pytest.mark.asyncio()
+    async def test_slow_upstream_opens_circuit(
+        self, app_config: AppConfig, stub_server: str
+    ) -> None:
+        """Test slow responses open the circuit so later requests don't wait."""
+        breaker = CircuitBreaker(
+            "stub", CircuitBreakerPolicy(slow_call_seconds=0.1, min_calls=2)
+        )
+        client = _stub_client(app_config, stub_server, breaker)
+        await client.get_weather_data()
+
+        _StubOpenWeatherMap.fault = "slow"
+        _StubOpenWeatherMap.delay = 0.1
+        for _ in range(2):
+            await client.get_weather_data(force_refresh=True)
+        assert breaker.state is CircuitState.OPEN
+
+        start = time.monotonic()
+        result = await client.get_weather_data(force_refresh=True)
+        assert time.monotonic() - start < 0.1
+        assert client._last_cache_key is not None
+        assert result is client._cache.get_stale(client._last_cache_key)
+
+    @pytest.mark.asyncio()
+    async def test_outage_without_cache_fails_fast(
+        self, app_config: AppConfig, stub_server: str
+    ) -> None:
+        """Test requests with nothing cached fail immediately while the circuit is open."""
+        breaker = CircuitBreaker("stub", CircuitBreakerPolicy(min_calls=1))
+        client = _stub_client(app_config, stub_server, breaker)
+        _StubOpenWeatherMap.fault = "error"
+
+        with pytest.raises(WeatherAPIError):
+            await client.get_weather_data()
+        with pytest.raises(CircuitOpenError):
+            await client.get_weather_data()
+        assert _StubOpenWeatherMap.requests == 1
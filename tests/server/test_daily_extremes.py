@@ -0,0 +1,157 @@
+"""Tests for the in-memory daily extremes tracker."""
+
+import threading
+from datetime import date
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from rpi_weather_display.server.daily_extremes import DailyExtremesTracker
+from rpi_weather_display.utils.file_utils import read_json
+
+TODAY = date(2024, 5, 25)
+NOON = 1_716_638_400  # 2024-05-25 12:00 UTC
+MONOTONIC = "rpi_weather_display.server.daily_extremes.time.monotonic"
+
+
+class TestDailyExtremesTracker:
+    """Tests for DailyExtremesTracker."""
+
+    def test_update_max_keeps_highest(self) -> None:
+        """Test the maximum and its timestamp are only replaced by higher values."""
+        tracker = DailyExtremesTracker()
+
+        assert tracker.update_max("home", "uvi", TODAY, 4.0, NOON) == (4.0, NOON)
+        assert tracker.update_max("home", "uvi", TODAY, 3.0, NOON + 60) == (4.0, NOON)
+        assert tracker.update_max("home", "uvi", TODAY, 6.0, NOON + 120) == (6.0, NOON + 120)
+        assert tracker.get_max("home", "uvi", TODAY) == (6.0, NOON + 120)
+
+    def test_values_reset_on_new_day(self) -> None:
+        """Test a new day starts without the previous day's values."""
+        tracker = DailyExtremesTracker()
+        tracker.update_max("home", "temp", TODAY, 30.0, NOON)
+        tracker.add_hourly_amount("home", "precipitation", TODAY, NOON, 2.0)
+        tomorrow = date(2024, 5, 26)
+
+        assert tracker.get_max("home", "temp", tomorrow) is None
+        assert tracker.update_max("home", "temp", tomorrow, 20.0, NOON + 86400) == (
+            20.0,
+            NOON + 86400,
+        )
+        assert tracker.get_total("home", "precipitation", tomorrow) == 0.0
+
+    def test_locations_are_independent(self) -> None:
+        """Test each location keeps its own extremes."""
+        tracker = DailyExtremesTracker()
+        tracker.update_max("home", "temp", TODAY, 30.0, NOON)
+        tracker.update_max("cabin", "temp", TODAY, 12.0, NOON)
+
+        assert tracker.get_max("home", "temp", TODAY) == (30.0, NOON)
+        assert tracker.get_max("cabin", "temp", TODAY) == (12.0, NOON)
+
+    def test_hourly_amounts_not_double_counted(self) -> None:
+        """Test repeated observations within an hour replace rather than add."""
+        tracker = DailyExtremesTracker()
+
+        tracker.add_hourly_amount("home", "precipitation", TODAY, NOON, 0.5)
+        tracker.add_hourly_amount("home", "precipitation", TODAY, NOON + 600, 0.8)
+        total = tracker.add_hourly_amount("home", "precipitation", TODAY, NOON + 3600, 0.3)
+
+        assert total == pytest.approx(1.1)
+        assert tracker.get_total("home", "precipitation", TODAY) == pytest.approx(1.1)
+
+    def test_readers_wait_for_writers(self) -> None:
+        """Test reads wait while another thread holds the tracker's lock."""
+        tracker = DailyExtremesTracker()
+        tracker.update_max("home", "temp", TODAY, 30.0, NOON)
+        results: list[object] = []
+
+        def read() -> None:
+            results.append(tracker.get_max("home", "temp", TODAY))
+            results.append(tracker.get_total("home", "precipitation", TODAY))
+
+        with tracker._lock:  # pyright: ignore[reportPrivateUsage]
+            reader = threading.Thread(target=read)
+            reader.start()
+            reader.join(timeout=0.05)
+            assert results == []
+
+        reader.join()
+        assert results == [(30.0, NOON), 0.0]
+
+    def test_flush_and_reload(self, tmp_path: Path) -> None:
+        """Test flushed extremes are loaded by a new tracker."""
+        state_file = tmp_path / "daily_extremes.json"
+        tracker = DailyExtremesTracker(state_file)
+        tracker.update_max("home", "uvi", TODAY, 7.5, NOON)
+        tracker.add_hourly_amount("home", "precipitation", TODAY, NOON, 1.5)
+
+        assert not any(tmp_path.iterdir())
+        tracker.flush()
+
+        restored = DailyExtremesTracker(state_file)
+        assert restored.get_max("home", "uvi", TODAY) == (7.5, NOON)
+        assert restored.get_total("home", "precipitation", TODAY) == 1.5
+
+    def test_flush_only_when_changed(self, tmp_path: Path) -> None:
+        """Test flushing without changes doesn't write the state file."""
+        state_file = tmp_path / "daily_extremes.json"
+        tracker = DailyExtremesTracker(state_file)
+        tracker.update_max("home", "uvi", TODAY, 7.5, NOON)
+        tracker.flush()
+
+        tracker.update_max("home", "uvi", TODAY, 2.0, NOON)
+        with patch("rpi_weather_display.server.daily_extremes.file_utils.atomic_write") as write:
+            tracker.flush()
+
+        write.assert_not_called()
+        assert read_json(state_file) is not None
+
+    def test_flush_due_after_interval(self, tmp_path: Path) -> None:
+        """Test a periodic flush is due once there are changes and the interval passed."""
+        with patch(MONOTONIC, return_value=0.0):
+            tracker = DailyExtremesTracker(tmp_path / "state.json", flush_interval_seconds=300)
+            tracker.update_max("home", "uvi", TODAY, 7.5, NOON)
+            assert not tracker.flush_due
+
+        with patch(MONOTONIC, return_value=300.0):
+            assert tracker.flush_due
+            tracker.flush()
+            assert not tracker.flush_due
+
+    def test_unpersisted_tracker_never_due(self) -> None:
+        """Test a tracker without a state file never needs flushing."""
+        tracker = DailyExtremesTracker(flush_interval_seconds=0)
+        tracker.update_max("home", "uvi", TODAY, 7.5, NOON)
+
+        assert not tracker.flush_due
+        tracker.flush()
+
+    def test_write_error_keeps_changes(
+        self, tmp_path: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test changes stay unsaved when the state file can't be written."""
+        tracker = DailyExtremesTracker(tmp_path / "state.json", flush_interval_seconds=0)
+        tracker.update_max("home", "uvi", TODAY, 7.5, NOON)
+
+        with patch(
+            "rpi_weather_display.server.daily_extremes.file_utils.atomic_write",
+            side_effect=OSError("Disk full"),
+        ):
+            tracker.flush()
+
+        assert "Error writing daily extremes" in caplog.text
+        assert tracker.flush_due
+
+    def test_corrupt_state_ignored(
+        self, tmp_path: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test an unreadable state file starts with no extremes."""
+        state_file = tmp_path / "daily_extremes.json"
+        state_file.write_text("{not json")
+
+        tracker = DailyExtremesTracker(state_file)
+
+        assert "Error reading daily extremes" in caplog.text
+        assert tracker.get_max("home", "uvi", TODAY) is None
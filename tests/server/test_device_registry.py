@@ -0,0 +1,309 @@
+"""Tests for the multi-device registry and device-aware rendering."""
+
+# pyright: reportPrivateUsage=false
+
+from collections.abc import Generator
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from rpi_weather_display.exceptions import MissingConfigError
+from rpi_weather_display.models.config import AppConfig, DeviceProfile
+from rpi_weather_display.models.system import BatteryStatus
+from rpi_weather_display.models.weather import AirPollutionData, OneCallResponse, WeatherData
+from rpi_weather_display.server.api import WeatherAPIClient
+from rpi_weather_display.server.device_registry import DeviceRegistry
+from rpi_weather_display.server.main import WeatherDisplayServer
+from rpi_weather_display.server.renderer import PreparedDisplay, WeatherRenderer
+from rpi_weather_display.utils.file_utils import read_json
+
+MOCK_RESPONSE_PATH = Path(__file__).parent.parent / "data" / "mock_weather_response.json"
+
+BATTERY_PAYLOAD = {
+    "level": 80,
+    "state": "discharging",
+    "voltage": 3.7,
+    "current": -0.5,
+    "temperature": 25.0,
+}
+
+
+@pytest.fixture()
+def server_config(test_config: AppConfig, tmp_path: Path) -> AppConfig:
+    """Create a configuration whose server caches and API quota state live in tmp_path."""
+    server = test_config.server.model_copy(update={"cache_dir": str(tmp_path)})
+    return test_config.model_copy(update={"server": server})
+
+
+@pytest.fixture()
+def multi_device_config(server_config: AppConfig) -> AppConfig:
+    """Create a configuration with devices in several locations."""
+    return server_config.model_copy(
+        update={
+            "devices": {
+                "kitchen": DeviceProfile(location={"lat": 40.7128, "lon": -74.006}),
+                "office": DeviceProfile(
+                    location={"lat": 40.7128, "lon": -74.006}, width=1872, height=1404
+                ),
+                "cabin": DeviceProfile(city_name="Aspen", units="imperial", rotate=90),
+                "hall": DeviceProfile(),
+            }
+        }
+    )
+
+
+class TestDeviceRegistry:
+    """Tests for resolving device profiles."""
+
+    def test_default_profile(self, multi_device_config: AppConfig, template_dir: Path) -> None:
+        """Test requests without a device ID use the server configuration."""
+        registry = DeviceRegistry(multi_device_config, template_dir)
+        assert registry.get_config(None) is multi_device_config
+
+    def test_unknown_device(self, multi_device_config: AppConfig, template_dir: Path) -> None:
+        """Test unknown device IDs are rejected."""
+        registry = DeviceRegistry(multi_device_config, template_dir)
+        with pytest.raises(MissingConfigError) as excinfo:
+            registry.get_config("garage")
+        assert excinfo.value.details["device_id"] == "garage"
+
+    def test_profile_overrides(self, multi_device_config: AppConfig, template_dir: Path) -> None:
+        """Test profile fields override the server configuration."""
+        registry = DeviceRegistry(multi_device_config, template_dir)
+
+        office = registry.get_config("office")
+        assert office.weather.location == {"lat": 40.7128, "lon": -74.006}
+        assert (office.display.width, office.display.height) == (1872, 1404)
+        assert office.weather.api_key == multi_device_config.weather.api_key
+
+        cabin = registry.get_config("cabin")
+        assert cabin.weather.city_name == "Aspen"
+        assert cabin.weather.units == "imperial"
+        assert cabin.display.rotate == 90
+        # City-only devices are geocoded rather than using the server's coordinates
+        assert cabin.weather.location == {}
+
+        # The server's own configuration is left untouched
+        assert multi_device_config.weather.units == "metric"
+        assert multi_device_config.display.rotate == 0
+
+    def test_clients_shared_by_location(
+        self, multi_device_config: AppConfig, template_dir: Path
+    ) -> None:
+        """Test devices at the same location share one weather client."""
+        default_client = WeatherAPIClient(multi_device_config.weather)
+        registry = DeviceRegistry(multi_device_config, template_dir, default_client)
+
+        assert registry.get_api_client("kitchen") is registry.get_api_client("office")
+        assert registry.get_api_client("hall") is default_client
+        assert registry.get_api_client("cabin") is not default_client
+        assert registry.location_count == 3
+        # All clients share the default client's weather cache
+        assert registry.get_api_client("cabin").cache_index is default_client.cache_index
+
+    def test_renderers_shared_by_profile(
+        self, multi_device_config: AppConfig, template_dir: Path
+    ) -> None:
+        """Test devices with identical render settings share one renderer."""
+        default_renderer = WeatherRenderer(multi_device_config, template_dir)
+        registry = DeviceRegistry(multi_device_config, template_dir, None, default_renderer)
+
+        assert registry.get_renderer("hall") is default_renderer
+        assert registry.get_renderer("kitchen") is registry.get_renderer("kitchen")
+        # Same location but different geometry needs its own renderer
+        assert registry.get_renderer("kitchen") is not registry.get_renderer("office")
+        assert registry.get_renderer("office").config.display.width == 1872
+
+    def test_renderers_share_daily_extremes(
+        self, multi_device_config: AppConfig, template_dir: Path
+    ) -> None:
+        """Test all renderers track daily extremes in one tracker, keyed by location."""
+        default_renderer = WeatherRenderer(multi_device_config, template_dir)
+        registry = DeviceRegistry(multi_device_config, template_dir, None, default_renderer)
+
+        office = registry.get_renderer("office").weather_calculator
+        assert office.daily_extremes is default_renderer.weather_calculator.daily_extremes
+        assert office.location == registry.get_config("office").weather.location_key
+
+
+def _build_fleet_config(base: AppConfig, device_count: int, location_count: int) -> AppConfig:
+    """Create a configuration with devices spread evenly over several locations.
+
+    Args:
+        base: Server configuration to extend.
+        device_count: Number of devices to register.
+        location_count: Number of distinct locations.
+
+    Returns:
+        Configuration with the generated device profiles.
+    """
+    devices = {
+        f"device-{i}": DeviceProfile(
+            location={"lat": 10.0 + i % location_count, "lon": 20.0 + i % location_count}
+        )
+        for i in range(device_count)
+    }
+    return base.model_copy(update={"devices": devices})
+
+
+@pytest.fixture()
+def fetch_counter() -> Generator[list[tuple[float, float]], None, None]:
+    """Count upstream weather fetches, returning canned data instead."""
+    raw_response: Any = read_json(MOCK_RESPONSE_PATH)
+    fetches: list[tuple[float, float]] = []
+
+    async def fake_fetch(self: WeatherAPIClient, lat: float, lon: float) -> WeatherData:
+        fetches.append((lat, lon))
+        return self._build_weather_data(
+            OneCallResponse.model_validate(raw_response),
+            AirPollutionData.model_validate(raw_response["air_pollution"]),
+        )
+
+    async def fake_render(
+        self: WeatherRenderer,
+        weather_data: WeatherData,
+        battery_status: BatteryStatus,
+        output_path: Path | None = None,
+        prepared: PreparedDisplay | None = None,
+    ) -> bytes:
+        image = b"PNG"
+        if output_path is not None:
+            output_path.write_bytes(image)
+        return image
+
+    with (
+        patch.object(WeatherAPIClient, "_fetch_weather_data", fake_fetch),
+        patch.object(WeatherRenderer, "render_weather_image", fake_render),
+    ):
+        yield fetches
+
+
+def _serve_fleet(config: AppConfig, rounds: int) -> WeatherDisplayServer:
+    """Serve several render rounds for every configured device.
+
+    Args:
+        config: Server configuration including device profiles.
+        rounds: Number of times each device requests an image.
+
+    Returns:
+        The server after handling all requests.
+    """
+    with patch.object(AppConfig, "from_yaml", return_value=config):
+        server = WeatherDisplayServer(Path("test_config.yaml"))
+
+    client = TestClient(server.app)
+    for _ in range(rounds):
+        for device_id in config.devices:
+            response = client.post(
+                "/render", json={"battery": BATTERY_PAYLOAD, "device_id": device_id}
+            )
+            assert response.status_code == 200
+    return server
+
+
+def _weather_cache_bytes(server: WeatherDisplayServer) -> int:
+    """Get the total bytes held in the server's shared weather cache."""
+    return server.device_registry.cache_index.cache._current_size
+
+
+class TestMultiDeviceServer:
+    """Tests for device-aware rendering through the server."""
+
+    def test_render_unknown_device(
+        self, multi_device_config: AppConfig, fetch_counter: list[tuple[float, float]]
+    ) -> None:
+        """Test rendering for an unknown device returns 404."""
+        with patch.object(AppConfig, "from_yaml", return_value=multi_device_config):
+            server = WeatherDisplayServer(Path("test_config.yaml"))
+
+        response = TestClient(server.app).post(
+            "/render", json={"battery": BATTERY_PAYLOAD, "device_id": "garage"}
+        )
+
+        assert response.status_code == 404
+        assert fetch_counter == []
+
+    def test_render_uses_device_location(
+        self, multi_device_config: AppConfig, fetch_counter: list[tuple[float, float]]
+    ) -> None:
+        """Test rendering for a device fetches weather for its location."""
+        with patch.object(AppConfig, "from_yaml", return_value=multi_device_config):
+            server = WeatherDisplayServer(Path("test_config.yaml"))
+
+        response = TestClient(server.app).post(
+            "/render", json={"battery": BATTERY_PAYLOAD, "device_id": "kitchen"}
+        )
+
+        assert response.status_code == 200
+        assert fetch_counter == [(40.7128, -74.006)]
+
+    @pytest.mark.slow()
+    def test_load_scales_with_locations_not_devices(
+        self, server_config: AppConfig, fetch_counter: list[tuple[float, float]]
+    ) -> None:
+        """Test upstream calls and memory grow with locations, not devices."""
+        location_count = 4
+
+        small_fleet = _serve_fleet(_build_fleet_config(server_config, 8, location_count), rounds=3)
+        small_fetches = len(fetch_counter)
+        fetch_counter.clear()
+
+        large_fleet = _serve_fleet(_build_fleet_config(server_config, 80, location_count), rounds=3)
+        large_fetches = len(fetch_counter)
+
+        # One upstream fetch per location, however many devices and requests
+        assert small_fetches == location_count
+        assert large_fetches == location_count
+
+        # Weather clients and cached data are per location (plus the server default)
+        assert small_fleet.device_registry.location_count == location_count + 1
+        assert large_fleet.device_registry.location_count == location_count + 1
+        assert _weather_cache_bytes(small_fleet) == _weather_cache_bytes(large_fleet)
+
+        # All devices share one render profile per location
+        small_renderers = small_fleet.device_registry.renderer_count
+        assert small_renderers == large_fleet.device_registry.renderer_count
+
+    def test_nearby_devices_share_grid_fetch(
+        self, server_config: AppConfig, fetch_counter: list[tuple[float, float]]
+    ) -> None:
+        """Test devices a few hundred meters apart share one upstream fetch."""
+        weather = server_config.weather.model_copy(update={"location_grid_degrees": 0.1})
+        devices = {
+            f"device-{i}": DeviceProfile(location={"lat": 40.71 + i * 0.002, "lon": -74.0})
+            for i in range(5)
+        }
+        config = server_config.model_copy(update={"weather": weather, "devices": devices})
+
+        server = _serve_fleet(config, rounds=2)
+
+        assert fetch_counter == [(40.7, -74.0)]
+        stats = TestClient(server.app).get("/cache").json()
+        assert stats["requests"] == 10
+        assert stats["upstream_fetches"] == 1
+        assert stats["dedupe_ratio"] == 0.9
+
+    def test_devices_share_persisted_quota(
+        self, server_config: AppConfig, fetch_counter: list[tuple[float, float]]
+    ) -> None:
+        """Test all devices draw on one persisted API call budget."""
+        config = _build_fleet_config(server_config, 6, 3)
+
+        server = _serve_fleet(config, rounds=2)
+
+        # Two API calls (One Call + air pollution) per location fetched
+        status = TestClient(server.app).get("/quota").json()
+        assert len(fetch_counter) == 3
+        assert len(status["keys"]) == 1
+        assert status["keys"][0]["calls_today"] == 6
+        assert server.device_registry.get_api_client("device-1").quota_governor is (
+            server.quota_governor
+        )
+
+        # A restarted server picks up where the previous one left off
+        server.quota_governor.flush()
+        restarted = _serve_fleet(config.model_copy(update={"devices": {}}), rounds=0)
+        assert restarted.quota_governor.get_status()["keys"][0]["calls_today"] == 6
@@ -0,0 +1,166 @@
+"""Tests for the Prometheus-style server metrics."""
+
+import asyncio
+import re
+from pathlib import Path
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from rpi_weather_display.constants import METRICS_NAMESPACE
+from rpi_weather_display.server.main import WeatherDisplayServer
+from rpi_weather_display.server.metrics import (
+    MetricsRegistry,
+    cache_requests_total,
+    device_requests_total,
+    upstream_fetch_seconds,
+)
+from rpi_weather_display.utils.path_utils import path_resolver
+
+SAMPLE_LINE = re.compile(r"^[a-z_]+(\{[a-z_]+=\"[^\"]*\"(,[a-z_]+=\"[^\"]*\")*\})? [-+0-9.eInf]+$")
+
+
+def _parse_samples(text: str) -> dict[str, float]:
+    """Parse exposition text into samples keyed by name and labels."""
+    samples: dict[str, float] = {}
+    for line in text.splitlines():
+        if line.startswith("#"):
+            continue
+        assert SAMPLE_LINE.match(line), line
+        series, value = line.rsplit(" ", 1)
+        samples[series] = float(value)
+    return samples
+
+
+@pytest.fixture()
+def registry() -> MetricsRegistry:
+    """Create an empty metrics registry."""
+    return MetricsRegistry()
+
+
+class TestMetricsRegistry:
+    """Tests for metric types and their exposition."""
+
+    def test_counter(self, registry: MetricsRegistry) -> None:
+        """Test counters expose one sample per label set."""
+        counter = registry.counter("requests_total", "Requests.", ("device",))
+        counter.inc("kitchen")
+        counter.inc("kitchen")
+        counter.inc('hall "2"', amount=3)
+
+        assert registry.expose().splitlines() == [
+            f"# HELP {METRICS_NAMESPACE}_requests_total Requests.",
+            f"# TYPE {METRICS_NAMESPACE}_requests_total counter",
+            f'{METRICS_NAMESPACE}_requests_total{{device="kitchen"}} 2',
+            f'{METRICS_NAMESPACE}_requests_total{{device="hall \\"2\\""}} 3',
+        ]
+        assert counter.get("kitchen") == 2
+
+    def test_gauge_track(self, registry: MetricsRegistry) -> None:
+        """Test gauges count blocks in progress, even when they raise."""
+        gauge = registry.gauge("in_progress", "In progress.")
+
+        with gauge.track():
+            assert gauge.get() == 1
+        with pytest.raises(RuntimeError), gauge.track():
+            raise RuntimeError("failed")
+
+        assert gauge.get() == 0
+
+    def test_histogram(self, registry: MetricsRegistry) -> None:
+        """Test histogram buckets are cumulative and end with +Inf."""
+        histogram = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 5.0):
+            histogram.observe(value)
+
+        samples = _parse_samples(registry.expose())
+        name = f"{METRICS_NAMESPACE}_latency_seconds"
+        assert samples[f'{name}_bucket{{le="0.1"}}'] == 2
+        assert samples[f'{name}_bucket{{le="1"}}'] == 3
+        assert samples[f'{name}_bucket{{le="+Inf"}}'] == 4
+        assert samples[f"{name}_sum"] == pytest.approx(5.65)
+        assert samples[f"{name}_count"] == 4
+        assert histogram.get_count() == 4
+
+    def test_histogram_time(self, registry: MetricsRegistry) -> None:
+        """Test timing a block records one observation."""
+        histogram = registry.histogram("fetch_seconds", "Fetch.", ("endpoint",))
+
+        with histogram.time("onecall"):
+            pass
+
+        assert histogram.get_count("onecall") == 1
+        assert histogram.get_count("air_pollution") == 0
+
+    def test_invalid_labels(self, registry: MetricsRegistry) -> None:
+        """Test label values must match the metric's label names."""
+        counter = registry.counter("requests_total", "Requests.", ("device",))
+
+        with pytest.raises(ValueError, match="expects labels"):
+            counter.inc()
+
+    def test_duplicate_name(self, registry: MetricsRegistry) -> None:
+        """Test metric names must be unique."""
+        registry.counter("requests_total", "Requests.")
+
+        with pytest.raises(ValueError, match="already registered"):
+            registry.gauge("requests_total", "Requests.")
+
+
+class TestMetricsEndpoint:
+    """Tests for the /metrics endpoint."""
+
+    @pytest.mark.asyncio()
+    async def test_scrape_under_load(self, test_config_path: Path) -> None:
+        """Test scrapes stay well-formed and consistent while metrics are recorded."""
+        with patch("pathlib.Path.exists", return_value=True):
+            server = WeatherDisplayServer(path_resolver.normalize_path(test_config_path))
+        workers = 20
+        updates = 200
+        device = "load-test"
+        start = device_requests_total.get(device)
+        fetches = upstream_fetch_seconds.get_count("load_test")
+
+        async def record() -> None:
+            for i in range(updates):
+                device_requests_total.inc(device)
+                cache_requests_total.inc("load_test", "hit" if i % 2 else "miss")
+                upstream_fetch_seconds.observe(i / updates, "load_test")
+                await asyncio.sleep(0)
+
+        async def scrape(client: httpx.AsyncClient) -> list[str]:
+            texts = []
+            for _ in range(10):
+                response = await client.get("/metrics")
+                assert response.status_code == 200
+                assert response.headers["content-type"].startswith("text/plain")
+                texts.append(response.text)
+                await asyncio.sleep(0)
+            return texts
+
+        transport = httpx.ASGITransport(app=server.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            results = await asyncio.gather(
+                *(record() for _ in range(workers)), scrape(client), scrape(client)
+            )
+            final = (await client.get("/metrics")).text
+
+        histogram = f"{METRICS_NAMESPACE}_upstream_fetch_seconds"
+        for text in [*results[-2], *results[-1], final]:
+            samples = _parse_samples(text)
+            buckets = [
+                value
+                for series, value in samples.items()
+                if series.startswith(f'{histogram}_bucket{{endpoint="load_test"')
+            ]
+            # Buckets are cumulative and the last one matches the count
+            assert buckets == sorted(buckets)
+            if buckets:
+                count = samples[f'{histogram}_count{{endpoint="load_test"}}']
+                assert buckets[-1] == count
+
+        samples = _parse_samples(final)
+        series = f'{METRICS_NAMESPACE}_device_requests_total{{device="{device}"}}'
+        assert samples[series] == start + workers * updates
+        assert upstream_fetch_seconds.get_count("load_test") == fetches + workers * updates
@@ -0,0 +1,189 @@
+"""Tests for the OpenWeatherMap API quota governor."""
+
+# pyright: reportPrivateUsage=false
+
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from rpi_weather_display.exceptions import APIQuotaExceededError, APIRateLimitError
+from rpi_weather_display.server.quota_governor import QuotaGovernor, RequestPriority
+from rpi_weather_display.utils.file_utils import read_json, write_json
+
+API_KEY = "test_api_key"
+MONOTONIC = "rpi_weather_display.server.quota_governor.time.monotonic"
+
+
+class TestQuotaGovernor:
+    """Tests for QuotaGovernor."""
+
+    def test_acquire_counts_calls(self) -> None:
+        """Test acquired calls are deducted from both budgets."""
+        governor = QuotaGovernor(calls_per_minute=60, calls_per_day=1000)
+
+        governor.acquire(API_KEY, cost=2)
+        governor.acquire(API_KEY)
+
+        [status] = governor.get_status()["keys"]
+        assert status["calls_today"] == 3
+        assert status["remaining_today"] == 997
+        assert status["minute_tokens"] == pytest.approx(57, abs=0.1)
+
+    def test_budgets_are_per_key_and_hashed(self) -> None:
+        """Test each API key has its own budget and is never exposed."""
+        governor = QuotaGovernor(calls_per_minute=60, calls_per_day=1000)
+
+        governor.acquire("key-one", cost=5)
+        governor.acquire("key-two", cost=1)
+
+        keys = governor.get_status()["keys"]
+        assert sorted(k["calls_today"] for k in keys) == [1, 5]
+        assert all(k["key_id"] not in ("key-one", "key-two") for k in keys)
+
+    def test_minute_limit(self) -> None:
+        """Test the per-minute bucket refuses calls until it refills."""
+        governor = QuotaGovernor(calls_per_minute=4, calls_per_day=1000)
+
+        with patch("rpi_weather_display.server.quota_governor.time.monotonic", return_value=0.0):
+            governor.acquire(API_KEY, cost=4)
+            with pytest.raises(APIQuotaExceededError) as excinfo:
+                governor.acquire(API_KEY)
+        assert excinfo.value.details["window"] == "minute"
+        assert isinstance(excinfo.value, APIRateLimitError)
+
+        # Half a minute refills half the bucket
+        with patch("rpi_weather_display.server.quota_governor.time.monotonic", return_value=30.0):
+            governor.acquire(API_KEY, cost=2)
+
+    def test_daily_limit(self) -> None:
+        """Test the daily budget refuses calls once used up."""
+        governor = QuotaGovernor(calls_per_minute=100, calls_per_day=10)
+        governor.acquire(API_KEY, cost=10)
+
+        with pytest.raises(APIQuotaExceededError) as excinfo:
+            governor.acquire(API_KEY)
+
+        assert excinfo.value.details["window"] == "daily"
+        assert excinfo.value.details["retry_after"] > 0
+
+    def test_background_requests_leave_reserve(self) -> None:
+        """Test background requests can't use the budget reserved for interactive ones."""
+        governor = QuotaGovernor(calls_per_minute=100, calls_per_day=10)
+        governor.acquire(API_KEY, cost=8, priority=RequestPriority.BACKGROUND)
+
+        with pytest.raises(APIQuotaExceededError) as excinfo:
+            governor.acquire(API_KEY, priority=RequestPriority.BACKGROUND)
+        assert excinfo.value.details["priority"] == "BACKGROUND"
+
+        # Interactive requests may still use the reserve
+        governor.acquire(API_KEY, cost=2, priority=RequestPriority.INTERACTIVE)
+
+    def test_daily_counter_resets_at_utc_midnight(self) -> None:
+        """Test the daily counter resets on a new UTC day."""
+        governor = QuotaGovernor(calls_per_minute=100, calls_per_day=10)
+        governor.acquire(API_KEY, cost=10)
+
+        budget = governor._get_budget(governor._key_id(API_KEY))
+        budget.day -= timedelta(days=1)
+
+        governor.acquire(API_KEY, cost=10)
+        assert governor.get_status()["keys"][0]["calls_today"] == 10
+
+    @pytest.mark.parametrize(
+        ("calls_today", "expected"),
+        [(0, 1.0), (500, 1.0), (750, 2.5), (1000, 4.0)],
+    )
+    def test_ttl_multiplier(self, calls_today: int, expected: float) -> None:
+        """Test cache lifetimes stretch linearly once half the budget is used."""
+        governor = QuotaGovernor(calls_per_minute=2000, calls_per_day=1000)
+        if calls_today:
+            governor.acquire(API_KEY, cost=calls_today)
+
+        assert governor.ttl_multiplier(API_KEY) == pytest.approx(expected)
+
+    def test_projected_exhaustion(self) -> None:
+        """Test exhaustion is projected from today's average call rate."""
+        governor = QuotaGovernor(calls_per_minute=1000, calls_per_day=1000)
+        governor.acquire(API_KEY, cost=500)
+        now = datetime(2024, 5, 25, 6, 0, tzinfo=UTC)
+
+        budget = governor._budgets[governor._key_id(API_KEY)]
+        resets_at = QuotaGovernor._next_reset(now)
+
+        # 500 calls in 6 hours runs out 6 hours later, before the midnight reset
+        assert governor._project_exhaustion(budget, now, resets_at) == (
+            datetime(2024, 5, 25, 12, 0, tzinfo=UTC).isoformat()
+        )
+        # The same usage late in the day lasts until the reset
+        late = datetime(2024, 5, 25, 18, 0, tzinfo=UTC)
+        assert governor._project_exhaustion(budget, late, resets_at) is None
+
+    def test_state_persisted(self, tmp_path: Path) -> None:
+        """Test daily consumption survives a restart without storing the key."""
+        state_file = tmp_path / "api_quota.json"
+        governor = QuotaGovernor(calls_per_minute=60, calls_per_day=1000, state_file=state_file)
+        governor.acquire(API_KEY, cost=7)
+        governor.flush()
+
+        assert API_KEY not in state_file.read_text()
+        restored = QuotaGovernor(calls_per_minute=60, calls_per_day=1000, state_file=state_file)
+        assert restored.get_status()["keys"][0]["calls_today"] == 7
+
+    def test_stale_state_ignored(self, tmp_path: Path) -> None:
+        """Test counters persisted on a previous day don't count against today."""
+        state_file = tmp_path / "api_quota.json"
+        write_json(state_file, {"abc123": {"date": "2000-01-01", "calls": 999}})
+
+        governor = QuotaGovernor(calls_per_minute=60, calls_per_day=1000, state_file=state_file)
+
+        assert governor.get_status()["keys"][0]["calls_today"] == 0
+
+    def test_corrupt_state_ignored(
+        self, tmp_path: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test an unreadable state file starts an empty budget."""
+        state_file = tmp_path / "api_quota.json"
+        state_file.write_text("{not json")
+
+        governor = QuotaGovernor(calls_per_minute=60, calls_per_day=1000, state_file=state_file)
+        governor.acquire(API_KEY)
+        governor.flush()
+
+        assert "Error reading API quota state" in caplog.text
+        assert isinstance(read_json(state_file), dict)
+
+    def test_flush_batches_writes(self, tmp_path: Path) -> None:
+        """Test calls are written once the flush interval passes, not on every call."""
+        state_file = tmp_path / "api_quota.json"
+        with patch(MONOTONIC, return_value=0.0):
+            governor = QuotaGovernor(
+                calls_per_minute=60,
+                calls_per_day=1000,
+                state_file=state_file,
+                flush_interval_seconds=60,
+            )
+            governor.acquire(API_KEY)
+            assert not governor.flush_due
+
+        with patch(MONOTONIC, return_value=60.0):
+            assert governor.flush_due
+            governor.flush()
+            assert not governor.flush_due
+
+        assert read_json(state_file) == {
+            governor._key_id(API_KEY): {
+                "date": datetime.now(UTC).date().isoformat(),
+                "calls": 1,
+            }
+        }
+
+    def test_flush_only_when_changed(self, tmp_path: Path) -> None:
+        """Test flushing without new calls doesn't write the state file."""
+        governor = QuotaGovernor(60, 1000, state_file=tmp_path / "api_quota.json")
+
+        with patch("rpi_weather_display.server.quota_governor.file_utils.atomic_write") as write:
+            governor.flush()
+
+        write.assert_not_called()
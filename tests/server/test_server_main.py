@@ -6,6 +6,8 @@ This file consolidates all server main tests into well-organized test classes.
 import json
 import logging
 import tempfile
+from datetime import UTC, datetime, time, timedelta, timezone
+from email.utils import formatdate
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
@@ -15,8 +17,14 @@ from fastapi.testclient import TestClient
 
 from rpi_weather_display.constants import (
     CLIENT_CACHE_DIR_NAME,
+    DATA_EXPIRES_HEADER,
     DEFAULT_SERVER_HOST,
+    DIRTY_REGIONS_HEADER,
+    ETAG_HEADER,
+    NEXT_UPDATE_HEADER,
+    OPERATION_ID_HEADER,
     SERVER_MEMORY_GROWTH_THRESHOLD_MB,
+    SERVER_TIMING_HEADER,
 )
 from rpi_weather_display.exceptions import ConfigFileNotFoundError
 from rpi_weather_display.models.config import AppConfig, LoggingConfig
@@ -29,9 +37,13 @@ from rpi_weather_display.server.main import (
     lifespan,
     main,
 )
+from rpi_weather_display.server.renderer import PreparedDisplay
 from rpi_weather_display.utils.file_utils import create_temp_file
 from rpi_weather_display.utils.path_utils import path_resolver, validate_config_path
 
+# Prepared display of content fingerprinted as "abc"
+PREPARED_DISPLAY = PreparedDisplay({}, {}, "abc")
+
 # Shared mock logger for all tests
 _mock_logger = MagicMock()
 _mock_logger.info = MagicMock()
@@ -246,11 +258,27 @@ class TestServerEndpoints:
         assert any("path='/weather'," in route for route in routes), "Weather route not found"
         assert any("path='/preview'," in route for route in routes), "Preview route not found"
         assert any("path='/memory'," in route for route in routes), "Memory route not found"
+        assert any("path='/renderer'," in route for route in routes), "Renderer route not found"
+
+    def test_health_reports_upstream_circuit(self, test_server: WeatherDisplayServer) -> None:
+        """Test the health check reports the upstream circuit breaker state."""
+        client = TestClient(test_server.app)
+
+        health = client.get("/").json()
+        assert health["status"] == "ok"
+        assert health["upstream"]["state"] == "closed"
+
+        breaker = test_server.api_client.circuit_breaker
+        breaker._open("test outage")
+        health = client.get("/").json()
+        assert health["status"] == "degraded"
+        assert health["upstream"]["state"] == "open"
+        assert health["upstream"]["retry_at"] is not None
 
     @pytest.mark.asyncio()
     async def test_render_endpoint(self, test_server: WeatherDisplayServer) -> None:
         """Test the render endpoint."""
-        mock_weather_data = MagicMock()
+        mock_weather_data = MagicMock(timezone_offset=0)
         test_server.api_client.get_weather_data = AsyncMock(return_value=mock_weather_data)
 
         tmp_path = create_temp_file(suffix=".png")
@@ -412,7 +440,7 @@ class TestServerEndpoints:
     @pytest.mark.asyncio()
     async def test_handle_render_direct(self, test_server_with_mocks: WeatherDisplayServer) -> None:
         """Test the _handle_render method directly."""
-        mock_weather_data = MagicMock()
+        mock_weather_data = MagicMock(timezone_offset=0)
         test_server_with_mocks.api_client.get_weather_data = AsyncMock(
             return_value=mock_weather_data
         )
@@ -440,6 +468,300 @@ class TestServerEndpoints:
 
             assert response == mock_response
 
+    @pytest.mark.asyncio()
+    async def test_handle_render_sets_schedule_headers(
+        self, test_server_with_mocks: WeatherDisplayServer
+    ) -> None:
+        """Test render responses advertise the next content update."""
+        test_server_with_mocks.api_client.get_weather_data = AsyncMock(return_value=MagicMock(timezone_offset=0))
+        test_server_with_mocks.renderer.render_weather_image = AsyncMock()
+        expiry = datetime.now() + timedelta(minutes=10)
+        test_server_with_mocks.api_client.get_data_expiry = MagicMock(return_value=expiry)
+
+        request = RenderRequest(
+            battery=BatteryInfo(level=85, state="full", voltage=3.9, current=0.5, temperature=25.0)
+        )
+
+        with (
+            patch(
+                "rpi_weather_display.server.main.path_resolver.get_temp_file",
+                return_value=Path("/var/folders/safe/mock/weather.png"),
+            ),
+            patch("rpi_weather_display.server.main.FileResponse") as mock_file_response,
+        ):
+            await test_server_with_mocks._handle_render(request, BackgroundTasks())
+
+        headers = mock_file_response.call_args.kwargs["headers"]
+        assert headers[DATA_EXPIRES_HEADER] == str(int(expiry.timestamp()))
+        # Weather expiry comes before midnight unless the test runs just before it
+        next_update = int(headers[NEXT_UPDATE_HEADER])
+        assert next_update <= int(expiry.timestamp())
+        assert headers["Cache-Control"].startswith("max-age=")
+        assert headers["Expires"].endswith("GMT")
+
+    @pytest.mark.asyncio()
+    async def test_handle_render_schedules_state_flushes(
+        self, test_server_with_mocks: WeatherDisplayServer
+    ) -> None:
+        """Test renders flush extremes and API call counters in the background once due."""
+        test_server_with_mocks.api_client.get_weather_data = AsyncMock(return_value=MagicMock(timezone_offset=0))
+        test_server_with_mocks.renderer.render_weather_image = AsyncMock()
+        daily_extremes = MagicMock(flush_due=False)
+        quota_governor = MagicMock(flush_due=False)
+        test_server_with_mocks.daily_extremes = daily_extremes
+        test_server_with_mocks.quota_governor = quota_governor
+        request = RenderRequest(
+            battery=BatteryInfo(level=85, state="full", voltage=3.9, current=0.5, temperature=25.0)
+        )
+
+        with (
+            patch(
+                "rpi_weather_display.server.main.path_resolver.get_temp_file",
+                return_value=Path("/var/folders/safe/mock/weather.png"),
+            ),
+            patch("rpi_weather_display.server.main.FileResponse"),
+        ):
+            not_due = BackgroundTasks()
+            await test_server_with_mocks._handle_render(request, not_due)
+            daily_extremes.flush_due = True
+            quota_governor.flush_due = True
+            due = BackgroundTasks()
+            await test_server_with_mocks._handle_render(request, due)
+
+        not_due_funcs = [task.func for task in not_due.tasks]
+        due_funcs = [task.func for task in due.tasks]
+        assert daily_extremes.flush not in not_due_funcs
+        assert quota_governor.flush not in not_due_funcs
+        assert daily_extremes.flush in due_funcs
+        assert quota_governor.flush in due_funcs
+
+    @pytest.mark.asyncio()
+    async def test_handle_render_schedules_prefetch(
+        self, test_server_with_mocks: WeatherDisplayServer
+    ) -> None:
+        """Test renders pre-fetch the device's weather data in the background."""
+        api_client = test_server_with_mocks.api_client
+        api_client.get_weather_data = AsyncMock(return_value=MagicMock(timezone_offset=0))
+        test_server_with_mocks.renderer.prepare_display = MagicMock(return_value=PREPARED_DISPLAY)
+        request = RenderRequest(
+            battery=BatteryInfo(level=85, state="full", voltage=3.9, current=0.5, temperature=25.0)
+        )
+        background_tasks = BackgroundTasks()
+
+        await test_server_with_mocks._handle_render(request, background_tasks, '"abc"')
+
+        assert api_client.prefetch_weather_data in [task.func for task in background_tasks.tasks]
+
+    @pytest.mark.asyncio()
+    async def test_handle_render_not_modified(
+        self, test_server_with_mocks: WeatherDisplayServer
+    ) -> None:
+        """Test a matching If-None-Match skips rendering with a 304 response."""
+        test_server_with_mocks.api_client.get_weather_data = AsyncMock(return_value=MagicMock(timezone_offset=0))
+        test_server_with_mocks.renderer.prepare_display = MagicMock(return_value=PREPARED_DISPLAY)
+        test_server_with_mocks.renderer.render_weather_image = AsyncMock()
+        request = RenderRequest(
+            battery=BatteryInfo(level=85, state="full", voltage=3.9, current=0.5, temperature=25.0)
+        )
+
+        response = await test_server_with_mocks._handle_render(
+            request, BackgroundTasks(), if_none_match='"abc"'
+        )
+
+        assert response.status_code == 304
+        assert response.headers[ETAG_HEADER] == '"abc"'
+        assert NEXT_UPDATE_HEADER in response.headers
+        test_server_with_mocks.renderer.render_weather_image.assert_not_called()
+
+    @pytest.mark.asyncio()
+    async def test_handle_render_server_timing(
+        self, test_server_with_mocks: WeatherDisplayServer
+    ) -> None:
+        """Test traced renders report their stage durations and log an operation ID."""
+        test_server_with_mocks.api_client.get_weather_data = AsyncMock(return_value=MagicMock(timezone_offset=0))
+        test_server_with_mocks.renderer.prepare_display = MagicMock(return_value=PREPARED_DISPLAY)
+        request = RenderRequest(
+            battery=BatteryInfo(level=85, state="full", voltage=3.9, current=0.5, temperature=25.0)
+        )
+
+        with patch.object(test_server_with_mocks.logger, "info") as mock_info:
+            response = await test_server_with_mocks._handle_render(
+                request, BackgroundTasks(), if_none_match='"abc"'
+            )
+
+        timing = response.headers[SERVER_TIMING_HEADER]
+        assert [entry.split(";")[0] for entry in timing.split(", ")] == [
+            "weather",
+            "fingerprint",
+            "total",
+        ]
+        record = mock_info.call_args.kwargs["extra"]
+        assert record["operation_id"] == response.headers[OPERATION_ID_HEADER]
+        assert set(record["spans"]) == {"weather", "fingerprint"}
+
+    @pytest.mark.asyncio()
+    async def test_handle_render_tracing_disabled(
+        self, test_server_with_mocks: WeatherDisplayServer
+    ) -> None:
+        """Test renders carry no Server-Timing header with request tracing disabled."""
+        test_server_with_mocks.config.server.request_tracing = False
+        test_server_with_mocks.api_client.get_weather_data = AsyncMock(return_value=MagicMock(timezone_offset=0))
+        test_server_with_mocks.renderer.prepare_display = MagicMock(return_value=PREPARED_DISPLAY)
+        request = RenderRequest(
+            battery=BatteryInfo(level=85, state="full", voltage=3.9, current=0.5, temperature=25.0)
+        )
+
+        response = await test_server_with_mocks._handle_render(
+            request, BackgroundTasks(), if_none_match='"abc"'
+        )
+
+        assert response.status_code == 304
+        assert SERVER_TIMING_HEADER not in response.headers
+        assert OPERATION_ID_HEADER not in response.headers
+
+    @pytest.mark.asyncio()
+    async def test_handle_render_serves_cached_image(
+        self, test_server_with_mocks: WeatherDisplayServer, tmp_path: Path
+    ) -> None:
+        """Test an image cached under the same fingerprint is served without rendering."""
+        test_server_with_mocks.api_client.get_weather_data = AsyncMock(return_value=MagicMock(timezone_offset=0))
+        test_server_with_mocks.renderer.prepare_display = MagicMock(return_value=PREPARED_DISPLAY)
+        test_server_with_mocks.renderer.render_weather_image = AsyncMock()
+        test_server_with_mocks.file_cache = MagicMock()
+        cached_path = tmp_path / "abc.png"
+        test_server_with_mocks.file_cache.get_cache_path.return_value = cached_path
+        test_server_with_mocks.file_cache.is_valid.return_value = True
+        request = RenderRequest(
+            battery=BatteryInfo(level=85, state="full", voltage=3.9, current=0.5, temperature=25.0)
+        )
+
+        with patch("rpi_weather_display.server.main.FileResponse") as mock_file_response:
+            await test_server_with_mocks._handle_render(request, BackgroundTasks(), '"old"')
+
+        assert mock_file_response.call_args.args[0] == cached_path
+        headers = mock_file_response.call_args.kwargs["headers"]
+        assert headers[ETAG_HEADER] == '"abc"'
+        # The client's frame layout is unknown, so no regions are advertised
+        assert DIRTY_REGIONS_HEADER not in headers
+        test_server_with_mocks.renderer.render_weather_image.assert_not_called()
+
+    @pytest.mark.asyncio()
+    async def test_handle_render_caches_new_image(
+        self, test_server_with_mocks: WeatherDisplayServer
+    ) -> None:
+        """Test a freshly rendered image is cached under its fingerprint."""
+        test_server_with_mocks.api_client.get_weather_data = AsyncMock(return_value=MagicMock(timezone_offset=0))
+        test_server_with_mocks.renderer.prepare_display = MagicMock(return_value=PREPARED_DISPLAY)
+        test_server_with_mocks.renderer.render_weather_image = AsyncMock()
+        test_server_with_mocks.file_cache = MagicMock()
+        test_server_with_mocks.file_cache.is_valid.return_value = False
+        tmp_path = Path("/var/folders/safe/mock/weather.png")
+        request = RenderRequest(
+            battery=BatteryInfo(level=85, state="full", voltage=3.9, current=0.5, temperature=25.0)
+        )
+        background_tasks = BackgroundTasks()
+
+        with (
+            patch(
+                "rpi_weather_display.server.main.path_resolver.get_temp_file",
+                return_value=tmp_path,
+            ),
+            patch("rpi_weather_display.server.main.FileResponse"),
+        ):
+            await test_server_with_mocks._handle_render(request, background_tasks)
+
+        test_server_with_mocks.renderer.render_weather_image.assert_called_once()
+        [cache_task] = [
+            task
+            for task in background_tasks.tasks
+            if task.func == test_server_with_mocks._cache_rendered_image
+        ]
+        assert cache_task.args == ("abc", tmp_path)
+
+        cache_task.func(*cache_task.args)
+        test_server_with_mocks.file_cache.put_file.assert_called_once_with("abc.png", tmp_path)
+
+    @pytest.mark.asyncio()
+    async def test_handle_render_sets_dirty_regions(
+        self, test_server_with_mocks: WeatherDisplayServer
+    ) -> None:
+        """Test the regions changed since the client's image are advertised."""
+        renderer = test_server_with_mocks.renderer
+        test_server_with_mocks.api_client.get_weather_data = AsyncMock(return_value=MagicMock(timezone_offset=0))
+        renderer.prepare_display = MagicMock(return_value=PREPARED_DISPLAY)
+        renderer.get_dirty_regions = MagicMock(return_value=[(0, 0, 800, 40)])
+        renderer.render_weather_image = AsyncMock()
+        test_server_with_mocks.file_cache = MagicMock()
+        test_server_with_mocks.file_cache.is_valid.return_value = False
+        request = RenderRequest(
+            battery=BatteryInfo(level=85, state="full", voltage=3.9, current=0.5, temperature=25.0)
+        )
+
+        with (
+            patch(
+                "rpi_weather_display.server.main.path_resolver.get_temp_file",
+                return_value=Path("/var/folders/safe/mock/weather.png"),
+            ),
+            patch("rpi_weather_display.server.main.FileResponse") as mock_file_response,
+        ):
+            await test_server_with_mocks._handle_render(request, BackgroundTasks(), '"old"')
+
+        renderer.get_dirty_regions.assert_called_once_with("old", "abc")
+        headers = mock_file_response.call_args.kwargs["headers"]
+        assert headers[DIRTY_REGIONS_HEADER] == "0,0,800,40"
+
+    def test_schedule_headers_capped_at_midnight(
+        self, test_server_with_mocks: WeatherDisplayServer
+    ) -> None:
+        """Test the next update never falls after the displayed date changes."""
+        test_server_with_mocks.api_client.get_data_expiry = MagicMock(
+            return_value=datetime.now() + timedelta(days=2)
+        )
+
+        headers = test_server_with_mocks._build_schedule_headers(
+            test_server_with_mocks.api_client, 0
+        )
+
+        next_midnight = datetime.combine(
+            datetime.now(UTC).date() + timedelta(days=1), time.min, UTC
+        )
+        assert int(headers[NEXT_UPDATE_HEADER]) == int(next_midnight.timestamp())
+        assert int(headers["Cache-Control"].removeprefix("max-age=")) <= 24 * 60 * 60
+
+    def test_schedule_headers_midnight_of_location(
+        self, test_server_with_mocks: WeatherDisplayServer
+    ) -> None:
+        """Test the date rolls over at midnight where the weather is shown."""
+        test_server_with_mocks.api_client.get_data_expiry = MagicMock(
+            return_value=datetime.now() + timedelta(days=2)
+        )
+        location_tz = timezone(timedelta(hours=-10))
+
+        headers = test_server_with_mocks._build_schedule_headers(
+            test_server_with_mocks.api_client, -10 * 60 * 60
+        )
+
+        next_midnight = datetime.combine(
+            datetime.now(location_tz).date() + timedelta(days=1), time.min, location_tz
+        )
+        assert int(headers[NEXT_UPDATE_HEADER]) == int(next_midnight.timestamp())
+        assert headers["Expires"] == formatdate(next_midnight.timestamp(), usegmt=True)
+
+    def test_schedule_headers_without_cached_data(
+        self, test_server_with_mocks: WeatherDisplayServer
+    ) -> None:
+        """Test the update interval is used when no data expiry is known."""
+        test_server_with_mocks.api_client.get_data_expiry = MagicMock(return_value=None)
+
+        headers = test_server_with_mocks._build_schedule_headers(
+            test_server_with_mocks.api_client, 0
+        )
+
+        expected = datetime.now() + timedelta(
+            minutes=test_server_with_mocks.config.weather.update_interval_minutes
+        )
+        assert abs(int(headers[DATA_EXPIRES_HEADER]) - int(expected.timestamp())) <= 1
+
     @pytest.mark.asyncio()
     async def test_handle_render_error(self, test_server_with_mocks: WeatherDisplayServer) -> None:
         """Test error handling in _handle_render."""
@@ -539,16 +861,38 @@ class TestServerLifecycle:
             assert "Shutting down Weather Display Server" in caplog.text
             assert "Final memory report: {'test': 'report'}" in caplog.text
 
+    @pytest.mark.asyncio()
+    async def test_lifespan_flushes_server_state(self) -> None:
+        """Test unsaved daily extremes and API call counters are flushed on shutdown."""
+        app = FastAPI()
+        app.state.daily_extremes = MagicMock()
+        app.state.quota_governor = MagicMock()
+
+        with (
+            patch("rpi_weather_display.server.main.memory_profiler"),
+            patch("rpi_weather_display.server.main.browser_manager") as mock_browser_manager,
+        ):
+            mock_browser_manager.cleanup = AsyncMock()
+
+            async with lifespan(app):
+                app.state.daily_extremes.flush.assert_not_called()
+                app.state.quota_governor.flush.assert_not_called()
+
+        app.state.daily_extremes.flush.assert_called_once()
+        app.state.quota_governor.flush.assert_called_once()
+
     @pytest.mark.asyncio()
     async def test_handle_render_memory_growth_warning(
         self, test_server_with_mocks: WeatherDisplayServer, caplog: pytest.LogCaptureFixture
     ) -> None:
         """Test memory growth warning during render."""
         mock_api_client = Mock()
-        mock_api_client.get_weather_data = AsyncMock(return_value=MagicMock())
+        mock_api_client.get_weather_data = AsyncMock(return_value=MagicMock(timezone_offset=0))
         test_server_with_mocks.api_client = mock_api_client
+        mock_api_client.get_data_expiry.return_value = datetime.now()
 
         mock_renderer = Mock()
+        mock_renderer.prepare_display.return_value = PREPARED_DISPLAY
         mock_renderer.render_weather_image = AsyncMock()
         test_server_with_mocks.renderer = mock_renderer
 
@@ -592,17 +936,8 @@ class TestServerLifecycle:
         mock_path = MagicMock()
         mock_path.unlink.side_effect = Exception("Cleanup failed")
 
-        def cleanup_temp_file() -> None:
-            """Clean up temporary file after response is sent."""
-            try:
-                mock_path.unlink(missing_ok=True)
-            except Exception as clean_e:
-                test_server_with_mocks.logger.warning(
-                    f"Failed to clean up temp file {mock_path}: {clean_e}"
-                )
-
         with caplog.at_level(logging.WARNING):
-            cleanup_temp_file()
+            test_server_with_mocks._cleanup_temp_file(mock_path)
 
             assert "Failed to clean up temp file" in caplog.text
             assert "Cleanup failed" in caplog.text
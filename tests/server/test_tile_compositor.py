@@ -0,0 +1,74 @@
+"""Tests for compositing dashboard section tiles."""
+
+from io import BytesIO
+
+from PIL import Image
+
+from rpi_weather_display.server.tile_compositor import composite_tiles, diff_layouts
+
+
+def _tile(width: int, height: int, color: str) -> bytes:
+    """Create a PNG tile of a single color."""
+    buffer = BytesIO()
+    with Image.new("RGB", (width, height), color) as image:
+        image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class TestCompositeTiles:
+    """Tests for composite_tiles."""
+
+    def test_tiles_stacked_in_order(self) -> None:
+        """Test tiles are stacked top to bottom and their rectangles recorded."""
+        tiles = [
+            ("header", "a", _tile(40, 10, "black")),
+            ("current", "b", _tile(40, 20, "red")),
+        ]
+
+        data, layout = composite_tiles(tiles, 40, 50)
+
+        with Image.open(BytesIO(data)) as frame:
+            assert frame.size == (40, 50)
+            assert frame.getpixel((5, 5)) == (0, 0, 0)
+            assert frame.getpixel((5, 15)) == (255, 0, 0)
+            assert frame.getpixel((5, 40)) == (255, 255, 255)
+        assert layout == {"header": ("a", (0, 0, 40, 10)), "current": ("b", (0, 10, 40, 30))}
+
+    def test_tiles_cropped_to_frame(self) -> None:
+        """Test tiles beyond the frame height are cropped."""
+        tiles = [("header", "a", _tile(40, 30, "black")), ("daily", "b", _tile(40, 30, "red"))]
+
+        _, layout = composite_tiles(tiles, 40, 40)
+
+        assert layout["daily"] == ("b", (0, 30, 40, 40))
+
+
+class TestDiffLayouts:
+    """Tests for diff_layouts."""
+
+    def test_changed_tile(self) -> None:
+        """Test only the rectangle of a changed tile is dirty."""
+        old = {"header": ("a", (0, 0, 40, 10)), "current": ("b", (0, 10, 40, 30))}
+        new = {"header": ("c", (0, 0, 40, 10)), "current": ("b", (0, 10, 40, 30))}
+
+        assert diff_layouts(old, new) == [(0, 0, 40, 10)]
+        assert diff_layouts(old, old) == []
+
+    def test_moved_tile(self) -> None:
+        """Test a moved tile dirties both its old and new rectangles."""
+        old = {"header": ("a", (0, 0, 40, 10)), "current": ("b", (0, 10, 40, 30))}
+        new = {"header": ("c", (0, 0, 40, 12)), "current": ("b", (0, 12, 40, 32))}
+
+        assert diff_layouts(old, new) == [
+            (0, 0, 40, 10),
+            (0, 0, 40, 12),
+            (0, 10, 40, 30),
+            (0, 12, 40, 32),
+        ]
+
+    def test_cropped_tiles_ignored(self) -> None:
+        """Test tiles entirely below the frame are not dirty."""
+        old = {"daily": ("a", (0, 40, 40, 40))}
+        new = {"daily": ("b", (0, 40, 40, 40))}
+
+        assert diff_layouts(old, new) == []
@@ -5,7 +5,14 @@ from unittest.mock import Mock
 
 import pytest
 
-from rpi_weather_display.server.time_formatter import TimeFormatter
+from rpi_weather_display.server.time_formatter import (
+    TimeFormatter,
+    format_timestamp,
+    get_format_cache_stats,
+)
+
+# 2024-01-15 14:30:45 UTC
+TIMESTAMP = 1705329045
 
 
 @pytest.fixture()
@@ -309,4 +316,39 @@ class TestTimeFormatter:
         
         # Test timestamp for display
         result = formatter.format_datetime_display(future_timestamp)
-        assert isinstance(result, str)
\ No newline at end of file
+        assert isinstance(result, str)
+
+    def test_timestamp_uses_utc_offset(self, formatter: TimeFormatter) -> None:
+        """Test timestamps are shown in the location's time when an offset is given."""
+        assert formatter.format_datetime(TIMESTAMP, utc_offset=0) == "2024-01-15 14:30:45"
+        assert formatter.format_time(TIMESTAMP, "%H:%M", utc_offset=-5 * 3600) == "09:30"
+        assert formatter.get_weekday_short(TIMESTAMP, utc_offset=10 * 3600) == "Tue"
+
+    def test_get_hour_parts(self, formatter: TimeFormatter) -> None:
+        """Test the hourly forecast labels."""
+        assert formatter.get_hour_parts(TIMESTAMP, "%H:%M", utc_offset=0) == (
+            "14:30",
+            "2",
+            "pm",
+        )
+        assert formatter.get_hour_parts(TIMESTAMP, utc_offset=-5 * 3600)[1:] == ("9", "am")
+
+    def test_timestamps_are_memoized(self, display_config: Mock) -> None:
+        """Test repeated timestamps are served from the shared cache."""
+        format_timestamp.cache_clear()
+
+        TimeFormatter(display_config).format_time(TIMESTAMP, utc_offset=0)
+        TimeFormatter(display_config).format_time(TIMESTAMP, utc_offset=0)
+        TimeFormatter(display_config).format_time(TIMESTAMP, utc_offset=3600)
+
+        stats = get_format_cache_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+        assert stats["hit_rate"] == pytest.approx(1 / 3)
+        assert stats["entries"] == 2
+
+    def test_format_cache_stats_empty(self) -> None:
+        """Test the hit rate is zero before any lookups."""
+        format_timestamp.cache_clear()
+
+        assert get_format_cache_stats()["hit_rate"] == 0.0
@@ -0,0 +1,76 @@
+"""Tests for per-request stage tracing."""
+
+import asyncio
+
+import pytest
+
+from rpi_weather_display.server.tracing import current_trace, span, start_trace
+
+
+class TestTracing:
+    """Tests for traces and spans."""
+
+    def test_span_without_trace(self) -> None:
+        """Test spans outside a trace record nothing."""
+        with span("jinja"):
+            pass
+
+        assert current_trace() is None
+
+    def test_spans_recorded(self) -> None:
+        """Test spans add their durations to the current trace."""
+        with start_trace("render") as trace:
+            assert current_trace() is trace
+            with span("jinja"):
+                pass
+            with span("jinja"), span("screenshot"):
+                pass
+
+        assert current_trace() is None
+        assert list(trace.spans) == ["jinja", "screenshot"]
+        assert all(seconds >= 0 for seconds in trace.spans.values())
+
+    def test_span_recorded_on_error(self) -> None:
+        """Test a stage that raises is still recorded."""
+        with start_trace("render") as trace, pytest.raises(RuntimeError), span("weather"):
+            raise RuntimeError("failed")
+
+        assert "weather" in trace.spans
+
+    def test_server_timing(self) -> None:
+        """Test the Server-Timing value lists stages in milliseconds and the total."""
+        with start_trace("render") as trace:
+            trace.record("fetch-onecall", 0.2124)
+            trace.record("jinja", 0.01)
+            trace.record("jinja", 0.02)
+
+        entries = trace.server_timing().split(", ")
+        assert entries[:2] == ["fetch-onecall;dur=212.4", "jinja;dur=30.0"]
+        assert entries[2].startswith("total;dur=")
+
+    def test_to_record(self) -> None:
+        """Test traces convert to structured log record fields."""
+        with start_trace("render") as trace:
+            trace.record("screenshot", 0.5)
+
+        record = trace.to_record()
+        assert record["operation"] == "render"
+        assert record["operation_id"] == trace.operation_id
+        assert record["spans"] == {"screenshot": 500.0}
+        assert record["total_ms"] >= 0
+
+    @pytest.mark.asyncio()
+    async def test_concurrent_traces_isolated(self) -> None:
+        """Test concurrent requests record spans into their own traces."""
+
+        async def handle(stage: str) -> dict[str, float]:
+            with start_trace("render") as trace:
+                for _ in range(3):
+                    with span(stage):
+                        await asyncio.sleep(0)
+            return trace.spans
+
+        first, second = await asyncio.gather(handle("weather"), handle("render"))
+
+        assert list(first) == ["weather"]
+        assert list(second) == ["render"]
@@ -0,0 +1,88 @@
+"""Tests for the shared weather cache index."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from rpi_weather_display.models.weather import WeatherData
+from rpi_weather_display.server.weather_cache import WeatherCacheIndex
+
+
+class TestWeatherCacheIndex:
+    """Tests for WeatherCacheIndex."""
+
+    def test_init(self) -> None:
+        """Test initial state of the cache index."""
+        index = WeatherCacheIndex(ttl_seconds=600, max_size_mb=1.0)
+
+        assert index.cache.ttl_seconds == 600
+        assert index.requests == 0
+        assert index.upstream_fetches == 0
+        assert index.dedupe_ratio == 0.0
+
+    @pytest.mark.asyncio()
+    async def test_fetch_once_joins_in_flight_fetch(self) -> None:
+        """Test concurrent fetches for one key share a single upstream call."""
+        index = WeatherCacheIndex(ttl_seconds=600)
+        weather = MagicMock(spec=WeatherData)
+        calls = 0
+
+        async def fetcher() -> WeatherData:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return weather
+
+        results = await asyncio.gather(*(index.fetch_once("key", fetcher) for _ in range(5)))
+
+        assert calls == 1
+        assert index.upstream_fetches == 1
+        assert all(result is weather for result in results)
+        assert index._in_flight == {}  # pyright: ignore[reportPrivateUsage]
+
+    @pytest.mark.asyncio()
+    async def test_fetch_once_separate_keys(self) -> None:
+        """Test different keys are fetched independently."""
+        index = WeatherCacheIndex(ttl_seconds=600)
+
+        async def fetcher() -> WeatherData:
+            return MagicMock(spec=WeatherData)
+
+        await asyncio.gather(index.fetch_once("a", fetcher), index.fetch_once("b", fetcher))
+
+        assert index.upstream_fetches == 2
+
+    @pytest.mark.asyncio()
+    async def test_fetch_once_error_propagates_and_clears(self) -> None:
+        """Test fetch errors reach every waiter and allow a retry."""
+        index = WeatherCacheIndex(ttl_seconds=600)
+
+        async def failing_fetcher() -> WeatherData:
+            await asyncio.sleep(0.01)
+            raise RuntimeError("upstream down")
+
+        results = await asyncio.gather(
+            index.fetch_once("key", failing_fetcher),
+            index.fetch_once("key", failing_fetcher),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert index.upstream_fetches == 1
+        assert index._in_flight == {}  # pyright: ignore[reportPrivateUsage]
+
+    def test_get_stats(self) -> None:
+        """Test statistics include the dedupe ratio."""
+        index = WeatherCacheIndex(ttl_seconds=600)
+        for _ in range(8):
+            index.record_request()
+        index.upstream_fetches = 2
+
+        stats = index.get_stats()
+
+        assert stats["requests"] == 8
+        assert stats["upstream_fetches"] == 2
+        assert stats["dedupe_ratio"] == 0.75
+        assert stats["cached_entries"] == 0
+        assert stats["cache_size_mb"] == 0.0
@@ -1,13 +1,31 @@
 """Tests for the WeatherCalculator class."""
 
-from datetime import date, datetime, timedelta
+import json
+from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Any
 from unittest.mock import Mock, patch
 
 import pytest
 
+from rpi_weather_display.models.weather import WeatherData
+from rpi_weather_display.server.daily_extremes import DailyExtremesTracker
 from rpi_weather_display.server.weather_calculator import WeatherCalculator
 
+MOCK_RESPONSE_PATH = Path(__file__).parent.parent / "data" / "mock_weather_response.json"
+
+
+def _hourly_weather(start: datetime, uvis: list[float], temps: list[float]) -> WeatherData:
+    """Create weather data with hourly forecasts starting at the given time."""
+    data: dict[str, Any] = json.loads(MOCK_RESPONSE_PATH.read_bytes())
+    hour = data["hourly"][0]
+    data["current"]["uvi"] = 0.0
+    data["hourly"] = [
+        {**hour, "dt": int((start + timedelta(hours=i)).timestamp()), "uvi": uvi, "temp": temp}
+        for i, (uvi, temp) in enumerate(zip(uvis, temps, strict=True))
+    ]
+    return WeatherData.model_validate(data)
+
 
 @pytest.fixture()
 def calculator() -> WeatherCalculator:
@@ -19,6 +37,7 @@ def calculator() -> WeatherCalculator:
 def sample_weather_data() -> Mock:
     """Create sample weather data for testing."""
     weather_data = Mock()
+    weather_data.columns = None  # No columnar view, as without numpy
     
     # Current weather with UVI
     weather_data.current = Mock()
@@ -96,97 +115,71 @@ class TestWeatherCalculator:
         result = calculator.convert_pressure(1013.25, "unknown")
         assert result == 1013.25
 
-    def test_get_daily_max_uvi_no_cache(
+    def test_get_daily_max_uvi_tracked(
         self, calculator: WeatherCalculator, sample_weather_data: Mock
     ) -> None:
-        """Test getting daily max UVI without cache."""
+        """Test today's max UVI is kept between calls with lower values."""
         now = datetime(2024, 1, 15, 12, 0, 0)
-        
-        # Add hourly data for today
         today_start = datetime(2024, 1, 15, 0, 0, 0)
         for hour in range(24):
             hourly = Mock()
             hourly.dt = int((today_start + timedelta(hours=hour)).timestamp())
             hourly.uvi = hour * 0.5 if hour < 14 else (24 - hour) * 0.5  # Peak at 13:00
             sample_weather_data.hourly.append(hourly)
-        
-        with patch("rpi_weather_display.server.weather_calculator.path_resolver.get_cache_file") as mock_cache, patch(
-            "rpi_weather_display.server.weather_calculator.file_utils.file_exists"
-        ) as mock_exists, patch("rpi_weather_display.server.weather_calculator.file_utils.write_json") as mock_write:
-            mock_cache.return_value = Path("/tmp/uvi_cache.json")
-            mock_exists.return_value = False
-            
-            max_uvi, timestamp = calculator.get_daily_max_uvi(sample_weather_data, now)
-            
-            assert max_uvi == 6.5  # Max at 13:00
-            assert timestamp == sample_weather_data.hourly[13].dt
-            
-            # Verify cache was written
-            mock_write.assert_called_once()
-
-    def test_get_daily_max_uvi_with_valid_cache(
+
+        peak = (6.5, sample_weather_data.hourly[13].dt)
+        assert calculator.get_daily_max_uvi(sample_weather_data, now) == peak
+
+        # Later data no longer includes the peak hour
+        sample_weather_data.current.uvi = 3.0
+        sample_weather_data.hourly = sample_weather_data.hourly[15:]
+        assert calculator.get_daily_max_uvi(sample_weather_data, now) == peak
+
+    def test_get_daily_max_uvi_new_day(
         self, calculator: WeatherCalculator, sample_weather_data: Mock
     ) -> None:
-        """Test getting daily max UVI with valid cache containing higher value."""
-        now = datetime(2024, 1, 15, 14, 0, 0)
-        
-        # Set current UVI lower than cached
-        sample_weather_data.current.uvi = 3.0
-        
-        with patch("rpi_weather_display.server.weather_calculator.path_resolver.get_cache_file") as mock_cache, patch(
-            "rpi_weather_display.server.weather_calculator.file_utils.file_exists"
-        ) as mock_exists, patch("rpi_weather_display.server.weather_calculator.file_utils.read_json") as mock_read:
-            mock_cache.return_value = Path("/tmp/uvi_cache.json")
-            mock_exists.return_value = True
-            
-            # Cache has higher UVI from earlier today
-            cache_data = {
-                "date": "2024-01-15",
-                "max_uvi": 8.5,
-                "timestamp": int(datetime(2024, 1, 15, 12, 0, 0).timestamp())
-            }
-            mock_read.return_value = cache_data
-            
-            max_uvi, timestamp = calculator.get_daily_max_uvi(sample_weather_data, now)
-            
-            assert max_uvi == 8.5  # Cached value
-            assert timestamp == cache_data["timestamp"]
-
-    def test_get_daily_max_uvi_with_outdated_cache(
+        """Test the tracked max UVI starts afresh on a new day."""
+        calculator.get_daily_max_uvi(sample_weather_data, datetime(2024, 1, 14, 12, 0, 0))
+
+        sample_weather_data.current.uvi = 2.0
+        now = datetime(2024, 1, 15, 12, 0, 0)
+
+        assert calculator.get_daily_max_uvi(sample_weather_data, now) == (
+            2.0,
+            int(now.timestamp()),
+        )
+
+    def test_get_daily_max_uvi_zero_uvi(
         self, calculator: WeatherCalculator, sample_weather_data: Mock
     ) -> None:
-        """Test getting daily max UVI with outdated cache."""
+        """Test a zero UV index is returned without being tracked."""
+        sample_weather_data.current.uvi = 0.0
+        now = datetime(2024, 1, 15, 2, 0, 0)
+
+        assert calculator.get_daily_max_uvi(sample_weather_data, now) == (
+            0.0,
+            int(now.timestamp()),
+        )
+        assert calculator.daily_extremes.get_max(calculator.location, "uvi", now.date()) is None
+
+    def test_get_daily_max_uvi_per_location(self, sample_weather_data: Mock) -> None:
+        """Test calculators sharing a tracker keep separate maxima per location."""
+        tracker = DailyExtremesTracker()
+        sunny = WeatherCalculator(tracker, "sunny")
+        cloudy = WeatherCalculator(tracker, "cloudy")
         now = datetime(2024, 1, 15, 12, 0, 0)
-        
-        with patch("rpi_weather_display.server.weather_calculator.path_resolver.get_cache_file") as mock_cache, patch(
-            "rpi_weather_display.server.weather_calculator.file_utils.file_exists"
-        ) as mock_exists, patch(
-            "rpi_weather_display.server.weather_calculator.file_utils.read_json"
-        ) as mock_read, patch("rpi_weather_display.server.weather_calculator.file_utils.write_json") as mock_write:
-            mock_cache.return_value = Path("/tmp/uvi_cache.json")
-            mock_exists.return_value = True
-            
-            # Cache from yesterday
-            cache_data = {
-                "date": "2024-01-14",
-                "max_uvi": 10.0,
-                "timestamp": int(datetime(2024, 1, 14, 12, 0, 0).timestamp())
-            }
-            mock_read.return_value = cache_data
-            
-            max_uvi, timestamp = calculator.get_daily_max_uvi(sample_weather_data, now)
-            
-            assert max_uvi == 5.5  # Current value (cache ignored)
-            assert timestamp == int(now.timestamp())
-            
-            # Verify new cache was written
-            mock_write.assert_called_once()
+
+        sunny.get_daily_max_uvi(sample_weather_data, now)
+        sample_weather_data.current.uvi = 1.5
+
+        assert cloudy.get_daily_max_uvi(sample_weather_data, now)[0] == 1.5
+        assert sunny.get_daily_max_uvi(sample_weather_data, now)[0] == 5.5
 
     def test_calculate_current_max_uvi_no_current_uvi(
         self, calculator: WeatherCalculator
     ) -> None:
         """Test calculating max UVI when current weather has no UVI."""
-        weather_data = Mock()
+        weather_data = Mock(columns=None)
         weather_data.current = Mock(spec=[])  # No uvi attribute
         weather_data.hourly = []
         
@@ -207,7 +200,7 @@ class TestWeatherCalculator:
         self, calculator: WeatherCalculator
     ) -> None:
         """Test that only today's UVI values are considered."""
-        weather_data = Mock()
+        weather_data = Mock(columns=None)
         weather_data.current = Mock()
         weather_data.current.uvi = 2.0
         weather_data.hourly = []
@@ -228,110 +221,11 @@ class TestWeatherCalculator:
         # Should only consider today's values (day 1, UVI = 10.0)
         assert max_uvi == 10.0
 
-    def test_read_uvi_cache_invalid_json(
-        self, calculator: WeatherCalculator
-    ) -> None:
-        """Test reading UVI cache with invalid JSON."""
-        cache_file = Path("/tmp/uvi_cache.json")
-        today = date(2024, 1, 15)
-        
-        with patch("rpi_weather_display.server.weather_calculator.file_utils.file_exists") as mock_exists, patch(
-            "rpi_weather_display.server.weather_calculator.file_utils.read_json"
-        ) as mock_read:
-            mock_exists.return_value = True
-            mock_read.side_effect = Exception("Invalid JSON")
-            
-            uvi, timestamp = calculator._read_uvi_cache(cache_file, today)
-            
-            assert uvi is None
-            assert timestamp is None
-
-    def test_read_uvi_cache_invalid_structure(
-        self, calculator: WeatherCalculator
-    ) -> None:
-        """Test reading UVI cache with invalid structure."""
-        cache_file = Path("/tmp/uvi_cache.json")
-        today = date(2024, 1, 15)
-        
-        with patch("rpi_weather_display.server.weather_calculator.file_utils.file_exists") as mock_exists, patch(
-            "rpi_weather_display.server.weather_calculator.file_utils.read_json"
-        ) as mock_read:
-            mock_exists.return_value = True
-            
-            # Test non-dict cache data
-            mock_read.return_value = []
-            uvi, timestamp = calculator._read_uvi_cache(cache_file, today)
-            assert uvi is None
-            assert timestamp is None
-            
-            # Test missing date
-            mock_read.return_value = {"max_uvi": 5.0, "timestamp": 12345}
-            uvi, timestamp = calculator._read_uvi_cache(cache_file, today)
-            assert uvi is None
-            assert timestamp is None
-            
-            # Test invalid date type
-            mock_read.return_value = {"date": 12345, "max_uvi": 5.0, "timestamp": 12345}
-            uvi, timestamp = calculator._read_uvi_cache(cache_file, today)
-            assert uvi is None
-            assert timestamp is None
-            
-            # Test invalid value types
-            mock_read.return_value = {
-                "date": "2024-01-15", 
-                "max_uvi": "not a number", 
-                "timestamp": 12345
-            }
-            uvi, timestamp = calculator._read_uvi_cache(cache_file, today)
-            assert uvi is None
-            assert timestamp is None
-
-    def test_write_uvi_cache_exception(
-        self, calculator: WeatherCalculator
-    ) -> None:
-        """Test writing UVI cache with exception."""
-        cache_file = Path("/tmp/uvi_cache.json")
-        today = date(2024, 1, 15)
-        
-        with patch("rpi_weather_display.server.weather_calculator.file_utils.write_json") as mock_write:
-            mock_write.side_effect = Exception("Write error")
-            
-            # Should not raise exception
-            calculator._write_uvi_cache(cache_file, today, 7.5, 12345)
-            
-            # Verify write was attempted
-            mock_write.assert_called_once()
-
-    def test_get_daily_max_uvi_zero_uvi(
-        self, calculator: WeatherCalculator
-    ) -> None:
-        """Test that zero UVI doesn't write to cache."""
-        weather_data = Mock()
-        weather_data.current = Mock()
-        weather_data.current.uvi = 0.0
-        weather_data.hourly = []
-        
-        now = datetime(2024, 1, 15, 12, 0, 0)
-        
-        with patch("rpi_weather_display.server.weather_calculator.path_resolver.get_cache_file") as mock_cache, patch(
-            "rpi_weather_display.server.weather_calculator.file_utils.file_exists"
-        ) as mock_exists, patch("rpi_weather_display.server.weather_calculator.file_utils.write_json") as mock_write:
-            mock_cache.return_value = Path("/tmp/uvi_cache.json")
-            mock_exists.return_value = False
-            
-            max_uvi, timestamp = calculator.get_daily_max_uvi(weather_data, now)
-            
-            assert max_uvi == 0.0
-            assert timestamp == int(now.timestamp())
-            
-            # Should not write to cache with zero UVI
-            mock_write.assert_not_called()
-
     def test_calculate_current_max_uvi_no_uvi_in_hourly(
         self, calculator: WeatherCalculator
     ) -> None:
         """Test max UVI calculation when hourly data has no UVI."""
-        weather_data = Mock()
+        weather_data = Mock(columns=None)
         weather_data.current = Mock()
         weather_data.current.uvi = 3.5
         weather_data.hourly = []
@@ -348,31 +242,6 @@ class TestWeatherCalculator:
         assert max_uvi == 3.5  # Uses current UVI
         assert timestamp == int(now.timestamp())
 
-    def test_read_uvi_cache_valid_types(
-        self, calculator: WeatherCalculator
-    ) -> None:
-        """Test reading UVI cache with both int and float values."""
-        cache_file = Path("/tmp/uvi_cache.json")
-        today = date(2024, 1, 15)
-        
-        with patch("rpi_weather_display.server.weather_calculator.file_utils.file_exists") as mock_exists, patch(
-            "rpi_weather_display.server.weather_calculator.file_utils.read_json"
-        ) as mock_read:
-            mock_exists.return_value = True
-            
-            # Test with int max_uvi
-            cache_data = {
-                "date": "2024-01-15",
-                "max_uvi": 8,  # int
-                "timestamp": 12345
-            }
-            mock_read.return_value = cache_data
-            
-            uvi, timestamp = calculator._read_uvi_cache(cache_file, today)
-            
-            assert uvi == 8.0  # Converted to float
-            assert timestamp == 12345
-
     def test_calculate_daylight_hours_edge_cases(self, calculator: WeatherCalculator) -> None:
         """Test daylight calculation edge cases."""
         # Test with 0 minutes
@@ -385,4 +254,17 @@ class TestWeatherCalculator:
         sunrise = 1640088000
         sunset = 1640091540  # 59 minutes later
         result = calculator.calculate_daylight_hours(sunrise, sunset)
-        assert result == "0h 59m"
\ No newline at end of file
+        assert result == "0h 59m"
+
+    def test_calculate_current_max_uvi_vectorized(self, calculator: WeatherCalculator) -> None:
+        """Test the columnar and model-loop paths find the same max UVI."""
+        now = datetime(2024, 1, 15, 12, 0, 0)
+        uvis = [float((i * 7) % 11) for i in range(48)]
+        weather = _hourly_weather(datetime(2024, 1, 14, 18, 0, 0), uvis, [10.0] * 48)
+
+        vectorized = calculator._calculate_current_max_uvi(weather, now)
+        with patch.object(WeatherData, "columns", None):
+            looped = calculator._calculate_current_max_uvi(weather, now)
+
+        assert vectorized == looped
+        assert vectorized[0] == 10.0
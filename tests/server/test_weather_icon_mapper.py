@@ -1,11 +1,22 @@
-"""Tests for the WeatherIconMapper class."""
+"""Tests for the WeatherIconMapper class and its generated lookup table."""
 
-from unittest.mock import Mock, patch
+# pyright: reportPrivateUsage=false
+
+import csv
+import importlib.util
+from pathlib import Path
+from types import ModuleType
+from unittest.mock import Mock
 
 import pytest
 
+from rpi_weather_display.server import weather_icon_table
 from rpi_weather_display.server.weather_icon_mapper import WeatherIconMapper
 
+ROOT_DIR = Path(__file__).parent.parent.parent
+CSV_PATH = ROOT_DIR / "owm_icon_map.csv"
+BUILD_SCRIPT_PATH = ROOT_DIR / "deploy" / "scripts" / "build_icon_map.py"
+
 
 @pytest.fixture()
 def mapper() -> WeatherIconMapper:
@@ -13,113 +24,80 @@ def mapper() -> WeatherIconMapper:
     return WeatherIconMapper()
 
 
+def _load_module(name: str, path: Path) -> ModuleType:
+    """Load a Python file as a module."""
+    spec = importlib.util.spec_from_file_location(name, path)
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
 @pytest.fixture()
-def sample_csv_content() -> str:
-    """Sample CSV content for testing."""
-    return """API response: id,API response: icon,Weather Icons Class
-200,11d,wi-thunderstorm
-201,11d,wi-thunderstorm
-202,11d,wi-thunderstorm
-210,11d,wi-lightning
-300,09d,wi-sprinkle
-500,10d,wi-rain
-501,10d,wi-rain
-502,10d,wi-rain-wind
-503,10d,wi-rain-wind
-504,10d,wi-rain-wind
-800,01d,wi-day-sunny
-800,01n,wi-night-clear
-801,02d,wi-day-cloudy
-801,02n,wi-night-cloudy
-802,03d,wi-cloud
-802,03n,wi-cloud
-803,04d,wi-cloudy
-803,04n,wi-cloudy
-804,04d,wi-cloudy
-804,04n,wi-cloudy"""
+def build_script() -> ModuleType:
+    """Load the icon map build script."""
+    return _load_module("build_icon_map", BUILD_SCRIPT_PATH)
 
 
-class TestWeatherIconMapper:
-    """Tests for WeatherIconMapper."""
+def _condition(weather_id: int | str, icon: str) -> Mock:
+    """Create a mock weather condition."""
+    weather_condition = Mock()
+    weather_condition.id = weather_id
+    weather_condition.icon = icon
+    return weather_condition
+
+
+class TestWeatherIconTable:
+    """Tests for the lookup table generated from owm_icon_map.csv."""
+
+    def test_generated_module_is_up_to_date(self, build_script: ModuleType) -> None:
+        """Test the committed module matches a fresh build from the CSV."""
+        expected = build_script.render_module(build_script.read_icon_rows(CSV_PATH))
 
-    def test_init(self, mapper: WeatherIconMapper) -> None:
-        """Test initialization."""
-        assert mapper._weather_icon_map == {}
-        assert mapper._weather_id_to_icon == {}
-        assert mapper._loaded is False
-
-    def test_ensure_mappings_loaded_once(self, mapper: WeatherIconMapper) -> None:
-        """Test that mappings are only loaded once."""
-        # Set loaded to True
-        mapper._loaded = True
-        
-        # Mock path_resolver and file_utils to ensure they're not called
-        with (
-            patch("rpi_weather_display.server.weather_icon_mapper.path_resolver") as mock_path,
-            patch("rpi_weather_display.server.weather_icon_mapper.file_utils") as mock_file
-        ):
-            mapper._ensure_mappings_loaded()
-            
-            # Should not call any file operations
-            mock_path.get_data_file.assert_not_called()
-            mock_file.file_exists.assert_not_called()
-
-    def test_ensure_mappings_loaded_no_file(self, mapper: WeatherIconMapper) -> None:
-        """Test loading when CSV file doesn't exist."""
-        with (
-            patch("rpi_weather_display.server.weather_icon_mapper.path_resolver.get_data_file") as mock_path,
-            patch("rpi_weather_display.server.weather_icon_mapper.file_utils.file_exists") as mock_exists
-        ):
-            mock_path.return_value = "/path/to/owm_icon_map.csv"
-            mock_exists.return_value = False
-            
-            mapper._ensure_mappings_loaded()
-            
-            assert mapper._loaded is True
-            assert mapper._weather_icon_map == {}
-            assert mapper._weather_id_to_icon == {}
-
-    def test_ensure_mappings_loaded_with_csv(
-        self, mapper: WeatherIconMapper, sample_csv_content: str
+        assert Path(weather_icon_table.__file__).read_text(encoding="utf-8") == expected
+
+    def test_every_csv_row_resolves(self, mapper: WeatherIconMapper) -> None:
+        """Test each CSV row maps its condition ID and icon code to its icon class."""
+        with CSV_PATH.open(encoding="utf-8", newline="") as f:
+            rows = list(csv.DictReader(f))
+
+        assert len(weather_icon_table.ICONS_BY_CONDITION) == len(rows)
+        for row in rows:
+            condition = _condition(int(row["API response: id"]), row["API response: icon"])
+            assert mapper.get_icon_for_condition(condition) == row["Weather Icons Class"]
+
+    def test_tables_are_frozen(self) -> None:
+        """Test the generated tables can't be modified."""
+        with pytest.raises(TypeError):
+            weather_icon_table.ICONS_BY_CONDITION[(800, "01d")] = "wi-moon"  # type: ignore[index]
+
+    def test_build_icon_map_writes_module(
+        self, build_script: ModuleType, tmp_path: Path
     ) -> None:
-        """Test loading mappings from CSV file."""
-        with (
-            patch("rpi_weather_display.server.weather_icon_mapper.path_resolver.get_data_file") as mock_path,
-            patch("rpi_weather_display.server.weather_icon_mapper.file_utils.file_exists") as mock_exists,
-            patch("rpi_weather_display.server.weather_icon_mapper.file_utils.read_text") as mock_read
-        ):
-            mock_path.return_value = "/path/to/owm_icon_map.csv"
-            mock_exists.return_value = True
-            mock_read.return_value = sample_csv_content
-            
-            mapper._ensure_mappings_loaded()
-            
-            assert mapper._loaded is True
-            assert len(mapper._weather_icon_map) > 0
-            assert len(mapper._weather_id_to_icon) > 0
-            
-            # Check specific mappings
-            assert mapper._weather_icon_map["200_11d"] == "wi-thunderstorm"
-            assert mapper._weather_icon_map["800_01d"] == "wi-day-sunny"
-            assert mapper._weather_icon_map["800_01n"] == "wi-night-clear"
-            assert mapper._weather_id_to_icon["200"] == "wi-thunderstorm"
-
-    def test_ensure_mappings_loaded_with_exception(self, mapper: WeatherIconMapper) -> None:
-        """Test loading with an exception."""
-        with (
-            patch("rpi_weather_display.server.weather_icon_mapper.path_resolver.get_data_file") as mock_path,
-            patch("rpi_weather_display.server.weather_icon_mapper.file_utils.file_exists") as mock_exists,
-            patch("rpi_weather_display.server.weather_icon_mapper.file_utils.read_text") as mock_read
-        ):
-            mock_path.return_value = "/path/to/owm_icon_map.csv"
-            mock_exists.return_value = True
-            mock_read.side_effect = Exception("Read error")
-            
-            mapper._ensure_mappings_loaded()
-            
-            assert mapper._loaded is True
-            assert mapper._weather_icon_map == {}
-            assert mapper._weather_id_to_icon == {}
+        """Test the build script writes an importable module."""
+        csv_path = tmp_path / "icons.csv"
+        csv_path.write_text(
+            "API response: id,API response: icon,Weather Icons Class\n"
+            "500, 10d ,wi-rain\n"
+            "500,10n,wi-night-rain\n",
+            encoding="utf-8",
+        )
+        out_path = tmp_path / "table.py"
+
+        build_script.build_icon_map(csv_path, out_path)
+
+        table = _load_module("table", out_path)
+        assert table.ICONS_BY_CONDITION == {
+            (500, "10d"): "wi-rain",
+            (500, "10n"): "wi-night-rain",
+        }
+        # Later rows win for the ID-only fallback
+        assert table.ICONS_BY_ID == {500: "wi-night-rain"}
+
+
+class TestWeatherIconMapper:
+    """Tests for WeatherIconMapper."""
 
     def test_get_icon_for_code(self, mapper: WeatherIconMapper) -> None:
         """Test getting icon for OpenWeatherMap icon codes."""
@@ -142,7 +120,7 @@ class TestWeatherIconMapper:
         assert mapper.get_icon_for_code("13n") == "wi-snow"
         assert mapper.get_icon_for_code("50d") == "wi-fog"
         assert mapper.get_icon_for_code("50n") == "wi-fog"
-        
+
         # Test unknown code
         assert mapper.get_icon_for_code("99x") == "wi-cloud"
 
@@ -152,169 +130,35 @@ class TestWeatherIconMapper:
         weather_condition = Mock()
         delattr(weather_condition, "id")
         delattr(weather_condition, "icon")
-        
+
         result = mapper.get_icon_for_condition(weather_condition)
         assert result == "wi-cloud"
 
-    def test_get_icon_for_condition_with_csv_mapping(
-        self, mapper: WeatherIconMapper, sample_csv_content: str
-    ) -> None:
-        """Test getting icon for condition with CSV mappings loaded."""
-        # Load CSV mappings
-        with (
-            patch("rpi_weather_display.server.weather_icon_mapper.path_resolver.get_data_file") as mock_path,
-            patch("rpi_weather_display.server.weather_icon_mapper.file_utils.file_exists") as mock_exists,
-            patch("rpi_weather_display.server.weather_icon_mapper.file_utils.read_text") as mock_read
-        ):
-            mock_path.return_value = "/path/to/owm_icon_map.csv"
-            mock_exists.return_value = True
-            mock_read.return_value = sample_csv_content
-            
-            # Test exact match
-            weather_condition = Mock()
-            weather_condition.id = 200
-            weather_condition.icon = "11d"
-            
-            result = mapper.get_icon_for_condition(weather_condition)
-            assert result == "wi-thunderstorm"
-            
-            # Test ID-only fallback
-            weather_condition.id = 500
-            weather_condition.icon = "99x"  # Unknown icon code
-            
-            result = mapper.get_icon_for_condition(weather_condition)
-            assert result == "wi-rain"
-
-    def test_get_icon_for_condition_clear_cloudy_variants(
-        self, mapper: WeatherIconMapper, sample_csv_content: str
-    ) -> None:
-        """Test getting icon for clear/cloudy conditions with day/night variants."""
-        # Load CSV mappings
-        with (
-            patch("rpi_weather_display.server.weather_icon_mapper.path_resolver.get_data_file") as mock_path,
-            patch("rpi_weather_display.server.weather_icon_mapper.file_utils.file_exists") as mock_exists,
-            patch("rpi_weather_display.server.weather_icon_mapper.file_utils.read_text") as mock_read
-        ):
-            mock_path.return_value = "/path/to/owm_icon_map.csv"
-            mock_exists.return_value = True
-            mock_read.return_value = sample_csv_content
-            
-            # Test day variant
-            weather_condition = Mock()
-            weather_condition.id = 800
-            weather_condition.icon = "01d"
-            
-            result = mapper.get_icon_for_condition(weather_condition)
-            assert result == "wi-day-sunny"
-            
-            # Test night variant
-            weather_condition.icon = "01n"
-            
-            result = mapper.get_icon_for_condition(weather_condition)
-            assert result == "wi-night-clear"
-            
-            # Test other clear/cloudy IDs
-            weather_condition.id = 802
-            weather_condition.icon = "03d"
-            
-            result = mapper.get_icon_for_condition(weather_condition)
-            assert result == "wi-cloud"
-
-    def test_get_icon_for_condition_fallback_to_code(self, mapper: WeatherIconMapper) -> None:
+    def test_get_icon_for_condition_exact_match(self) -> None:
+        """Test the condition ID and icon code together take precedence."""
+        mapper = WeatherIconMapper(
+            icons_by_condition={(800, "01n"): "wi-night-clear"},
+            icons_by_id={800: "wi-day-sunny"},
+        )
+
+        assert mapper.get_icon_for_condition(_condition(800, "01n")) == "wi-night-clear"
+
+    def test_get_icon_for_condition_id_fallback(self, mapper: WeatherIconMapper) -> None:
+        """Test an unlisted icon code falls back to the condition ID."""
+        assert mapper.get_icon_for_condition(_condition(501, "99x")) == "wi-rain"
+
+    def test_get_icon_for_condition_fallback_to_code(self) -> None:
         """Test fallback to icon code when no mappings match."""
-        # Don't load any CSV mappings
-        with (
-            patch("rpi_weather_display.server.weather_icon_mapper.path_resolver.get_data_file") as mock_path,
-            patch("rpi_weather_display.server.weather_icon_mapper.file_utils.file_exists") as mock_exists
-        ):
-            mock_path.return_value = "/path/to/owm_icon_map.csv"
-            mock_exists.return_value = False
-            
-            weather_condition = Mock()
-            weather_condition.id = 999  # Unknown ID
-            weather_condition.icon = "10d"  # Known icon code
-            
-            result = mapper.get_icon_for_condition(weather_condition)
-            assert result == "wi-day-rain"
-            
-            # Test with unknown ID and unknown icon code
-            weather_condition.icon = "99x"
-            
-            result = mapper.get_icon_for_condition(weather_condition)
-            assert result == "wi-cloud"
-
-    def test_get_icon_for_condition_string_conversion(self, mapper: WeatherIconMapper) -> None:
-        """Test that weather ID is converted to string."""
-        weather_condition = Mock()
-        weather_condition.id = 200  # Integer ID
-        weather_condition.icon = "11d"
-        
-        # Should handle integer ID by converting to string
-        result = mapper.get_icon_for_condition(weather_condition)
-        # Will use default mapping since no CSV loaded
-        assert result == "wi-thunderstorm"
-
-    def test_csv_parsing_with_whitespace(self, mapper: WeatherIconMapper) -> None:
-        """Test CSV parsing handles whitespace correctly."""
-        csv_with_whitespace = """API response: id,API response: icon,Weather Icons Class
-        200  ,  11d  ,  wi-thunderstorm  
-        201,11d,wi-thunderstorm"""
-        
-        with (
-            patch("rpi_weather_display.server.weather_icon_mapper.path_resolver.get_data_file") as mock_path,
-            patch("rpi_weather_display.server.weather_icon_mapper.file_utils.file_exists") as mock_exists,
-            patch("rpi_weather_display.server.weather_icon_mapper.file_utils.read_text") as mock_read
-        ):
-            mock_path.return_value = "/path/to/owm_icon_map.csv"
-            mock_exists.return_value = True
-            mock_read.return_value = csv_with_whitespace
-            
-            mapper._ensure_mappings_loaded()
-            
-            # Check that whitespace was stripped
-            assert mapper._weather_icon_map["200_11d"] == "wi-thunderstorm"
-            assert mapper._weather_id_to_icon["200"] == "wi-thunderstorm"
-
-    def test_special_clear_cloudy_key_generation(self, mapper: WeatherIconMapper) -> None:
-        """Test the special key generation for 800-804 weather IDs."""
-        # Create weather conditions for testing
-        weather_condition = Mock()
-        
-        # Test 800 with day icon
-        weather_condition.id = "800"
-        weather_condition.icon = "01d"
-        
-        # The special key should be "800_80d" for day variant
-        # But since we don't have mappings loaded, it will fall back
-        result = mapper.get_icon_for_condition(weather_condition)
-        assert result == "wi-day-sunny"  # Falls back to get_icon_for_code
-        
-        # Test 803 with night icon
-        weather_condition.id = "803"
-        weather_condition.icon = "04n"
-        
-        result = mapper.get_icon_for_condition(weather_condition)
-        assert result == "wi-cloudy"  # Falls back to get_icon_for_code
-
-    def test_special_clear_cloudy_key_with_mapping(self, mapper: WeatherIconMapper) -> None:
-        """Test clear/cloudy conditions when special key exists in mapping."""
-        # Manually set up mappings to test the special key branch
-        mapper._weather_icon_map["800_80d"] = "wi-special-day-clear"
-        mapper._weather_icon_map["803_80n"] = "wi-special-night-cloudy"
-        mapper._loaded = True  # Prevent loading from file
-        
-        weather_condition = Mock()
-        
-        # Test 800 with day icon - should use special mapping
-        weather_condition.id = "800"
-        weather_condition.icon = "01d"
-        
-        result = mapper.get_icon_for_condition(weather_condition)
-        assert result == "wi-special-day-clear"
-        
-        # Test 803 with night icon - should use special mapping
-        weather_condition.id = "803"
-        weather_condition.icon = "04n"
-        
-        result = mapper.get_icon_for_condition(weather_condition)
-        assert result == "wi-special-night-cloudy"
\ No newline at end of file
+        mapper = WeatherIconMapper(icons_by_condition={}, icons_by_id={})
+
+        assert mapper.get_icon_for_condition(_condition(999, "10d")) == "wi-day-rain"
+        assert mapper.get_icon_for_condition(_condition(999, "99x")) == "wi-cloud"
+
+    def test_get_icon_for_condition_string_id(self, mapper: WeatherIconMapper) -> None:
+        """Test that a string weather ID is converted to an integer."""
+        assert mapper.get_icon_for_condition(_condition("200", "11d")) == "wi-thunderstorm"
+        assert mapper.get_icon_for_condition(_condition("803", "04n")) == "wi-cloudy"
+
+    def test_get_icon_for_condition_invalid_id(self, mapper: WeatherIconMapper) -> None:
+        """Test a non-numeric weather ID falls back to the icon code."""
+        assert mapper.get_icon_for_condition(_condition("unknown", "13n")) == "wi-snow"
@@ -5,9 +5,11 @@ import pytest
 from rpi_weather_display.exceptions import (
     APIAuthenticationError,
     APIError,
+    APIQuotaExceededError,
     APIRateLimitError,
     APITimeoutError,
     BatteryMonitoringError,
+    CircuitOpenError,
     ConfigFileNotFoundError,
     ConfigurationError,
     CriticalBatteryError,
@@ -244,6 +246,25 @@ class TestAPIExceptions:
         )
         assert exc.status_code == 429
         assert exc.details["retry_after"] == 3600
+
+    def test_api_quota_exceeded_error(self):
+        """Test APIQuotaExceededError."""
+        exc = APIQuotaExceededError(
+            "Daily API call budget exhausted",
+            {"key_id": "3f2a9c", "window": "daily", "limit": 1000}
+        )
+        assert isinstance(exc, APIRateLimitError)
+        assert exc.status_code is None
+        assert exc.details["window"] == "daily"
+
+    def test_circuit_open_error(self):
+        """Test CircuitOpenError."""
+        exc = CircuitOpenError(
+            "Circuit open for OpenWeatherMap",
+            {"service": "OpenWeatherMap", "state": "open"}
+        )
+        assert isinstance(exc, APIError)
+        assert exc.details["state"] == "open"
         
     def test_api_authentication_error(self):
         """Test APIAuthenticationError."""
@@ -1,14 +1,20 @@
 """Tests for cache manager utilities."""
 
+import json
 import logging
+import sys
 import time
+import tracemalloc
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
 from rpi_weather_display.constants import BYTES_PER_MEGABYTE, DEFAULT_FILE_CACHE_TTL_SECONDS
-from rpi_weather_display.utils.cache_manager import FileCache, MemoryAwareCache
+from rpi_weather_display.models.weather import WeatherData
+from rpi_weather_display.utils.cache_manager import FileCache, MemoryAwareCache, deep_sizeof
+
+MOCK_RESPONSE_PATH = Path(__file__).parent.parent / "data" / "mock_weather_response.json"
 
 
 class TestMemoryAwareCache:
@@ -55,6 +61,40 @@ class TestMemoryAwareCache:
             assert cache.get("key1") is None
             assert cache.item_count == 0
 
+    def test_get_expiry(self) -> None:
+        """Test expiry time of cached items."""
+        cache: MemoryAwareCache[str] = MemoryAwareCache(ttl_seconds=60)
+        assert cache.get_expiry("key1") is None
+
+        with patch("time.time", return_value=100.0):
+            cache.put("key1", "value1", 100)
+
+        assert cache.get_expiry("key1") == 160.0
+        assert cache.get_expiry("key1", ttl_seconds=120) == 220.0
+
+    def test_get_with_ttl_override(self) -> None:
+        """Test a per-call TTL overrides the cache default."""
+        cache: MemoryAwareCache[str] = MemoryAwareCache(ttl_seconds=60)
+
+        with patch("time.time", side_effect=[100.0, 200.0, 200.0]):
+            cache.put("key1", "value1", 100)
+
+            # Expired under the default TTL, but valid under a stretched one
+            assert cache.get("key1", ttl_seconds=120) == "value1"
+            assert cache.get("key1") is None
+
+    def test_get_stale(self) -> None:
+        """Test expired items can be kept and served as a fallback."""
+        cache: MemoryAwareCache[str] = MemoryAwareCache(ttl_seconds=60)
+        assert cache.get_stale("key1") is None
+
+        with patch("time.time", side_effect=[100.0, 200.0]):
+            cache.put("key1", "value1", 100)
+            assert cache.get("key1", evict_expired=False) is None
+
+        assert cache.item_count == 1
+        assert cache.get_stale("key1") == "value1"
+
     def test_lru_ordering(self) -> None:
         """Test LRU ordering - most recently used items are kept."""
         cache: MemoryAwareCache[str] = MemoryAwareCache()
@@ -160,6 +200,98 @@ class TestMemoryAwareCache:
         assert cache.get("key4") == "value4"
         assert cache._current_size == 350  # key3 (100) + key4 (250)
 
+    def test_put_uses_sizer(self) -> None:
+        """Test items put without a size are measured by the sizer."""
+        cache: MemoryAwareCache[str] = MemoryAwareCache(sizer=len)
+
+        cache.put("key1", "a" * 300)
+        cache.put("key2", "b" * 10, size_bytes=50)
+
+        assert cache._sizes == {"key1": 300, "key2": 50}
+        assert cache._current_size == 350
+
+    def test_default_sizer_is_deep(self) -> None:
+        """Test the default sizer counts nested objects."""
+        cache: MemoryAwareCache[dict[str, list[str]]] = MemoryAwareCache()
+        value = {"items": ["x" * 1000, "y" * 1000]}
+
+        cache.put("key1", value)
+
+        assert cache._sizes["key1"] == deep_sizeof(value)
+        assert cache._sizes["key1"] > 2000
+
+
+class TestDeepSizeof:
+    """Test the deep_sizeof sizer."""
+
+    def test_atomic(self) -> None:
+        """Test objects without references are measured directly."""
+        assert deep_sizeof("hello") == sys.getsizeof("hello")
+        assert deep_sizeof(3.5) == sys.getsizeof(3.5)
+
+    def test_containers(self) -> None:
+        """Test container contents are included."""
+        text = "x" * 100
+        assert deep_sizeof([text]) == sys.getsizeof([text]) + sys.getsizeof(text)
+        key, value = "key", (1.5, 2.5)
+        assert deep_sizeof({key: value}) == (
+            sys.getsizeof({key: value})
+            + sys.getsizeof(key)
+            + sys.getsizeof(value)
+            + sys.getsizeof(1.5)
+            + sys.getsizeof(2.5)
+        )
+
+    def test_shared_objects_counted_once(self) -> None:
+        """Test objects referenced several times are counted once."""
+        shared = "s" * 1000
+        single = deep_sizeof([shared])
+        repeated = deep_sizeof([shared, shared, shared])
+
+        assert repeated - single == sys.getsizeof([shared] * 3) - sys.getsizeof([shared])
+
+    def test_cycles(self) -> None:
+        """Test reference cycles terminate."""
+        items: list[object] = []
+        items.append(items)
+        assert deep_sizeof(items) == sys.getsizeof(items)
+
+    def test_slots_and_instances(self) -> None:
+        """Test instance dictionaries and slots are followed."""
+
+        class Slotted:
+            __slots__ = ("payload",)
+
+            def __init__(self, payload: str) -> None:
+                self.payload = payload
+
+        class Plain:
+            def __init__(self, payload: str) -> None:
+                self.payload = payload
+
+        payload = "p" * 500
+        assert deep_sizeof(Slotted(payload)) > sys.getsizeof(payload)
+        assert deep_sizeof(Plain(payload)) > sys.getsizeof(payload)
+
+    def test_matches_allocated_memory(self) -> None:
+        """Test the size of weather data is close to the memory it allocates."""
+        # Full-size response with 48 hourly and 8 daily forecasts, as One Call returns
+        data = json.loads(MOCK_RESPONSE_PATH.read_bytes())
+        hour, day = data["hourly"][0], data["daily"][0]
+        data["hourly"] = [{**hour, "dt": hour["dt"] + i * 3600} for i in range(48)]
+        data["daily"] = [{**day, "dt": day["dt"] + i * 86400} for i in range(8)]
+        raw = json.dumps(data).encode("utf-8")
+        WeatherData.model_validate_json(raw)  # Warm up validators
+
+        tracemalloc.start()
+        weather = WeatherData.model_validate_json(raw)
+        allocated = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        # Within 25% of what validation actually allocated, unlike the JSON length
+        assert abs(deep_sizeof(weather) - allocated) < allocated * 0.25
+        assert len(weather.model_dump_json()) < allocated * 0.5
+
 
 class TestFileCache:
     """Test FileCache class."""
@@ -220,6 +352,13 @@ class TestFileCache:
         with patch("pathlib.Path.exists", return_value=False):
             assert not cache.is_valid(path)
 
+    def test_is_valid_file_removed(self, temp_cache_dir: Path) -> None:
+        """Test is_valid for a file removed between the existence check and stat."""
+        cache = FileCache(temp_cache_dir)
+
+        # Path.exists is mocked to return True, so stat finds the file missing
+        assert not cache.is_valid(temp_cache_dir / "removed.png")
+
     def test_is_valid_fresh_file(self, temp_cache_dir: Path) -> None:
         """Test is_valid for fresh file."""
         cache = FileCache(temp_cache_dir, ttl_seconds=3600)
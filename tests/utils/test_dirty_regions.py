@@ -0,0 +1,59 @@
+"""Tests for the dirty region header format and merging."""
+
+from rpi_weather_display.utils.dirty_regions import format_regions, merge_regions, parse_regions
+
+
+class TestDirtyRegions:
+    """Tests for formatting and parsing dirty regions."""
+
+    def test_round_trip(self) -> None:
+        """Test formatted regions parse back to the same rectangles."""
+        regions = [(0, 0, 1872, 48), (0, 48, 1872, 520)]
+
+        assert format_regions(regions) == "0,0,1872,48;0,48,1872,520"
+        assert parse_regions(format_regions(regions)) == regions
+
+    def test_no_regions(self) -> None:
+        """Test an empty header means nothing changed."""
+        assert format_regions([]) == ""
+        assert parse_regions("") == []
+
+    def test_malformed(self) -> None:
+        """Test malformed or empty rectangles are rejected."""
+        assert parse_regions("0,0,10") is None
+        assert parse_regions("a,b,c,d") is None
+        assert parse_regions("0,10,10,10") is None
+        assert parse_regions("-1,0,10,10") is None
+
+    def test_merge_keeps_distant_regions(self) -> None:
+        """Test regions far apart are cheaper to refresh separately."""
+        regions = [(100, 1300, 300, 1380), (1600, 10, 1800, 50)]
+
+        assert merge_regions(regions, 100_000, 8) == [
+            (1600, 10, 1800, 50),
+            (100, 1300, 300, 1380),
+        ]
+
+    def test_merge_nearby_regions(self) -> None:
+        """Test regions close together are cheaper to refresh as one."""
+        regions = [(0, 0, 100, 20), (0, 30, 100, 50)]
+
+        assert merge_regions(regions, 100_000, 8) == [(0, 0, 100, 50)]
+        # Without a fixed cost per update, the gap between them isn't worth refreshing
+        assert merge_regions(regions, 0, 8) == regions
+
+    def test_merge_overlapping_regions(self) -> None:
+        """Test overlapping regions are always merged, leaving disjoint ones."""
+        regions = [(0, 0, 100, 100), (50, 50, 150, 150), (1000, 1000, 1010, 1010)]
+
+        assert merge_regions(regions, 0, 8) == [(0, 0, 150, 150), (1000, 1000, 1010, 1010)]
+
+    def test_merge_limits_region_count(self) -> None:
+        """Test regions are merged down to the most updates allowed."""
+        regions = [(i * 100, 0, i * 100 + 10, 10) for i in range(5)]
+
+        merged = merge_regions(regions, 0, 2)
+
+        assert len(merged) == 2
+        assert min(r[0] for r in merged) == 0
+        assert max(r[2] for r in merged) == 410
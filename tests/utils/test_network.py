@@ -455,6 +455,8 @@ wlan0     IEEE 802.11  ESSID:"TestNetwork"
 
             # WiFi should be disabled after context exit
             mock_disable.assert_called_once()
+            assert network_manager.last_radio_on_seconds is not None
+            assert network_manager.last_radio_on_seconds >= 0
 
     @pytest.mark.asyncio()
     async def test_ensure_connectivity_connect_success(self, network_manager):
@@ -177,6 +177,53 @@ class TestPiJuiceAdapter:
         assert "Failed to set RTC alarm" in str(exc_info.value)
         assert exc_info.value.details["target_time"] == wake_time.isoformat()
 
+    def test_set_alarm_clears_alarm_flag(self, mock_pijuice_hardware: MagicMock) -> None:
+        """Test the previous alarm's flag is cleared before arming a new alarm."""
+        mock_pijuice_hardware.rtcAlarm.SetAlarm.return_value = {"error": "NO_ERROR"}
+        mock_pijuice_hardware.rtcAlarm.SetWakeupEnabled.return_value = {"error": "NO_ERROR"}
+
+        PiJuiceAdapter(mock_pijuice_hardware).set_alarm(datetime(2024, 5, 25, 10, 30, 0))
+
+        calls = [name for name, *_ in mock_pijuice_hardware.rtcAlarm.method_calls]
+        assert calls[:2] == ["ClearAlarmFlag", "SetAlarm"]
+
+    @pytest.mark.parametrize(
+        ("response", "expected"),
+        [
+            ({"error": "NO_ERROR", "data": {"alarm_flag": True}}, True),
+            ({"error": "NO_ERROR", "data": {"alarm_flag": False}}, False),
+            ({"error": "COMMUNICATION_ERROR", "data": {}}, None),
+        ],
+    )
+    def test_get_alarm_flag(
+        self, mock_pijuice_hardware: MagicMock, response: dict[str, object], expected: bool | None
+    ) -> None:
+        """Test reading whether the RTC alarm fired."""
+        mock_pijuice_hardware.rtcAlarm.GetControlStatus.return_value = response
+
+        assert PiJuiceAdapter(mock_pijuice_hardware).get_alarm_flag() is expected
+
+    def test_get_alarm_flag_not_initialized(self) -> None:
+        """Test the alarm flag is unknown without a PiJuice."""
+        assert PiJuiceAdapter().get_alarm_flag() is None
+
+    @pytest.mark.parametrize(
+        ("data", "expected"),
+        [
+            ({"battery": "NORMAL", "powerInput": "NOT_PRESENT"}, False),
+            ({"battery": "CHARGING_FROM_IN", "powerInput": "PRESENT"}, True),
+            ({"battery": "NORMAL", "powerInput": "PRESENT"}, True),
+            ({"battery": "NORMAL", "powerInput5vIo": "PRESENT"}, True),
+        ],
+    )
+    def test_is_on_external_power(
+        self, mock_pijuice_hardware: MagicMock, data: dict[str, str], expected: bool
+    ) -> None:
+        """Test detecting a connected charger or supply."""
+        mock_pijuice_hardware.status.GetStatus.return_value = {"error": "NO_ERROR", "data": data}
+
+        assert PiJuiceAdapter(mock_pijuice_hardware).is_on_external_power() is expected
+
     def test_disable_wakeup(self, mock_pijuice_hardware: MagicMock) -> None:
         """Test disabling wakeup alarm."""
         adapter = PiJuiceAdapter(mock_pijuice_hardware)
@@ -2,7 +2,7 @@
 
 import subprocess
 import sys
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -398,6 +398,8 @@ class TestPowerStateManagerCoverage:
 
             assert result is True
             mock_adapter.set_alarm.assert_called_once()
+            wake_time = mock_adapter.set_alarm.call_args.args[0]
+            assert manager.get_scheduled_wakeup() == wake_time
 
     def test_schedule_wakeup_without_adapter(self, power_manager: PowerStateManager) -> None:
         """Test schedule_wakeup when no PiJuice adapter."""
@@ -406,6 +408,7 @@ class TestPowerStateManagerCoverage:
         # Should return True (mocked) when no adapter
         result = power_manager.schedule_wakeup(30)
         assert result is True
+        assert power_manager.get_scheduled_wakeup() is None
 
     def test_schedule_wakeup_dynamic_mode(self, production_config: AppConfig) -> None:
         """Test schedule_wakeup with dynamic mode enabled."""
@@ -593,6 +596,35 @@ class TestPowerStateManagerCoverage:
 
             assert result is False
 
+    def test_schedule_wakeup_aligns_to_server_update(self, production_config: AppConfig) -> None:
+        """Test dynamic wakeups snap onto the server-advised update time."""
+        manager = PowerStateManager(production_config)
+
+        with patch("rpi_weather_display.utils.power_manager.PiJuiceAdapter") as mock_adapter_class:
+            mock_adapter = MagicMock()
+            mock_adapter.initialize.return_value = True
+            mock_adapter.set_alarm.return_value = True
+            mock_adapter_class.return_value = mock_adapter
+
+            manager.initialize()
+            assert manager._power_controller is not None
+            target = datetime.now() + timedelta(minutes=90)
+            manager._power_controller.get_server_wakeup_target = MagicMock(return_value=target)
+            manager._power_controller.calculate_sleep_time = MagicMock(return_value=90)
+
+            assert manager.schedule_wakeup(30, dynamic=True) is True
+            mock_adapter.set_alarm.assert_called_once_with(target)
+
+    def test_set_server_next_update_delegates(self, power_manager: PowerStateManager) -> None:
+        """Test server update hints are passed to the power controller."""
+        power_manager.initialize()
+        next_update = datetime.now() + timedelta(hours=1)
+
+        power_manager.set_server_next_update(next_update)
+
+        assert power_manager._power_controller is not None
+        assert power_manager._power_controller._server_next_update == next_update
+
     def test_get_event_configuration_valid_event(self, production_config: AppConfig) -> None:
         """Test get_event_configuration with valid event type."""
         manager = PowerStateManager(production_config)
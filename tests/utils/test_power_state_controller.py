@@ -812,3 +812,73 @@ class TestPowerStateControllerCoverage:
             test_time2 = datetime.now()
             helper.set_last_update(controller, test_time2)
             assert helper.get_last_update(controller) == test_time2
+
+
+@pytest.mark.usefixtures("mock_normal_hours_time")
+class TestPowerStateControllerServerSchedule:
+    """Tests for aligning sleep with server-advised content updates."""
+
+    def test_no_server_hint_leaves_sleep_unchanged(
+        self, mock_config: AppConfig, mock_battery_monitor: MagicMock
+    ) -> None:
+        """Test sleep time is unchanged when the server has not advised an update."""
+        with patch("rpi_weather_display.utils.power_state_controller.is_quiet_hours", return_value=False):
+            controller = PowerStateController(mock_config, mock_battery_monitor)
+            controller.initialize()
+
+            with patch.object(controller, "_update_power_state"):
+                assert controller.get_server_wakeup_target() is None
+                assert controller.calculate_sleep_time() == 30
+
+    def test_sleep_extended_until_server_update(
+        self, mock_config: AppConfig, mock_battery_monitor: MagicMock
+    ) -> None:
+        """Test sleep is extended when the server's next update is later."""
+        with patch("rpi_weather_display.utils.power_state_controller.is_quiet_hours", return_value=False):
+            controller = PowerStateController(mock_config, mock_battery_monitor)
+            controller.initialize()
+            now = datetime(2024, 5, 25, 10, 0, 0)
+            controller.set_server_next_update(now + timedelta(minutes=50))
+
+            with patch.object(controller, "_update_power_state"):
+                # 50 minutes plus the grace period, rounded up to whole minutes
+                assert controller.calculate_sleep_time() == 51
+
+    def test_sleep_not_shortened_for_earlier_update(
+        self, mock_config: AppConfig, mock_battery_monitor: MagicMock
+    ) -> None:
+        """Test an earlier server update does not override power-based sleep."""
+        with patch("rpi_weather_display.utils.power_state_controller.is_quiet_hours", return_value=False):
+            controller = PowerStateController(mock_config, mock_battery_monitor)
+            controller.initialize()
+            now = datetime(2024, 5, 25, 10, 0, 0)
+            controller.set_server_next_update(now + timedelta(minutes=10))
+
+            with patch.object(controller, "_update_power_state"):
+                assert controller.calculate_sleep_time() == 30
+
+    def test_past_server_update_ignored(
+        self, mock_config: AppConfig, mock_battery_monitor: MagicMock
+    ) -> None:
+        """Test a server update in the past is ignored."""
+        controller = PowerStateController(mock_config, mock_battery_monitor)
+        now = datetime(2024, 5, 25, 10, 0, 0)
+        controller.set_server_next_update(now - timedelta(minutes=5))
+
+        assert controller.get_server_wakeup_target() is None
+        assert controller.align_wakeup_time(now) == now
+
+    def test_align_wakeup_time_snaps_to_server_update(
+        self, mock_config: AppConfig, mock_battery_monitor: MagicMock
+    ) -> None:
+        """Test wakeups rounded past the server update snap back onto it."""
+        controller = PowerStateController(mock_config, mock_battery_monitor)
+        now = datetime(2024, 5, 25, 10, 0, 0)
+        controller.set_server_next_update(now + timedelta(minutes=50))
+        target = controller.get_server_wakeup_target()
+
+        assert target == now + timedelta(minutes=50, seconds=30)
+        assert controller.align_wakeup_time(now + timedelta(minutes=51)) == target
+        # Wakeups well after the update are left alone
+        later = now + timedelta(minutes=90)
+        assert controller.align_wakeup_time(later) == later